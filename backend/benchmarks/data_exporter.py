@@ -0,0 +1,88 @@
+"""
+Benchmark: render-freie Exports (DataExporter: CSV, ICS, SRT/VTT) vs. PDF (PDFGenerator).
+
+Serialisiert pro Content Type und Format N-mal und vergleicht die CPU-Zeit pro Export
+(Median, time.process_time) mit einem PDF-Export derselben Daten im selben Prozess.
+
+Braucht keine Datenbank, nur reportlab.
+
+Usage (aus backend/):
+    python -m benchmarks.data_exporter
+    python -m benchmarks.data_exporter --repeats 5000 --type calendar
+"""
+import argparse
+import time
+from datetime import datetime
+from statistics import median
+from typing import Callable, List
+from src.domain.entities.content import ContentType
+from src.infrastructure.pdf.data_exporter import DataExporter, PDF
+from src.infrastructure.pdf.pdf_generator import PDFGenerator
+
+
+SAMPLE_DATA = {
+    ContentType.HOOK: {"hooks": [f"Hook Nummer {i} über Morgenroutinen, die wirklich funktionieren" for i in range(1, 11)]},
+    ContentType.BROLL: {"ideas": [f"Idee {i}: Kaffee am Fenster" for i in range(1, 11)]},
+    ContentType.SHOTLIST: {"shots": [f"Shot {i}: Halbtotale vom Schreibtisch, Kamera auf Augenhöhe" for i in range(1, 5)]},
+    ContentType.SCRIPT: {
+        "scenes": [
+            {
+                "scene_number": i, "type": "Facecam", "text": f"Szene {i}: " + "Text " * 30,
+                "visual_description": "Nahaufnahme, natürliches Licht", "duration_seconds": 4
+            }
+            for i in range(1, 5)
+        ],
+        "cta": "Folge für mehr!",
+        "total_duration": 16,
+    },
+    ContentType.CALENDAR: {
+        "niche": "Fitness",
+        "days": {
+            str(day): {"day": day, "hook": f"Tag {day}: " + "Hook " * 12, "theme": "Motivation"}
+            for day in range(1, 31)
+        },
+    },
+}
+CONTENT_ID = "00000000-0000-0000-0000-000000000001"
+GENERATED_AT = datetime(2024, 1, 1, 9, 30)
+
+
+def _measure(export: Callable[[], object], repeats: int) -> float:
+    """Returns: Median der CPU-Zeit pro Export in µs"""
+    export()
+    timings: List[float] = []
+    for _ in range(repeats):
+        started = time.process_time()
+        export()
+        timings.append(time.process_time() - started)
+    return median(timings) * 1_000_000
+
+
+def main(content_types: List[ContentType], repeats: int) -> None:
+    exporter = DataExporter()
+    generator = PDFGenerator()
+    print(f"{repeats} Exports pro Format, CPU-Zeit pro Export (Median)\n")
+    print(f"{'Content Type':<14} {'Format':<7} {'Export':>10} {'PDF':>10} {'Faktor':>8}")
+    for content_type in content_types:
+        data = SAMPLE_DATA[content_type]
+        pdf_us = _measure(
+            lambda: generator.generate_pdf(content_type, data, "Benchmark", GENERATED_AT), max(repeats // 100, 10)
+        )
+        for export_format in exporter.formats(content_type):
+            if export_format == PDF:
+                continue
+            export_us = _measure(
+                lambda: "".join(exporter.serialize(content_type, export_format, data, CONTENT_ID, GENERATED_AT)).encode(),
+                repeats
+            )
+            print(f"{content_type.value:<14} {export_format.name:<7} {export_us:>8.1f}µs {pdf_us / 1000:>8.2f}ms "
+                  f"{pdf_us / export_us:>7.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render-freie Exports vs. PDF")
+    parser.add_argument("--type", choices=[t.value for t in SAMPLE_DATA], nargs="+",
+                        default=[t.value for t in SAMPLE_DATA])
+    parser.add_argument("--repeats", type=int, default=2000)
+    args = parser.parse_args()
+    main([ContentType(t) for t in args.type], args.repeats)
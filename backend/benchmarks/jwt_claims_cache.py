@@ -0,0 +1,57 @@
+"""
+Benchmark: Auth Dependency pro Request - jwt.decode mit Signaturprüfung vs. JWTClaimsCache.
+
+Simuliert pollende Clients: --users Access Tokens, jeder wird --polls Mal verifiziert
+(AuthMiddleware.verify_token). Verglichen wird die CPU-Zeit pro Aufruf ohne Cache
+(ttl 0) und mit Cache sowie die Hit-Ratio.
+
+Braucht keine Datenbank.
+
+Usage (aus backend/):
+    python -m benchmarks.jwt_claims_cache
+    python -m benchmarks.jwt_claims_cache --users 1000 --polls 50
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+import jwt
+from src.infrastructure.security.jwt_claims_cache import JWTClaimsCache
+from src.presentation.middlewares.auth_middleware import AuthMiddleware
+
+
+def _tokens(middleware: AuthMiddleware, users: int) -> List[str]:
+    exp = datetime.now(timezone.utc) + timedelta(hours=1)
+    return [
+        jwt.encode(
+            {"sub": f"user-{i}", "email": f"user{i}@example.com", "role": "free", "type": "access", "exp": exp},
+            middleware.jwt_secret, algorithm=middleware.jwt_algorithm
+        )
+        for i in range(users)
+    ]
+
+
+def _run(middleware: AuthMiddleware, tokens: List[str], polls: int) -> float:
+    """Returns: CPU-Zeit pro verify_token in µs"""
+    started = time.process_time()
+    for _ in range(polls):
+        for token in tokens:
+            middleware.verify_token(token)
+    return (time.process_time() - started) / (polls * len(tokens)) * 1_000_000
+
+
+def main(users: int, polls: int) -> None:
+    uncached = AuthMiddleware(JWTClaimsCache(ttl_seconds=0))
+    cached = AuthMiddleware(JWTClaimsCache(max_entries=max(users, 1)))
+    tokens = _tokens(uncached, users)
+    print(f"{users} Tokens x {polls} Polls\n")
+    print(f"ohne Cache: {_run(uncached, tokens, polls):>7.2f}µs pro Request")
+    print(f"mit Cache:  {_run(cached, tokens, polls):>7.2f}µs pro Request (Hit-Ratio {cached.claims_cache.stats()['hit_ratio']:.3f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Auth Dependency: jwt.decode vs. JWTClaimsCache")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--polls", type=int, default=20)
+    args = parser.parse_args()
+    main(args.users, args.polls)
@@ -0,0 +1,85 @@
+"""
+Benchmark: Event-Loop-Lag während eines Login-Schwalls - bcrypt im Event Loop vs. PasswordHasher.
+
+Startet N gleichzeitige Logins (bcrypt verify) und misst parallel, wie verspätet ein
+Probe-Task aufwacht, der alle --interval ms schläft. Die Verspätung ist die Zeit, die
+jeder andere Request des Workers (z.B. eine Generierung) in dieser Phase warten würde.
+
+- inline: CryptContext.verify direkt im Event Loop (altes Verhalten)
+- pool:   PasswordHasher.verify_and_update (ThreadPoolExecutor, begrenzte Queue)
+
+Braucht keine Datenbank.
+
+Usage (aus backend/):
+    python -m benchmarks.password_hashing
+    python -m benchmarks.password_hashing --logins 100 --rounds 12 --workers 1 2 4
+"""
+import argparse
+import asyncio
+import time
+from statistics import quantiles
+from typing import Awaitable, Callable, List
+from src.infrastructure.security.password_hasher import PasswordHasher
+
+
+PASSWORD = "correct horse battery staple"
+
+
+async def _probe(lags: List[float], interval: float, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def _storm(login: Callable[[], Awaitable[bool]], logins: int, interval: float) -> None:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, interval, stop))
+    await asyncio.sleep(interval * 2)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(logins)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    ok = sum(1 for result in results if result is True)
+    rejected = sum(1 for result in results if isinstance(result, asyncio.QueueFull))
+    cuts = quantiles(lags, n=100, method="inclusive") if len(lags) >= 2 else [lags[0]] * 99
+    print(f"  {ok}/{logins} ok, {rejected} abgelehnt (503), {elapsed:.2f}s, {ok / elapsed:.1f} Logins/s")
+    print(f"  Loop-Lag: p50 {cuts[49] * 1000:.1f}ms, p99 {cuts[98] * 1000:.1f}ms, max {max(lags) * 1000:.1f}ms")
+
+
+async def main(logins: int, rounds: int, workers: List[int], interval: float) -> None:
+    reference = PasswordHasher(workers=1, rounds=rounds)
+    password_hash = await reference.hash(PASSWORD)
+    await reference.close()
+    print(f"{logins} gleichzeitige Logins, bcrypt rounds={rounds}, Probe alle {interval * 1000:.0f}ms\n")
+
+    async def inline() -> bool:
+        return reference.pwd_context.verify(PASSWORD, password_hash)
+
+    print("inline (bcrypt im Event Loop)")
+    await _storm(inline, logins, interval)
+
+    for worker_count in workers:
+        hasher = PasswordHasher(workers=worker_count, max_queue=logins, rounds=rounds)
+
+        async def pooled() -> bool:
+            valid, _ = await hasher.verify_and_update(PASSWORD, password_hash)
+            return valid
+
+        print(f"\npool ({worker_count} Threads)")
+        await _storm(pooled, logins, interval)
+        await hasher.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event-Loop-Lag bei Login-Schwall: inline vs. PasswordHasher")
+    parser.add_argument("--logins", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--interval", type=float, default=0.01, help="Probe-Intervall in Sekunden")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds, args.workers, args.interval))
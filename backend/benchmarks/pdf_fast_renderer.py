@@ -0,0 +1,76 @@
+"""
+Benchmark: CPU-Zeit pro PDF-Export - Platypus (PDFGenerator) vs. Canvas Fast Path (ListPDFRenderer).
+
+Rendert jeden Content Type mit Fast Path (Hooks, B-Roll, Caption) N-mal über beide
+Wege und vergleicht die CPU-Zeit pro Export (Median, time.process_time) im selben
+Prozess - das entspricht der Zeit, die ein Worker im PDFRenderPool belegt ist.
+
+Braucht keine Datenbank, nur reportlab.
+
+Usage (aus backend/):
+    python -m benchmarks.pdf_fast_renderer
+    python -m benchmarks.pdf_fast_renderer --repeats 500 --type hook
+"""
+import argparse
+import time
+from datetime import datetime
+from statistics import median
+from typing import Callable, List
+from src.domain.entities.content import ContentType
+from src.infrastructure.pdf.pdf_generator import PDFGenerator
+
+
+SAMPLE_DATA = {
+    ContentType.HOOK: {"hooks": [f"Hook Nummer {i} über Morgenroutinen, die wirklich funktionieren" for i in range(1, 11)]},
+    ContentType.BROLL: {"ideas": [f"Idee {i}: Slow-Motion Aufnahme vom Kaffee am Fenster im Morgenlicht" for i in range(1, 11)]},
+    ContentType.CAPTION: {
+        "caption": "Deine Morgenroutine entscheidet über deinen Tag. " * 6,
+        "hashtags": [f"#morgenroutine{i}" for i in range(1, 21)],
+    },
+}
+GENERATED_AT = datetime(2024, 1, 1, 9, 30)
+
+
+def _platypus(generator: PDFGenerator, content_type: ContentType) -> Callable[[], bytes]:
+    return lambda: generator.render_template(content_type, SAMPLE_DATA[content_type], "Benchmark", GENERATED_AT)
+
+
+def _fast(generator: PDFGenerator, content_type: ContentType) -> Callable[[], bytes]:
+    data = SAMPLE_DATA[content_type]
+
+    def render() -> bytes:
+        pdf_bytes = generator.fast_renderer.render(content_type, data, "Benchmark", GENERATED_AT)
+        if pdf_bytes is None:
+            raise RuntimeError(f"Fast Path hat {content_type.value} abgelehnt")
+        return pdf_bytes
+    return render
+
+
+def _measure(render: Callable[[], bytes], repeats: int) -> float:
+    """Returns: Median der CPU-Zeit pro Export in ms"""
+    render()
+    timings: List[float] = []
+    for _ in range(repeats):
+        started = time.process_time()
+        render()
+        timings.append(time.process_time() - started)
+    return median(timings) * 1000
+
+
+def main(content_types: List[ContentType], repeats: int) -> None:
+    generator = PDFGenerator()
+    print(f"{repeats} Exports pro Variante, CPU-Zeit pro Export (Median)\n")
+    print(f"{'Content Type':<14} {'Platypus':>10} {'Fast Path':>10} {'Speedup':>8}")
+    for content_type in content_types:
+        slow = _measure(_platypus(generator, content_type), repeats)
+        fast = _measure(_fast(generator, content_type), repeats)
+        print(f"{content_type.value:<14} {slow:>8.2f}ms {fast:>8.2f}ms {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF-Export: Platypus vs. Canvas Fast Path")
+    parser.add_argument("--type", choices=[t.value for t in SAMPLE_DATA], nargs="+",
+                        default=[t.value for t in SAMPLE_DATA])
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+    main([ContentType(t) for t in args.type], args.repeats)
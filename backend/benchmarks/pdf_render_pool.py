@@ -0,0 +1,110 @@
+"""
+Benchmark: PDF-Export inline im Event Loop vs. PDFRenderPool (Worker-Prozesse).
+
+Rendert N gleichzeitige Exports (Default: 30-Tage-Kalender, der teuerste Content Type)
+und misst parallel die Verzögerung eines 5-ms-Tickers im Event Loop - das ist die
+Latenz, die jeder andere Request im selben uvicorn Worker währenddessen sieht.
+"inline" entspricht dem alten Verhalten (PDFGenerator direkt im Handler).
+
+Braucht keine Datenbank, nur reportlab.
+
+Usage (aus backend/):
+    python -m benchmarks.pdf_render_pool
+    python -m benchmarks.pdf_render_pool --exports 64 --workers 1 2 4 8 --type script
+"""
+import argparse
+import asyncio
+import os
+import time
+from statistics import quantiles
+from typing import Dict, List
+from src.domain.entities.content import ContentType
+from src.infrastructure.pdf.pdf_generator import PDFGenerator
+from src.infrastructure.pdf.render_pool import PDFRenderPool
+
+
+SAMPLE_DATA = {
+    ContentType.HOOK: {"hooks": [f"Hook Nummer {i} über Morgenroutinen" for i in range(1, 11)]},
+    ContentType.SCRIPT: {
+        "scenes": [
+            {
+                "scene_number": i, "type": "Facecam", "text": f"Szene {i}: " + "Text " * 30,
+                "visual_description": "Nahaufnahme, natürliches Licht", "duration_seconds": 4
+            }
+            for i in range(1, 5)
+        ],
+        "cta": "Folge für mehr!",
+        "total_duration": 16,
+    },
+    ContentType.CALENDAR: {
+        "niche": "Fitness",
+        "days": {
+            str(day): {"day": day, "hook": f"Tag {day}: " + "Hook " * 12, "theme": "Motivation"}
+            for day in range(1, 31)
+        },
+    },
+}
+
+
+async def _ticker(lags: List[float], stop: asyncio.Event, interval: float = 0.005) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(time.perf_counter() - started - interval, 0.0))
+
+
+async def _run(render, content_type: ContentType, exports: int) -> Dict[str, float]:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(render(content_type, SAMPLE_DATA[content_type], "Benchmark") for _ in range(exports)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+    p99 = quantiles(lags, n=100, method="inclusive")[98] if len(lags) >= 2 else lags[0]
+    return {
+        "seconds": elapsed,
+        "per_second": exports / elapsed,
+        "lag_p99_ms": p99 * 1000,
+        "lag_max_ms": max(lags) * 1000,
+    }
+
+
+def _print(name: str, result: Dict[str, float]) -> None:
+    print(
+        f"{name:<14} {result['seconds']:>8.2f}s {result['per_second']:>9.1f} "
+        f"{result['lag_p99_ms']:>11.1f}ms {result['lag_max_ms']:>11.1f}ms"
+    )
+
+
+async def main(content_type: ContentType, exports: int, workers: List[int]) -> None:
+    generator = PDFGenerator()
+
+    async def inline(content_type: ContentType, data: dict, prompt: str) -> bytes:
+        return generator.generate_pdf(content_type, data, prompt)
+
+    print(f"{exports} Exports vom Typ {content_type.value}, {os.cpu_count()} Kerne\n")
+    print(f"{'Variante':<14} {'Dauer':>9} {'Exports/s':>9} {'Loop-Lag p99':>13} {'Loop-Lag max':>13}")
+    await inline(content_type, SAMPLE_DATA[content_type], "Warmup")
+    _print("inline", await _run(inline, content_type, exports))
+
+    for count in workers:
+        pool = PDFRenderPool(workers=count, max_queue=exports)
+        await pool.start()
+        try:
+            _print(f"pool ({count})", await _run(pool.render, content_type, exports))
+        finally:
+            await pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF-Export: inline vs. Process Pool")
+    parser.add_argument("--type", choices=[t.value for t in SAMPLE_DATA], default=ContentType.CALENDAR.value)
+    parser.add_argument("--exports", type=int, default=32)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+    asyncio.run(main(ContentType(args.type), args.exports, args.workers))
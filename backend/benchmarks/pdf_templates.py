@@ -0,0 +1,92 @@
+"""
+Benchmark: Platypus-Rendering über die Template Engine (PDFGenerator.render_template) pro Content Type.
+
+Misst pro Content Type die CPU-Zeit pro Export (Median, time.process_time) und den
+Speicher-Peak pro Export (tracemalloc), außerdem einmalig die Kompilierzeit der
+Templates (PDFGenerator()). Der Fast Path ist hier bewusst
+aus - dafür gibt es benchmarks.pdf_fast_renderer.
+
+Braucht keine Datenbank, nur reportlab.
+
+Usage (aus backend/):
+    python -m benchmarks.pdf_templates
+    python -m benchmarks.pdf_templates --repeats 500 --type script calendar
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+from statistics import median
+from typing import List, Tuple
+from src.domain.entities.content import ContentType
+from src.infrastructure.pdf.pdf_generator import PDFGenerator
+
+
+SAMPLE_DATA = {
+    ContentType.HOOK: {"hooks": [f"Hook Nummer {i} über Morgenroutinen, die wirklich funktionieren" for i in range(1, 11)]},
+    ContentType.SCRIPT: {
+        "scenes": [
+            {
+                "scene_number": i, "type": "Facecam", "text": f"Szene {i}: " + "Text " * 30,
+                "visual_description": "Nahaufnahme, natürliches Licht", "duration_seconds": 4
+            }
+            for i in range(1, 5)
+        ],
+        "cta": "Folge für mehr!",
+        "total_duration": 16,
+    },
+    ContentType.SHOTLIST: {"shots": [f"Shot {i}: Halbtotale vom Schreibtisch, Kamera auf Augenhöhe" for i in range(1, 9)]},
+    ContentType.VOICEOVER: {"text": "Deine Morgenroutine entscheidet über deinen Tag. " * 12, "estimated_duration": 30},
+    ContentType.CAPTION: {
+        "caption": "Deine Morgenroutine entscheidet über deinen Tag. " * 6,
+        "hashtags": [f"#morgenroutine{i}" for i in range(1, 21)],
+    },
+    ContentType.BROLL: {"ideas": [f"Idee {i}: Kaffee am Fenster" for i in range(1, 11)]},
+    ContentType.CALENDAR: {
+        "niche": "Fitness",
+        "days": {
+            str(day): {"day": day, "hook": f"Tag {day}: " + "Hook " * 12, "theme": "Motivation"}
+            for day in range(1, 31)
+        },
+    },
+}
+GENERATED_AT = datetime(2024, 1, 1, 9, 30)
+
+
+def _measure(generator: PDFGenerator, content_type: ContentType, repeats: int) -> Tuple[float, float]:
+    """Returns: (CPU ms pro Export (Median), Speicher-Peak pro Export in KiB)"""
+    data = SAMPLE_DATA[content_type]
+    generator.render_template(content_type, data, "Benchmark", GENERATED_AT)
+
+    timings: List[float] = []
+    for _ in range(repeats):
+        started = time.process_time()
+        generator.render_template(content_type, data, "Benchmark", GENERATED_AT)
+        timings.append(time.process_time() - started)
+
+    # Speicher separat messen - tracemalloc verfälscht die CPU-Zeit
+    tracemalloc.start()
+    generator.render_template(content_type, data, "Benchmark", GENERATED_AT)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return median(timings) * 1000, peak / 1024
+
+
+def main(content_types: List[ContentType], repeats: int) -> None:
+    started = time.process_time()
+    generator = PDFGenerator()
+    print(f"Templates kompilieren (PDFGenerator()): {(time.process_time() - started) * 1000:.2f}ms")
+    print(f"{repeats} Exports pro Content Type, ohne Fast Path\n")
+    print(f"{'Content Type':<14} {'CPU/Export':>11} {'Peak':>11}")
+    for content_type in content_types:
+        cpu_ms, peak_kib = _measure(generator, content_type, repeats)
+        print(f"{content_type.value:<14} {cpu_ms:>9.2f}ms {peak_kib:>8.0f}KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF-Export: Template Engine pro Content Type")
+    parser.add_argument("--type", choices=[t.value for t in SAMPLE_DATA], nargs="+",
+                        default=[t.value for t in SAMPLE_DATA])
+    parser.add_argument("--repeats", type=int, default=100)
+    args = parser.parse_args()
+    main([ContentType(t) for t in args.type], args.repeats)
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional
+
+
+# ================== Usage Analytics DTOs ==================
+
+@dataclass
+class UsageAnalyticsRequestDTO:
+    """Request für Usage-Auswertungen (Admin)"""
+    start: date
+    end: date
+    group_by: List[str] = field(default_factory=lambda: ["day"])
+    content_type: Optional[str] = None
+    plan: Optional[str] = None
+    user_id: Optional[str] = None
+    limit: Optional[int] = None
+
+
+@dataclass
+class UsageAnalyticsRowDTO:
+    """Eine aggregierte Zeile (nicht gruppierte Dimensionen sind null)"""
+    count: int
+    day: Optional[date] = None
+    content_type: Optional[str] = None
+    plan: Optional[str] = None
+    user_id: Optional[str] = None
+
+
+@dataclass
+class UsageAnalyticsResponseDTO:
+    """Response für Usage-Auswertungen"""
+    start: date
+    end: date
+    group_by: List[str]
+    rows: List[UsageAnalyticsRowDTO]
+    total: int
+    data_until: Optional[datetime] = None  # Rollups enthalten Contents bis zu diesem Zeitpunkt
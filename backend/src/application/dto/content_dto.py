@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from typing import List, Optional, Any
-from datetime import datetime
+from typing import List, Optional, Any, AsyncIterable, BinaryIO
+from datetime import date, datetime
 from ...domain.entities.content import ContentType, ContentStatus
 
 
@@ -12,6 +12,9 @@ class GenerateContentRequestDTO:
     user_id: str
     prompt: str
     context: Optional[str] = None
+    content_id: Optional[str] = None  # Gesetzt: Regenerierung → neue Version dieses Contents
+    complete_pending: bool = False  # Worker: content_id ist ein Platzhalter (GENERATING) und wird vervollständigt
+    queued: bool = False  # Worker: content_id wurde per Job eingestellt und steht deshalb auf GENERATING
 
 
 @dataclass
@@ -65,6 +68,7 @@ class HookResponseDTO:
     hooks: List[str]
     prompt: str
     created_at: datetime
+    version: int = 1
 
 
 @dataclass
@@ -86,6 +90,7 @@ class ScriptResponseDTO:
     total_duration: int
     prompt: str
     created_at: datetime
+    version: int = 1
 
 
 @dataclass
@@ -95,6 +100,7 @@ class ShotlistResponseDTO:
     shots: List[str]
     prompt: str
     created_at: datetime
+    version: int = 1
 
 
 @dataclass
@@ -105,6 +111,7 @@ class VoiceoverResponseDTO:
     estimated_duration: int
     prompt: str
     created_at: datetime
+    version: int = 1
 
 
 @dataclass
@@ -115,6 +122,7 @@ class CaptionResponseDTO:
     hashtags: List[str]
     prompt: str
     created_at: datetime
+    version: int = 1
 
 
 @dataclass
@@ -124,6 +132,7 @@ class BRollResponseDTO:
     ideas: List[str]
     prompt: str
     created_at: datetime
+    version: int = 1
 
 
 @dataclass
@@ -142,6 +151,7 @@ class CalendarResponseDTO:
     days: List[DayContentDTO]
     prompt: str
     created_at: datetime
+    version: int = 1
 
 
 # ================== Generic Content DTOs ==================
@@ -171,6 +181,119 @@ class ContentDetailDTO:
     updated_at: datetime
 
 
+@dataclass
+class ContentVersionRequestDTO:
+    """Request für Versions-Historie bzw. eine einzelne Version"""
+    user_id: str
+    content_id: str
+    version: Optional[int] = None  # Nur für den Abruf einer Version
+
+
+@dataclass
+class ContentVersionDTO:
+    """DTO für einen Eintrag der Versions-Historie"""
+    version: int
+    prompt: str
+    created_at: datetime
+    metadata: Optional[dict] = None
+
+
+@dataclass
+class ContentVersionListDTO:
+    """Response für die Versions-Historie eines Contents"""
+    content_id: str
+    current_version: int
+    versions: List[ContentVersionDTO]  # Neueste zuerst
+
+
+# ================== Async Generation DTOs ==================
+
+@dataclass
+class EnqueueGenerationRequestDTO:
+    """Request für eine asynchrone Generierung (?async=true)"""
+    user_id: str
+    content_type: ContentType
+    prompt: str
+    params: dict  # Typ-spezifische Request-Felder (context, script, niche, ...)
+    content_id: Optional[str] = None  # Gesetzt: Regenerierung → neue Version dieses Contents
+
+
+@dataclass
+class GenerationJobResponseDTO:
+    """Response (202) für eine eingestellte Generierung"""
+    content_id: str
+    type: ContentType
+    status: ContentStatus
+
+
+@dataclass
+class ContentStatusRequestDTO:
+    """Request für den Generierungs-Status eines Contents"""
+    user_id: str
+    content_id: str
+
+
+@dataclass
+class ContentStatusDTO:
+    """Generierungs-Status eines Contents (Polling nach ?async=true)"""
+    id: str
+    type: ContentType
+    status: ContentStatus
+    version: int
+    updated_at: datetime
+    data: Any = None  # Nur bei Status completed
+    error: Optional[str] = None  # Nur bei Status failed
+
+
+# ================== Search DTOs ==================
+
+@dataclass
+class SearchContentRequestDTO:
+    """Request für die Volltextsuche"""
+    user_id: str
+    query: str
+    limit: int = 20
+    cursor: Optional[str] = None  # Keyset-Cursor aus vorheriger Seite
+
+
+@dataclass
+class ContentSearchItemDTO:
+    """DTO für einen Suchtreffer"""
+    id: str
+    type: ContentType
+    status: ContentStatus
+    prompt: str
+    created_at: datetime
+    preview: str  # Kurze Vorschau des Contents
+    rank: float  # Relevanz-Score
+
+
+@dataclass
+class ContentSearchResponseDTO:
+    """Response für die Volltextsuche"""
+    items: List[ContentSearchItemDTO]
+    next_cursor: Optional[str] = None
+
+
+# ================== NDJSON Import DTOs ==================
+
+@dataclass
+class ImportContentRequestDTO:
+    """Request für den Bulk-Import (NDJSON, bereits dekomprimiert)"""
+    user_id: str
+    chunks: AsyncIterable[bytes]  # Roher Request-Body als Byte-Stream
+    job_id: Optional[str] = None  # ID für die Fortschritts-Events (Default: neue UUID)
+
+
+@dataclass
+class ImportContentResponseDTO:
+    """Response für den Bulk-Import"""
+    imported: int
+    skipped: int
+    errors: List[str]  # Gründe für übersprungene Zeilen ("Zeile 12: ...")
+    job_id: Optional[str] = None  # ID der Fortschritts-Events (WebSocket)
+
+
 # ================== PDF Export DTOs ==================
 
 @dataclass
@@ -178,12 +301,75 @@ class ExportPDFRequestDTO:
     """Request für PDF Export"""
     user_id: str
     content_id: str
+    if_none_match: Optional[str] = None  # If-None-Match Header (Conditional GET)
 
 
 @dataclass
 class ExportPDFResponseDTO:
-    """Response für PDF Export"""
+    """
+    Response für PDF Export: pdf_file (geöffnet aus dem Cache, Aufrufer schließt) oder
+    pdf_bytes (frisch gerendert); beides None wenn not_modified
+    """
+    content_id: str
+    content_type: ContentType
+    pdf_bytes: Optional[bytes]
+    filename: str
+    etag: str
+    not_modified: bool = False
+    pdf_file: Optional[BinaryIO] = None
+
+
+@dataclass
+class ExportDataRequestDTO:
+    """Request für einen render-freien Export (CSV, ICS, SRT/VTT) mit Content Negotiation"""
+    user_id: str
+    content_id: str
+    format: Optional[str] = None  # Explizites Format (?format=), hat Vorrang vor accept
+    accept: Optional[str] = None  # Accept Header
+    start: Optional[date] = None  # ICS: Datum von Tag 1 (Default: Tag nach der Generierung)
+
+
+@dataclass
+class ExportDataResponseDTO:
+    """
+    Response für den render-freien Export: format None → nichts Akzeptables (406),
+    format "pdf" → Aufrufer exportiert über ExportPDFUseCase (body None)
+    """
     content_id: str
     content_type: ContentType
+    format: Optional[str]
+    available: List[str]
+    media_type: Optional[str] = None
+    filename: Optional[str] = None
+    body: Optional[bytes] = None
+
+
+@dataclass
+class ExportBundleRequestDTO:
+    """Request für den Bundle-Export mehrerer Contents (ein ZIP mit einem PDF pro Content)"""
+    user_id: str
+    content_ids: List[str]
+    job_id: Optional[str] = None  # ID für die Fortschritts-Events (Default: neue UUID)
+
+
+@dataclass
+class BundleFileDTO:
+    """Eine gerenderte Datei im Bundle"""
+    filename: str
+    created_at: datetime
     pdf_bytes: bytes
+
+
+@dataclass
+class ExportBundleResponseDTO:
+    """
+    Response für den Bundle-Export. Liegt das ZIP schon im Bundle Cache, ist bundle_file
+    die geöffnete Datei und files None - sonst wird files erst beim Streamen gerendert.
+    """
     filename: str
+    count: int
+    job_id: str
+    files: Optional[AsyncIterable[BundleFileDTO]]
+    cache_key: str
+    etag: str
+    bundle_file: Optional[BinaryIO] = None
@@ -0,0 +1,145 @@
+import dataclasses
+import uuid
+from datetime import datetime, timedelta
+from ...domain.interfaces.content_repository import IContentRepository
+from ...domain.interfaces.user_repository import IUserRepository
+from ...domain.interfaces.subscription_repository import ISubscriptionRepository
+from ...domain.interfaces.usage_repository import IUsageRepository
+from ...domain.interfaces.generation_job_repository import IGenerationJobRepository
+from ...domain.interfaces.unit_of_work import IUnitOfWork
+from ...domain.interfaces.progress_publisher import IProgressPublisher
+from ...domain.entities.content import Content, ContentStatus
+from ...domain.entities.generation_job import GenerationJob
+from ...domain.entities.progress import ProgressEvent, JobKind, ProgressStatus
+from ...domain.services.rate_limiter import RateLimiter
+from ..dto.content_dto import EnqueueGenerationRequestDTO, GenerationJobResponseDTO
+
+
+class EnqueueGenerationUseCase:
+    """
+    Use Case für asynchrone Content-Generierung (POST /api/content/{type}?async=true).
+
+    Flow:
+    1. User & Subscription laden
+    2. Rate-Limits prüfen (noch offene Jobs zählen mit)
+    3. Content mit Status GENERATING anlegen bzw. bestehenden Content auf GENERATING setzen
+    4. Job einstellen (selbe Transaktion wie 3.)
+    5. queued-Event an die WebSockets des Users, Content-ID zurückgeben
+
+    Den LLM Call macht der GenerationWorker mit dem jeweiligen Generate Use Case -
+    der Request hält weder Connection noch Socket offen.
+    """
+
+    def __init__(
+        self,
+        content_repository: IContentRepository,
+        user_repository: IUserRepository,
+        subscription_repository: ISubscriptionRepository,
+        usage_repository: IUsageRepository,
+        generation_job_repository: IGenerationJobRepository,
+        rate_limiter: RateLimiter,
+        unit_of_work: IUnitOfWork,
+        progress_publisher: IProgressPublisher
+    ):
+        self.content_repo = content_repository
+        self.user_repo = user_repository
+        self.subscription_repo = subscription_repository
+        self.usage_repo = usage_repository
+        self.job_repo = generation_job_repository
+        self.rate_limiter = rate_limiter
+        self.uow = unit_of_work
+        self.progress = progress_publisher
+
+    async def execute(self, request: EnqueueGenerationRequestDTO) -> GenerationJobResponseDTO:
+        """
+        Stellt eine Generierung ein.
+
+        Returns:
+            GenerationJobResponseDTO mit der Content-ID (Status GENERATING)
+
+        Raises:
+            ValueError: Wenn User/Content nicht existiert oder der Content bereits generiert wird
+            PermissionError: Wenn Rate-Limit erreicht
+        """
+        # 1. User & Subscription laden
+        user = await self.user_repo.get_by_id(request.user_id)
+        if not user:
+            raise ValueError(f"User {request.user_id} nicht gefunden")
+
+        subscription = await self.subscription_repo.get_by_user_id(request.user_id)
+        if not subscription:
+            raise ValueError(f"Keine Subscription für User {request.user_id}")
+
+        if request.content_id:
+            existing = await self.content_repo.get_by_id(request.content_id, request.user_id)
+            if not existing or existing.type != request.content_type:
+                raise ValueError(f"Content {request.content_id} nicht gefunden")
+            if existing.status == ContentStatus.GENERATING:
+                raise ValueError(f"Content {request.content_id} wird bereits generiert")
+
+        # 2. Rate-Limits prüfen - eingestellte, noch nicht generierte Jobs zählen als verbraucht
+        period_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        period_end = (period_start + timedelta(days=32)).replace(day=1) - timedelta(seconds=1)
+
+        current_usage = await self.usage_repo.get_current_usage(
+            user_id=request.user_id,
+            content_type=request.content_type,
+            period_start=period_start,
+            period_end=period_end
+        )
+        pending = await self.job_repo.count_pending(request.user_id, request.content_type)
+
+        can_generate, error_message = self.rate_limiter.can_generate(
+            subscription=subscription,
+            content_type=request.content_type,
+            current_usage=dataclasses.replace(current_usage, count=current_usage.count + pending)
+        )
+
+        if not can_generate:
+            raise PermissionError(error_message)
+
+        # 3. Platzhalter anlegen bzw. bestehenden Content als GENERATING markieren
+        if request.content_id:
+            content = await self.content_repo.update(
+                request.content_id,
+                request.user_id,
+                status=ContentStatus.GENERATING
+            )
+        else:
+            content = await self.content_repo.create(Content(
+                id=str(uuid.uuid4()),
+                user_id=request.user_id,
+                type=request.content_type,
+                status=ContentStatus.GENERATING,
+                data={},
+                prompt=request.prompt,
+                version=1,
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+                metadata=None
+            ))
+
+        # 4. Job einstellen
+        await self.job_repo.enqueue(GenerationJob(
+            content_id=content.id,
+            user_id=request.user_id,
+            content_type=request.content_type,
+            prompt=request.prompt,
+            params=request.params,
+            regenerate=bool(request.content_id)
+        ))
+        self.uow.mark_written(request.user_id)
+        await self.uow.commit()
+
+        # 5. Live-Event + Response zurückgeben
+        await self.progress.publish(request.user_id, ProgressEvent(
+            job_id=content.id,
+            kind=JobKind.GENERATION,
+            status=ProgressStatus.QUEUED,
+            data={"type": content.type.value, "regenerate": bool(request.content_id)}
+        ))
+        return GenerationJobResponseDTO(
+            content_id=content.id,
+            type=content.type,
+            status=ContentStatus.GENERATING
+        )
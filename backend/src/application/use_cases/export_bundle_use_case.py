@@ -0,0 +1,241 @@
+import asyncio
+import hashlib
+import uuid
+from collections import deque
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Deque, List, Optional, Tuple
+from ...domain.interfaces.content_repository import IContentRepository
+from ...domain.interfaces.user_repository import IUserRepository
+from ...domain.interfaces.subscription_repository import ISubscriptionRepository
+from ...domain.interfaces.unit_of_work import IUnitOfWork
+from ...domain.interfaces.progress_publisher import IProgressPublisher
+from ...domain.entities.content import Content, ContentStatus
+from ...domain.entities.progress import ProgressEvent, JobKind, ProgressStatus
+from ...infrastructure.pdf.pdf_cache import PDFDiskCache
+from ...infrastructure.pdf.pdf_generator import PDFGenerator
+from ...infrastructure.pdf.render_pool import PDFRenderPool
+from ...infrastructure.pdf.prerender import PDFPrerenderer
+from ..dto.content_dto import ExportBundleRequestDTO, ExportBundleResponseDTO, BundleFileDTO
+
+
+class ExportBundleUseCase:
+    """
+    Use Case für den Export mehrerer Contents als ein Bundle (ZIP mit einem PDF pro Content).
+
+    Flow:
+    1. Content-IDs prüfen (Duplikate entfernen, Limit)
+    2. User & Subscription laden
+    3. Alle Contents in einer Query laden - fehlt einer oder ist nicht fertig, schlägt der Export vor dem Streamen fehl
+    4. DB-Connection freigeben
+    5. PDFs parallel im PDFRenderPool rendern (bzw. aus dem PDFDiskCache) und in Reihenfolge weitergeben
+
+    Es rendern höchstens so viele PDFs gleichzeitig wie der Pool Worker hat, fertige
+    Dateien werden sofort ausgeliefert - der Speicher wächst nicht mit der Bundle-Größe.
+
+    Das fertige ZIP wird beim Streamen per store() im Bundle Cache abgelegt (Key: IDs +
+    Versionen + Template-Version, zugleich der ETag). Wiederholte bzw. fortgesetzte
+    Downloads kommen dann als Datei aus dem Cache (bundle_file), mit Range-Support.
+    """
+
+    MAX_CONTENTS = 100
+    BUSY_RETRY_SECONDS = 0.2
+
+    def __init__(
+        self,
+        content_repository: IContentRepository,
+        user_repository: IUserRepository,
+        subscription_repository: ISubscriptionRepository,
+        pdf_render_pool: PDFRenderPool,
+        pdf_cache: PDFDiskCache,
+        bundle_cache: PDFDiskCache,
+        unit_of_work: IUnitOfWork,
+        progress_publisher: Optional[IProgressPublisher] = None,
+        pdf_prerenderer: Optional[PDFPrerenderer] = None
+    ):
+        self.content_repo = content_repository
+        self.user_repo = user_repository
+        self.subscription_repo = subscription_repository
+        self.pdf_render_pool = pdf_render_pool
+        self.pdf_cache = pdf_cache
+        self.bundle_cache = bundle_cache
+        self.uow = unit_of_work
+        self.progress = progress_publisher
+        self.pdf_prerenderer = pdf_prerenderer
+
+    async def execute(self, request: ExportBundleRequestDTO) -> ExportBundleResponseDTO:
+        """
+        Bereitet den Bundle-Export vor. Gerendert wird erst beim Iterieren von files.
+
+        Args:
+            request: ExportBundleRequestDTO mit user_id und content_ids
+
+        Returns:
+            ExportBundleResponseDTO mit Dateiname und asynchronem Datei-Stream bzw. der Datei aus dem Cache
+
+        Raises:
+            ValueError: Bei ungültigen IDs, fehlenden oder nicht fertigen Contents
+            asyncio.QueueFull: Wenn der PDFRenderPool bereits ausgelastet ist
+        """
+        # 1. Content-IDs prüfen (Reihenfolge bleibt erhalten)
+        content_ids: List[str] = []
+        for content_id in request.content_ids:
+            try:
+                content_id = str(uuid.UUID(content_id))
+            except (TypeError, ValueError):
+                raise ValueError(f"Ungültige Content-ID: {content_id}")
+            if content_id not in content_ids:
+                content_ids.append(content_id)
+        if not content_ids:
+            raise ValueError("Mindestens eine Content-ID angeben")
+        if len(content_ids) > self.MAX_CONTENTS:
+            raise ValueError(f"Zu viele Contents (max. {self.MAX_CONTENTS} pro Bundle)")
+
+        # 2. User & Subscription laden
+        user = await self.user_repo.get_by_id(request.user_id)
+        if not user:
+            raise ValueError(f"User {request.user_id} nicht gefunden")
+
+        subscription = await self.subscription_repo.get_by_user_id(request.user_id)
+        if not subscription:
+            raise ValueError(f"Keine Subscription für User {request.user_id}")
+
+        # 3. Contents in einer Query laden
+        contents = await self.content_repo.get_many(content_ids, request.user_id)
+        found = {content.id for content in contents}
+        missing = [content_id for content_id in content_ids if content_id not in found]
+        if missing:
+            raise ValueError(f"Content nicht gefunden: {', '.join(missing)}")
+        pending = [content.id for content in contents if content.status != ContentStatus.COMPLETED]
+        if pending:
+            raise ValueError(f"Content ist noch nicht fertig generiert: {', '.join(pending)}")
+
+        # 4. DB-Connection wird fürs Rendern nicht gebraucht
+        await self.uow.release()
+
+        job_id = request.job_id or str(uuid.uuid4())
+        cache_key = self.bundle_key(contents)
+        result = ExportBundleResponseDTO(
+            filename=f"bundle_{len(contents)}_contents.zip",
+            count=len(contents),
+            job_id=job_id,
+            files=None,
+            cache_key=cache_key,
+            etag=f'"{cache_key}"',
+            bundle_file=await self.bundle_cache.open(cache_key)
+        )
+        if result.bundle_file is not None:
+            return result
+
+        # Nach Beginn des Streams lässt sich kein Statuscode mehr senden - also vorher ablehnen
+        if self.pdf_render_pool.saturated:
+            raise asyncio.QueueFull("PDF-Export ist gerade ausgelastet, bitte gleich nochmal versuchen")
+
+        result.files = self._stream(request.user_id, job_id, contents)
+        return result
+
+    @staticmethod
+    def bundle_key(contents: List[Content]) -> str:
+        """Gleiche Contents in gleicher Reihenfolge und Version → gleiches ZIP (Dateinamen enthalten die Position)"""
+        digest = hashlib.sha256("|".join(f"{content.id}:{content.version}" for content in contents).encode())
+        return f"bundle-{digest.hexdigest()[:32]}-t{PDFGenerator.TEMPLATE_VERSION}"
+
+    async def store(self, result: ExportBundleResponseDTO, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """
+        Reicht die ZIP-Chunks durch und schreibt sie parallel in den Bundle Cache.
+        Nur ein vollständig geschriebenes ZIP wird übernommen (Abbruch → verworfen).
+        """
+        spool = await self.bundle_cache.spool()
+        if spool is None:
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        file, tmp_path = spool
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(file.write, chunk)
+                yield chunk
+        except BaseException:
+            file.close()
+            self.bundle_cache.discard(tmp_path)
+            raise
+        file.close()
+        await self.bundle_cache.put_file(result.cache_key, tmp_path)
+
+    async def build(self, result: ExportBundleResponseDTO, chunks: AsyncIterable[bytes]) -> BinaryIO:
+        """
+        Schreibt das ganze ZIP in den Bundle Cache und gibt die geöffnete Datei zurück
+        (für Range-Requests auf ein noch nicht gespeichertes Bundle).
+
+        Raises:
+            OSError: Wenn das Bundle nicht gespeichert werden konnte (Cache aus/voll)
+        """
+        async for _ in self.store(result, chunks):
+            pass
+        bundle_file = await self.bundle_cache.open(result.cache_key)
+        if bundle_file is None:
+            raise OSError("Bundle konnte nicht zwischengespeichert werden")
+        return bundle_file
+
+    async def _stream(self, user_id: str, job_id: str, contents: List[Content]) -> AsyncIterator[BundleFileDTO]:
+        """5. Rendert mit begrenztem Fenster parallel und gibt die Dateien in Reihenfolge weiter"""
+        window = max(self.pdf_render_pool.workers, 1)
+        queue = iter(enumerate(contents, 1))
+        running: Deque[Tuple[int, Content, asyncio.Task]] = deque()
+
+        def schedule() -> None:
+            for index, content in queue:
+                running.append((index, content, asyncio.create_task(self._render(content))))
+                return
+
+        for _ in range(window):
+            schedule()
+
+        await self._publish(user_id, job_id, ProgressStatus.STARTED, {"total": len(contents)})
+        try:
+            while running:
+                index, content, task = running.popleft()
+                pdf_bytes = await task
+                schedule()
+                yield BundleFileDTO(
+                    filename=f"{index:03d}_{content.type.value}_{content.created_at.strftime('%Y%m%d_%H%M%S')}.pdf",
+                    created_at=content.created_at,
+                    pdf_bytes=pdf_bytes
+                )
+                await self._publish(user_id, job_id, ProgressStatus.PARTIAL, {
+                    "rendered": index, "total": len(contents)
+                })
+        except BaseException as e:
+            for _, _, task in running:
+                task.cancel()
+            if isinstance(e, Exception):
+                await self._publish(user_id, job_id, ProgressStatus.FAILED, {"error": str(e)})
+            raise
+        await self._publish(user_id, job_id, ProgressStatus.COMPLETED, {"rendered": len(contents)})
+
+    async def _render(self, content: Content) -> bytes:
+        """PDF aus dem Cache oder neu rendern; bei voller Render-Queue kurz warten statt abzubrechen"""
+        cache_key = self.pdf_cache.key(content.id, content.version, PDFGenerator.TEMPLATE_VERSION)
+        pdf_bytes = await self.pdf_cache.get(cache_key)
+        if pdf_bytes is not None:
+            self._record_export(content, cache_key, cache_hit=True)
+            return pdf_bytes
+
+        while True:
+            try:
+                pdf_bytes = await self.pdf_render_pool.render(
+                    content.type, content.data, content.prompt, generated_at=content.created_at
+                )
+                break
+            except asyncio.QueueFull:
+                await asyncio.sleep(self.BUSY_RETRY_SECONDS)
+        await self.pdf_cache.put(cache_key, pdf_bytes)
+        self._record_export(content, cache_key, cache_hit=False)
+        return pdf_bytes
+
+    def _record_export(self, content: Content, cache_key: str, cache_hit: bool) -> None:
+        if self.pdf_prerenderer is not None:
+            self.pdf_prerenderer.record_export(content.user_id, content.type, cache_key, cache_hit)
+
+    async def _publish(self, user_id: str, job_id: str, status: ProgressStatus, data: dict) -> None:
+        if self.progress is not None:
+            await self.progress.publish(user_id, ProgressEvent(job_id=job_id, kind=JobKind.EXPORT, status=status, data=data))
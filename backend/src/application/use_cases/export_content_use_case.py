@@ -0,0 +1,72 @@
+import json
+import uuid
+from typing import Any, AsyncIterator, Dict, Optional
+from ...domain.interfaces.content_repository import IContentRepository
+from ...domain.interfaces.progress_publisher import IProgressPublisher
+from ...domain.entities.content import Content
+from ...domain.entities.progress import ProgressEvent, JobKind, ProgressStatus
+
+
+# Felder einer NDJSON-Zeile (Format von Export und Import)
+NDJSON_FIELDS = ("id", "type", "status", "prompt", "data", "version", "metadata", "created_at", "updated_at")
+
+
+def content_to_record(content: Content) -> Dict[str, Any]:
+    """Content → JSON-serialisierbares Dict (eine NDJSON-Zeile)"""
+    return {
+        "id": content.id,
+        "type": content.type.value,
+        "status": content.status.value,
+        "prompt": content.prompt,
+        "data": content.data,
+        "version": content.version,
+        "metadata": content.metadata,
+        "created_at": content.created_at.isoformat() if content.created_at else None,
+        "updated_at": content.updated_at.isoformat() if content.updated_at else None,
+    }
+
+
+class ExportContentUseCase:
+    """
+    Use Case für den Voll-Export aller Contents eines Users als NDJSON.
+
+    Flow:
+    1. Contents per Server-Side Cursor aus dem Repository streamen
+    2. Jede Zeile sofort serialisieren und weitergeben
+
+    Der Speicherverbrauch ist unabhängig von der Anzahl der Contents.
+    Mit progress_publisher wird der Fortschritt (alle BATCH_SIZE Zeilen) live gemeldet.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, content_repository: IContentRepository, progress_publisher: Optional[IProgressPublisher] = None):
+        self.content_repo = content_repository
+        self.progress = progress_publisher
+
+    async def stream(self, user_id: str, job_id: Optional[str] = None) -> AsyncIterator[bytes]:
+        """
+        Liefert den Export als Folge von NDJSON-Zeilen (UTF-8, je mit \\n).
+
+        Args:
+            user_id: User dessen Contents exportiert werden
+            job_id: ID für die Fortschritts-Events (Default: neue UUID)
+        """
+        job_id = job_id or str(uuid.uuid4())
+        exported = 0
+        await self._publish(user_id, job_id, ProgressStatus.STARTED, {})
+        try:
+            async for content in self.content_repo.stream_all(user_id, batch_size=self.BATCH_SIZE):
+                line = json.dumps(content_to_record(content), ensure_ascii=False, separators=(",", ":"))
+                yield line.encode("utf-8") + b"\n"
+                exported += 1
+                if exported % self.BATCH_SIZE == 0:
+                    await self._publish(user_id, job_id, ProgressStatus.PARTIAL, {"exported": exported})
+        except Exception as e:
+            await self._publish(user_id, job_id, ProgressStatus.FAILED, {"exported": exported, "error": str(e)})
+            raise
+        await self._publish(user_id, job_id, ProgressStatus.COMPLETED, {"exported": exported})
+
+    async def _publish(self, user_id: str, job_id: str, status: ProgressStatus, data: dict) -> None:
+        if self.progress is not None:
+            await self.progress.publish(user_id, ProgressEvent(job_id=job_id, kind=JobKind.EXPORT, status=status, data=data))
@@ -0,0 +1,81 @@
+from ...domain.entities.content import ContentStatus
+from ...domain.interfaces.content_repository import IContentRepository
+from ...domain.interfaces.unit_of_work import IUnitOfWork
+from ...infrastructure.pdf.data_exporter import DataExporter, FORMATS, PDF
+from ..dto.content_dto import ExportDataRequestDTO, ExportDataResponseDTO
+
+
+class ExportDataUseCase:
+    """
+    Use Case für maschinenlesbare Exports (CSV, ICS, SRT/VTT) - die render-freie
+    Alternative zum PDF für User, die Content in andere Tools importieren.
+
+    Flow:
+    1. Content aus DB laden (nur eigene Contents)
+    2. Format wählen: ?format= oder Content Negotiation über den Accept Header
+    3. Direkt serialisieren (DataExporter, kein PDFRenderPool)
+
+    Ist PDF das beste Format (z.B. Voiceover oder Accept: application/pdf), gibt der Use
+    Case nur format="pdf" zurück - der Export läuft dann über ExportPDFUseCase (Cache,
+    ETag, Pool). Zählt wie der PDF-Export nicht gegen Limits.
+    """
+
+    def __init__(self, content_repository: IContentRepository, data_exporter: DataExporter, unit_of_work: IUnitOfWork):
+        self.content_repo = content_repository
+        self.data_exporter = data_exporter
+        self.uow = unit_of_work
+
+    async def execute(self, request: ExportDataRequestDTO) -> ExportDataResponseDTO:
+        """
+        Exportiert Content im gewählten bzw. ausgehandelten Format.
+
+        Args:
+            request: ExportDataRequestDTO mit user_id, content_id, optional format/accept/start
+
+        Returns:
+            ExportDataResponseDTO mit Format, Media Type, Dateiname und bytes
+
+        Raises:
+            ValueError: Wenn der Content nicht existiert oder nicht fertig generiert ist
+            PermissionError: Wenn der Content nicht dem User gehört
+        """
+        # 1. Content laden
+        content = await self.content_repo.get_by_id(request.content_id, request.user_id)
+        if not content:
+            raise ValueError(f"Content {request.content_id} nicht gefunden")
+
+        if content.user_id != request.user_id:
+            raise PermissionError("Content gehört nicht diesem User")
+
+        # Platzhalter (GENERATING) und fehlgeschlagene Generierungen haben keine Daten -
+        # vor der Negotiation ablehnen, damit auch der PDF-Zweig nicht erst erreicht wird
+        if content.status != ContentStatus.COMPLETED:
+            raise ValueError(f"Content {request.content_id} ist noch nicht fertig generiert")
+        await self.uow.release()
+
+        # 2. Format wählen
+        offered = self.data_exporter.formats(content.type)
+        if request.format:
+            export_format = FORMATS.get(request.format.lower())
+            if export_format not in offered:
+                export_format = None
+        else:
+            export_format = self.data_exporter.negotiate(content.type, request.accept)
+
+        result = ExportDataResponseDTO(
+            content_id=content.id,
+            content_type=content.type,
+            format=export_format.name if export_format else None,
+            available=[offer.name for offer in offered]
+        )
+        if export_format is None or export_format == PDF:
+            return result
+
+        # 3. Serialisieren (Filename wie beim PDF aus created_at)
+        lines = self.data_exporter.serialize(
+            content.type, export_format, content.data, content.id, content.created_at, start=request.start
+        )
+        result.body = "".join(lines).encode("utf-8")
+        result.media_type = export_format.media_type
+        result.filename = f"{content.type.value}_{content.created_at.strftime('%Y%m%d_%H%M%S')}.{export_format.extension}"
+        return result
@@ -1,18 +1,16 @@
-from datetime import datetime, timedelta
+import asyncio
+from typing import Optional
+from ...domain.entities.content import ContentStatus
 from ...domain.interfaces.content_repository import IContentRepository
 from ...domain.interfaces.user_repository import IUserRepository
 from ...domain.interfaces.subscription_repository import ISubscriptionRepository
 from ...domain.interfaces.usage_repository import IUsageRepository
-from ...domain.entities.content import ContentType
-from ...domain.entities.hook import HookContent
-from ...domain.entities.script import ScriptContent, SceneContent
-from ...domain.entities.shotlist import ShotlistContent
-from ...domain.entities.voiceover import VoiceoverContent
-from ...domain.entities.caption import CaptionContent
-from ...domain.entities.broll import BRollContent
-from ...domain.entities.calendar import CalendarContent, DayContent
+from ...domain.interfaces.unit_of_work import IUnitOfWork
 from ...domain.services.rate_limiter import RateLimiter
+from ...infrastructure.pdf.pdf_cache import PDFDiskCache
 from ...infrastructure.pdf.pdf_generator import PDFGenerator
+from ...infrastructure.pdf.render_pool import PDFRenderPool
+from ...infrastructure.pdf.prerender import PDFPrerenderer
 from ..dto.content_dto import ExportPDFRequestDTO, ExportPDFResponseDTO
 
 
@@ -24,9 +22,16 @@ class ExportPDFUseCase:
     1. User & Subscription laden
     2. PDF-Export Limits prüfen
     3. Content aus DB laden
-    4. PDF generieren (basierend auf Content Type)
+    4. PDF generieren (basierend auf Content Type, im PDFRenderPool außerhalb des Event Loops)
     5. Usage-Counter erhöhen
     6. PDF bytes zurückgeben
+
+    Gerenderte PDFs landen im PDFDiskCache (Key: Content-ID, Version, Template-Version).
+    Derselbe Key ist auch der starke ETag - passt If-None-Match, wird gar nicht erst
+    gelesen oder gerendert (not_modified → 304). Cache-Treffer werden als geöffnete Datei
+    zurückgegeben, nicht eingelesen.
+
+    Ausgelieferte PDFs werden dem PDFPrerenderer gemeldet (Export-Rate pro User/Typ, Trefferquote).
     """
 
     def __init__(
@@ -35,29 +40,36 @@ class ExportPDFUseCase:
         user_repository: IUserRepository,
         subscription_repository: ISubscriptionRepository,
         usage_repository: IUsageRepository,
-        pdf_generator: PDFGenerator,
-        rate_limiter: RateLimiter
+        pdf_render_pool: PDFRenderPool,
+        pdf_cache: PDFDiskCache,
+        rate_limiter: RateLimiter,
+        unit_of_work: IUnitOfWork,
+        pdf_prerenderer: Optional[PDFPrerenderer] = None
     ):
         self.content_repo = content_repository
         self.user_repo = user_repository
         self.subscription_repo = subscription_repository
         self.usage_repo = usage_repository
-        self.pdf_generator = pdf_generator
+        self.pdf_render_pool = pdf_render_pool
+        self.pdf_cache = pdf_cache
         self.rate_limiter = rate_limiter
+        self.uow = unit_of_work
+        self.pdf_prerenderer = pdf_prerenderer
 
     async def execute(self, request: ExportPDFRequestDTO) -> ExportPDFResponseDTO:
         """
         Exportiert Content als PDF.
 
         Args:
-            request: ExportPDFRequestDTO mit user_id, content_id
+            request: ExportPDFRequestDTO mit user_id, content_id, optional if_none_match
 
         Returns:
-            ExportPDFResponseDTO mit PDF bytes
+            ExportPDFResponseDTO mit PDF-Datei bzw. bytes und ETag (ohne beides wenn not_modified)
 
         Raises:
-            ValueError: Wenn User oder Content nicht existiert
+            ValueError: Wenn User oder Content nicht existiert oder der Content nicht fertig generiert ist
             PermissionError: Wenn PDF-Limit erreicht oder Content nicht gehört User
+            asyncio.QueueFull: Wenn der PDFRenderPool ausgelastet ist
         """
         # 1. User & Subscription laden
         user = await self.user_repo.get_by_id(request.user_id)
@@ -69,7 +81,7 @@ class ExportPDFUseCase:
             raise ValueError(f"Keine Subscription für User {request.user_id}")
 
         # 2. Content laden
-        content = await self.content_repo.get_by_id(request.content_id)
+        content = await self.content_repo.get_by_id(request.content_id, request.user_id)
         if not content:
             raise ValueError(f"Content {request.content_id} nicht gefunden")
 
@@ -77,93 +89,62 @@ class ExportPDFUseCase:
         if content.user_id != request.user_id:
             raise PermissionError("Content gehört nicht diesem User")
 
+        # Platzhalter (GENERATING) und fehlgeschlagene Generierungen haben keine Daten zum Rendern
+        if content.status != ContentStatus.COMPLETED:
+            raise ValueError(f"Content {request.content_id} ist noch nicht fertig generiert")
+
         # 3. PDF-Export Limits prüfen
         # Hinweis: PDF Export hat eigenes Limit (nicht per Content Type)
         # Für simplified implementation: Keine separate PDF Usage Tracking
         # In production würde man ein separates PDF_EXPORT ContentType tracken
 
-        # 4. PDF generieren (basierend auf Content Type)
-        try:
-            pdf_bytes = await self._generate_pdf_for_content(content)
-        except Exception as e:
-            raise Exception(f"Fehler bei PDF-Generierung: {str(e)}")
+        # 4. PDF aus Cache bzw. neu generieren - DB-Connection wird dafür nicht gebraucht
+        await self.uow.release()
+        cache_key = self.pdf_cache.key(content.id, content.version, PDFGenerator.TEMPLATE_VERSION)
+        etag = f'"{cache_key}"'
+        # 5. Filename generieren (aus created_at, damit er zum ETag passt)
+        filename = f"{content.type.value}_{content.created_at.strftime('%Y%m%d_%H%M%S')}.pdf"
+
+        if self._etag_matches(request.if_none_match, etag):
+            return ExportPDFResponseDTO(
+                content_id=content.id,
+                content_type=content.type,
+                pdf_bytes=None,
+                filename=filename,
+                etag=etag,
+                not_modified=True
+            )
 
-        # 5. Filename generieren
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{content.type.value}_{timestamp}.pdf"
+        pdf_file = await self.pdf_cache.open(cache_key)
+        pdf_bytes = None
+        cache_hit = pdf_file is not None
+        if not cache_hit:
+            try:
+                pdf_bytes = await self.pdf_render_pool.render(
+                    content.type, content.data, content.prompt, generated_at=content.created_at
+                )
+            except asyncio.QueueFull:
+                raise
+            except Exception as e:
+                raise Exception(f"Fehler bei PDF-Generierung: {str(e)}")
+            await self.pdf_cache.put(cache_key, pdf_bytes)
+        if self.pdf_prerenderer is not None:
+            self.pdf_prerenderer.record_export(content.user_id, content.type, cache_key, cache_hit)
 
         # 6. Response zurückgeben
         return ExportPDFResponseDTO(
             content_id=content.id,
             content_type=content.type,
             pdf_bytes=pdf_bytes,
-            filename=filename
+            filename=filename,
+            etag=etag,
+            pdf_file=pdf_file
         )
 
-    async def _generate_pdf_for_content(self, content) -> bytes:
-        """Generiert PDF basierend auf Content Type"""
-        content_type = content.type
-        data = content.data
-        prompt = content.prompt
-
-        if content_type == ContentType.HOOK:
-            hook_content = HookContent(hooks=data["hooks"])
-            return self.pdf_generator.generate_hook_pdf(hook_content, prompt)
-
-        elif content_type == ContentType.SCRIPT:
-            scenes = [
-                Scene(
-                    scene_number=scene["scene_number"],
-                    type=scene["type"],
-                    text=scene["text"],
-                    visual_description=scene["visual_description"],
-                    duration_seconds=scene["duration_seconds"]
-                )
-                for scene in data["scenes"]
-            ]
-            script_content = ScriptContent(
-                scenes=scenes,
-                cta=data["cta"],
-                total_duration=data["total_duration"]
-            )
-            return self.pdf_generator.generate_script_pdf(script_content, prompt)
-
-        elif content_type == ContentType.SHOTLIST:
-            shotlist_content = ShotlistContent(shots=data["shots"])
-            return self.pdf_generator.generate_shotlist_pdf(shotlist_content, prompt)
-
-        elif content_type == ContentType.VOICEOVER:
-            voiceover_content = VoiceoverContent(
-                text=data["text"],
-                estimated_duration=data["estimated_duration"]
-            )
-            return self.pdf_generator.generate_voiceover_pdf(voiceover_content, prompt)
-
-        elif content_type == ContentType.CAPTION:
-            caption_content = CaptionContent(
-                caption=data["caption"],
-                hashtags=data["hashtags"]
-            )
-            return self.pdf_generator.generate_caption_pdf(caption_content, prompt)
-
-        elif content_type == ContentType.BROLL:
-            broll_content = BRollContent(ideas=data["ideas"])
-            return self.pdf_generator.generate_broll_pdf(broll_content, prompt)
-
-        elif content_type == ContentType.CALENDAR:
-            days = {
-                int(day_num): DayContent(
-                    day=day_data["day"],
-                    hook=day_data["hook"],
-                    theme=day_data["theme"]
-                )
-                for day_num, day_data in data["days"].items()
-            }
-            calendar_content = CalendarContent(
-                niche=data["niche"],
-                days=days
-            )
-            return self.pdf_generator.generate_calendar_pdf(calendar_content, prompt)
-
-        else:
-            raise ValueError(f"Unbekannter Content Type: {content_type}")
+    @staticmethod
+    def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """If-None-Match Vergleich (RFC 9110: schwacher Vergleich, Liste oder *)"""
+        if not if_none_match:
+            return False
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
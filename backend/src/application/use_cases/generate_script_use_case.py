@@ -5,11 +5,13 @@ from ...domain.interfaces.content_repository import IContentRepository
 from ...domain.interfaces.user_repository import IUserRepository
 from ...domain.interfaces.subscription_repository import ISubscriptionRepository
 from ...domain.interfaces.usage_repository import IUsageRepository
+from ...domain.interfaces.unit_of_work import IUnitOfWork
 from ...domain.entities.content import Content, ContentType, ContentStatus
 from ...domain.entities.script import ScriptContent
 from ...domain.services.rate_limiter import RateLimiter
 from ...domain.services.content_validator import ContentValidator
 from ...infrastructure.ai_services.claude_service import ClaudeService
+from ...infrastructure.pdf.prerender import PDFPrerenderer
 from ..dto.content_dto import GenerateScriptRequestDTO, ScriptResponseDTO, SceneDTO
 
 
@@ -24,7 +26,9 @@ class GenerateScriptUseCase:
         usage_repository: IUsageRepository,
         claude_service: ClaudeService,
         rate_limiter: RateLimiter,
-        content_validator: ContentValidator
+        content_validator: ContentValidator,
+        unit_of_work: IUnitOfWork,
+        pdf_prerenderer: Optional[PDFPrerenderer] = None
     ):
         self.content_repo = content_repository
         self.user_repo = user_repository
@@ -33,6 +37,8 @@ class GenerateScriptUseCase:
         self.claude_service = claude_service
         self.rate_limiter = rate_limiter
         self.content_validator = content_validator
+        self.uow = unit_of_work
+        self.pdf_prerenderer = pdf_prerenderer
 
     async def execute(self, request: GenerateScriptRequestDTO) -> ScriptResponseDTO:
         """Generiert Reel-Script mit 2-4 Szenen"""
@@ -46,6 +52,15 @@ class GenerateScriptUseCase:
         if not subscription:
             raise ValueError(f"Keine Subscription für User {request.user_id}")
 
+        # Regenerierung: Content muss dem User gehören, vom gleichen Typ sein und darf nicht
+        # gerade asynchron generiert werden (außer dieser Aufruf ist der Job des Workers)
+        if request.content_id:
+            existing = await self.content_repo.get_by_id(request.content_id, request.user_id)
+            if not existing or existing.type != ContentType.SCRIPT:
+                raise ValueError(f"Content {request.content_id} nicht gefunden")
+            if existing.status == ContentStatus.GENERATING and not request.queued:
+                raise ValueError(f"Content {request.content_id} wird bereits generiert")
+
         # 2. Rate-Limits prüfen
         period_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         period_end = (period_start + timedelta(days=32)).replace(day=1) - timedelta(seconds=1)
@@ -66,7 +81,8 @@ class GenerateScriptUseCase:
         if not can_generate:
             raise PermissionError(error_message)
 
-        # 3. Claude API aufrufen
+        # 3. Claude API aufrufen (DB-Connection vorher freigeben)
+        await self.uow.release()
         try:
             script_content = await self.claude_service.generate_script(
                 prompt=request.prompt,
@@ -82,9 +98,9 @@ class GenerateScriptUseCase:
         except Exception as e:
             raise Exception(f"Validierung fehlgeschlagen: {str(e)}")
 
-        # 5. In Datenbank speichern
+        # 5. In Datenbank speichern (Content bzw. neue Version + Usage in einer Transaktion)
         content = Content(
-            id=str(uuid.uuid4()),
+            id=request.content_id or str(uuid.uuid4()),
             user_id=request.user_id,
             type=ContentType.SCRIPT,
             status=ContentStatus.COMPLETED,
@@ -112,7 +128,20 @@ class GenerateScriptUseCase:
             }
         )
 
-        saved_content = await self.content_repo.create(content)
+        if request.complete_pending:
+            # Asynchrone Generierung (GenerationWorker): Platzhalter vervollständigen
+            saved_content = await self.content_repo.update(
+                content.id,
+                content.user_id,
+                data=content.data,
+                status=content.status,
+                prompt=content.prompt,
+                metadata=content.metadata
+            )
+        elif request.content_id:
+            saved_content = await self.content_repo.add_version(content)
+        else:
+            saved_content = await self.content_repo.create(content)
 
         # 6. Usage-Counter erhöhen
         await self.usage_repo.increment_usage(
@@ -121,6 +150,11 @@ class GenerateScriptUseCase:
             period_start=period_start,
             period_end=period_end
         )
+        await self.uow.commit()
+
+        # PDF für bezahlte Pläne spekulativ vorrendern (im Hintergrund, blockiert nicht)
+        if self.pdf_prerenderer is not None:
+            self.pdf_prerenderer.submit(saved_content, subscription.plan)
 
         # 7. Response zurückgeben
         return ScriptResponseDTO(
@@ -138,5 +172,6 @@ class GenerateScriptUseCase:
             cta=script_content.cta,
             total_duration=script_content.total_duration,
             prompt=request.prompt,
-            created_at=saved_content.created_at
+            created_at=saved_content.created_at,
+            version=saved_content.version
         )
@@ -0,0 +1,34 @@
+from ...domain.interfaces.content_repository import IContentRepository
+from ...domain.entities.content import ContentStatus
+from ..dto.content_dto import ContentStatusRequestDTO, ContentStatusDTO
+
+
+class GetContentStatusUseCase:
+    """
+    Use Case für den Generierungs-Status eines Contents (Polling nach ?async=true).
+    Liefert die Daten erst, wenn die Generierung abgeschlossen ist.
+    """
+
+    def __init__(self, content_repository: IContentRepository):
+        self.content_repo = content_repository
+
+    async def execute(self, request: ContentStatusRequestDTO) -> ContentStatusDTO:
+        """
+        Holt Status, Version und - falls abgeschlossen - die Daten eines Contents.
+
+        Raises:
+            ValueError: Wenn Content nicht existiert
+        """
+        content = await self.content_repo.get_by_id(request.content_id, request.user_id)
+        if not content:
+            raise ValueError(f"Content {request.content_id} nicht gefunden")
+
+        return ContentStatusDTO(
+            id=content.id,
+            type=content.type,
+            status=content.status,
+            version=content.version,
+            updated_at=content.updated_at,
+            data=content.data if content.status == ContentStatus.COMPLETED else None,
+            error=(content.metadata or {}).get("error") if content.status == ContentStatus.FAILED else None
+        )
@@ -0,0 +1,38 @@
+from ...domain.interfaces.content_repository import IContentRepository
+from ..dto.content_dto import ContentVersionRequestDTO, ContentDetailDTO
+
+
+class GetContentVersionUseCase:
+    """
+    Use Case für den Abruf einer bestimmten Content-Version.
+    Ältere Versionen rekonstruiert das Repository aus Snapshot + JSON Patches.
+    """
+
+    def __init__(self, content_repository: IContentRepository):
+        self.content_repo = content_repository
+
+    async def execute(self, request: ContentVersionRequestDTO) -> ContentDetailDTO:
+        """
+        Holt einen Content im Stand von request.version.
+
+        Raises:
+            ValueError: Wenn Content oder Version nicht existiert
+        """
+        if request.version is None or request.version < 1:
+            raise ValueError("Version muss eine positive Ganzzahl sein")
+
+        content = await self.content_repo.get_version(request.content_id, request.user_id, request.version)
+        if not content:
+            raise ValueError(f"Version {request.version} von Content {request.content_id} nicht gefunden")
+
+        return ContentDetailDTO(
+            id=content.id,
+            user_id=content.user_id,
+            type=content.type,
+            status=content.status,
+            data=content.data,
+            prompt=content.prompt,
+            version=content.version,
+            created_at=content.created_at,
+            updated_at=content.updated_at
+        )
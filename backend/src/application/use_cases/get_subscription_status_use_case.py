@@ -1,7 +1,9 @@
 from datetime import datetime, timedelta
+from typing import Optional
 from ...domain.interfaces.user_repository import IUserRepository
 from ...domain.interfaces.subscription_repository import ISubscriptionRepository
 from ...domain.interfaces.usage_repository import IUsageRepository
+from ...domain.interfaces.status_cache import ISubscriptionStatusCache
 from ...domain.entities.content import ContentType
 from ...domain.entities.subscription import PLAN_LIMITS
 from ..dto.subscription_dto import SubscriptionStatusResponseDTO, SubscriptionResponseDTO, UsageLimitDTO, CurrentUsageDTO
@@ -16,17 +18,22 @@ class GetSubscriptionStatusUseCase:
     - Plan Limits
     - Current Usage
     - Remaining Quota
+
+    Das Ergebnis wird pro User kurz gecacht (status_cache), da das Frontend
+    den Status pollt. Usage-Writes und Webhooks invalidieren den Eintrag.
     """
 
     def __init__(
         self,
         user_repository: IUserRepository,
         subscription_repository: ISubscriptionRepository,
-        usage_repository: IUsageRepository
+        usage_repository: IUsageRepository,
+        status_cache: Optional[ISubscriptionStatusCache] = None
     ):
         self.user_repo = user_repository
         self.subscription_repo = subscription_repository
         self.usage_repo = usage_repository
+        self.status_cache = status_cache
 
     async def execute(self, user_id: str) -> SubscriptionStatusResponseDTO:
         """
@@ -41,99 +48,60 @@ class GetSubscriptionStatusUseCase:
         Raises:
             ValueError: Wenn User oder Subscription nicht existiert
         """
+        # 0. Gecachten Status verwenden
+        if self.status_cache is not None:
+            cached = self.status_cache.get(user_id)
+            if cached is not None:
+                return cached
+
         # 1. User laden
         user = await self.user_repo.get_by_id(user_id)
         if not user:
             raise ValueError(f"User {user_id} nicht gefunden")
 
-        # 2. Subscription laden
-        subscription = await self.subscription_repo.get_by_user_id(user_id)
-        if not subscription:
-            raise ValueError(f"Keine Subscription für User {user_id}")
-
-        # 3. Plan Limits holen
-        plan_limits = PLAN_LIMITS[subscription.plan]
-
-        # 4. Current Usage laden
+        # 2. Subscription + Usage aller Content Types laden (eine Query, GROUP BY)
         period_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         period_end = (period_start + timedelta(days=32)).replace(day=1) - timedelta(seconds=1)
 
-        # Usage für jeden Content Type laden
-        hook_usage = await self.usage_repo.get_current_usage(
+        subscription_with_usage = await self.subscription_repo.get_by_user_id_with_usage(
             user_id=user_id,
-            content_type=ContentType.HOOK,
-            period_start=period_start,
-            period_end=period_end
-        )
-
-        script_usage = await self.usage_repo.get_current_usage(
-            user_id=user_id,
-            content_type=ContentType.SCRIPT,
-            period_start=period_start,
-            period_end=period_end
-        )
-
-        shotlist_usage = await self.usage_repo.get_current_usage(
-            user_id=user_id,
-            content_type=ContentType.SHOTLIST,
-            period_start=period_start,
-            period_end=period_end
-        )
-
-        voiceover_usage = await self.usage_repo.get_current_usage(
-            user_id=user_id,
-            content_type=ContentType.VOICEOVER,
-            period_start=period_start,
-            period_end=period_end
-        )
-
-        caption_usage = await self.usage_repo.get_current_usage(
-            user_id=user_id,
-            content_type=ContentType.CAPTION,
             period_start=period_start,
             period_end=period_end
         )
+        if not subscription_with_usage:
+            raise ValueError(f"Keine Subscription für User {user_id}")
 
-        broll_usage = await self.usage_repo.get_current_usage(
-            user_id=user_id,
-            content_type=ContentType.BROLL,
-            period_start=period_start,
-            period_end=period_end
-        )
+        subscription, usage = subscription_with_usage
 
-        calendar_usage = await self.usage_repo.get_current_usage(
-            user_id=user_id,
-            content_type=ContentType.CALENDAR,
-            period_start=period_start,
-            period_end=period_end
-        )
+        # 3. Plan Limits holen
+        plan_limits = PLAN_LIMITS[subscription.plan]
 
-        # 5. Current Usage DTO erstellen
+        # 4. Current Usage DTO erstellen
         current_usage = CurrentUsageDTO(
-            hook=hook_usage.count if hook_usage else 0,
-            script=script_usage.count if script_usage else 0,
-            shotlist=shotlist_usage.count if shotlist_usage else 0,
-            voiceover=voiceover_usage.count if voiceover_usage else 0,
-            caption=caption_usage.count if caption_usage else 0,
-            broll=broll_usage.count if broll_usage else 0,
-            calendar=calendar_usage.count if calendar_usage else 0,
+            hook=usage.count_for(ContentType.HOOK),
+            script=usage.count_for(ContentType.SCRIPT),
+            shotlist=usage.count_for(ContentType.SHOTLIST),
+            voiceover=usage.count_for(ContentType.VOICEOVER),
+            caption=usage.count_for(ContentType.CAPTION),
+            broll=usage.count_for(ContentType.BROLL),
+            calendar=usage.count_for(ContentType.CALENDAR),
             pdf=0  # PDF Usage wird separat getrackt
         )
 
-        # 6. Remaining berechnen
+        # 5. Remaining berechnen
         remaining = {
-            "hook": max(0, plan_limits.hook_per_month - current_usage.hook) if plan_limits.hook_per_month != -1 else -1,
-            "script": max(0, plan_limits.script_per_month - current_usage.script) if plan_limits.script_per_month != -1 else -1,
-            "shotlist": max(0, plan_limits.shotlist_per_month - current_usage.shotlist) if plan_limits.shotlist_per_month != -1 else -1,
-            "voiceover": max(0, plan_limits.voiceover_per_month - current_usage.voiceover) if plan_limits.voiceover_per_month != -1 else -1,
-            "caption": max(0, plan_limits.caption_per_month - current_usage.caption) if plan_limits.caption_per_month != -1 else -1,
-            "broll": max(0, plan_limits.broll_per_month - current_usage.broll) if plan_limits.broll_per_month != -1 else -1,
-            "calendar": max(0, plan_limits.calendar_per_month - current_usage.calendar) if plan_limits.calendar_per_month != -1 else -1,
-            "pdf": max(0, plan_limits.pdf_per_month - current_usage.pdf) if plan_limits.pdf_per_month != -1 else -1,
+            "hook": self._remaining(plan_limits.hook_per_month, current_usage.hook),
+            "script": self._remaining(plan_limits.script_per_month, current_usage.script),
+            "shotlist": self._remaining(plan_limits.shotlist_per_month, current_usage.shotlist),
+            "voiceover": self._remaining(plan_limits.voiceover_per_month, current_usage.voiceover),
+            "caption": self._remaining(plan_limits.caption_per_month, current_usage.caption),
+            "broll": self._remaining(plan_limits.broll_per_month, current_usage.broll),
+            "calendar": self._remaining(plan_limits.calendar_per_month, current_usage.calendar),
+            "pdf": self._remaining(plan_limits.pdf_exports_per_month, current_usage.pdf),
         }
 
-        # 7. Response erstellen
-        return SubscriptionStatusResponseDTO(
+        # 6. Response erstellen
+        response = SubscriptionStatusResponseDTO(
             subscription=SubscriptionResponseDTO(
                 id=subscription.id,
                 user_id=subscription.user_id,
@@ -152,8 +120,20 @@ class GetSubscriptionStatusUseCase:
                 caption_per_month=plan_limits.caption_per_month,
                 broll_per_month=plan_limits.broll_per_month,
                 calendar_per_month=plan_limits.calendar_per_month,
-                pdf_per_month=plan_limits.pdf_per_month
+                pdf_per_month=plan_limits.pdf_exports_per_month
             ),
             current_usage=current_usage,
             remaining=remaining
         )
+
+        if self.status_cache is not None:
+            self.status_cache.set(user_id, response)
+
+        return response
+
+    @staticmethod
+    def _remaining(limit: int, used: int) -> int:
+        """Verbleibende Quota (-1 = unlimited)"""
+        if limit == -1:
+            return -1
+        return max(0, limit - used)
@@ -0,0 +1,88 @@
+from ...domain.interfaces.usage_analytics_repository import IUsageAnalyticsRepository
+from ...domain.entities.analytics import ANALYTICS_DIMENSIONS
+from ...domain.entities.content import ContentType
+from ...domain.entities.subscription import SubscriptionPlan
+from ..dto.analytics_dto import UsageAnalyticsRequestDTO, UsageAnalyticsResponseDTO, UsageAnalyticsRowDTO
+
+
+class GetUsageAnalyticsUseCase:
+    """
+    Use Case für Usage-Auswertungen über die Tages-Rollups (Admin Dashboard).
+
+    Flow:
+    1. Zeitraum, Gruppierung und Filter validieren
+    2. Rollups aggregieren (Index-Lookup statt Scan über contents)
+    3. Zeilen + Gesamtsumme + Aktualität zurückgeben
+    """
+
+    MAX_RANGE_DAYS = 366
+    MAX_LIMIT = 1000
+
+    def __init__(self, analytics_repository: IUsageAnalyticsRepository):
+        self.analytics_repo = analytics_repository
+
+    async def execute(self, request: UsageAnalyticsRequestDTO) -> UsageAnalyticsResponseDTO:
+        """
+        Wertet die Usage im Zeitraum aus.
+
+        Args:
+            request: UsageAnalyticsRequestDTO mit Zeitraum, group_by und Filtern
+
+        Returns:
+            UsageAnalyticsResponseDTO mit aggregierten Zeilen
+
+        Raises:
+            ValueError: Wenn Zeitraum, Gruppierung oder Filter ungültig sind
+        """
+        # 1. Validierung
+        if request.start > request.end:
+            raise ValueError("start muss vor end liegen")
+        if (request.end - request.start).days + 1 > self.MAX_RANGE_DAYS:
+            raise ValueError(f"Zeitraum zu groß (max. {self.MAX_RANGE_DAYS} Tage)")
+
+        group_by = list(dict.fromkeys(request.group_by))
+        unknown = [name for name in group_by if name not in ANALYTICS_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unbekannte Dimension(en): {', '.join(unknown)} (erlaubt: {', '.join(ANALYTICS_DIMENSIONS)})")
+
+        if request.content_type:
+            ContentType(request.content_type)  # ValueError bei unbekanntem Typ
+        if request.plan:
+            SubscriptionPlan(request.plan)
+
+        limit = min(request.limit, self.MAX_LIMIT) if request.limit else None
+        if "user_id" in group_by and limit is None:
+            # Gruppierung nach User kann sehr groß werden → Top-N
+            limit = self.MAX_LIMIT
+
+        # 2. Aggregation
+        result = await self.analytics_repo.query(
+            start=request.start,
+            end=request.end,
+            group_by=group_by,
+            content_type=request.content_type,
+            plan=request.plan,
+            user_id=request.user_id,
+            limit=limit
+        )
+
+        # 3. Response
+        rows = [
+            UsageAnalyticsRowDTO(
+                count=row.count,
+                day=row.day,
+                content_type=row.content_type,
+                plan=row.plan,
+                user_id=row.user_id
+            )
+            for row in result.rows
+        ]
+
+        return UsageAnalyticsResponseDTO(
+            start=request.start,
+            end=request.end,
+            group_by=group_by,
+            rows=rows,
+            total=sum(row.count for row in rows),
+            data_until=result.data_until
+        )
@@ -1,9 +1,12 @@
 from datetime import datetime
+from typing import Optional
 from ...domain.interfaces.user_repository import IUserRepository
 from ...domain.interfaces.subscription_repository import ISubscriptionRepository
+from ...domain.interfaces.unit_of_work import IUnitOfWork
 from ...domain.entities.subscription import Subscription, SubscriptionPlan, SubscriptionStatus
 from ...domain.entities.user import UserRole
 from ...infrastructure.payment.stripe_service import StripeService
+from ...infrastructure.cache.entity_cache import EntityCache
 from ..dto.subscription_dto import WebhookEventDTO, WebhookEventResponseDTO
 import uuid
 
@@ -21,17 +24,22 @@ class HandleSubscriptionWebhookUseCase:
        - subscription.deleted → Subscription kündigen
        - invoice.paid → Status auf active setzen
        - invoice.payment_failed → Status auf past_due setzen
+    4. Änderungen committen, danach User/Subscription Cache des betroffenen Users invalidieren
     """
 
     def __init__(
         self,
         user_repository: IUserRepository,
         subscription_repository: ISubscriptionRepository,
-        stripe_service: StripeService
+        stripe_service: StripeService,
+        unit_of_work: IUnitOfWork,
+        entity_cache: Optional[EntityCache] = None
     ):
         self.user_repo = user_repository
         self.subscription_repo = subscription_repository
         self.stripe_service = stripe_service
+        self.uow = unit_of_work
+        self.entity_cache = entity_cache
 
     async def execute(self, request: WebhookEventDTO) -> WebhookEventResponseDTO:
         """
@@ -58,36 +66,42 @@ class HandleSubscriptionWebhookUseCase:
         event_type = event_data.get("event_type")
 
         # 2. Event Type handling
+        affected_user_id = None
         if event_type == "subscription.created":
-            await self._handle_subscription_created(event_data)
+            affected_user_id = await self._handle_subscription_created(event_data)
             message = "Subscription erstellt"
 
         elif event_type == "subscription.updated":
-            await self._handle_subscription_updated(event_data)
+            affected_user_id = await self._handle_subscription_updated(event_data)
             message = "Subscription aktualisiert"
 
         elif event_type == "subscription.deleted":
-            await self._handle_subscription_deleted(event_data)
+            affected_user_id = await self._handle_subscription_deleted(event_data)
             message = "Subscription gekündigt"
 
         elif event_type == "invoice.paid":
-            await self._handle_invoice_paid(event_data)
+            affected_user_id = await self._handle_invoice_paid(event_data)
             message = "Zahlung erfolgreich"
 
         elif event_type == "invoice.payment_failed":
-            await self._handle_payment_failed(event_data)
+            affected_user_id = await self._handle_payment_failed(event_data)
             message = "Zahlung fehlgeschlagen"
 
         else:
             message = f"Event Type {event_type} nicht handled"
 
+        # 3. Committen, dann Cache invalidieren (Plan/Status/Role haben sich evtl. geändert)
+        await self.uow.commit()
+        if affected_user_id and self.entity_cache:
+            await self.entity_cache.invalidate_user(affected_user_id, source="stripe_webhook")
+
         return WebhookEventResponseDTO(
             event_type=event_type,
             processed=True,
             message=message
         )
 
-    async def _handle_subscription_created(self, event_data: dict):
+    async def _handle_subscription_created(self, event_data: dict) -> Optional[str]:
         """Erstellt neue Subscription in DB"""
         user_id = event_data.get("user_id")
         stripe_subscription_id = event_data.get("stripe_subscription_id")
@@ -124,14 +138,16 @@ class HandleSubscriptionWebhookUseCase:
             subscription_id=created_subscription.id
         )
 
-    async def _handle_subscription_updated(self, event_data: dict):
+        return user_id
+
+    async def _handle_subscription_updated(self, event_data: dict) -> Optional[str]:
         """Updated existierende Subscription"""
         stripe_subscription_id = event_data.get("stripe_subscription_id")
 
         # Subscription per Stripe ID finden
         subscription = await self.subscription_repo.get_by_stripe_id(stripe_subscription_id)
         if not subscription:
-            return  # Subscription noch nicht in DB
+            return None  # Subscription noch nicht in DB
 
         # Subscription updaten
         plan_str = event_data.get("plan")
@@ -153,13 +169,15 @@ class HandleSubscriptionWebhookUseCase:
                 role=UserRole(plan_str)
             )
 
-    async def _handle_subscription_deleted(self, event_data: dict):
+        return subscription.user_id
+
+    async def _handle_subscription_deleted(self, event_data: dict) -> Optional[str]:
         """Kündigt Subscription (Status → canceled, User Role → free)"""
         stripe_subscription_id = event_data.get("stripe_subscription_id")
 
         subscription = await self.subscription_repo.get_by_stripe_id(stripe_subscription_id)
         if not subscription:
-            return
+            return None
 
         # Subscription Status → canceled
         await self.subscription_repo.update(
@@ -173,32 +191,38 @@ class HandleSubscriptionWebhookUseCase:
             role=UserRole.FREE
         )
 
-    async def _handle_invoice_paid(self, event_data: dict):
+        return subscription.user_id
+
+    async def _handle_invoice_paid(self, event_data: dict) -> Optional[str]:
         """Setzt Subscription Status auf active nach erfolgreicher Zahlung"""
         stripe_subscription_id = event_data.get("stripe_subscription_id")
         if not stripe_subscription_id:
-            return
+            return None
 
         subscription = await self.subscription_repo.get_by_stripe_id(stripe_subscription_id)
         if not subscription:
-            return
+            return None
 
         await self.subscription_repo.update(
             subscription_id=subscription.id,
             status=SubscriptionStatus.ACTIVE
         )
 
-    async def _handle_payment_failed(self, event_data: dict):
+        return subscription.user_id
+
+    async def _handle_payment_failed(self, event_data: dict) -> Optional[str]:
         """Setzt Subscription Status auf past_due nach fehlgeschlagener Zahlung"""
         stripe_subscription_id = event_data.get("stripe_subscription_id")
         if not stripe_subscription_id:
-            return
+            return None
 
         subscription = await self.subscription_repo.get_by_stripe_id(stripe_subscription_id)
         if not subscription:
-            return
+            return None
 
         await self.subscription_repo.update(
             subscription_id=subscription.id,
             status=SubscriptionStatus.PAST_DUE
         )
+
+        return subscription.user_id
@@ -0,0 +1,197 @@
+import json
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, List, Optional
+from ...domain.interfaces.content_repository import IContentRepository
+from ...domain.interfaces.unit_of_work import IUnitOfWork
+from ...domain.interfaces.progress_publisher import IProgressPublisher
+from ...domain.entities.content import Content, ContentType, ContentStatus
+from ...domain.entities.progress import ProgressEvent, JobKind, ProgressStatus
+from ...domain.services.content_validator import ContentValidator
+from ..dto.content_dto import ImportContentRequestDTO, ImportContentResponseDTO
+
+
+class ImportContentUseCase:
+    """
+    Use Case für den Bulk-Import von Contents aus NDJSON (Format von ExportContentUseCase).
+
+    Flow:
+    1. Byte-Stream zeilenweise lesen (nie mehr als eine Zeile + ein Batch im Speicher)
+    2. Jede Zeile validieren (Typ, Status, Prompt, typ-spezifische Daten)
+    3. Gültige Zeilen batchweise per COPY importieren
+    4. Alles in einem Commit speichern
+
+    Ungültige Zeilen werden übersprungen und gemeldet. Werden zu viele Fehler
+    oder Zeilen erreicht, wird der gesamte Import abgebrochen (nichts wird gespeichert).
+    Importierte Contents erhalten neue IDs - ein Re-Import erzeugt Kopien.
+    created_at/updated_at und version werden ebenfalls neu vergeben (jetzt bzw. 1): so landen
+    Imports in der aktuellen Monatspartition, werden vom Usage Rollup erfasst und haben eine
+    konsistente Versions-Historie. Die Originalwerte stehen in metadata["imported"].
+    Mit progress_publisher wird nach jedem geschriebenen Batch ein Zwischenstand gemeldet.
+    """
+
+    BATCH_SIZE = 1000
+    MAX_ROWS = 50_000
+    MAX_LINE_BYTES = 1024 * 1024
+    MAX_ERRORS = 100
+    MAX_PROMPT_LENGTH = 2000
+
+    def __init__(
+        self,
+        content_repository: IContentRepository,
+        content_validator: ContentValidator,
+        unit_of_work: IUnitOfWork,
+        progress_publisher: Optional[IProgressPublisher] = None
+    ):
+        self.content_repo = content_repository
+        self.validator = content_validator
+        self.uow = unit_of_work
+        self.progress = progress_publisher
+
+    async def execute(self, request: ImportContentRequestDTO) -> ImportContentResponseDTO:
+        """
+        Importiert Contents für einen User.
+
+        Args:
+            request: ImportContentRequestDTO mit user_id und NDJSON Byte-Stream
+
+        Returns:
+            ImportContentResponseDTO mit Anzahl importierter/übersprungener Zeilen
+
+        Raises:
+            ValueError: Wenn der Stream ungültig ist oder Limits überschritten werden
+        """
+        errors: List[str] = []
+        skipped = 0
+        written = 0
+        job_id = request.job_id or str(uuid.uuid4())
+
+        async def batches() -> AsyncIterator[List[Content]]:
+            nonlocal skipped, written
+            batch: List[Content] = []
+            rows = 0
+            async for line_number, line in self._iter_lines(request.chunks):
+                rows += 1
+                if rows > self.MAX_ROWS:
+                    raise ValueError(f"Zu viele Zeilen (max. {self.MAX_ROWS})")
+                try:
+                    batch.append(self._parse(request.user_id, line))
+                except ValueError as e:
+                    skipped += 1
+                    errors.append(f"Zeile {line_number}: {e}")
+                    if len(errors) > self.MAX_ERRORS:
+                        raise ValueError(f"Import abgebrochen: mehr als {self.MAX_ERRORS} ungültige Zeilen")
+                    continue
+                if len(batch) >= self.BATCH_SIZE:
+                    yield batch
+                    # Das Repository fordert den nächsten Batch erst an, wenn der vorige geschrieben ist
+                    written += len(batch)
+                    await self._publish(request.user_id, job_id, ProgressStatus.PARTIAL, {
+                        "imported": written, "skipped": skipped
+                    })
+                    batch = []
+            if batch:
+                yield batch
+
+        await self._publish(request.user_id, job_id, ProgressStatus.STARTED, {})
+        try:
+            imported = await self.content_repo.bulk_import(request.user_id, batches())
+            self.uow.mark_written(request.user_id)
+            await self.uow.commit()
+        except Exception as e:
+            await self._publish(request.user_id, job_id, ProgressStatus.FAILED, {"error": str(e)})
+            raise
+        await self._publish(request.user_id, job_id, ProgressStatus.COMPLETED, {
+            "imported": imported, "skipped": skipped
+        })
+
+        return ImportContentResponseDTO(imported=imported, skipped=skipped, errors=errors, job_id=job_id)
+
+    async def _publish(self, user_id: str, job_id: str, status: ProgressStatus, data: dict) -> None:
+        if self.progress is not None:
+            await self.progress.publish(user_id, ProgressEvent(job_id=job_id, kind=JobKind.IMPORT, status=status, data=data))
+
+    async def _iter_lines(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+        """Zerlegt einen Byte-Stream in nicht-leere Zeilen (mit Zeilennummer)"""
+        buffer = b""
+        line_number = 0
+        async for chunk in chunks:
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line_number += 1
+                if line.strip():
+                    yield line_number, line
+            if len(buffer) > self.MAX_LINE_BYTES:
+                raise ValueError(f"Zeile {line_number + 1} ist zu lang (max. {self.MAX_LINE_BYTES} Bytes)")
+        if buffer.strip():
+            yield line_number + 1, buffer
+
+    def _parse(self, user_id: str, line: bytes) -> Content:
+        """Validiert eine NDJSON-Zeile und baut die Content Entity"""
+        try:
+            record = json.loads(line)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Kein gültiges JSON ({e})")
+        if not isinstance(record, dict):
+            raise ValueError("Zeile muss ein JSON-Objekt sein")
+
+        try:
+            content_type = ContentType(record.get("type"))
+        except ValueError:
+            raise ValueError(f"Unbekannter Content-Typ: {record.get('type')}")
+
+        status = record.get("status", ContentStatus.COMPLETED.value)
+        if status != ContentStatus.COMPLETED.value:
+            raise ValueError(f"Nur abgeschlossene Contents können importiert werden (Status: {status})")
+
+        prompt = record.get("prompt")
+        if not isinstance(prompt, str):
+            raise ValueError("prompt fehlt")
+        is_valid, error = self.validator.validate_prompt(prompt, min_length=1, max_length=self.MAX_PROMPT_LENGTH)
+        if not is_valid:
+            raise ValueError(error)
+
+        data = record.get("data")
+        if not isinstance(data, dict):
+            raise ValueError("data muss ein JSON-Objekt sein")
+        is_valid, error = self.validator.validate(content_type, data)
+        if not is_valid:
+            raise ValueError(error)
+
+        metadata = record.get("metadata")
+        if metadata is not None and not isinstance(metadata, dict):
+            raise ValueError("metadata muss ein JSON-Objekt sein")
+
+        version = record.get("version", 1)
+        if not isinstance(version, int) or version < 1:
+            raise ValueError("version muss eine positive Ganzzahl sein")
+
+        original = {"version": version}
+        for field in ("created_at", "updated_at"):
+            value = self._parse_datetime(record.get(field), field)
+            if value is not None:
+                original[field] = value.isoformat()
+
+        now = datetime.utcnow()
+        return Content(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            type=content_type,
+            status=ContentStatus.COMPLETED,
+            data=data,
+            prompt=prompt,
+            version=1,
+            created_at=now,
+            updated_at=now,
+            metadata={**(metadata or {}), "imported": original}
+        )
+
+    @staticmethod
+    def _parse_datetime(value: Any, field: str):
+        if value is None:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{field} ist kein ISO-Zeitstempel")
@@ -0,0 +1,37 @@
+from ...domain.interfaces.content_repository import IContentRepository
+from ..dto.content_dto import ContentVersionRequestDTO, ContentVersionListDTO, ContentVersionDTO
+
+
+class ListContentVersionsUseCase:
+    """
+    Use Case für die Versions-Historie eines Contents.
+    Liefert nur Metadaten (Version, Prompt, Zeitpunkt) - Payloads werden nicht rekonstruiert.
+    """
+
+    def __init__(self, content_repository: IContentRepository):
+        self.content_repo = content_repository
+
+    async def execute(self, request: ContentVersionRequestDTO) -> ContentVersionListDTO:
+        """
+        Listet alle Versionen eines Contents (neueste zuerst).
+
+        Raises:
+            ValueError: Wenn der Content nicht existiert oder nicht dem User gehört
+        """
+        versions = await self.content_repo.list_versions(request.content_id, request.user_id)
+        if not versions:
+            raise ValueError(f"Content {request.content_id} nicht gefunden")
+
+        return ContentVersionListDTO(
+            content_id=request.content_id,
+            current_version=versions[0].version,
+            versions=[
+                ContentVersionDTO(
+                    version=version.version,
+                    prompt=version.prompt,
+                    created_at=version.created_at,
+                    metadata=version.metadata
+                )
+                for version in versions
+            ]
+        )
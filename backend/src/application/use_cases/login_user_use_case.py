@@ -1,26 +1,35 @@
 from datetime import datetime, timedelta, timezone
-from passlib.context import CryptContext
 import jwt
+import logging
 import os
 from ...domain.interfaces.user_repository import IUserRepository
+from ...domain.interfaces.unit_of_work import IUnitOfWork
 from ...domain.entities.user import User
+from ...infrastructure.security.password_hasher import PasswordHasher
 from ..dto.auth_dto import LoginRequestDTO, LoginResponseDTO, UserResponseDTO, AuthTokensDTO
 
 
+logger = logging.getLogger(__name__)
+
+
 class LoginUserUseCase:
     """
     Use Case für User-Login.
 
     Flow:
     1. User per Email laden
-    2. Password verifizieren
+    2. Password verifizieren (im PasswordHasher, außerhalb des Event Loops)
     3. JWT Tokens generieren
     4. Response zurückgeben
+
+    Hat der gespeicherte Hash einen veralteten Cost Factor, wird der neue Hash nach dem
+    Login gespeichert - schlägt das fehl, bleibt der Login trotzdem gültig.
     """
 
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(self, user_repository: IUserRepository, password_hasher: PasswordHasher, unit_of_work: IUnitOfWork):
         self.user_repo = user_repository
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.password_hasher = password_hasher
+        self.uow = unit_of_work
         self.jwt_secret = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
         self.jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
 
@@ -37,20 +46,26 @@ class LoginUserUseCase:
         Raises:
             ValueError: Wenn Email oder Password falsch
             PermissionError: Wenn User nicht aktiv
+            asyncio.QueueFull: Wenn der PasswordHasher ausgelastet ist
         """
         # 1. User per Email laden
         user = await self.user_repo.get_by_email(request.email)
         if not user:
             raise ValueError("Email oder Password falsch")
 
-        # 2. Password verifizieren
-        if not self.pwd_context.verify(request.password, user.password_hash):
+        # 2. Password verifizieren (DB-Connection wird währenddessen nicht gebraucht)
+        await self.uow.release()
+        valid, new_hash = await self.password_hasher.verify_and_update(request.password, user.password_hash)
+        if not valid:
             raise ValueError("Email oder Password falsch")
 
         # User aktiv?
         if not user.is_active:
             raise PermissionError("User-Account ist deaktiviert")
 
+        if new_hash is not None:
+            await self._rehash(user, new_hash)
+
         # 3. JWT Tokens generieren
         tokens = self._generate_tokens(user)
 
@@ -69,6 +84,15 @@ class LoginUserUseCase:
             tokens=tokens
         )
 
+    async def _rehash(self, user: User, new_hash: str) -> None:
+        """Speichert den Hash mit dem aktuellen Cost Factor"""
+        try:
+            await self.user_repo.update(user_id=user.id, password_hash=new_hash)
+            await self.uow.commit()
+        except Exception:
+            await self.uow.rollback()
+            logger.warning("Password-Hash für User %s konnte nicht aktualisiert werden", user.id, exc_info=True)
+
     def _generate_tokens(self, user: User) -> AuthTokensDTO:
         """Generiert Access & Refresh Tokens"""
         now = datetime.now(timezone.utc)
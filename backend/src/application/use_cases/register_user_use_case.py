@@ -1,12 +1,13 @@
 from datetime import datetime, timedelta
 import uuid
-from passlib.context import CryptContext
 import jwt
 import os
 from ...domain.interfaces.user_repository import IUserRepository
 from ...domain.interfaces.subscription_repository import ISubscriptionRepository
+from ...domain.interfaces.unit_of_work import IUnitOfWork
 from ...domain.entities.user import User, UserRole
 from ...domain.entities.subscription import Subscription, SubscriptionPlan, SubscriptionStatus
+from ...infrastructure.security.password_hasher import PasswordHasher
 from ..dto.auth_dto import RegisterRequestDTO, RegisterResponseDTO, UserResponseDTO, AuthTokensDTO
 
 
@@ -16,9 +17,9 @@ class RegisterUserUseCase:
 
     Flow:
     1. Email-Validierung (unique check)
-    2. Password hashen
+    2. Password hashen (im PasswordHasher, außerhalb des Event Loops)
     3. User erstellen
-    4. FREE Subscription erstellen
+    4. FREE Subscription erstellen (User + Subscription in einer Transaktion)
     5. JWT Tokens generieren
     6. Response zurückgeben
     """
@@ -26,11 +27,14 @@ class RegisterUserUseCase:
     def __init__(
         self,
         user_repository: IUserRepository,
-        subscription_repository: ISubscriptionRepository
+        subscription_repository: ISubscriptionRepository,
+        unit_of_work: IUnitOfWork,
+        password_hasher: PasswordHasher
     ):
         self.user_repo = user_repository
         self.subscription_repo = subscription_repository
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.uow = unit_of_work
+        self.password_hasher = password_hasher
         self.jwt_secret = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
         self.jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
 
@@ -46,6 +50,7 @@ class RegisterUserUseCase:
 
         Raises:
             ValueError: Wenn Email bereits existiert oder Validierung fehlschlägt
+            asyncio.QueueFull: Wenn der PasswordHasher ausgelastet ist
         """
         # 1. Email-Validierung
         existing_user = await self.user_repo.get_by_email(request.email)
@@ -58,8 +63,9 @@ class RegisterUserUseCase:
         if not self._validate_password(request.password):
             raise ValueError("Password muss mindestens 8 Zeichen haben")
 
-        # 2. Password hashen
-        password_hash = self.pwd_context.hash(request.password)
+        # 2. Password hashen (DB-Connection wird währenddessen nicht gebraucht)
+        await self.uow.release()
+        password_hash = await self.password_hasher.hash(request.password)
 
         # 3. User erstellen
         user_id = str(uuid.uuid4())
@@ -68,6 +74,7 @@ class RegisterUserUseCase:
             email=request.email,
             name=request.name,
             role=UserRole.FREE,
+            password_hash=password_hash,
             subscription_id=None,  # Wird nach Subscription-Erstellung gesetzt
             stripe_customer_id=None,
             created_at=datetime.now(),
@@ -75,8 +82,6 @@ class RegisterUserUseCase:
             is_active=True
         )
 
-        # Password hash hinzufügen (nicht Teil der Domain Entity)
-        # In production würde man password_hash in UserModel speichern
         created_user = await self.user_repo.create(user)
 
         # 4. FREE Subscription erstellen
@@ -102,6 +107,7 @@ class RegisterUserUseCase:
             user_id=created_user.id,
             subscription_id=created_subscription.id
         )
+        await self.uow.commit()
 
         # 5. JWT Tokens generieren
         tokens = self._generate_tokens(updated_user)
@@ -0,0 +1,96 @@
+from ...domain.interfaces.content_repository import IContentRepository
+from ...domain.entities.content import Content, ContentType
+from ..dto.content_dto import SearchContentRequestDTO, ContentSearchResponseDTO, ContentSearchItemDTO
+
+
+class SearchContentUseCase:
+    """
+    Use Case für die Volltextsuche über generierten Content.
+
+    Flow:
+    1. Query & Limit validieren
+    2. Suche im Repository (GIN-Index, Ranking, Keyset-Pagination)
+    3. Treffer mit Vorschau zurückgeben
+    """
+
+    MIN_QUERY_LENGTH = 2
+    MAX_QUERY_LENGTH = 200
+    MAX_LIMIT = 50
+    PREVIEW_LENGTH = 120
+
+    def __init__(self, content_repository: IContentRepository):
+        self.content_repo = content_repository
+
+    async def execute(self, request: SearchContentRequestDTO) -> ContentSearchResponseDTO:
+        """
+        Durchsucht alle Contents des Users.
+
+        Args:
+            request: SearchContentRequestDTO mit user_id, query, limit, cursor
+
+        Returns:
+            ContentSearchResponseDTO mit Treffern und next_cursor
+
+        Raises:
+            ValueError: Wenn Query oder Cursor ungültig
+        """
+        # 1. Validierung
+        query = (request.query or "").strip()
+        if len(query) < self.MIN_QUERY_LENGTH:
+            raise ValueError(f"Suchbegriff zu kurz (min. {self.MIN_QUERY_LENGTH} Zeichen)")
+        if len(query) > self.MAX_QUERY_LENGTH:
+            raise ValueError(f"Suchbegriff zu lang (max. {self.MAX_QUERY_LENGTH} Zeichen)")
+
+        limit = max(1, min(request.limit, self.MAX_LIMIT))
+
+        # 2. Suche
+        page = await self.content_repo.search(
+            user_id=request.user_id,
+            query=query,
+            limit=limit,
+            cursor=request.cursor
+        )
+
+        # 3. Response
+        return ContentSearchResponseDTO(
+            items=[
+                ContentSearchItemDTO(
+                    id=hit.content.id,
+                    type=hit.content.type,
+                    status=hit.content.status,
+                    prompt=hit.content.prompt,
+                    created_at=hit.content.created_at,
+                    preview=self._build_preview(hit.content),
+                    rank=hit.rank
+                )
+                for hit in page.hits
+            ],
+            next_cursor=page.next_cursor
+        )
+
+    def _build_preview(self, content: Content) -> str:
+        """Erstellt eine kurze Text-Vorschau je nach Content Type"""
+        data = content.data or {}
+
+        if content.type == ContentType.HOOK:
+            text = (data.get("hooks") or [""])[0]
+        elif content.type == ContentType.SCRIPT:
+            scenes = data.get("scenes") or [{}]
+            text = scenes[0].get("text", "")
+        elif content.type == ContentType.SHOTLIST:
+            text = (data.get("shots") or [""])[0]
+        elif content.type == ContentType.VOICEOVER:
+            text = data.get("text", "")
+        elif content.type == ContentType.CAPTION:
+            text = data.get("caption", "")
+        elif content.type == ContentType.BROLL:
+            text = (data.get("ideas") or [""])[0]
+        elif content.type == ContentType.CALENDAR:
+            day_one = (data.get("days") or {}).get("1", {})
+            text = day_one.get("hook", data.get("niche", ""))
+        else:
+            text = ""
+
+        if len(text) > self.PREVIEW_LENGTH:
+            return text[:self.PREVIEW_LENGTH - 1].rstrip() + "…"
+        return text
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional
+
+
+# Dimensionen nach denen Usage-Rollups gruppiert werden können
+ANALYTICS_DIMENSIONS = ("day", "content_type", "plan", "user_id")
+
+
+@dataclass
+class UsageAnalyticsRow:
+    """
+    Eine aggregierte Zeile aus den Tages-Rollups.
+    Nicht gruppierte Dimensionen sind None.
+    """
+    count: int
+    day: Optional[date] = None
+    content_type: Optional[str] = None
+    plan: Optional[str] = None
+    user_id: Optional[str] = None
+
+
+@dataclass
+class UsageAnalyticsResult:
+    """Ergebnis einer Analytics-Abfrage inkl. Aktualität der Rollups"""
+    rows: List[UsageAnalyticsRow]
+    data_until: Optional[datetime] = None  # Watermark: Contents bis hierhin sind enthalten
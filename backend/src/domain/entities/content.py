@@ -38,3 +38,16 @@ class Content:
     created_at: datetime
     updated_at: datetime
     metadata: Optional[dict] = None  # Zusätzlicher Kontext
+
+
+@dataclass
+class ContentVersion:
+    """
+    Eintrag in der Versions-Historie eines Contents.
+    Jede Regenerierung erzeugt eine neue Version unter derselben Content-ID.
+    """
+    content_id: str
+    version: int
+    prompt: str
+    created_at: datetime
+    metadata: Optional[dict] = None
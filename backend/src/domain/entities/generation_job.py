@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict
+from .content import ContentType
+
+
+@dataclass
+class GenerationJob:
+    """
+    Auftrag für eine asynchrone Content-Generierung (?async=true).
+    Der Content existiert bereits mit Status GENERATING; ein Worker führt den
+    LLM Call aus und setzt den Content auf COMPLETED bzw. FAILED.
+    """
+    content_id: str
+    user_id: str
+    content_type: ContentType
+    prompt: str
+    params: Dict[str, Any] = field(default_factory=dict)  # Typ-spezifische Request-Felder (context, script, ...)
+    regenerate: bool = False  # True: neue Version eines bestehenden Contents
+    attempts: int = 0
+    available_at: datetime = None  # Frühester (nächster) Ausführungszeitpunkt
+    created_at: datetime = None
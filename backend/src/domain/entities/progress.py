@@ -0,0 +1,33 @@
+from enum import Enum
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict
+
+
+class JobKind(str, Enum):
+    """Art eines länger laufenden Jobs, dessen Fortschritt live gemeldet wird"""
+    GENERATION = "generation"
+    EXPORT = "export"
+    IMPORT = "import"
+
+
+class ProgressStatus(str, Enum):
+    """Lebenszyklus eines Jobs aus Sicht des Clients"""
+    QUEUED = "queued"
+    STARTED = "started"
+    PARTIAL = "partial"  # Zwischenstand (z.B. Anzahl verarbeiteter Zeilen)
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class ProgressEvent:
+    """
+    Fortschritts-Event eines Jobs (Generierung, Export, Bulk-Import).
+    Wird per WebSocket an alle verbundenen Sessions des Users verteilt.
+    """
+    job_id: str  # Generierung: Content-ID
+    kind: JobKind
+    status: ProgressStatus
+    data: Dict[str, Any] = field(default_factory=dict)
+    created_at: datetime = None
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from .content import Content
+
+
+@dataclass
+class ContentSearchHit:
+    """Einzelner Treffer der Volltextsuche mit Relevanz-Score"""
+    content: Content
+    rank: float
+
+
+@dataclass
+class ContentSearchPage:
+    """
+    Eine Seite von Suchergebnissen.
+    next_cursor ist ein opaker Keyset-Cursor (None = keine weiteren Treffer).
+    """
+    hits: List[ContentSearchHit]
+    next_cursor: Optional[str] = None
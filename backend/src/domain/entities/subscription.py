@@ -31,6 +31,7 @@ class PlanLimits:
     broll_per_month: int
     calendar_per_month: int
     pdf_exports_per_month: int
+    content_retention_days: int  # Wie lange Contents aufbewahrt werden (-1 = unbegrenzt)
 
 
 # Plan-Konfiguration
@@ -43,7 +44,8 @@ PLAN_LIMITS = {
         caption_per_month=5,
         broll_per_month=3,
         calendar_per_month=1,
-        pdf_exports_per_month=2
+        pdf_exports_per_month=2,
+        content_retention_days=90
     ),
     SubscriptionPlan.BASIC: PlanLimits(
         hook_per_month=50,
@@ -53,7 +55,8 @@ PLAN_LIMITS = {
         caption_per_month=50,
         broll_per_month=30,
         calendar_per_month=5,
-        pdf_exports_per_month=20
+        pdf_exports_per_month=20,
+        content_retention_days=365
     ),
     SubscriptionPlan.PRO: PlanLimits(
         hook_per_month=500,
@@ -63,7 +66,8 @@ PLAN_LIMITS = {
         caption_per_month=500,
         broll_per_month=300,
         calendar_per_month=20,
-        pdf_exports_per_month=200
+        pdf_exports_per_month=200,
+        content_retention_days=-1
     ),
     SubscriptionPlan.ENTERPRISE: PlanLimits(
         hook_per_month=-1,  # Unlimited
@@ -73,7 +77,8 @@ PLAN_LIMITS = {
         caption_per_month=-1,
         broll_per_month=-1,
         calendar_per_month=-1,
-        pdf_exports_per_month=-1
+        pdf_exports_per_month=-1,
+        content_retention_days=-1
     )
 }
 
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Dict
 
 
 @dataclass
@@ -40,3 +41,20 @@ class Usage:
         if now is None:
             now = datetime.utcnow()
         return self.period_start <= now <= self.period_end
+
+
+@dataclass
+class UsageSummary:
+    """
+    Aggregierte Usage aller Content-Typen eines Users für einen Zeitraum.
+    Content-Typen ohne Eintrag haben count=0.
+    """
+    user_id: str
+    period_start: datetime
+    period_end: datetime
+    counts: Dict[str, int] = field(default_factory=dict)  # content_type → count
+
+    def count_for(self, content_type: str) -> int:
+        """Gibt den Count für einen Content-Typ zurück (0 wenn keine Usage)"""
+        key = content_type.value if hasattr(content_type, "value") else content_type
+        return self.counts.get(key, 0)
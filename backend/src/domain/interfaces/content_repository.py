@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..entities.content import Content, ContentType
+from typing import AsyncIterator, List, Optional
+from ..entities.content import Content, ContentType, ContentVersion
+from ..entities.search import ContentSearchPage
 
 
 class IContentRepository(ABC):
@@ -11,26 +12,73 @@ class IContentRepository(ABC):
         """Holt alle Contents eines Users"""
         pass
 
+    @abstractmethod
+    def stream_all(self, user_id: str, batch_size: int = 500) -> AsyncIterator[Content]:
+        """Streamt alle Contents eines Users (älteste zuerst) mit konstantem Speicherverbrauch"""
+        pass
+
     @abstractmethod
     async def get_by_id(self, content_id: str, user_id: str) -> Optional[Content]:
         """Holt einen Content by ID (nur wenn er dem User gehört)"""
         pass
 
+    @abstractmethod
+    async def get_many(self, content_ids: List[str], user_id: str) -> List[Content]:
+        """Holt mehrere Contents in einer Query (nur die des Users, Reihenfolge wie content_ids)"""
+        pass
+
     @abstractmethod
     async def get_by_type(self, user_id: str, content_type: ContentType) -> List[Content]:
         """Holt alle Contents eines bestimmten Typs für einen User"""
         pass
 
+    @abstractmethod
+    async def search(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> ContentSearchPage:
+        """Volltextsuche über Prompt und Content-Texte eines Users (nach Relevanz sortiert, Keyset-Pagination)"""
+        pass
+
     @abstractmethod
     async def create(self, content: Content) -> Content:
         """Erstellt einen neuen Content"""
         pass
 
+    @abstractmethod
+    async def bulk_import(self, user_id: str, batches: AsyncIterator[List[Content]]) -> int:
+        """
+        Importiert Contents batchweise für einen User (alles oder nichts).
+        Gibt die Anzahl importierter Contents zurück.
+        """
+        pass
+
     @abstractmethod
     async def update(self, content_id: str, user_id: str, **kwargs) -> Content:
         """Updated einen Content"""
         pass
 
+    @abstractmethod
+    async def add_version(self, content: Content) -> Content:
+        """
+        Speichert content als neue Version eines bestehenden Contents (gleiche ID).
+        Die vorherige Version bleibt in der Historie abrufbar.
+        """
+        pass
+
+    @abstractmethod
+    async def list_versions(self, content_id: str, user_id: str) -> List[ContentVersion]:
+        """Listet alle Versionen eines Contents (neueste zuerst, leer wenn nicht gefunden)"""
+        pass
+
+    @abstractmethod
+    async def get_version(self, content_id: str, user_id: str, version: int) -> Optional[Content]:
+        """Holt einen Content im Stand einer bestimmten Version"""
+        pass
+
     @abstractmethod
     async def delete(self, content_id: str, user_id: str) -> None:
         """Löscht einen Content"""
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..entities.generation_job import GenerationJob
+from ..entities.content import ContentType
+
+
+class IGenerationJobRepository(ABC):
+    """Repository Interface für die Queue der asynchronen Generierungen"""
+
+    @abstractmethod
+    async def enqueue(self, job: GenerationJob) -> GenerationJob:
+        """Stellt einen Job ein (ein Job pro Content)"""
+        pass
+
+    @abstractmethod
+    async def claim(self, lease_seconds: int) -> Optional[GenerationJob]:
+        """
+        Holt den nächsten fälligen Job und verschiebt available_at um lease_seconds.
+        Bricht der Worker ab, wird der Job nach Ablauf des Leases erneut vergeben.
+        """
+        pass
+
+    @abstractmethod
+    async def retry(self, content_id: str, delay_seconds: int) -> None:
+        """Gibt einen Job nach einem Fehler frei (erneuter Versuch frühestens nach delay_seconds)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, content_id: str) -> None:
+        """Entfernt einen Job (erledigt oder endgültig fehlgeschlagen)"""
+        pass
+
+    @abstractmethod
+    async def count_pending(self, user_id: str, content_type: ContentType) -> int:
+        """Anzahl offener Jobs eines Users für einen Content-Typ (zählen für das Rate-Limit mit)"""
+        pass
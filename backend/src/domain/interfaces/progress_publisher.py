@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from ..entities.progress import ProgressEvent
+
+
+class IProgressPublisher(ABC):
+    """Interface für Live-Fortschritts-Events (Generierungen, Exporte, Imports)"""
+
+    @abstractmethod
+    async def publish(self, user_id: str, event: ProgressEvent) -> None:
+        """
+        Verteilt ein Event an alle verbundenen Clients des Users.
+        Best effort: blockiert nicht auf langsame Clients und wirft keine Fehler.
+        """
+        pass
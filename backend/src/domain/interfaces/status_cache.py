@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class ISubscriptionStatusCache(ABC):
+    """Interface für den kurzlebigen Cache des Subscription Status pro User"""
+
+    @abstractmethod
+    def get(self, user_id: str) -> Optional[Any]:
+        """Gecachter Status oder None"""
+        pass
+
+    @abstractmethod
+    def set(self, user_id: str, status: Any) -> None:
+        """Speichert den Status für die konfigurierte TTL"""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, user_id: str, source: str = "write") -> None:
+        """Entfernt den Status des Users auf allen Workern (z.B. nach Usage-Writes)"""
+        pass
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
+from datetime import datetime
 from ..entities.subscription import Subscription
+from ..entities.usage import UsageSummary
 
 
 class ISubscriptionRepository(ABC):
@@ -11,6 +13,16 @@ class ISubscriptionRepository(ABC):
         """Holt die aktive Subscription eines Users"""
         pass
 
+    @abstractmethod
+    async def get_by_user_id_with_usage(
+        self,
+        user_id: str,
+        period_start: datetime,
+        period_end: datetime
+    ) -> Optional[Tuple[Subscription, UsageSummary]]:
+        """Holt die aktive Subscription + aggregierte Usage des Zeitraums in einem Roundtrip"""
+        pass
+
     @abstractmethod
     async def get_by_stripe_id(self, stripe_subscription_id: str) -> Optional[Subscription]:
         """Holt eine Subscription by Stripe ID"""
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional
+
+
+class IUnitOfWork(ABC):
+    """
+    Transaktionsgrenze eines Requests.
+
+    Alle Repositories eines Requests teilen sich eine Unit of Work. Repositories
+    schreiben nur (flush) - dauerhaft gespeichert wird erst mit commit(), einmal pro Request.
+    """
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Schreibt alle Änderungen in einer Transaktion und führt danach die after_commit Callbacks aus"""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Verwirft alle nicht committeten Änderungen und Callbacks"""
+        pass
+
+    @abstractmethod
+    async def release(self) -> None:
+        """
+        Beendet die laufende Lese-Transaktion und gibt die DB-Connection frei.
+        Vor langen Wartezeiten ohne DB-Zugriff aufrufen (z.B. LLM Calls);
+        der nächste Repository-Zugriff holt sich automatisch wieder eine Connection.
+        """
+        pass
+
+    @abstractmethod
+    def mark_written(self, user_id: str) -> None:
+        """
+        Merkt sich, dass dieser Request Daten des Users schreibt.
+        Nach dem Commit liest der User für ein kurzes Fenster vom Primary (Read-Your-Writes).
+        """
+        pass
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], Optional[Awaitable[None]]]) -> None:
+        """Registriert einen Callback der erst nach erfolgreichem Commit läuft (z.B. Cache-Invalidierung)"""
+        pass
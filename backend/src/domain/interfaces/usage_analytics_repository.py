@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+from ..entities.analytics import UsageAnalyticsResult
+
+
+class IUsageAnalyticsRepository(ABC):
+    """Repository Interface für Auswertungen über die vorberechneten Usage-Rollups"""
+
+    @abstractmethod
+    async def query(
+        self,
+        start: date,
+        end: date,
+        group_by: List[str],
+        content_type: Optional[str] = None,
+        plan: Optional[str] = None,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> UsageAnalyticsResult:
+        """
+        Summiert die Rollups im Zeitraum [start, end] gruppiert nach den gegebenen Dimensionen.
+        Ohne Gruppierung nach day wird nach Anzahl absteigend sortiert.
+        """
+        pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 from datetime import datetime
-from ..entities.usage import Usage
+from ..entities.usage import Usage, UsageSummary
 from ..entities.content import ContentType
 
 
@@ -19,6 +19,16 @@ class IUsageRepository(ABC):
         """Holt die aktuelle Usage für einen Content-Typ im gegebenen Zeitraum. Returns default Usage with count=0 if none exists."""
         pass
 
+    @abstractmethod
+    async def get_usage_summary(
+        self,
+        user_id: str,
+        period_start: datetime,
+        period_end: datetime
+    ) -> UsageSummary:
+        """Holt die Usage aller Content-Typen im gegebenen Zeitraum mit einer einzigen Query"""
+        pass
+
     @abstractmethod
     async def create(self, usage: Usage) -> Usage:
         """Erstellt einen neuen Usage-Eintrag"""
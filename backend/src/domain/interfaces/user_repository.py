@@ -22,8 +22,12 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    async def update(self, user_id: str, **kwargs) -> User:
-        """Updated einen User"""
+    async def update(self, user_id: str, revoke_sessions: bool = False, **kwargs) -> User:
+        """
+        Updated einen User.
+        revoke_sessions=True beendet bestehende Sessions (z.B. WebSockets) - für Passwortwechsel;
+        is_active=False tut das immer. Ein Rehash beim Login ist kein Passwortwechsel.
+        """
         pass
 
     @abstractmethod
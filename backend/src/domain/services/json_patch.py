@@ -0,0 +1,147 @@
+import copy
+import json
+from typing import Any, Dict, List
+
+
+class JsonPatch:
+    """
+    Domain Service für JSON Patches (RFC 6902, Operationen add/remove/replace).
+    Wird für die Versions-Historie der Contents verwendet: jede Version nach einem
+    Snapshot wird nur als Differenz zur vorherigen Version gespeichert.
+    """
+
+    def diff(self, source: Any, target: Any) -> List[Dict[str, Any]]:
+        """
+        Berechnet den Patch, der source in target überführt.
+
+        Objekte werden pro Key verglichen, Listen pro Index (Überhang wird
+        von hinten entfernt bzw. angehängt), alles andere wird ersetzt. Wäre der
+        Patch eines Teilbaums größer als der Teilbaum selbst, wird er als Ganzes ersetzt.
+        """
+        return self._diff(source, target, "")
+
+    def apply(self, document: Any, patch: List[Dict[str, Any]]) -> Any:
+        """
+        Wendet einen Patch auf eine Kopie von document an.
+
+        Raises:
+            ValueError: Wenn ein Pfad nicht existiert oder die Operation unbekannt ist
+        """
+        document = copy.deepcopy(document)
+        for operation in patch:
+            document = self._apply_operation(document, operation)
+        return document
+
+    def _diff(self, source: Any, target: Any, path: str) -> List[Dict[str, Any]]:
+        if type(source) is type(target) and source == target:
+            return []
+
+        if isinstance(source, dict) and isinstance(target, dict):
+            operations = [
+                {"op": "remove", "path": f"{path}/{self._escape(key)}"}
+                for key in source
+                if key not in target
+            ]
+            for key, value in target.items():
+                child = f"{path}/{self._escape(key)}"
+                if key in source:
+                    operations.extend(self._diff(source[key], value, child))
+                else:
+                    operations.append({"op": "add", "path": child, "value": value})
+            return self._smaller(operations, target, path)
+
+        if isinstance(source, list) and isinstance(target, list):
+            common = min(len(source), len(target))
+            operations = []
+            for index in range(common):
+                operations.extend(self._diff(source[index], target[index], f"{path}/{index}"))
+            for index in range(len(source) - 1, common - 1, -1):
+                operations.append({"op": "remove", "path": f"{path}/{index}"})
+            for index in range(common, len(target)):
+                operations.append({"op": "add", "path": f"{path}/{index}", "value": target[index]})
+            return self._smaller(operations, target, path)
+
+        return [{"op": "replace", "path": path, "value": target}]
+
+    @staticmethod
+    def _smaller(operations: List[Dict[str, Any]], target: Any, path: str) -> List[Dict[str, Any]]:
+        """Einzelne Operationen oder ein replace des ganzen Teilbaums - je nachdem was kleiner ist"""
+        replace = [{"op": "replace", "path": path, "value": target}]
+        if len(json.dumps(operations, ensure_ascii=False)) < len(json.dumps(replace, ensure_ascii=False)):
+            return operations
+        return replace
+
+    def _apply_operation(self, document: Any, operation: Dict[str, Any]) -> Any:
+        op = operation.get("op")
+        tokens = self._split(operation.get("path", ""))
+
+        if not tokens:
+            if op in ("add", "replace"):
+                return copy.deepcopy(operation["value"])
+            raise ValueError(f"Ungültige Patch-Operation auf Root: {op}")
+
+        parent = document
+        for token in tokens[:-1]:
+            parent = self._child(parent, token)
+        last = tokens[-1]
+
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else self._index(last)
+            if op == "add":
+                if index > len(parent):
+                    raise ValueError(f"Index außerhalb der Liste: {operation['path']}")
+                parent.insert(index, copy.deepcopy(operation["value"]))
+            elif op in ("remove", "replace"):
+                if index >= len(parent):
+                    raise ValueError(f"Index außerhalb der Liste: {operation['path']}")
+                if op == "remove":
+                    del parent[index]
+                else:
+                    parent[index] = copy.deepcopy(operation["value"])
+            else:
+                raise ValueError(f"Unbekannte Patch-Operation: {op}")
+        elif isinstance(parent, dict):
+            if op == "add":
+                parent[last] = copy.deepcopy(operation["value"])
+            elif op in ("remove", "replace"):
+                if last not in parent:
+                    raise ValueError(f"Pfad existiert nicht: {operation['path']}")
+                if op == "remove":
+                    del parent[last]
+                else:
+                    parent[last] = copy.deepcopy(operation["value"])
+            else:
+                raise ValueError(f"Unbekannte Patch-Operation: {op}")
+        else:
+            raise ValueError(f"Pfad existiert nicht: {operation['path']}")
+
+        return document
+
+    def _child(self, node: Any, token: str) -> Any:
+        try:
+            if isinstance(node, list):
+                return node[self._index(token)]
+            if isinstance(node, dict):
+                return node[token]
+        except (KeyError, IndexError):
+            pass
+        raise ValueError(f"Pfad existiert nicht: /{token}")
+
+    @staticmethod
+    def _index(token: str) -> int:
+        if not token.isdigit():
+            raise ValueError(f"Ungültiger Listen-Index: {token}")
+        return int(token)
+
+    @staticmethod
+    def _escape(key: str) -> str:
+        """JSON Pointer Escaping (RFC 6901)"""
+        return str(key).replace("~", "~0").replace("/", "~1")
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        if path == "":
+            return []
+        if not path.startswith("/"):
+            raise ValueError(f"Ungültiger Patch-Pfad: {path}")
+        return [token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")]
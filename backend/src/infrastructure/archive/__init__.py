@@ -0,0 +1,3 @@
+from .ndjson_store import NDJSONArchiveStore, ArchiveManifest
+
+__all__ = ["NDJSONArchiveStore", "ArchiveManifest"]
@@ -0,0 +1,142 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterable, Dict, Iterator, List, Optional
+from uuid import UUID
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - Fallback auf gzip
+    zstandard = None
+
+
+def _json_default(value: Any):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Nicht serialisierbar: {type(value).__name__}")
+
+
+@dataclass
+class ArchiveManifest:
+    """Metadaten eines archivierten Datensatzes (liegt als .json neben der Datei)"""
+    name: str
+    file: str
+    codec: str  # "zstd" oder "gzip"
+    rows: int
+    sha256: str
+    created_at: str
+
+
+class NDJSONArchiveStore:
+    """
+    Cold Storage als komprimierte NDJSON-Dateien (eine Zeile = ein JSON-Objekt).
+
+    Bevorzugt zstd (Paket `zstandard`), sonst gzip. Dateien werden zuerst als .tmp
+    geschrieben und erst nach vollständigem Schreiben atomar umbenannt - ein
+    Manifest existiert also nur für vollständige Archive.
+    """
+
+    def __init__(self, base_dir: Optional[str] = None, compression_level: int = 10):
+        self.base_dir = Path(base_dir or os.getenv("CONTENT_ARCHIVE_DIR", "./archive/contents"))
+        self.compression_level = compression_level
+        self.codec = "zstd" if zstandard is not None else "gzip"
+
+    # ---------- Schreiben ----------
+
+    async def write(self, name: str, rows: AsyncIterable[Dict[str, Any]]) -> ArchiveManifest:
+        """Schreibt Zeilen streamend in ein komprimiertes NDJSON-Archiv"""
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        extension = "zst" if self.codec == "zstd" else "gz"
+        final_path = self.base_dir / f"{name}.ndjson.{extension}"
+        tmp_path = final_path.with_suffix(final_path.suffix + ".tmp")
+
+        count = 0
+        with open(tmp_path, "wb") as raw:
+            writer = self._open_writer(raw)
+            try:
+                async for row in rows:
+                    writer.write(json.dumps(row, default=_json_default, ensure_ascii=False).encode())
+                    writer.write(b"\n")
+                    count += 1
+            finally:
+                writer.close()
+            raw.flush()
+            os.fsync(raw.fileno())
+
+        os.replace(tmp_path, final_path)
+
+        manifest = ArchiveManifest(
+            name=name,
+            file=final_path.name,
+            codec=self.codec,
+            rows=count,
+            sha256=self._sha256(final_path),
+            created_at=datetime.utcnow().isoformat()
+        )
+        manifest_path = self._manifest_path(name)
+        tmp_manifest = manifest_path.with_suffix(".json.tmp")
+        tmp_manifest.write_text(json.dumps(asdict(manifest), indent=2))
+        os.replace(tmp_manifest, manifest_path)
+        return manifest
+
+    # ---------- Lesen ----------
+
+    def read(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Liest ein Archiv zeilenweise (konstanter Speicherverbrauch)"""
+        manifest = self.get_manifest(name)
+        if manifest is None:
+            raise FileNotFoundError(f"Kein Archiv für {name}")
+
+        path = self.base_dir / manifest.file
+        if self._sha256(path) != manifest.sha256:
+            raise ValueError(f"Checksumme von {path} stimmt nicht mit dem Manifest überein")
+
+        with open(path, "rb") as raw:
+            if manifest.codec == "zstd":
+                if zstandard is None:
+                    raise RuntimeError("Archiv ist zstd-komprimiert, aber 'zstandard' ist nicht installiert")
+                stream = io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw), encoding="utf-8")
+            else:
+                stream = io.TextIOWrapper(gzip.GzipFile(fileobj=raw, mode="rb"), encoding="utf-8")
+            for line in stream:
+                if line.strip():
+                    yield json.loads(line)
+
+    def get_manifest(self, name: str) -> Optional[ArchiveManifest]:
+        path = self._manifest_path(name)
+        if not path.exists():
+            return None
+        return ArchiveManifest(**json.loads(path.read_text()))
+
+    def list(self) -> List[ArchiveManifest]:
+        if not self.base_dir.exists():
+            return []
+        manifests = []
+        for path in sorted(self.base_dir.glob("*.manifest.json")):
+            manifests.append(ArchiveManifest(**json.loads(path.read_text())))
+        return manifests
+
+    # ---------- Intern ----------
+
+    def _open_writer(self, raw):
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=self.compression_level).stream_writer(raw, closefd=False)
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=min(self.compression_level, 9))
+
+    def _manifest_path(self, name: str) -> Path:
+        return self.base_dir / f"{name}.manifest.json"
+
+    @staticmethod
+    def _sha256(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
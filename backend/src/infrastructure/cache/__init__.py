@@ -0,0 +1,13 @@
+from .entity_cache import EntityCache
+from .ttl_cache import TTLCache
+from .status_cache import SubscriptionStatusCache
+from .cached_repositories import CachedUserRepository, CachedSubscriptionRepository, CachedUsageRepository
+
+__all__ = [
+    "EntityCache",
+    "TTLCache",
+    "SubscriptionStatusCache",
+    "CachedUserRepository",
+    "CachedSubscriptionRepository",
+    "CachedUsageRepository",
+]
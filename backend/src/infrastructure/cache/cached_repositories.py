@@ -0,0 +1,198 @@
+from datetime import datetime
+from typing import Awaitable, Callable, Optional, Tuple
+from ...domain.interfaces.user_repository import IUserRepository
+from ...domain.interfaces.subscription_repository import ISubscriptionRepository
+from ...domain.interfaces.usage_repository import IUsageRepository
+from ...domain.interfaces.unit_of_work import IUnitOfWork
+from ...domain.interfaces.status_cache import ISubscriptionStatusCache
+from ...domain.entities.user import User
+from ...domain.entities.subscription import Subscription
+from ...domain.entities.usage import Usage, UsageSummary
+from ...domain.entities.content import ContentType
+from .entity_cache import (
+    EntityCache,
+    USER_CODEC,
+    SUBSCRIPTION_CODEC,
+    USER_NAMESPACE,
+    SUBSCRIPTION_NAMESPACE
+)
+
+
+async def _after_commit(
+    unit_of_work: Optional[IUnitOfWork],
+    user_id: str,
+    invalidate: Callable[[], Optional[Awaitable[None]]]
+) -> None:
+    """
+    Führt eine Invalidierung nach dem Commit der Unit of Work aus (ohne Unit of Work sofort).
+    Sonst könnte ein paralleler Request den alten Stand aus der DB lesen und erneut cachen.
+    Der User wird als Schreiber markiert (Read-Your-Writes gegenüber der Replica).
+    """
+    if unit_of_work is not None:
+        unit_of_work.mark_written(user_id)
+        unit_of_work.after_commit(invalidate)
+        return
+    result = invalidate()
+    if result is not None:
+        await result
+
+
+class CachedUserRepository(IUserRepository):
+    """
+    Read-Through Decorator für ein IUserRepository.
+    get_by_id wird gecacht, alle Writes invalidieren den User explizit (nach dem Commit).
+    """
+
+    def __init__(self, inner: IUserRepository, cache: EntityCache, unit_of_work: Optional[IUnitOfWork] = None):
+        self.inner = inner
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        return await self.cache.get_or_load(
+            USER_NAMESPACE,
+            str(user_id),
+            USER_CODEC,
+            lambda: self.inner.get_by_id(user_id)
+        )
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        # Nicht gecacht: Login braucht den aktuellen password_hash
+        return await self.inner.get_by_email(email)
+
+    async def create(self, user: User) -> User:
+        created = await self.inner.create(user)
+        if self.unit_of_work is not None:
+            self.unit_of_work.mark_written(str(created.id))
+        return created
+
+    async def update(self, user_id: str, revoke_sessions: bool = False, **kwargs) -> User:
+        updated = await self.inner.update(user_id, revoke_sessions=revoke_sessions, **kwargs)
+        # Deaktivierung beendet immer alle Sessions, Passwortwechsel per revoke_sessions=True
+        if kwargs.get("is_active") is False:
+            revoke_sessions = True
+        source = "user_repo.revoke_sessions" if revoke_sessions else "user_repo.update"
+        await _after_commit(
+            self.unit_of_work,
+            str(user_id),
+            lambda: self.cache.invalidate(USER_NAMESPACE, str(user_id), source=source)
+        )
+        return updated
+
+    async def delete(self, user_id: str) -> None:
+        await self.inner.delete(user_id)
+        await _after_commit(
+            self.unit_of_work,
+            str(user_id),
+            lambda: self.cache.invalidate_user(str(user_id), source="user_repo.delete")
+        )
+
+
+class CachedSubscriptionRepository(ISubscriptionRepository):
+    """
+    Read-Through Decorator für ein ISubscriptionRepository.
+    get_by_user_id wird gecacht, Writes invalidieren die Subscription des Users (nach dem Commit).
+    """
+
+    def __init__(self, inner: ISubscriptionRepository, cache: EntityCache, unit_of_work: Optional[IUnitOfWork] = None):
+        self.inner = inner
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+
+    async def get_by_user_id(self, user_id: str) -> Optional[Subscription]:
+        return await self.cache.get_or_load(
+            SUBSCRIPTION_NAMESPACE,
+            str(user_id),
+            SUBSCRIPTION_CODEC,
+            lambda: self.inner.get_by_user_id(user_id)
+        )
+
+    async def get_by_stripe_id(self, stripe_subscription_id: str) -> Optional[Subscription]:
+        # Nur vom Webhook genutzt - immer frisch aus der DB
+        return await self.inner.get_by_stripe_id(stripe_subscription_id)
+
+    async def get_by_user_id_with_usage(
+        self,
+        user_id: str,
+        period_start: datetime,
+        period_end: datetime
+    ) -> Optional[Tuple[Subscription, UsageSummary]]:
+        # Usage ändert sich mit jeder Generierung - nicht im Entity Cache
+        return await self.inner.get_by_user_id_with_usage(user_id, period_start, period_end)
+
+    async def create(self, subscription: Subscription) -> Subscription:
+        created = await self.inner.create(subscription)
+        await _after_commit(
+            self.unit_of_work,
+            str(created.user_id),
+            lambda: self.cache.invalidate(SUBSCRIPTION_NAMESPACE, str(created.user_id), source="subscription_repo.create")
+        )
+        return created
+
+    async def update(self, subscription_id: str, **kwargs) -> Subscription:
+        updated = await self.inner.update(subscription_id, **kwargs)
+        await _after_commit(
+            self.unit_of_work,
+            str(updated.user_id),
+            lambda: self.cache.invalidate(SUBSCRIPTION_NAMESPACE, str(updated.user_id), source="subscription_repo.update")
+        )
+        return updated
+
+    async def delete(self, subscription_id: str) -> None:
+        # Die user_id ist hier nicht bekannt - der Eintrag läuft spätestens nach der TTL ab.
+        # Aufrufer mit user_id sollten zusätzlich EntityCache.invalidate_user aufrufen.
+        await self.inner.delete(subscription_id)
+
+
+class CachedUsageRepository(IUsageRepository):
+    """
+    Decorator für ein IUsageRepository.
+    Usage-Writes invalidieren den gecachten Subscription Status des Users (nach dem Commit,
+    auf allen Workern).
+    """
+
+    def __init__(self, inner: IUsageRepository, status_cache: ISubscriptionStatusCache, unit_of_work: Optional[IUnitOfWork] = None):
+        self.inner = inner
+        self.status_cache = status_cache
+        self.unit_of_work = unit_of_work
+
+    async def get_current_usage(
+        self,
+        user_id: str,
+        content_type: ContentType,
+        period_start: datetime,
+        period_end: datetime
+    ) -> Usage:
+        return await self.inner.get_current_usage(user_id, content_type, period_start, period_end)
+
+    async def get_usage_summary(
+        self,
+        user_id: str,
+        period_start: datetime,
+        period_end: datetime
+    ) -> UsageSummary:
+        return await self.inner.get_usage_summary(user_id, period_start, period_end)
+
+    async def create(self, usage: Usage) -> Usage:
+        created = await self.inner.create(usage)
+        await _after_commit(self.unit_of_work, str(usage.user_id), lambda: self.status_cache.invalidate(str(usage.user_id), source="usage_repo.create"))
+        return created
+
+    async def increment_usage(
+        self,
+        user_id: str,
+        content_type: ContentType,
+        period_start: datetime,
+        period_end: datetime
+    ) -> Usage:
+        usage = await self.inner.increment_usage(user_id, content_type, period_start, period_end)
+        await _after_commit(
+            self.unit_of_work, str(user_id), lambda: self.status_cache.invalidate(str(user_id), source="usage_repo.increment")
+        )
+        return usage
+
+    async def reset_usage(self, user_id: str) -> None:
+        await self.inner.reset_usage(user_id)
+        await _after_commit(
+            self.unit_of_work, str(user_id), lambda: self.status_cache.invalidate(str(user_id), source="usage_repo.reset")
+        )
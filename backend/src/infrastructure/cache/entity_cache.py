@@ -0,0 +1,363 @@
+import asyncio
+import copy
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from ...domain.entities.user import User, UserRole
+from ...domain.entities.subscription import Subscription, SubscriptionPlan, SubscriptionStatus
+from ..monitoring import metrics
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - redis ist optional
+    aioredis = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============== Codecs ==============
+
+@dataclass(frozen=True)
+class EntityCodec:
+    """Serialisierung einer Entity für den Shared Tier (Redis)"""
+    encode: Callable[[Any], dict]
+    decode: Callable[[dict], Any]
+
+
+def _dt(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _encode_user(user: User) -> dict:
+    # password_hash wird bewusst NICHT gecacht (Login liest per get_by_email direkt aus der DB)
+    return {
+        "id": user.id,
+        "email": user.email,
+        "name": user.name,
+        "role": user.role.value,
+        "subscription_id": user.subscription_id,
+        "stripe_customer_id": user.stripe_customer_id,
+        "created_at": _dt(user.created_at),
+        "updated_at": _dt(user.updated_at),
+        "is_active": user.is_active,
+    }
+
+
+def _decode_user(data: dict) -> User:
+    return User(
+        id=data["id"],
+        email=data["email"],
+        name=data["name"],
+        role=UserRole(data["role"]),
+        subscription_id=data["subscription_id"],
+        stripe_customer_id=data["stripe_customer_id"],
+        created_at=_parse_dt(data["created_at"]),
+        updated_at=_parse_dt(data["updated_at"]),
+        is_active=data["is_active"],
+    )
+
+
+def _encode_subscription(subscription: Subscription) -> dict:
+    return {
+        "id": subscription.id,
+        "user_id": subscription.user_id,
+        "plan": subscription.plan.value,
+        "status": subscription.status.value,
+        "stripe_subscription_id": subscription.stripe_subscription_id,
+        "current_period_start": _dt(subscription.current_period_start),
+        "current_period_end": _dt(subscription.current_period_end),
+        "cancel_at_period_end": subscription.cancel_at_period_end,
+    }
+
+
+def _decode_subscription(data: dict) -> Subscription:
+    return Subscription(
+        id=data["id"],
+        user_id=data["user_id"],
+        plan=SubscriptionPlan(data["plan"]),
+        status=SubscriptionStatus(data["status"]),
+        stripe_subscription_id=data["stripe_subscription_id"],
+        current_period_start=_parse_dt(data["current_period_start"]),
+        current_period_end=_parse_dt(data["current_period_end"]),
+        cancel_at_period_end=data["cancel_at_period_end"],
+    )
+
+
+USER_CODEC = EntityCodec(encode=_encode_user, decode=_decode_user)
+SUBSCRIPTION_CODEC = EntityCodec(encode=_encode_subscription, decode=_decode_subscription)
+
+# Namespaces: user:{user_id}, subscription:{user_id}
+USER_NAMESPACE = "user"
+SUBSCRIPTION_NAMESPACE = "subscription"
+# usage:{user_id} hat keinen Shared Tier - nur Invalidierung abhängiger Caches (Subscription Status)
+USAGE_NAMESPACE = "usage"
+
+# Quellen von User-Invalidierungen, die bestehende Sessions beenden (Löschung, Deaktivierung,
+# Passwortwechsel). Andere Writes (Stripe Webhooks, Rehash beim Login) lassen Sessions offen.
+SESSION_REVOKING_SOURCES = frozenset({"user_repo.delete", "user_repo.revoke_sessions"})
+
+
+# ============== Cache ==============
+
+class EntityCache:
+    """
+    Read-Through Cache für User- und Subscription-Entities.
+
+    Zwei Tiers:
+    - Local Tier: In-Process LRU mit kurzer TTL (kein Netzwerk-Roundtrip)
+    - Shared Tier: Redis mit etwas längerer TTL (geteilt zwischen allen uvicorn Workern)
+
+    Invalidierung löscht beide Tiers und published Key + Quelle per Redis Pub/Sub,
+    damit alle anderen Worker ihren Local Tier ebenfalls leeren.
+    Fehler im Shared Tier werden geloggt und führen nie zu Request-Fehlern.
+
+    Jeder Key hat im Shared Tier eine Version, die jede Invalidierung erhöht. Ein Loader
+    merkt sich die Version vor dem DB-Read und schreibt nur, wenn sie noch gilt (atomar
+    per Lua) - so kann ein langsamer Loader eines Workers den Wert nach dem DEL eines
+    anderen Workers nicht wieder veraltet installieren.
+    """
+
+    INVALIDATION_CHANNEL = "entity-cache:invalidate"
+    KEY_PREFIX = "entity-cache:"
+    VERSION_PREFIX = "entity-cache-version:"
+    # Versionen überleben jeden Wert deutlich; läuft eine ab, scheitert ein laufender SET nur
+    VERSION_TTL_SECONDS = 86_400
+
+    # KEYS: Wert, Version; ARGV: erwartete Version, JSON, TTL
+    _SET_IF_CURRENT_LUA = """
+        if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+            return 0
+        end
+        redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+        return 1
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        local_ttl_seconds: Optional[float] = None,
+        max_local_entries: int = 10_000
+    ):
+        self.redis_url = redis_url if redis_url is not None else os.getenv("REDIS_URL")
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv("ENTITY_CACHE_TTL_SECONDS", "60"))
+        self.local_ttl_seconds = local_ttl_seconds if local_ttl_seconds is not None else float(
+            os.getenv("ENTITY_CACHE_LOCAL_TTL_SECONDS", "10")
+        )
+        self.max_local_entries = max_local_entries
+
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Generation pro Key: verhindert dass ein Loader der vor einer Invalidierung
+        # gestartet wurde den veralteten Wert danach wieder in den Cache schreibt.
+        self._generations: Dict[str, int] = {}
+        # Abhängige Caches (z.B. Subscription Status) werden bei jeder lokalen Eviction benachrichtigt
+        self._invalidation_listeners: List[Callable[[str, str, str], None]] = []
+
+        self._redis = None
+        self._set_if_current = None
+        self._listener_task: Optional[asyncio.Task] = None
+        if self.redis_url and aioredis is not None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+            self._set_if_current = self._redis.register_script(self._SET_IF_CURRENT_LUA)
+
+        self._requests = metrics.counter("entity_cache_requests_total", "Entity Cache Lookups nach Namespace und Ergebnis")
+        self._invalidations = metrics.counter("entity_cache_invalidations_total", "Entity Cache Invalidierungen nach Quelle")
+        self._errors = metrics.counter("entity_cache_shared_errors_total", "Fehler im Shared Tier (Redis)")
+        metrics.register_collector("entity_cache_hit_ratio", self.stats)
+
+    # ---------- Lifecycle ----------
+
+    async def start(self) -> None:
+        """Startet den Pub/Sub Listener (im FastAPI lifespan aufrufen)"""
+        if self._redis is not None and self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen_for_invalidations())
+
+    async def close(self) -> None:
+        """Stoppt den Listener und schließt die Redis-Verbindung"""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self._redis is not None:
+            await self._redis.close()
+
+    # ---------- Read-Through ----------
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: str,
+        codec: EntityCodec,
+        loader: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        """
+        Liefert die Entity aus Local Tier → Shared Tier → Loader (DB).
+        None-Ergebnisse werden nicht gecacht.
+        """
+        cache_key = f"{namespace}:{key}"
+
+        # 1. Local Tier
+        entry = self._local.get(cache_key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(cache_key)
+                self._requests.inc(namespace=namespace, result="hit_local")
+                return copy.copy(value)
+            self._local.pop(cache_key, None)
+
+        generation = self._generations.get(cache_key, 0)
+        # Shared-Tier-Version vor dem Loader lesen (None = Shared Tier nicht verfügbar)
+        shared_version: Optional[str] = None
+
+        # 2. Shared Tier
+        if self._redis is not None:
+            try:
+                raw, version = await self._redis.mget(self.KEY_PREFIX + cache_key, self.VERSION_PREFIX + cache_key)
+                shared_version = version or "0"
+            except Exception as e:
+                self._errors.inc(operation="get")
+                logger.warning("Entity Cache: Redis GET fehlgeschlagen: %s", e)
+                raw = None
+            if raw is not None:
+                value = codec.decode(json.loads(raw))
+                self._store_local(cache_key, value, generation)
+                self._requests.inc(namespace=namespace, result="hit_shared")
+                return copy.copy(value)
+
+        # 3. Loader
+        self._requests.inc(namespace=namespace, result="miss")
+        value = await loader()
+        if value is None:
+            return None
+
+        if self._generations.get(cache_key, 0) == generation:
+            self._store_local(cache_key, value, generation)
+            if shared_version is not None:
+                try:
+                    await self._set_if_current(
+                        keys=[self.KEY_PREFIX + cache_key, self.VERSION_PREFIX + cache_key],
+                        args=[shared_version, json.dumps(codec.encode(value)), max(1, int(self.ttl_seconds))]
+                    )
+                except Exception as e:
+                    self._errors.inc(operation="set")
+                    logger.warning("Entity Cache: Redis SET fehlgeschlagen: %s", e)
+
+        return copy.copy(value)
+
+    # ---------- Invalidierung ----------
+
+    async def invalidate(self, namespace: str, key: str, source: str = "write") -> None:
+        """Entfernt einen Key aus beiden Tiers und benachrichtigt alle Worker"""
+        cache_key = f"{namespace}:{key}"
+        self._evict_local(cache_key, source)
+        self._invalidations.inc(namespace=namespace, source=source)
+
+        if self._redis is not None:
+            message = json.dumps({"key": cache_key, "source": source})
+            try:
+                if namespace == USAGE_NAMESPACE:
+                    await self._redis.publish(self.INVALIDATION_CHANNEL, message)
+                    return
+                # Version erhöhen → laufende Loader anderer Worker schreiben nicht mehr
+                async with self._redis.pipeline(transaction=True) as pipe:
+                    pipe.incr(self.VERSION_PREFIX + cache_key)
+                    pipe.expire(self.VERSION_PREFIX + cache_key, self.VERSION_TTL_SECONDS)
+                    pipe.delete(self.KEY_PREFIX + cache_key)
+                    await pipe.execute()
+                await self._redis.publish(self.INVALIDATION_CHANNEL, message)
+            except Exception as e:
+                self._errors.inc(operation="invalidate")
+                logger.warning("Entity Cache: Redis Invalidierung fehlgeschlagen: %s", e)
+
+    def add_invalidation_listener(self, listener: Callable[[str, str, str], None]) -> None:
+        """
+        Registriert einen Callback (namespace, key, source) für jede lokale Eviction -
+        auch für Invalidierungen die per Pub/Sub von anderen Workern kommen.
+        source ist die Quelle der Invalidierung (z.B. "user_repo.delete", siehe SESSION_REVOKING_SOURCES).
+        """
+        self._invalidation_listeners.append(listener)
+
+    async def invalidate_user(self, user_id: str, source: str = "write") -> None:
+        """Invalidiert User und Subscription eines Users"""
+        await self.invalidate(USER_NAMESPACE, user_id, source=source)
+        await self.invalidate(SUBSCRIPTION_NAMESPACE, user_id, source=source)
+
+    # ---------- Metrics ----------
+
+    def stats(self) -> dict:
+        """Hit-Ratio pro Namespace (Local + Shared Hits / alle Lookups)"""
+        result = {"local_entries": len(self._local), "namespaces": {}}
+        for namespace in (USER_NAMESPACE, SUBSCRIPTION_NAMESPACE):
+            hits_local = self._requests.value(namespace=namespace, result="hit_local")
+            hits_shared = self._requests.value(namespace=namespace, result="hit_shared")
+            misses = self._requests.value(namespace=namespace, result="miss")
+            total = hits_local + hits_shared + misses
+            result["namespaces"][namespace] = {
+                "hits_local": hits_local,
+                "hits_shared": hits_shared,
+                "misses": misses,
+                "hit_ratio": (hits_local + hits_shared) / total if total else 0.0,
+            }
+        return result
+
+    # ---------- Intern ----------
+
+    def _store_local(self, cache_key: str, value: Any, generation: int) -> None:
+        if self._generations.get(cache_key, 0) != generation:
+            return
+        self._local[cache_key] = (time.monotonic() + self.local_ttl_seconds, value)
+        self._local.move_to_end(cache_key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+    def _evict_local(self, cache_key: str, source: str) -> None:
+        self._local.pop(cache_key, None)
+        namespace, _, key = cache_key.partition(":")
+        for listener in self._invalidation_listeners:
+            listener(namespace, key, source)
+        self._generations[cache_key] = self._generations.get(cache_key, 0) + 1
+        if len(self._generations) > self.max_local_entries * 2:
+            # Alte Generationen verwerfen - schlimmstenfalls wird ein laufender Loader-Wert gecacht
+            self._generations.clear()
+
+    @staticmethod
+    def _parse_invalidation(data: str) -> Tuple[str, str]:
+        """Pub/Sub Nachricht → (cache_key, source); ältere Worker publishen nur den Key"""
+        if data.startswith("{"):
+            payload = json.loads(data)
+            return payload["key"], payload.get("source", "write")
+        return data, "write"
+
+    async def _listen_for_invalidations(self) -> None:
+        """Empfängt Invalidierungen anderer Worker und leert den Local Tier"""
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._evict_local(*self._parse_invalidation(message["data"]))
+            except asyncio.CancelledError:
+                await pubsub.close()
+                raise
+            except Exception as e:
+                self._errors.inc(operation="subscribe")
+                logger.warning("Entity Cache: Pub/Sub Verbindung verloren, reconnect: %s", e)
+                # Während der Verbindung verpasste Invalidierungen → Local Tier komplett leeren
+                self._local.clear()
+                await pubsub.close()
+                await asyncio.sleep(1)
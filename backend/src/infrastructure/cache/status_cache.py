@@ -0,0 +1,30 @@
+from typing import Any, Optional
+from ...domain.interfaces.status_cache import ISubscriptionStatusCache
+from .entity_cache import EntityCache, USAGE_NAMESPACE
+from .ttl_cache import TTLCache
+
+
+class SubscriptionStatusCache(ISubscriptionStatusCache):
+    """
+    Subscription Status pro User im Local Tier (TTLCache) jedes Workers.
+
+    Invalidierungen laufen über den EntityCache (Namespace usage) und damit per Pub/Sub
+    an alle Worker - auch Usage-Writes des Generation Workers leeren den Status der API
+    Worker. Das Leeren selbst übernimmt der Invalidation Listener (siehe dependencies).
+    """
+
+    def __init__(self, entity_cache: EntityCache, ttl_seconds: float, max_entries: int = 10_000):
+        self.entity_cache = entity_cache
+        self._local = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries, name="subscription_status")
+
+    def get(self, user_id: str) -> Optional[Any]:
+        return self._local.get(str(user_id))
+
+    def set(self, user_id: str, status: Any) -> None:
+        self._local.set(str(user_id), status)
+
+    async def invalidate(self, user_id: str, source: str = "write") -> None:
+        await self.entity_cache.invalidate(USAGE_NAMESPACE, str(user_id), source=source)
+
+    def evict_local(self, user_id: str) -> None:
+        self._local.pop(str(user_id))
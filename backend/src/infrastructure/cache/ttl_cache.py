@@ -0,0 +1,63 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+from ..monitoring import metrics
+
+
+class TTLCache:
+    """
+    Einfacher In-Process LRU Cache mit TTL pro Eintrag.
+    Thread-safe, ohne Netzwerk - für kurzlebige, pro Worker gehaltene Werte.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000, name: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.name = name
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._requests = metrics.counter("ttl_cache_requests_total", "TTL Cache Lookups nach Cache und Ergebnis")
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._record("hit")
+                    return value
+                del self._entries[key]
+        self._record("miss")
+        return None
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def hit_ratio(self) -> float:
+        hits = self._requests.value(cache=self.name, result="hit")
+        total = hits + self._requests.value(cache=self.name, result="miss")
+        return hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _record(self, result: str) -> None:
+        if self.name:
+            self._requests.inc(cache=self.name, result=result)
@@ -25,6 +25,23 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False
 )
 
+# Optionale Read Replica für read-only Endpoints (ohne URL: alles über engine)
+REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL")
+
+replica_engine = create_async_engine(
+    REPLICA_DATABASE_URL,
+    echo=True,  # SQL logging (disable in production)
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20
+) if REPLICA_DATABASE_URL else None
+
+replica_session_maker = async_sessionmaker(
+    replica_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+) if replica_engine is not None else None
+
 # Base for models
 Base = declarative_base()
 
@@ -50,3 +67,5 @@ async def init_db():
 async def close_db():
     """Schließt die Datenbank-Verbindung"""
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
@@ -0,0 +1,66 @@
+from typing import Any, Dict, Union
+from sqlalchemy import Select, false, func, literal, select, true
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from ...monitoring import metrics
+from .models import ContentBlobModel
+
+
+BLOBS = ContentBlobModel.__table__
+
+
+class ContentBlobStore:
+    """
+    Content-addressed Store für generierte JSON-Payloads (Tabelle content_blobs).
+
+    Der Hash wird von Postgres berechnet (content_blob_hash = SHA-256 über jsonb::text).
+    JSONB normalisiert Key-Reihenfolge und Whitespace, damit ist die Darstellung
+    kanonisch und identisch für Backfill, Rehydrierung und neue Writes.
+
+    Ein Dedup-Treffer schreibt die Blob-Zeile nicht: INSERT ... ON CONFLICT DO NOTHING,
+    der bestehende Blob wird nur per FOR KEY SHARE referenziert. Die Sperre blockiert
+    parallele Generierungen desselben Payloads nicht (wie die Foreign-Key-Prüfung von
+    contents), schützt den Blob aber bis zum Commit vor dem GC (FOR UPDATE SKIP LOCKED).
+    Ob ein Blob noch referenziert wird, berechnet erst der ContentBlobGCJob.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, executor: Union[AsyncSession, AsyncConnection]):
+        self.executor = executor
+        self._writes = metrics.counter("content_blob_writes_total", "Blob Upserts nach Ergebnis (new/dedup)")
+
+    async def put(self, data: Dict[str, Any]) -> str:
+        """Speichert einen Payload (falls neu) und liefert seinen Hash"""
+        for _ in range(self.MAX_ATTEMPTS):
+            row = (await self.executor.execute(self.reference(data))).one_or_none()
+            if row is not None:
+                self.record(row.inserted)
+                return row.hash
+        raise RuntimeError("Content Blob konnte nicht gespeichert werden")
+
+    def reference(self, data: Dict[str, Any]) -> Select:
+        """
+        Statement für einen Payload mit den Spalten (hash, inserted): neu einfügen oder
+        den bestehenden Blob sperren. Kann als CTE in den Content-Write eingebettet werden
+        (ein Round Trip statt zwei).
+
+        Liefert ausnahmsweise keine Zeile, wenn der Blob erst nach dem Snapshot des
+        Statements committed oder gerade vom GC gelöscht wurde - dann das Statement
+        wiederholen (put() tut das selbst).
+        """
+        payload = literal(data, JSONB)
+        blob_hash = func.content_blob_hash(payload)
+        inserted = insert(BLOBS).values(hash=blob_hash, data=payload).on_conflict_do_nothing(
+            index_elements=[BLOBS.c.hash]
+        ).returning(BLOBS.c.hash).cte("blob_insert")
+        existing = select(BLOBS.c.hash).where(BLOBS.c.hash == blob_hash).with_for_update(
+            read=True, key_share=True
+        ).subquery("blob_existing")
+        return select(inserted.c.hash, true().label("inserted")).union_all(
+            select(existing.c.hash, false().label("inserted"))
+        )
+
+    def record(self, inserted: bool) -> None:
+        """Zählt einen Write in content_blob_writes_total"""
+        self._writes.inc(result="new" if inserted else "dedup")
@@ -1,127 +1,540 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from datetime import datetime
-from sqlalchemy import select
+import base64
+import json
+import uuid
+from sqlalchemy import select, insert, update, delete, func, tuple_, literal, text, true, false, Float, DateTime
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from ....domain.interfaces.content_repository import IContentRepository
-from ....domain.entities.content import Content, ContentType, ContentStatus
-from .models import ContentModel
+from ....domain.entities.content import Content, ContentType, ContentStatus, ContentVersion
+from ....domain.entities.search import ContentSearchHit, ContentSearchPage
+from ....domain.services.json_patch import JsonPatch
+from .models import ContentModel, ContentBlobModel, ContentVersionModel, SEARCH_CONFIG
+from .content_blob_store import ContentBlobStore
+
+
+# Staging-Tabelle für COPY beim Bulk Import (pro Connection, Inhalt wird pro Batch geleert)
+IMPORT_STAGING_TABLE = "content_import_staging"
+IMPORT_COLUMNS = ("id", "type", "status", "data", "prompt", "version", "metadata", "created_at", "updated_at")
+
+# Writes laufen als Core-Statements mit RETURNING (ein Round Trip, kein refresh).
+# Die Labels entsprechen den Model-Attributen, damit _to_entity Rows wie Models behandelt.
+CONTENTS = ContentModel.__table__
+RETURNING_COLUMNS = tuple(
+    column.label("content_metadata") if column.name == "metadata" else column
+    for column in CONTENTS.c
+    if column.name != "search_vector"
+)
+# Per update() änderbare Felder (Model-Attribut → Spalte)
+UPDATABLE_COLUMNS = {
+    "type": CONTENTS.c.type,
+    "status": CONTENTS.c.status,
+    "prompt": CONTENTS.c.prompt,
+    "version": CONTENTS.c.version,
+    "metadata": CONTENTS.c.metadata,
+    "content_metadata": CONTENTS.c.metadata,
+}
+
+VERSIONS = ContentVersionModel.__table__
 
 
 class PostgresContentRepository(IContentRepository):
     """
     Postgres Implementation des Content Repository.
     Verwendet Vercel Postgres (Neon) via asyncpg.
+
+    Der Payload (Content.data) liegt dedupliziert in content_blobs und wird
+    beim Lesen per Join auf blob_hash geladen.
     """
 
+    # Spätestens jede N-te Version wird als Snapshot gespeichert (begrenzt die Patches pro Rekonstruktion)
+    SNAPSHOT_INTERVAL = 10
+
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.blobs = ContentBlobStore(session)
+        self.patches = JsonPatch()
 
     async def get_all(self, user_id: str) -> List[Content]:
         """Holt alle Contents eines Users"""
-        stmt = select(ContentModel).where(
+        stmt = self._select().where(
             ContentModel.user_id == user_id
         ).order_by(ContentModel.created_at.desc())
 
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
 
-        return [self._to_entity(model) for model in models]
+        return [self._to_entity(model, data) for model, data in result.all()]
+
+    async def stream_all(self, user_id: str, batch_size: int = 500) -> AsyncIterator[Content]:
+        """
+        Streamt alle Contents eines Users über einen Server-Side Cursor.
+
+        Es sind nie mehr als batch_size Zeilen im Speicher; die Identity Map
+        hält die Models nur schwach referenziert.
+        """
+        stmt = self._select().where(
+            ContentModel.user_id == user_id
+        ).order_by(
+            ContentModel.created_at, ContentModel.id
+        ).execution_options(yield_per=batch_size)
+
+        result = await self.session.stream(stmt)
+        try:
+            async for model, data in result:
+                yield self._to_entity(model, data)
+        finally:
+            await result.close()
+            # Lese-Transaktion beenden und Connection an den Pool zurückgeben
+            # (auch bei Abbruch durch den Client)
+            await self.session.close()
 
     async def get_by_id(self, content_id: str, user_id: str) -> Optional[Content]:
         """Holt einen Content by ID (nur wenn er dem User gehört)"""
-        stmt = select(ContentModel).where(
+        stmt = self._select().where(
             ContentModel.id == content_id,
             ContentModel.user_id == user_id
         )
 
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        return self._to_entity(model) if model else None
+        return self._to_entity(*row) if row else None
+
+    async def get_many(self, content_ids: List[str], user_id: str) -> List[Content]:
+        """Holt mehrere Contents in einer Query (nur die des Users, Reihenfolge wie content_ids)"""
+        if not content_ids:
+            return []
+        stmt = self._select().where(
+            ContentModel.id.in_(content_ids),
+            ContentModel.user_id == user_id
+        )
+
+        result = await self.session.execute(stmt)
+        contents = {content.id: content for content in (self._to_entity(*row) for row in result.all())}
+
+        return [contents[content_id] for content_id in content_ids if content_id in contents]
 
     async def get_by_type(self, user_id: str, content_type: ContentType) -> List[Content]:
         """Holt alle Contents eines bestimmten Typs für einen User"""
-        stmt = select(ContentModel).where(
+        stmt = self._select().where(
             ContentModel.user_id == user_id,
             ContentModel.type == content_type.value
         ).order_by(ContentModel.created_at.desc())
 
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
 
-        return [self._to_entity(model) for model in models]
+        return [self._to_entity(model, data) for model, data in result.all()]
 
-    async def create(self, content: Content) -> Content:
-        """Erstellt einen neuen Content"""
-        model = ContentModel(
-            id=content.id,
-            user_id=content.user_id,
-            type=content.type.value,
-            status=content.status.value,
-            data=content.data,
-            prompt=content.prompt,
-            version=content.version,
-            content_metadata=content.metadata,
-            created_at=content.created_at,
-            updated_at=content.updated_at
+    async def search(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> ContentSearchPage:
+        """
+        Volltextsuche über den GIN-indizierten search_vector.
+
+        Sortierung: Relevanz (ts_rank_cd), dann created_at und id als Tie-Breaker.
+        Pagination per Keyset auf (rank, created_at, id) - kein OFFSET.
+        """
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank_cd(ContentModel.search_vector, ts_query)
+
+        stmt = self._select(rank.label("rank")).where(
+            ContentModel.user_id == user_id,
+            ContentModel.search_vector.bool_op("@@")(ts_query)
         )
 
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
+        if cursor:
+            last_rank, last_created_at, last_id = self._decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(rank, ContentModel.created_at, ContentModel.id) < tuple_(
+                    literal(last_rank, Float),
+                    literal(last_created_at, DateTime(timezone=True)),
+                    literal(last_id, UUID(as_uuid=True))
+                )
+            )
+
+        # Ein Element mehr laden um zu wissen ob es eine nächste Seite gibt
+        stmt = stmt.order_by(
+            rank.desc(),
+            ContentModel.created_at.desc(),
+            ContentModel.id.desc()
+        ).limit(limit + 1)
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        hits = [
+            ContentSearchHit(content=self._to_entity(model, data), rank=float(row_rank))
+            for model, data, row_rank in rows
+        ]
+
+        next_cursor = None
+        if has_more and rows:
+            last_model, _, last_rank = rows[-1]
+            next_cursor = self._encode_cursor(float(last_rank), last_model.created_at, last_model.id)
+
+        return ContentSearchPage(hits=hits, next_cursor=next_cursor)
+
+    async def create(self, content: Content) -> Content:
+        """
+        Erstellt einen neuen Content in einem Round Trip: Blob-Referenz als CTE,
+        INSERT ... SELECT in contents und RETURNING der gespeicherten Zeile.
+        """
+        row = (await self.session.execute(
+            self._insert_statement(content, self.blobs.reference(content.data).cte("blob"))
+        )).one_or_none()
+        if row is not None:
+            self.blobs.record(row.inserted)
+        else:
+            # Blob nicht im Snapshot (parallel neu committed oder vom GC gelöscht) → separat speichern
+            blob_hash = await self.blobs.put(content.data)
+            blob = select(literal(blob_hash).label("hash"), false().label("inserted")).cte("blob")
+            row = (await self.session.execute(self._insert_statement(content, blob))).one()
+
+        return self._to_entity(row, content.data)
+
+    def _insert_statement(self, content: Content, blob):
+        """INSERT ... SELECT in contents mit dem Blob-Hash aus der CTE blob (hash, inserted)"""
+        created = insert(CONTENTS).from_select(
+            ["id", "user_id", "type", "status", "blob_hash", "prompt", "version", "metadata", "created_at", "updated_at"],
+            select(
+                literal(content.id, UUID(as_uuid=True)),
+                literal(content.user_id, UUID(as_uuid=True)),
+                literal(content.type.value, CONTENTS.c.type.type),
+                literal(content.status.value, CONTENTS.c.status.type),
+                blob.c.hash,
+                literal(content.prompt),
+                literal(content.version),
+                literal(content.metadata, JSONB),
+                literal(content.created_at, DateTime(timezone=True)),
+                literal(content.updated_at, DateTime(timezone=True))
+            ).select_from(blob)
+        ).returning(*RETURNING_COLUMNS).cte("created")
+
+        return select(created, blob.c.inserted).join_from(created, blob, true())
+
+    async def bulk_import(self, user_id: str, batches: AsyncIterator[List[Content]]) -> int:
+        """
+        Importiert Contents per COPY (Commit über die Unit of Work des Requests).
 
-        return self._to_entity(model)
+        Pro Batch: COPY in eine temporäre Staging-Tabelle, bestehende Blobs per FOR KEY SHARE
+        sperren (Schutz vor dem GC), fehlende einfügen, dann INSERT ... SELECT in contents
+        (search_vector per Trigger).
+        user_id wird immer auf den importierenden User gesetzt.
+        """
+        conn = await self.session.connection()
+        await conn.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {IMPORT_STAGING_TABLE} ("
+            "id UUID, type TEXT, status TEXT, data JSONB, prompt TEXT, version INTEGER, "
+            "metadata JSONB, created_at TIMESTAMPTZ, updated_at TIMESTAMPTZ"
+            ") ON COMMIT DROP"
+        ))
+        driver = (await conn.get_raw_connection()).driver_connection
+
+        imported = 0
+        async for batch in batches:
+            if not batch:
+                continue
+            await conn.execute(text(f"TRUNCATE {IMPORT_STAGING_TABLE}"))
+            await driver.copy_records_to_table(
+                IMPORT_STAGING_TABLE,
+                records=[self._to_import_record(content) for content in batch],
+                columns=IMPORT_COLUMNS
+            )
+            await conn.execute(text(
+                "SELECT hash FROM content_blobs "
+                f"WHERE hash IN (SELECT content_blob_hash(data) FROM {IMPORT_STAGING_TABLE}) "
+                "FOR KEY SHARE"
+            ))
+            await conn.execute(text(
+                "INSERT INTO content_blobs (hash, data) "
+                f"SELECT DISTINCT ON (hash) content_blob_hash(data) AS hash, data FROM {IMPORT_STAGING_TABLE} "
+                "ON CONFLICT (hash) DO NOTHING"
+            ))
+            result = await conn.execute(text(
+                "INSERT INTO contents (id, user_id, type, status, blob_hash, prompt, version, metadata, created_at, updated_at) "
+                "SELECT id, CAST(:user_id AS UUID), CAST(type AS content_type_enum), CAST(status AS content_status_enum), "
+                "content_blob_hash(data), prompt, version, metadata, "
+                f"created_at, updated_at FROM {IMPORT_STAGING_TABLE}"
+            ), {"user_id": user_id})
+            imported += result.rowcount
+
+        return imported
 
     async def update(self, content_id: str, user_id: str, **kwargs) -> Content:
-        """Updated einen Content"""
-        stmt = select(ContentModel).where(
-            ContentModel.id == content_id,
-            ContentModel.user_id == user_id
+        """
+        Updated einen Content mit einem UPDATE ... RETURNING.
+        Neuer Payload → Blob-Referenz als CTE, nur der Pointer wird umgehängt (der alte Blob
+        wird ggf. vom GC entfernt).
+        """
+        values = {CONTENTS.c.updated_at: func.now()}
+        for key, value in kwargs.items():
+            column = UPDATABLE_COLUMNS.get(key)
+            if column is None:
+                continue
+            # Handle enum values
+            values[column] = value.value if key in ("type", "status") and hasattr(value, "value") else value
+
+        stmt = update(CONTENTS).where(
+            CONTENTS.c.id == content_id,
+            CONTENTS.c.user_id == user_id
         )
 
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        data = kwargs.get("data")
+        if data is not None:
+            blob = self.blobs.reference(data).cte("blob")
+            row = (await self.session.execute(
+                stmt.add_cte(blob).where(select(blob.c.hash).exists()).values(
+                    {**values, CONTENTS.c.blob_hash: select(blob.c.hash).scalar_subquery()}
+                ).returning(*RETURNING_COLUMNS)
+            )).one_or_none()
+            if row is None:
+                # Blob nicht im Snapshot (parallel neu committed oder vom GC gelöscht) → separat speichern
+                values[CONTENTS.c.blob_hash] = await self.blobs.put(data)
+                row = (await self.session.execute(
+                    stmt.values(values).returning(*RETURNING_COLUMNS)
+                )).one_or_none()
+        else:
+            # UPDATE ... FROM content_blobs liefert den (unveränderten) Payload gleich mit
+            blobs = ContentBlobModel.__table__
+            row = (await self.session.execute(
+                stmt.where(CONTENTS.c.blob_hash == blobs.c.hash).values(values).returning(
+                    *RETURNING_COLUMNS, blobs.c.data
+                )
+            )).one_or_none()
 
-        if not model:
+        if row is None:
             raise ValueError(f"Content {content_id} nicht gefunden")
 
-        # Update fields
-        for key, value in kwargs.items():
-            if hasattr(model, key):
-                # Handle enum values
-                if key in ['type', 'status'] and hasattr(value, 'value'):
-                    setattr(model, key, value.value)
-                else:
-                    setattr(model, key, value)
+        return self._to_entity(row, data if data is not None else row.data)
+
+    async def add_version(self, content: Content) -> Content:
+        """
+        Speichert content als neue Version des bestehenden Contents content.id.
 
-        model.updated_at = datetime.utcnow()
-        await self.session.commit()
-        await self.session.refresh(model)
+        1. Aktuelle Zeile + Payload sperren (FOR UPDATE) - parallele Regenerierungen laufen nacheinander
+        2. Hat die aktuelle Version noch keinen Historien-Eintrag (erste Regenerierung, Import),
+           wird sie als Snapshot nachgetragen
+        3. Neue Version als JSON Patch gegen die vorherige speichern - als Snapshot, wenn der letzte
+           Snapshot SNAPSHOT_INTERVAL Versionen zurückliegt oder der Patch nicht kleiner ist
+        4. contents auf den neuen Payload umhängen (den alten Blob entfernt ggf. der GC)
+        """
+        last_snapshot = select(func.max(VERSIONS.c.version)).where(
+            VERSIONS.c.content_id == ContentModel.id,
+            VERSIONS.c.kind == "snapshot"
+        ).scalar_subquery()
+        has_history = select(VERSIONS.c.version).where(
+            VERSIONS.c.content_id == ContentModel.id,
+            VERSIONS.c.version == ContentModel.version
+        ).exists()
 
-        return self._to_entity(model)
+        row = (await self.session.execute(
+            self._select(last_snapshot.label("last_snapshot"), has_history.label("has_history")).where(
+                ContentModel.id == content.id,
+                ContentModel.user_id == content.user_id
+            ).with_for_update(of=ContentModel)
+        )).one_or_none()
+        if row is None:
+            raise ValueError(f"Content {content.id} nicht gefunden")
+
+        current, current_data, last_snapshot_version, current_has_history = row
+        if current.type != content.type.value:
+            raise ValueError(f"Content {content.id} ist vom Typ {current.type}, nicht {content.type.value}")
+
+        current_version = current.version or 1
+        version = current_version + 1
+        records = []
+        if not current_has_history:
+            records.append(self._version_record(
+                current.id, current_version, current.user_id, "snapshot", current_data,
+                current.prompt, current.content_metadata, current.updated_at
+            ))
+            last_snapshot_version = current_version
+
+        patch = self.patches.diff(current_data, content.data)
+        is_snapshot = (
+            version - (last_snapshot_version or 0) >= self.SNAPSHOT_INTERVAL
+            or len(json.dumps(patch)) >= len(json.dumps(content.data))
+        )
+        records.append(self._version_record(
+            current.id, version, current.user_id,
+            "snapshot" if is_snapshot else "patch",
+            content.data if is_snapshot else patch,
+            content.prompt, content.metadata, func.now()
+        ))
+        await self.session.execute(insert(VERSIONS).values(records))
+
+        return await self.update(
+            content.id,
+            content.user_id,
+            data=content.data,
+            status=content.status,
+            prompt=content.prompt,
+            metadata=content.metadata,
+            version=version
+        )
+
+    async def list_versions(self, content_id: str, user_id: str) -> List[ContentVersion]:
+        """Listet die Versionen (nur Metadaten, keine Payloads) - neueste zuerst"""
+        result = await self.session.execute(
+            select(VERSIONS.c.version, VERSIONS.c.prompt, VERSIONS.c.metadata, VERSIONS.c.created_at).where(
+                VERSIONS.c.content_id == content_id,
+                VERSIONS.c.user_id == user_id
+            ).order_by(VERSIONS.c.version.desc())
+        )
+        versions = [
+            ContentVersion(
+                content_id=content_id,
+                version=row.version,
+                prompt=row.prompt,
+                created_at=row.created_at,
+                metadata=row.metadata
+            )
+            for row in result.all()
+        ]
+        if versions:
+            return versions
+
+        # Nie regeneriert: einzige Version ist der Content selbst
+        current = (await self.session.execute(
+            select(CONTENTS.c.version, CONTENTS.c.prompt, CONTENTS.c.metadata, CONTENTS.c.created_at).where(
+                CONTENTS.c.id == content_id,
+                CONTENTS.c.user_id == user_id
+            )
+        )).one_or_none()
+        if current is None:
+            return []
+        return [ContentVersion(
+            content_id=content_id,
+            version=current.version or 1,
+            prompt=current.prompt,
+            created_at=current.created_at,
+            metadata=current.metadata
+        )]
+
+    async def get_version(self, content_id: str, user_id: str, version: int) -> Optional[Content]:
+        """
+        Holt einen Content im Stand einer Version.
+
+        Die aktuelle Version kommt direkt aus contents. Ältere Versionen werden aus dem
+        letzten Snapshot <= version plus den folgenden Patches rekonstruiert (eine Query).
+        """
+        current = await self.get_by_id(content_id, user_id)
+        if current is None or version < 1 or version > current.version:
+            return None
+        if version == current.version:
+            return current
+
+        base = select(func.max(VERSIONS.c.version)).where(
+            VERSIONS.c.content_id == content_id,
+            VERSIONS.c.kind == "snapshot",
+            VERSIONS.c.version <= version
+        ).scalar_subquery()
+        rows = (await self.session.execute(
+            select(VERSIONS).where(
+                VERSIONS.c.content_id == content_id,
+                VERSIONS.c.user_id == user_id,
+                VERSIONS.c.version >= base,
+                VERSIONS.c.version <= version
+            ).order_by(VERSIONS.c.version)
+        )).all()
+        if not rows or rows[-1].version != version:
+            return None
+
+        data = rows[0].payload
+        for row in rows[1:]:
+            data = self.patches.apply(data, row.payload)
+        target = rows[-1]
+
+        return Content(
+            id=current.id,
+            user_id=current.user_id,
+            type=current.type,
+            status=ContentStatus.COMPLETED,
+            data=data,
+            prompt=target.prompt,
+            version=version,
+            created_at=current.created_at,
+            updated_at=target.created_at,
+            metadata=target.metadata
+        )
 
     async def delete(self, content_id: str, user_id: str) -> None:
-        """Löscht einen Content"""
-        stmt = select(ContentModel).where(
-            ContentModel.id == content_id,
-            ContentModel.user_id == user_id
+        """Löscht einen Content (ein DELETE; unreferenzierte Blobs entfernt der GC)"""
+        await self.session.execute(
+            delete(CONTENTS).where(
+                CONTENTS.c.id == content_id,
+                CONTENTS.c.user_id == user_id
+            )
         )
 
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+    @staticmethod
+    def _encode_cursor(rank: float, created_at: datetime, content_id) -> str:
+        """Kodiert die Keyset-Position als opaken URL-sicheren Cursor"""
+        raw = json.dumps([rank, created_at.isoformat(), str(content_id)])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[float, datetime, uuid.UUID]:
+        """Dekodiert einen Cursor aus _encode_cursor"""
+        try:
+            rank, created_at, content_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return float(rank), datetime.fromisoformat(created_at), uuid.UUID(content_id)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Ungültiger Cursor: {cursor}") from e
 
-        if model:
-            await self.session.delete(model)
-            await self.session.commit()
+    @staticmethod
+    def _to_import_record(content: Content) -> tuple:
+        """Content → COPY-Record (Spalten wie IMPORT_COLUMNS, JSONB als Text)"""
+        return (
+            uuid.UUID(content.id),
+            content.type.value,
+            content.status.value,
+            json.dumps(content.data, ensure_ascii=False),
+            content.prompt,
+            content.version,
+            json.dumps(content.metadata, ensure_ascii=False) if content.metadata is not None else None,
+            content.created_at,
+            content.updated_at
+        )
+
+    @staticmethod
+    def _version_record(content_id, version: int, user_id, kind: str, payload, prompt: str,
+                        metadata: Optional[dict], created_at) -> dict:
+        """Zeile für content_versions (Keys = Spaltennamen)"""
+        return {
+            "content_id": content_id,
+            "version": version,
+            "user_id": user_id,
+            "kind": kind,
+            "payload": payload,
+            "prompt": prompt,
+            "metadata": metadata,
+            "created_at": created_at
+        }
+
+    @staticmethod
+    def _select(*columns):
+        """SELECT auf contents inkl. Payload aus content_blobs: Zeilen sind (model, data, *columns)"""
+        return select(ContentModel, ContentBlobModel.data, *columns).join(
+            ContentBlobModel, ContentBlobModel.hash == ContentModel.blob_hash
+        )
 
-    def _to_entity(self, model: ContentModel) -> Content:
-        """Konvertiert SQLAlchemy Model zu Domain Entity"""
+    def _to_entity(self, model: ContentModel, data: dict) -> Content:
+        """Konvertiert SQLAlchemy Model (+ Blob Payload) zu Domain Entity"""
         return Content(
             id=str(model.id),
             user_id=str(model.user_id),
             type=ContentType(model.type),
             status=ContentStatus(model.status),
-            data=model.data,
+            data=data,
             prompt=model.prompt,
             version=model.version,
             metadata=model.content_metadata,
@@ -0,0 +1,91 @@
+from datetime import timedelta
+from typing import Optional
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from ....domain.interfaces.generation_job_repository import IGenerationJobRepository
+from ....domain.entities.generation_job import GenerationJob
+from ....domain.entities.content import ContentType
+from .models import GenerationJobModel
+
+
+GENERATION_JOBS = GenerationJobModel.__table__
+
+
+class PostgresGenerationJobRepository(IGenerationJobRepository):
+    """
+    Postgres Implementation der Generierungs-Queue.
+
+    Beliebig viele Worker können parallel claimen: der nächste fällige Job wird
+    per FOR UPDATE SKIP LOCKED gewählt und im selben Statement geleast.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, job: GenerationJob) -> GenerationJob:
+        stmt = insert(GENERATION_JOBS).values(
+            content_id=job.content_id,
+            user_id=job.user_id,
+            content_type=job.content_type.value,
+            prompt=job.prompt,
+            params=job.params,
+            regenerate=job.regenerate,
+            attempts=0
+        ).returning(GENERATION_JOBS)
+        row = (await self.session.execute(stmt)).one()
+        return self._to_entity(row)
+
+    async def claim(self, lease_seconds: int) -> Optional[GenerationJob]:
+        """UPDATE ... WHERE content_id = (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING - ein Round Trip"""
+        next_job = (
+            select(GENERATION_JOBS.c.content_id)
+            .where(GENERATION_JOBS.c.available_at <= func.now())
+            .order_by(GENERATION_JOBS.c.available_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(GENERATION_JOBS)
+            .where(GENERATION_JOBS.c.content_id == next_job)
+            .values(
+                attempts=GENERATION_JOBS.c.attempts + 1,
+                available_at=func.now() + timedelta(seconds=lease_seconds)
+            )
+            .returning(GENERATION_JOBS)
+        )
+        row = (await self.session.execute(stmt)).one_or_none()
+        return self._to_entity(row) if row else None
+
+    async def retry(self, content_id: str, delay_seconds: int) -> None:
+        await self.session.execute(
+            update(GENERATION_JOBS)
+            .where(GENERATION_JOBS.c.content_id == content_id)
+            .values(available_at=func.now() + timedelta(seconds=delay_seconds))
+        )
+
+    async def delete(self, content_id: str) -> None:
+        await self.session.execute(
+            delete(GENERATION_JOBS).where(GENERATION_JOBS.c.content_id == content_id)
+        )
+
+    async def count_pending(self, user_id: str, content_type: ContentType) -> int:
+        stmt = select(func.count()).select_from(GENERATION_JOBS).where(
+            GENERATION_JOBS.c.user_id == user_id,
+            GENERATION_JOBS.c.content_type == content_type.value
+        )
+        return (await self.session.execute(stmt)).scalar_one()
+
+    def _to_entity(self, row) -> GenerationJob:
+        """Konvertiert eine Row zu Domain Entity"""
+        return GenerationJob(
+            content_id=str(row.content_id),
+            user_id=str(row.user_id),
+            content_type=ContentType(row.content_type),
+            prompt=row.prompt,
+            params=row.params or {},
+            regenerate=row.regenerate,
+            attempts=row.attempts,
+            available_at=row.available_at,
+            created_at=row.created_at
+        )
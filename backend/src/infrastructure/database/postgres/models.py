@@ -1,11 +1,27 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, CheckConstraint, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.sql import func
+from sqlalchemy import Column, String, Integer, BigInteger, Date, DateTime, Boolean, Text, CheckConstraint, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR, ENUM
+from sqlalchemy.sql import func, text
 import uuid
+from ....domain.entities.content import ContentType, ContentStatus
 from .config import Base
 
 
+# Text Search Config für die Volltextsuche (Content ist deutsch)
+SEARCH_CONFIG = "german"
+
+# search_vector wird per Trigger aus prompt (Gewicht A) und den Text-Feldern des
+# referenzierten content_blobs.data (Gewicht B) berechnet - siehe SQL-Funktion
+# contents_search_vector() in schema.sql. Suchen machen keine Extraktion mehr.
+
+
+# Native Postgres Enums für Content-Typ und -Status (4 Bytes statt TEXT + CHECK).
+# Das ORM liest und schreibt weiterhin die String-Werte der Domain Enums;
+# neue Werte brauchen eine Migration (ALTER TYPE ... ADD VALUE).
+CONTENT_TYPE_ENUM = ENUM(*(t.value for t in ContentType), name="content_type_enum", create_type=False)
+CONTENT_STATUS_ENUM = ENUM(*(s.value for s in ContentStatus), name="content_status_enum", create_type=False)
+
+
 class UserModel(Base):
     """SQLAlchemy Model für Users Tabelle"""
     __tablename__ = "users"
@@ -51,32 +67,99 @@ class SubscriptionModel(Base):
     )
 
 
+class ContentBlobModel(Base):
+    """
+    SQLAlchemy Model für Content Blobs (content-addressed Payload Store).
+    Jeder generierte JSON-Payload wird genau einmal gespeichert, Schlüssel ist
+    der SHA-256 der kanonischen JSONB-Darstellung (SQL-Funktion content_blob_hash).
+    Blobs ohne Referenz aus contents entfernt der ContentBlobGCJob.
+    """
+    __tablename__ = "content_blobs"
+
+    hash = Column(Text, primary_key=True)
+    data = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class ContentModel(Base):
-    """SQLAlchemy Model für Contents Tabelle (polymorphisch)"""
+    """
+    SQLAlchemy Model für Contents Tabelle (polymorphisch).
+    Monatlich nach created_at range-partitioniert - der Primary Key muss daher
+    den Partition Key enthalten. Partitionen verwaltet ContentPartitionManager.
+    Der Payload (data) liegt dedupliziert in content_blobs, referenziert über blob_hash.
+    """
     __tablename__ = "contents"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
-    type = Column(Text, nullable=False, index=True)
-    status = Column(Text, nullable=False, default='completed')
-    data = Column(JSONB, nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    type = Column(CONTENT_TYPE_ENUM, nullable=False, index=True)
+    status = Column(CONTENT_STATUS_ENUM, nullable=False, default='completed')
+    blob_hash = Column(Text, ForeignKey('content_blobs.hash'), nullable=False, index=True)
     prompt = Column(Text, nullable=False)
     version = Column(Integer, default=1)
-    content_metadata = Column(JSONB, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    content_metadata = Column('metadata', JSONB, nullable=True)
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)  # per Trigger beim ersten Abschluss (contents_set_completed_at)
+    search_vector = Column(TSVECTOR)  # per Trigger gepflegt (contents_search_vector)
 
     __table_args__ = (
-        CheckConstraint(
-            "type IN ('hook', 'script', 'shotlist', 'voiceover', 'caption', 'broll', 'calendar')",
-            name='contents_type_check'
-        ),
-        CheckConstraint(
-            "status IN ('generating', 'completed', 'failed')",
-            name='contents_status_check'
+        Index('idx_contents_user_created_at', 'user_id', 'created_at'),
+        Index('idx_contents_completed_at', 'completed_at'),
+        Index('idx_contents_search_vector', 'search_vector', postgresql_using='gin'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+
+
+
+class ContentVersionModel(Base):
+    """
+    SQLAlchemy Model für die Versions-Historie der Contents.
+    kind 'snapshot': payload = kompletter Content, kind 'patch': JSON Patch gegen die
+    vorherige Version. Einträge werden per Trigger mit dem Content gelöscht.
+    """
+    __tablename__ = "content_versions"
+
+    content_id = Column(UUID(as_uuid=True), primary_key=True)
+    version = Column(Integer, primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    kind = Column(Text, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    prompt = Column(Text, nullable=False)
+    content_metadata = Column('metadata', JSONB, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        CheckConstraint("kind IN ('snapshot', 'patch')", name='content_versions_kind_check'),
+        Index(
+            'idx_content_versions_snapshots', 'content_id', 'version',
+            postgresql_where=text("kind = 'snapshot'")
         ),
     )
 
+class GenerationJobModel(Base):
+    """
+    SQLAlchemy Model für die Queue der asynchronen Generierungen (ein Job pro Content).
+    Worker holen Jobs per FOR UPDATE SKIP LOCKED und verschieben available_at als Lease.
+    Kein Foreign Key auf contents (partitioniert, PK inkl. created_at) - Jobs ohne
+    Content verwirft der Worker.
+    """
+    __tablename__ = "generation_jobs"
+
+    content_id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    content_type = Column(CONTENT_TYPE_ENUM, nullable=False)
+    prompt = Column(Text, nullable=False)
+    params = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    regenerate = Column(Boolean, nullable=False, default=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index('idx_generation_jobs_user_type', 'user_id', 'content_type'),
+    )
+
 
 class UsageTrackingModel(Base):
     """SQLAlchemy Model für Usage Tracking Tabelle"""
@@ -84,9 +167,36 @@ class UsageTrackingModel(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
-    content_type = Column(Text, nullable=False)
+    content_type = Column(CONTENT_TYPE_ENUM, nullable=False)
     count = Column(Integer, default=0)
     period_start = Column(DateTime(timezone=True), nullable=False, index=True)
     period_end = Column(DateTime(timezone=True), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class UsageDailyRollupModel(Base):
+    """
+    SQLAlchemy Model für vorberechnete Tages-Aggregate (Tag, Typ, Plan, User).
+    Wird vom UsageRollupJob inkrementell gepflegt - Dashboards lesen nur diese Tabelle.
+    """
+    __tablename__ = "usage_daily_rollups"
+
+    day = Column(Date, primary_key=True)
+    content_type = Column(Text, primary_key=True)
+    plan = Column(Text, primary_key=True)
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        Index('idx_usage_daily_rollups_user_day', 'user_id', 'day'),
+    )
+
+
+class JobWatermarkModel(Base):
+    """SQLAlchemy Model für Watermarks inkrementeller Jobs (bis wohin ist verarbeitet)"""
+    __tablename__ = "job_watermarks"
+
+    name = Column(Text, primary_key=True)
+    watermark = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,165 @@
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from .models import ContentModel
+
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "contents"
+DEFAULT_PARTITION = "contents_default"
+PARTITION_NAME_PATTERN = re.compile(r"^contents_p(\d{4})_(\d{2})$")
+# Spaltenliste für das Umziehen von Zeilen aus der Default-Partition
+CONTENT_COLUMNS = ", ".join(f'"{c.name}"' for c in ContentModel.__table__.columns)
+
+
+def month_start(value: date) -> date:
+    """Erster Tag des Monats"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """Verschiebt einen Monatsanfang um n Monate (auch negativ)"""
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name der Monatspartition, z.B. contents_p2025_03"""
+    return f"contents_p{month.year:04d}_{month.month:02d}"
+
+
+@dataclass
+class ContentPartition:
+    """Eine Monatspartition der contents Tabelle"""
+    name: str
+    month: date  # Erster Tag des Monats (inklusive)
+
+    @property
+    def upper_bound(self) -> date:
+        return add_months(self.month, 1)
+
+
+class ContentPartitionManager:
+    """
+    Verwaltet die monatlichen Range-Partitionen von contents.
+
+    - ensure_partitions: legt Partitionen für die kommenden Monate an (idempotent)
+    - list_partitions: alle angehängten Monatspartitionen (ohne Default-Partition)
+    - detach_and_drop: entfernt eine archivierte Partition
+
+    Nur aus Jobs unter Advisory Lock aufrufen (ContentArchivalJob), nie im Request-Pfad
+    oder beim Start jedes Workers. Neue Monate werden als eigene Tabelle angelegt und per
+    ATTACH PARTITION angehängt - das sperrt contents nur mit SHARE UPDATE EXCLUSIVE,
+    Reads und Writes laufen weiter (CREATE TABLE ... PARTITION OF bräuchte ACCESS EXCLUSIVE).
+
+    Die Default-Partition fängt Zeilen außerhalb aller Monatsbereiche ab und sollte leer
+    bleiben. Liegen dort doch Zeilen des Monats (z.B. nach dem Archivieren eingefügt),
+    werden sie vor dem Anhängen in die neue Partition verschoben - sonst schlägt ATTACH fehl.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+
+    async def ensure_partitions(self, months_ahead: int = 3, months_back: int = 0, today: Optional[date] = None) -> List[str]:
+        """Erstellt fehlende Partitionen von (heute - months_back) bis (heute + months_ahead)"""
+        current = month_start(today or datetime.utcnow().date())
+        created = []
+
+        async with self.engine.connect() as conn:
+            existing = {p.name for p in await self._list(conn)}
+        for offset in range(-months_back, months_ahead + 1):
+            month = add_months(current, offset)
+            if partition_name(month) in existing:
+                continue
+            # Eine Transaktion pro Monat: die Sperren auf contents_default bleiben kurz
+            async with self.engine.begin() as conn:
+                await self._attach_month(conn, month)
+            created.append(partition_name(month))
+
+        return created
+
+    async def create_partition(self, month: date) -> bool:
+        """
+        Erstellt die Partition für einen Monat, falls sie fehlt - z.B. für Rehydrierung.
+        Returns: True wenn sie neu angelegt wurde
+        """
+        month = month_start(month)
+        async with self.engine.begin() as conn:
+            if partition_name(month) in {p.name for p in await self._list(conn)}:
+                return False
+            await self._attach_month(conn, month)
+        return True
+
+    async def _attach_month(self, conn: AsyncConnection, month: date) -> int:
+        """
+        Legt die Monatspartition an, zieht passende Zeilen aus der Default-Partition um
+        und hängt sie an. Returns: Anzahl umgezogener Zeilen
+        """
+        name = partition_name(month)
+        lower, upper = month.isoformat(), add_months(month, 1).isoformat()
+        bounds = f"created_at >= '{lower}' AND created_at < '{upper}'"
+
+        await conn.execute(text(f'CREATE TABLE "{name}" (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+
+        # Umzug ist kein Löschen: Versions-Historie der Zeilen bleibt erhalten (nur in dieser Transaktion)
+        await conn.execute(text(f"ALTER TABLE {DEFAULT_PARTITION} DISABLE TRIGGER contents_delete_versions"))
+        moved = (await conn.execute(text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {bounds} RETURNING {CONTENT_COLUMNS}) "
+            f'INSERT INTO "{name}" ({CONTENT_COLUMNS}) SELECT {CONTENT_COLUMNS} FROM moved'
+        ))).rowcount
+        await conn.execute(text(f"ALTER TABLE {DEFAULT_PARTITION} ENABLE TRIGGER contents_delete_versions"))
+
+        # Passender CHECK Constraint → ATTACH muss die neue Tabelle nicht erneut scannen
+        await conn.execute(text(f'ALTER TABLE "{name}" ADD CONSTRAINT "{name}_bounds" CHECK ({bounds})'))
+        await conn.execute(text(
+            f'ALTER TABLE {PARENT_TABLE} ATTACH PARTITION "{name}" '
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        ))
+        await conn.execute(text(f'ALTER TABLE "{name}" DROP CONSTRAINT "{name}_bounds"'))
+
+        if moved:
+            logger.warning("Partition %s: %d Zeilen aus %s umgezogen", name, moved, DEFAULT_PARTITION)
+        return moved
+
+    async def list_partitions(self) -> List[ContentPartition]:
+        async with self.engine.connect() as conn:
+            return await self._list(conn)
+
+    async def partitions_older_than(self, months: int, today: Optional[date] = None) -> List[ContentPartition]:
+        """Partitionen deren gesamter Monat vor (aktueller Monat - months) liegt"""
+        cutoff = add_months(month_start(today or datetime.utcnow().date()), -months)
+        return [p for p in await self.list_partitions() if p.upper_bound <= cutoff]
+
+    async def detach_and_drop(self, partition: ContentPartition) -> None:
+        """Hängt eine Partition ab und löscht sie (nur nach erfolgreicher Archivierung aufrufen)"""
+        async with self.engine.begin() as conn:
+            await conn.execute(text(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION "{partition.name}"'))
+            # DROP feuert keine DELETE-Trigger → Versions-Historie der Partition selbst löschen
+            # (nicht mehr referenzierte Blobs entfernt der ContentBlobGCJob)
+            await conn.execute(text(
+                f'DELETE FROM content_versions v USING "{partition.name}" p WHERE v.content_id = p.id'
+            ))
+            await conn.execute(text(f'DROP TABLE "{partition.name}"'))
+
+    async def _list(self, conn) -> List[ContentPartition]:
+        result = await conn.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent"
+        ), {"parent": PARENT_TABLE})
+
+        partitions = []
+        for (name,) in result.all():
+            match = PARTITION_NAME_PATTERN.match(name)
+            if match:
+                partitions.append(ContentPartition(
+                    name=name,
+                    month=date(int(match.group(1)), int(match.group(2)), 1)
+                ))
+        return sorted(partitions, key=lambda p: p.month)
@@ -0,0 +1,41 @@
+import time
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from ...monitoring import metrics
+
+
+def instrument_pool(engine: AsyncEngine, name: str = "primary") -> None:
+    """
+    Registriert Pool-Metrics für eine Engine (Label pool=name):
+    - db_pool_checkout_seconds: wie lange eine Connection pro Checkout gehalten wurde
+    - db_pool_checkouts_total: Anzahl Checkouts
+    - db_pool_<name> (Collector): size, checked_out, checked_in, overflow
+    """
+    pool = engine.sync_engine.pool
+    hold_time = metrics.histogram(
+        "db_pool_checkout_seconds",
+        "Haltezeit einer Pool-Connection pro Checkout",
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    )
+    checkouts = metrics.counter("db_pool_checkouts_total", "Pool Checkouts")
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout_started"] = time.perf_counter()
+        checkouts.inc(pool=name)
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        started = connection_record.info.pop("checkout_started", None)
+        if started is not None:
+            hold_time.observe(time.perf_counter() - started, pool=name)
+
+    def _pool_status() -> dict:
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+        }
+
+    metrics.register_collector(f"db_pool_{name}", _pool_status)
@@ -0,0 +1,129 @@
+"""
+Read-Replica Routing.
+
+Read-only Requests laufen - wenn REPLICA_DATABASE_URL gesetzt ist - gegen die Replica,
+alles andere gegen den Primary. Ohne Replica (oder wenn sie beim Start nicht erreichbar ist)
+geht alles transparent an die eine Engine aus config.py.
+"""
+import logging
+import os
+from typing import Iterable, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from ...cache.ttl_cache import TTLCache
+from ...monitoring import metrics
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - redis ist optional
+    aioredis = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReadYourWritesGuard:
+    """
+    Pinnt User nach einem Write für ein kurzes Fenster auf den Primary.
+
+    Die Replica hängt dem Primary um die Replikationsverzögerung hinterher - ohne Pin
+    würde ein User direkt nach einem Write (Generierung, Upgrade, Import) seinen alten
+    Stand sehen. Pins liegen lokal im Worker und (mit REDIS_URL) zusätzlich in Redis,
+    damit sie auch für Requests auf anderen Workern gelten.
+    """
+
+    KEY_PREFIX = "ryw:"
+
+    def __init__(self, window_seconds: Optional[float] = None, redis_url: Optional[str] = None):
+        self.window_seconds = window_seconds if window_seconds is not None else float(
+            os.getenv("READ_YOUR_WRITES_WINDOW_SECONDS", "10")
+        )
+        self.redis_url = redis_url if redis_url is not None else os.getenv("REDIS_URL")
+        self._local = TTLCache(ttl_seconds=self.window_seconds, name="read_your_writes")
+        self._redis = None
+        if self.redis_url and aioredis is not None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+
+    async def pin(self, user_ids: Iterable[str]) -> None:
+        """Pinnt die User für window_seconds auf den Primary"""
+        user_ids = [str(user_id) for user_id in user_ids]
+        for user_id in user_ids:
+            self._local.set(user_id, True)
+        if self._redis is not None and user_ids:
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for user_id in user_ids:
+                        pipe.set(self.KEY_PREFIX + user_id, "1", px=int(self.window_seconds * 1000))
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning("Read-Your-Writes: Redis nicht erreichbar (%s) - Pin nur lokal", e)
+
+    async def is_pinned(self, user_id: str) -> bool:
+        """True wenn der User kürzlich geschrieben hat"""
+        user_id = str(user_id)
+        if self._local.get(user_id):
+            return True
+        if self._redis is None:
+            return False
+        try:
+            return bool(await self._redis.exists(self.KEY_PREFIX + user_id))
+        except Exception as e:
+            # Im Zweifel Primary - lieber Last als veraltete Daten
+            logger.warning("Read-Your-Writes: Redis nicht erreichbar (%s) - Request geht an den Primary", e)
+            return True
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.close()
+
+
+class DatabaseRouter:
+    """
+    Wählt pro Request die Session Factory (Primary oder Replica).
+
+    Writes und alles ohne erklärte read-only Absicht gehen immer an den Primary.
+    Read-only Requests gehen an die Replica, außer der User ist durch den
+    ReadYourWritesGuard gepinnt.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica: Optional[async_sessionmaker] = None,
+        guard: Optional[ReadYourWritesGuard] = None
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.guard = guard
+        self._routed = metrics.counter("db_routed_sessions_total", "Sessions nach Ziel (primary/replica/pinned)")
+
+    @property
+    def has_replica(self) -> bool:
+        return self.replica is not None
+
+    async def session_factory(self, read_only: bool = False, user_id: Optional[str] = None) -> async_sessionmaker:
+        """Session Factory für einen Request mit gegebener Absicht"""
+        if not read_only or self.replica is None:
+            self._routed.inc(target="primary")
+            return self.primary
+        if user_id and self.guard is not None and await self.guard.is_pinned(user_id):
+            self._routed.inc(target="pinned")
+            return self.primary
+        self._routed.inc(target="replica")
+        return self.replica
+
+    async def check_replica(self) -> bool:
+        """
+        Prüft beim Start ob die Replica erreichbar ist.
+        Wenn nicht, wird sie deaktiviert und alle Reads gehen an den Primary.
+        """
+        if self.replica is None:
+            return False
+        try:
+            async with self.replica() as session:
+                await session.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.warning("Read Replica nicht erreichbar (%s) - alle Queries gehen an den Primary", e)
+            self.replica = None
+            return False
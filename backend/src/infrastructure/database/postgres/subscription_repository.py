@@ -1,9 +1,15 @@
-from typing import Optional
-from sqlalchemy import select
+from typing import Optional, Tuple
+from datetime import datetime
+from sqlalchemy import select, insert, update, delete, func, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from ....domain.interfaces.subscription_repository import ISubscriptionRepository
 from ....domain.entities.subscription import Subscription, SubscriptionPlan, SubscriptionStatus
-from .models import SubscriptionModel
+from ....domain.entities.usage import UsageSummary
+from .models import SubscriptionModel, UsageTrackingModel
+
+
+# Writes als Core-Statements mit RETURNING (ein Round Trip pro Write, kein refresh)
+SUBSCRIPTIONS = SubscriptionModel.__table__
 
 
 class PostgresSubscriptionRepository(ISubscriptionRepository):
@@ -21,6 +27,53 @@ class PostgresSubscriptionRepository(ISubscriptionRepository):
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
+    async def get_by_user_id_with_usage(
+        self,
+        user_id: str,
+        period_start: datetime,
+        period_end: datetime
+    ) -> Optional[Tuple[Subscription, UsageSummary]]:
+        """
+        Subscription LEFT JOIN aggregierte Usage (GROUP BY content_type) in einer Query.
+        Liefert eine Zeile pro Content-Typ mit Usage (bzw. eine Zeile mit NULL ohne Usage).
+        """
+        usage = select(
+            UsageTrackingModel.content_type.label("content_type"),
+            func.sum(UsageTrackingModel.count).label("total")
+        ).where(
+            UsageTrackingModel.user_id == user_id,
+            UsageTrackingModel.period_start == period_start,
+            UsageTrackingModel.period_end == period_end
+        ).group_by(UsageTrackingModel.content_type).subquery()
+
+        stmt = select(
+            SubscriptionModel,
+            usage.c.content_type,
+            usage.c.total
+        ).outerjoin(usage, true()).where(
+            SubscriptionModel.user_id == user_id,
+            SubscriptionModel.status.in_(['active', 'trialing'])
+        )
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        if not rows:
+            return None
+
+        subscription = self._to_entity(rows[0][0])
+        counts = {
+            content_type: int(total or 0)
+            for _, content_type, total in rows
+            if content_type is not None
+        }
+
+        return subscription, UsageSummary(
+            user_id=user_id,
+            period_start=period_start,
+            period_end=period_end,
+            counts=counts
+        )
+
     async def get_by_stripe_id(self, stripe_subscription_id: str) -> Optional[Subscription]:
         stmt = select(SubscriptionModel).where(
             SubscriptionModel.stripe_subscription_id == stripe_subscription_id
@@ -30,7 +83,7 @@ class PostgresSubscriptionRepository(ISubscriptionRepository):
         return self._to_entity(model) if model else None
 
     async def create(self, subscription: Subscription) -> Subscription:
-        model = SubscriptionModel(
+        stmt = insert(SUBSCRIPTIONS).values(
             id=subscription.id,
             user_id=subscription.user_id,
             plan=subscription.plan.value,
@@ -39,41 +92,34 @@ class PostgresSubscriptionRepository(ISubscriptionRepository):
             current_period_start=subscription.current_period_start,
             current_period_end=subscription.current_period_end,
             cancel_at_period_end=subscription.cancel_at_period_end
-        )
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+        ).returning(SUBSCRIPTIONS)
+        row = (await self.session.execute(stmt)).one()
+        return self._to_entity(row)
 
     async def update(self, subscription_id: str, **kwargs) -> Subscription:
-        stmt = select(SubscriptionModel).where(SubscriptionModel.id == subscription_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-
-        if not model:
-            raise ValueError(f"Subscription {subscription_id} nicht gefunden")
-
+        values = {}
         for key, value in kwargs.items():
-            if hasattr(model, key):
+            if key in SUBSCRIPTIONS.c:
                 if key in ['plan', 'status'] and hasattr(value, 'value'):
-                    setattr(model, key, value.value)
+                    values[key] = value.value
                 else:
-                    setattr(model, key, value)
+                    values[key] = value
 
-        await self.session.commit()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+        stmt = update(SUBSCRIPTIONS).where(
+            SUBSCRIPTIONS.c.id == subscription_id
+        ).values(values).returning(SUBSCRIPTIONS)
+        row = (await self.session.execute(stmt)).one_or_none()
 
-    async def delete(self, subscription_id: str) -> None:
-        stmt = select(SubscriptionModel).where(SubscriptionModel.id == subscription_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        if not row:
+            raise ValueError(f"Subscription {subscription_id} nicht gefunden")
+
+        return self._to_entity(row)
 
-        if model:
-            await self.session.delete(model)
-            await self.session.commit()
+    async def delete(self, subscription_id: str) -> None:
+        await self.session.execute(delete(SUBSCRIPTIONS).where(SUBSCRIPTIONS.c.id == subscription_id))
 
-    def _to_entity(self, model: SubscriptionModel) -> Subscription:
+    def _to_entity(self, model) -> Subscription:
+        """SubscriptionModel oder RETURNING-Row → Domain Entity"""
         return Subscription(
             id=str(model.id),
             user_id=str(model.user_id),
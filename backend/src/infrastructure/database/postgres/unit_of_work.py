@@ -0,0 +1,92 @@
+import inspect
+import logging
+from typing import Awaitable, Callable, List, Optional, Set
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from ....domain.interfaces.unit_of_work import IUnitOfWork
+from ...monitoring import metrics
+from .config import async_session_maker
+from .routing import ReadYourWritesGuard
+
+
+logger = logging.getLogger(__name__)
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    """
+    Unit of Work auf Basis einer AsyncSession (eine pro Request).
+
+    Die Session holt sich eine Pool-Connection erst beim ersten Query und gibt sie
+    bei commit/rollback/release wieder ab - während eines LLM Calls hält der Request
+    also keine Connection. Alle Writes landen in einer Transaktion mit einem Commit.
+
+    read_only=True erklärt die Absicht eines Requests nur zu lesen (die Session kann
+    dann von der Replica kommen) - ein Commit mit Änderungen schlägt fehl.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = async_session_maker,
+        read_only: bool = False,
+        guard: Optional[ReadYourWritesGuard] = None
+    ):
+        self.session: AsyncSession = session_factory()
+        self.read_only = read_only
+        self.guard = guard
+        self._written_users: Set[str] = set()
+        self._after_commit: List[Callable[[], Optional[Awaitable[None]]]] = []
+        self._transactions = metrics.counter("db_transactions_total", "Unit of Work Transaktionen nach Ergebnis")
+
+    async def __aenter__(self) -> "SqlAlchemyUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def commit(self) -> None:
+        if self.read_only and (self.session.new or self.session.dirty or self.session.deleted or self._written_users):
+            raise RuntimeError("Read-only Unit of Work kann keine Änderungen committen")
+        await self.session.commit()
+        self._transactions.inc(outcome="commit")
+
+        written, self._written_users = self._written_users, set()
+        if written and self.guard is not None:
+            await self.guard.pin(written)
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                # Der Commit ist bereits erfolgt - Callback-Fehler dürfen den Request nicht scheitern lassen
+                logger.warning("Unit of Work: after_commit Callback fehlgeschlagen: %s", e)
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+        self._after_commit.clear()
+        self._written_users.clear()
+        self._transactions.inc(outcome="rollback")
+
+    async def release(self) -> None:
+        if not self.session.in_transaction():
+            return
+        if self.session.new or self.session.dirty or self.session.deleted:
+            raise RuntimeError("Unit of Work enthält ungespeicherte Änderungen - vor release() committen")
+        # Commit einer reinen Lese-Transaktion kostet keinen WAL-Flush
+        await self.session.commit()
+        self._transactions.inc(outcome="release")
+
+    def mark_written(self, user_id: str) -> None:
+        self._written_users.add(str(user_id))
+
+    def after_commit(self, callback: Callable[[], Optional[Awaitable[None]]]) -> None:
+        self._after_commit.append(callback)
+
+    async def close(self) -> None:
+        """Schließt die Session; nicht committete Änderungen werden verworfen"""
+        if self.session.in_transaction() and (self.session.new or self.session.dirty or self.session.deleted or self._after_commit or self._written_users):
+            self._transactions.inc(outcome="rollback")
+        self._after_commit.clear()
+        self._written_users.clear()
+        await self.session.close()
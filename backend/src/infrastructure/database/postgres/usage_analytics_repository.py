@@ -0,0 +1,73 @@
+from datetime import date
+from typing import List, Optional
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from ....domain.interfaces.usage_analytics_repository import IUsageAnalyticsRepository
+from ....domain.entities.analytics import UsageAnalyticsRow, UsageAnalyticsResult, ANALYTICS_DIMENSIONS
+from .models import UsageDailyRollupModel, JobWatermarkModel
+
+
+ROLLUP_WATERMARK_NAME = "usage_daily_rollups"
+
+
+class PostgresUsageAnalyticsRepository(IUsageAnalyticsRepository):
+    """
+    Postgres Implementation der Usage Analytics.
+    Liest ausschließlich usage_daily_rollups (Range-Scan über den Primary Key ab day) -
+    contents wird nie gescannt.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def query(
+        self,
+        start: date,
+        end: date,
+        group_by: List[str],
+        content_type: Optional[str] = None,
+        plan: Optional[str] = None,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> UsageAnalyticsResult:
+        """Summiert die Rollups im Zeitraum gruppiert nach den gegebenen Dimensionen"""
+        dimensions = [getattr(UsageDailyRollupModel, name) for name in ANALYTICS_DIMENSIONS if name in group_by]
+        total = func.sum(UsageDailyRollupModel.count).label("count")
+
+        stmt = select(*dimensions, total).where(
+            UsageDailyRollupModel.day >= start,
+            UsageDailyRollupModel.day <= end
+        )
+        if content_type:
+            stmt = stmt.where(UsageDailyRollupModel.content_type == content_type)
+        if plan:
+            stmt = stmt.where(UsageDailyRollupModel.plan == plan)
+        if user_id:
+            stmt = stmt.where(UsageDailyRollupModel.user_id == user_id)
+
+        if dimensions:
+            stmt = stmt.group_by(*dimensions)
+        if "day" in group_by:
+            stmt = stmt.order_by(UsageDailyRollupModel.day, total.desc())
+        else:
+            stmt = stmt.order_by(total.desc())
+        if limit:
+            stmt = stmt.limit(limit)
+
+        result = await self.session.execute(stmt)
+        rows = []
+        for row in result.all():
+            values = row._mapping
+            rows.append(UsageAnalyticsRow(
+                count=int(values["count"] or 0),
+                day=values.get("day"),
+                content_type=values.get("content_type"),
+                plan=values.get("plan"),
+                user_id=str(values["user_id"]) if values.get("user_id") else None
+            ))
+
+        watermark = (await self.session.execute(
+            select(JobWatermarkModel.watermark).where(JobWatermarkModel.name == ROLLUP_WATERMARK_NAME)
+        )).scalar_one_or_none()
+
+        return UsageAnalyticsResult(rows=rows, data_until=watermark)
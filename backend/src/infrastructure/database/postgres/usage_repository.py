@@ -1,14 +1,19 @@
 from typing import Optional
 from datetime import datetime
 import uuid
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, delete, and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from ....domain.interfaces.usage_repository import IUsageRepository
-from ....domain.entities.usage import Usage
+from ....domain.entities.usage import Usage, UsageSummary
 from ....domain.entities.content import ContentType
 from .models import UsageTrackingModel
 
 
+# Writes als Core-Statements mit RETURNING (ein Round Trip pro Write, kein refresh)
+USAGE_TRACKING = UsageTrackingModel.__table__
+
+
 class PostgresUsageRepository(IUsageRepository):
     """Postgres Implementation des Usage Repository"""
 
@@ -48,19 +53,42 @@ class PostgresUsageRepository(IUsageRepository):
                 updated_at=datetime.utcnow()
             )
 
+    async def get_usage_summary(
+        self,
+        user_id: str,
+        period_start: datetime,
+        period_end: datetime
+    ) -> UsageSummary:
+        """Alle Content-Typen in einer GROUP BY Query statt einer Query pro Typ"""
+        stmt = select(
+            UsageTrackingModel.content_type,
+            func.sum(UsageTrackingModel.count)
+        ).where(
+            UsageTrackingModel.user_id == user_id,
+            UsageTrackingModel.period_start == period_start,
+            UsageTrackingModel.period_end == period_end
+        ).group_by(UsageTrackingModel.content_type)
+
+        result = await self.session.execute(stmt)
+
+        return UsageSummary(
+            user_id=user_id,
+            period_start=period_start,
+            period_end=period_end,
+            counts={content_type: int(total or 0) for content_type, total in result.all()}
+        )
+
     async def create(self, usage: Usage) -> Usage:
-        model = UsageTrackingModel(
+        stmt = insert(USAGE_TRACKING).values(
             id=usage.id,
             user_id=usage.user_id,
             content_type=usage.content_type,
             count=usage.count,
             period_start=usage.period_start,
             period_end=usage.period_end
-        )
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+        ).returning(USAGE_TRACKING)
+        row = (await self.session.execute(stmt)).one()
+        return self._to_entity(row)
 
     async def increment_usage(
         self,
@@ -69,44 +97,37 @@ class PostgresUsageRepository(IUsageRepository):
         period_start: datetime,
         period_end: datetime
     ) -> Usage:
-        # Try to get existing usage
-        usage = await self.get_current_usage(user_id, content_type, period_start, period_end)
-
-        if usage:
-            # Update existing
-            stmt = select(UsageTrackingModel).where(UsageTrackingModel.id == usage.id)
-            result = await self.session.execute(stmt)
-            model = result.scalar_one()
-            model.count += 1
-            await self.session.commit()
-            await self.session.refresh(model)
-            return self._to_entity(model)
-        else:
-            # Create new
-            import uuid
-            new_usage = Usage(
-                id=str(uuid.uuid4()),
-                user_id=user_id,
-                content_type=content_type.value,
-                count=1,
-                period_start=period_start,
-                period_end=period_end
-            )
-            return await self.create(new_usage)
+        """
+        Atomarer Upsert auf UNIQUE(user_id, content_type, period_start, period_end):
+        legt den Zähler mit 1 an oder erhöht ihn - ein Statement, kein Lost Update
+        bei parallelen Generierungen.
+        """
+        stmt = pg_insert(USAGE_TRACKING).values(
+            user_id=user_id,
+            content_type=content_type.value,
+            count=1,
+            period_start=period_start,
+            period_end=period_end
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                USAGE_TRACKING.c.user_id,
+                USAGE_TRACKING.c.content_type,
+                USAGE_TRACKING.c.period_start,
+                USAGE_TRACKING.c.period_end
+            ],
+            set_={"count": USAGE_TRACKING.c.count + 1, "updated_at": func.now()}
+        ).returning(USAGE_TRACKING)
+        row = (await self.session.execute(stmt)).one()
+        return self._to_entity(row)
 
     async def reset_usage(self, user_id: str) -> None:
         # In practice würde man alte Records archivieren statt löschen
         # Für jetzt: löschen wir alle Usage-Records des Users
-        stmt = select(UsageTrackingModel).where(UsageTrackingModel.user_id == user_id)
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-
-        for model in models:
-            await self.session.delete(model)
-
-        await self.session.commit()
+        await self.session.execute(delete(USAGE_TRACKING).where(USAGE_TRACKING.c.user_id == user_id))
 
-    def _to_entity(self, model: UsageTrackingModel) -> Usage:
+    def _to_entity(self, model) -> Usage:
+        """UsageTrackingModel oder RETURNING-Row → Domain Entity"""
         return Usage(
             id=str(model.id),
             user_id=str(model.user_id),
@@ -1,11 +1,15 @@
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from ....domain.interfaces.user_repository import IUserRepository
 from ....domain.entities.user import User, UserRole
 from .models import UserModel
 
 
+# Writes als Core-Statements mit RETURNING (ein Round Trip pro Write, kein refresh)
+USERS = UserModel.__table__
+
+
 class PostgresUserRepository(IUserRepository):
     """Postgres Implementation des User Repository"""
 
@@ -25,7 +29,7 @@ class PostgresUserRepository(IUserRepository):
         return self._to_entity(model) if model else None
 
     async def create(self, user: User) -> User:
-        model = UserModel(
+        stmt = insert(USERS).values(
             id=user.id,
             email=user.email,
             name=user.name,
@@ -36,41 +40,32 @@ class PostgresUserRepository(IUserRepository):
             is_active=user.is_active,
             created_at=user.created_at,
             updated_at=user.updated_at
-        )
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        return self._to_entity(model)
-
-    async def update(self, user_id: str, **kwargs) -> User:
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-
-        if not model:
-            raise ValueError(f"User {user_id} nicht gefunden")
+        ).returning(USERS)
+        row = (await self.session.execute(stmt)).one()
+        return self._to_entity(row)
 
+    async def update(self, user_id: str, revoke_sessions: bool = False, **kwargs) -> User:
+        values = {}
         for key, value in kwargs.items():
-            if hasattr(model, key):
+            if key in USERS.c:
                 if key == 'role' and hasattr(value, 'value'):
-                    setattr(model, key, value.value)
+                    values[key] = value.value
                 else:
-                    setattr(model, key, value)
+                    values[key] = value
 
-        await self.session.commit()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+        stmt = update(USERS).where(USERS.c.id == user_id).values(values).returning(USERS)
+        row = (await self.session.execute(stmt)).one_or_none()
 
-    async def delete(self, user_id: str) -> None:
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        if not row:
+            raise ValueError(f"User {user_id} nicht gefunden")
 
-        if model:
-            await self.session.delete(model)
-            await self.session.commit()
+        return self._to_entity(row)
+
+    async def delete(self, user_id: str) -> None:
+        await self.session.execute(delete(USERS).where(USERS.c.id == user_id))
 
-    def _to_entity(self, model: UserModel) -> User:
+    def _to_entity(self, model) -> User:
+        """UserModel oder RETURNING-Row → Domain Entity"""
         return User(
             id=str(model.id),
             email=model.email,
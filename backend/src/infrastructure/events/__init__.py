@@ -0,0 +1,6 @@
+from .progress_broker import ProgressBroker, ProgressSubscription
+
+__all__ = [
+    "ProgressBroker",
+    "ProgressSubscription",
+]
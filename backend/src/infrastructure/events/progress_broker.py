@@ -0,0 +1,253 @@
+import asyncio
+import json
+import logging
+import os
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, Optional, Set
+from ...domain.entities.progress import ProgressEvent, JobKind, ProgressStatus
+from ...domain.interfaces.progress_publisher import IProgressPublisher
+from ..monitoring import metrics
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - redis ist optional
+    aioredis = None
+
+
+logger = logging.getLogger(__name__)
+
+# Gründe für das Beenden einer Subscription (ProgressSubscription.closed_reason)
+CLOSE_OVERFLOW = "overflow"
+CLOSE_EXPIRED = "expired"
+CLOSE_REVOKED = "revoked"
+
+
+def encode_event(event: ProgressEvent) -> dict:
+    """ProgressEvent → JSON-serialisierbares Dict (WebSocket-Nachricht und Redis Payload)"""
+    return {
+        "job_id": event.job_id,
+        "kind": event.kind.value,
+        "status": event.status.value,
+        "data": event.data,
+        "created_at": event.created_at.isoformat() if event.created_at else None,
+    }
+
+
+def decode_event(data: dict) -> ProgressEvent:
+    return ProgressEvent(
+        job_id=data["job_id"],
+        kind=JobKind(data["kind"]),
+        status=ProgressStatus(data["status"]),
+        data=data.get("data") or {},
+        created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
+    )
+
+
+class ProgressSubscription:
+    """
+    Event-Queue einer WebSocket-Verbindung mit Backpressure.
+
+    Die Queue ist begrenzt (max_queue). Ein langsamer Client bekommt zuerst nur
+    noch den jeweils neuesten Zwischenstand pro Job (partial Events werden
+    zusammengefasst), danach werden die ältesten partial Events verworfen.
+    Passt auch dann nichts mehr hinein, gilt die Subscription als übergelaufen -
+    die Verbindung wird geschlossen und der Client synchronisiert sich neu.
+
+    close() beendet die Subscription von außen (Token abgelaufen, User invalidiert);
+    closed_reason sagt der WebSocket, mit welchem Code sie schließen soll.
+    """
+
+    def __init__(self, user_id: str, max_queue: int):
+        self.user_id = user_id
+        self.max_queue = max_queue
+        self.closed_reason: Optional[str] = None
+        self._events: Deque[ProgressEvent] = deque()
+        self._ready = asyncio.Event()
+
+    @property
+    def overflowed(self) -> bool:
+        return self.closed_reason == CLOSE_OVERFLOW
+
+    def close(self, reason: str) -> None:
+        """Beendet die Subscription - get() liefert danach None"""
+        if self.closed_reason is None:
+            self.closed_reason = reason
+            self._events.clear()
+        self._ready.set()
+
+    def push(self, event: ProgressEvent) -> Optional[str]:
+        """Reiht ein Event ein. Returns: Grund falls dabei ein Event verworfen wurde"""
+        if self.closed_reason is not None:
+            return self.closed_reason
+
+        if event.status == ProgressStatus.PARTIAL:
+            for index, queued in enumerate(self._events):
+                if queued.status == ProgressStatus.PARTIAL and queued.job_id == event.job_id:
+                    self._events[index] = event
+                    return "coalesced"
+
+        dropped = None
+        if len(self._events) >= self.max_queue:
+            for index, queued in enumerate(self._events):
+                if queued.status == ProgressStatus.PARTIAL:
+                    del self._events[index]
+                    dropped = "dropped"
+                    break
+            else:
+                self.close(CLOSE_OVERFLOW)
+                return CLOSE_OVERFLOW
+
+        self._events.append(event)
+        self._ready.set()
+        return dropped
+
+    async def get(self) -> Optional[ProgressEvent]:
+        """Wartet auf das nächste Event. Returns: None wenn die Subscription beendet ist (closed_reason)"""
+        while not self._events and self.closed_reason is None:
+            self._ready.clear()
+            await self._ready.wait()
+        if self.closed_reason is not None:
+            return None
+        return self._events.popleft()
+
+
+class ProgressBroker(IProgressPublisher):
+    """
+    In-Process Pub/Sub für Fortschritts-Events, pro User an alle offenen WebSockets.
+
+    Mit REDIS_URL läuft jedes Event über einen Redis Pub/Sub Channel, damit es auch
+    Sockets auf anderen uvicorn Workern (und Events aus dem separaten Generation
+    Worker Prozess) erreicht - zugestellt wird dann nur über den Listener, sonst direkt.
+    Fehler im Redis-Pfad werden geloggt; das Event wird dann nur lokal zugestellt.
+
+    Pro User sind höchstens max_sockets_per_user Subscriptions je Worker offen;
+    close_user() beendet alle Subscriptions eines Users (z.B. nach Invalidierung).
+    """
+
+    CHANNEL = "progress:events"
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_queue: Optional[int] = None,
+        max_sockets_per_user: Optional[int] = None
+    ):
+        self.redis_url = redis_url if redis_url is not None else os.getenv("REDIS_URL")
+        self.max_queue = max_queue or int(os.getenv("PROGRESS_QUEUE_SIZE", "100"))
+        self.max_sockets_per_user = max_sockets_per_user or int(os.getenv("PROGRESS_MAX_SOCKETS_PER_USER", "10"))
+        self._subscribers: Dict[str, Set[ProgressSubscription]] = {}
+
+        self._redis = None
+        self._listener_task: Optional[asyncio.Task] = None
+        if self.redis_url and aioredis is not None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+
+        self._events = metrics.counter("progress_events_total", "Veröffentlichte Fortschritts-Events nach Job-Art und Status")
+        self._dropped = metrics.counter("progress_events_dropped_total", "Wegen Backpressure zusammengefasste/verworfene Events")
+        self._errors = metrics.counter("progress_broker_errors_total", "Fehler im Redis Pub/Sub des Progress Brokers")
+        self._rejected = metrics.counter("progress_subscriptions_rejected_total", "Abgelehnte WebSockets (Limit pro User)")
+        self._closed = metrics.counter("progress_subscriptions_closed_total", "Vom Server beendete Subscriptions nach Grund")
+        metrics.register_collector("progress_subscribers", self.stats)
+
+    # ---------- Lifecycle ----------
+
+    async def start(self) -> None:
+        """Startet den Pub/Sub Listener (im FastAPI lifespan aufrufen)"""
+        if self._redis is not None and self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        """Stoppt den Listener und schließt die Redis-Verbindung"""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self._redis is not None:
+            await self._redis.close()
+
+    # ---------- Pub/Sub ----------
+
+    def subscribe(self, user_id: str) -> ProgressSubscription:
+        """
+        Raises:
+            PermissionError: Wenn der User bereits max_sockets_per_user offene Subscriptions hat
+        """
+        subscriptions = self._subscribers.setdefault(user_id, set())
+        if len(subscriptions) >= self.max_sockets_per_user:
+            self._rejected.inc()
+            raise PermissionError(f"Maximal {self.max_sockets_per_user} offene Verbindungen pro User")
+        subscription = ProgressSubscription(user_id, self.max_queue)
+        subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ProgressSubscription) -> None:
+        subscriptions = self._subscribers.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscribers[subscription.user_id]
+
+    def close_user(self, user_id: str, reason: str = CLOSE_REVOKED) -> None:
+        """Beendet alle lokalen Subscriptions eines Users (die WebSockets schließen sich selbst)"""
+        for subscription in list(self._subscribers.get(user_id, ())):
+            subscription.close(reason)
+            self._closed.inc(reason=reason)
+
+    async def publish(self, user_id: str, event: ProgressEvent) -> None:
+        if event.created_at is None:
+            event.created_at = datetime.now(timezone.utc)
+        self._events.inc(kind=event.kind.value, status=event.status.value)
+
+        if self._redis is not None:
+            try:
+                await self._redis.publish(
+                    self.CHANNEL,
+                    json.dumps({"user_id": user_id, "event": encode_event(event)}, default=str)
+                )
+                return
+            except Exception as e:
+                self._errors.inc(operation="publish")
+                logger.warning("Progress Broker: Redis PUBLISH fehlgeschlagen, nur lokal zugestellt: %s", e)
+        self._deliver(user_id, event)
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._subscribers),
+            "sockets": sum(len(subscriptions) for subscriptions in self._subscribers.values()),
+        }
+
+    # ---------- Intern ----------
+
+    def _deliver(self, user_id: str, event: ProgressEvent) -> None:
+        for subscription in list(self._subscribers.get(user_id, ())):
+            reason = subscription.push(event)
+            if reason is not None:
+                self._dropped.inc(reason=reason)
+
+    async def _listen(self) -> None:
+        """Empfängt Events aller Worker und stellt sie an die lokalen Sockets zu"""
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self.CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        payload = json.loads(message["data"])
+                        self._deliver(payload["user_id"], decode_event(payload["event"]))
+                    except (KeyError, ValueError) as e:
+                        logger.warning("Progress Broker: ungültige Nachricht verworfen: %s", e)
+            except asyncio.CancelledError:
+                await pubsub.close()
+                raise
+            except Exception as e:
+                self._errors.inc(operation="subscribe")
+                logger.warning("Progress Broker: Pub/Sub Verbindung verloren, reconnect: %s", e)
+                await pubsub.close()
+                await asyncio.sleep(1)
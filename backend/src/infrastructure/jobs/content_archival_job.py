@@ -0,0 +1,201 @@
+"""
+Content Archival Job.
+
+Verschiebt Monatspartitionen von contents, die älter als N Monate sind, in den
+Cold Storage (komprimiertes NDJSON) und kann sie bei Bedarf wieder herstellen.
+Legt außerdem die Partitionen der kommenden Monate an (ensure, z.B. täglicher Cron) -
+alle Partitions-Änderungen laufen damit unter demselben Advisory Lock.
+
+Usage:
+    python -m src.infrastructure.jobs.content_archival_job ensure
+    python -m src.infrastructure.jobs.content_archival_job archive --older-than 12
+    python -m src.infrastructure.jobs.content_archival_job rehydrate 2024-03
+"""
+import argparse
+import asyncio
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import select, table, column, func
+from sqlalchemy.ext.asyncio import AsyncEngine
+from ..archive import NDJSONArchiveStore
+from ..database.postgres.content_blob_store import ContentBlobStore
+from ..database.postgres.models import ContentModel, ContentBlobModel
+from ..database.postgres.partitioning import ContentPartitionManager, ContentPartition, partition_name, month_start
+from ..monitoring import metrics
+from .locks import AdvisoryLock
+
+
+# Advisory Lock Key: verhindert parallele Läufe über mehrere Instanzen
+ARCHIVAL_LOCK_KEY = 72_029_001
+
+
+@dataclass
+class ArchivalResult:
+    """Ergebnis eines Archivierungs-Laufs pro Partition"""
+    partition: str
+    rows: int
+    archive_file: str
+
+
+class ContentArchivalJob:
+    """
+    Archiviert alte contents-Partitionen.
+
+    Ablauf pro Partition:
+    1. Zeilen per Server-Side Cursor streamen und als NDJSON komprimiert schreiben
+    2. Zeilenanzahl gegen die Partition verifizieren
+    3. Partition abhängen und löschen
+
+    Bricht der Job zwischendurch ab, bleibt die Partition erhalten und der
+    nächste Lauf überschreibt das unvollständige Archiv.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        store: Optional[NDJSONArchiveStore] = None,
+        partition_manager: Optional[ContentPartitionManager] = None
+    ):
+        self.engine = engine
+        self.store = store or NDJSONArchiveStore()
+        self.partitions = partition_manager or ContentPartitionManager(engine)
+        # search_vector wird nicht archiviert - der Trigger berechnet ihn beim Rehydrieren neu.
+        # Der Payload wird aus content_blobs mitarchiviert, damit das Archiv eigenständig ist.
+        self.columns = [c for c in ContentModel.__table__.columns if c.name != "search_vector"]
+        self._archived_rows = metrics.counter("content_archive_rows_total", "Archivierte bzw. rehydrierte Content-Zeilen")
+        self._archived_partitions = metrics.counter("content_archive_partitions_total", "Archivierte bzw. rehydrierte Partitionen")
+
+    async def ensure_partitions(self, months_ahead: int) -> List[str]:
+        """Legt fehlende Partitionen bis heute + months_ahead an"""
+        async with self._lock():
+            return await self.partitions.ensure_partitions(months_ahead=months_ahead)
+
+    async def archive_older_than(self, months: int) -> List[ArchivalResult]:
+        """Archiviert alle Partitionen die komplett älter als `months` Monate sind"""
+        results = []
+        async with self._lock():
+            for partition in await self.partitions.partitions_older_than(months):
+                results.append(await self._archive_partition(partition))
+        return results
+
+    async def rehydrate(self, month: date) -> int:
+        """Stellt eine archivierte Monatspartition wieder her (on demand)"""
+        name = partition_name(month_start(month))
+        if self.store.get_manifest(name) is None:
+            raise ValueError(f"Kein Archiv für {name}")
+
+        async with self._lock():
+            # Neu angelegt → enthält höchstens nach dem Archivieren eingefügte Zeilen aus der Default-Partition
+            created = await self.partitions.create_partition(month)
+            target = table(name, *[column(c.name, c.type) for c in self.columns])
+
+            restored = 0
+            batch: List[Dict[str, Any]] = []
+            # Eine Transaktion: entweder alle Zeilen oder keine (Re-Run nach Abbruch ist sicher)
+            async with self.engine.begin() as conn:
+                existing = (await conn.execute(select(func.count()).select_from(target))).scalar_one()
+                if existing and not created:
+                    raise ValueError(f"Partition {name} enthält bereits {existing} Zeilen")
+                blobs = ContentBlobStore(conn)
+                for row in self.store.read(name):
+                    values = self._from_archive(row)
+                    values["blob_hash"] = await blobs.put(row["data"])
+                    batch.append(values)
+                    if len(batch) >= self.BATCH_SIZE:
+                        await conn.execute(target.insert(), batch)
+                        restored += len(batch)
+                        batch = []
+                if batch:
+                    await conn.execute(target.insert(), batch)
+                    restored += len(batch)
+
+        self._archived_rows.inc(restored, direction="rehydrate")
+        self._archived_partitions.inc(direction="rehydrate")
+        return restored
+
+    async def _archive_partition(self, partition: ContentPartition) -> ArchivalResult:
+        source = table(partition.name, *[column(c.name, c.type) for c in self.columns])
+
+        async with self.engine.connect() as conn:
+            expected = (await conn.execute(select(func.count()).select_from(source))).scalar_one()
+
+            async def rows() -> AsyncIterator[Dict[str, Any]]:
+                stream = await conn.stream(
+                    select(source, ContentBlobModel.data)
+                    .join(ContentBlobModel, ContentBlobModel.hash == source.c.blob_hash)
+                    .order_by(source.c.created_at)
+                    .execution_options(yield_per=self.BATCH_SIZE)
+                )
+                async for row in stream:
+                    yield dict(row._mapping)
+
+            manifest = await self.store.write(partition.name, rows())
+
+        if manifest.rows != expected:
+            raise RuntimeError(
+                f"Archiv {partition.name} unvollständig: {manifest.rows} von {expected} Zeilen - Partition bleibt erhalten"
+            )
+
+        await self.partitions.detach_and_drop(partition)
+
+        self._archived_rows.inc(manifest.rows, direction="archive")
+        self._archived_partitions.inc(direction="archive")
+        return ArchivalResult(partition=partition.name, rows=manifest.rows, archive_file=manifest.file)
+
+    def _from_archive(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Wandelt eine NDJSON-Zeile zurück in typisierte Spaltenwerte"""
+        values = {}
+        for c in self.columns:
+            value = row.get(c.name)
+            if value is not None:
+                if c.name in ("id", "user_id"):
+                    value = UUID(value)
+                elif c.name in ("created_at", "updated_at", "completed_at"):
+                    value = datetime.fromisoformat(value)
+            values[c.name] = value
+        return values
+
+    def _lock(self) -> AdvisoryLock:
+        return AdvisoryLock(self.engine, ARCHIVAL_LOCK_KEY)
+
+
+async def _main(argv: Optional[List[str]] = None) -> None:
+    from ..database.postgres.config import engine
+
+    parser = argparse.ArgumentParser(description="Content Partition Archival")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ensure = sub.add_parser("ensure", help="Partitionen für kommende Monate anlegen")
+    ensure.add_argument("--months-ahead", type=int, default=int(os.getenv("CONTENT_PARTITIONS_AHEAD", "3")))
+
+    archive = sub.add_parser("archive", help="Alte Partitionen in den Cold Storage verschieben")
+    archive.add_argument("--older-than", type=int, default=int(os.getenv("CONTENT_ARCHIVE_AFTER_MONTHS", "12")))
+
+    rehydrate = sub.add_parser("rehydrate", help="Archivierten Monat wiederherstellen (YYYY-MM)")
+    rehydrate.add_argument("month")
+
+    args = parser.parse_args(argv)
+    job = ContentArchivalJob(engine)
+
+    try:
+        if args.command == "ensure":
+            created = await job.ensure_partitions(months_ahead=args.months_ahead)
+            print(f"Partitionen angelegt: {', '.join(created) or 'keine'}")
+        elif args.command == "archive":
+            for result in await job.archive_older_than(args.older_than):
+                print(f"{result.partition}: {result.rows} Zeilen → {result.archive_file}")
+        elif args.command == "rehydrate":
+            month = datetime.strptime(args.month, "%Y-%m").date()
+            restored = await job.rehydrate(month)
+            print(f"{partition_name(month)}: {restored} Zeilen wiederhergestellt")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
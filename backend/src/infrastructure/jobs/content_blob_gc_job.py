@@ -0,0 +1,132 @@
+"""
+Content Blob Garbage Collection.
+
+Löscht Payloads aus content_blobs, die von keinem Content mehr referenziert werden.
+Ob ein Blob noch referenziert wird, prüft der Job selbst (NOT EXISTS gegen contents) -
+Writes halten dafür keinen Zähler am Blob.
+
+Usage:
+    python -m src.infrastructure.jobs.content_blob_gc_job collect
+"""
+import argparse
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from ..monitoring import metrics
+from .locks import AdvisoryLock
+
+
+logger = logging.getLogger(__name__)
+
+GC_LOCK_KEY = 72_030_001
+
+
+@dataclass
+class BlobGCResult:
+    """Ergebnis eines GC-Laufs"""
+    deleted: int
+    freed_bytes: int
+
+
+class ContentBlobGCJob:
+    """
+    Garbage Collection für content_blobs mit lazy berechneter Liveness.
+
+    Der Job läuft per Keyset über den Primary Key (hash) in Batches mit kurzen
+    Transaktionen. Kandidaten sind Blobs, die älter als die Grace Period sind und auf die
+    kein Content zeigt (Index idx_contents_blob_hash). Gesperrt wird mit FOR UPDATE
+    SKIP LOCKED: ein Blob, den ein laufender Write gerade per FOR KEY SHARE referenziert
+    (ContentBlobStore bzw. Foreign-Key-Prüfung von contents), wird übersprungen.
+    Committet ein neuer Verweis genau zwischen Snapshot und DELETE, lehnt der Foreign Key
+    das DELETE ab - der Batch wird verworfen und beim nächsten Lauf neu geprüft.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, engine: AsyncEngine, grace_seconds: Optional[int] = None):
+        self.engine = engine
+        self.grace_seconds = grace_seconds if grace_seconds is not None else int(
+            os.getenv("CONTENT_BLOB_GC_GRACE_SECONDS", "3600")
+        )
+        self._deleted = metrics.counter("content_blob_gc_deleted_total", "Vom GC gelöschte Content Blobs")
+        self._freed = metrics.counter("content_blob_gc_freed_bytes_total", "Vom GC freigegebene Payload-Bytes")
+
+    async def collect(self) -> BlobGCResult:
+        """Löscht unreferenzierte Blobs in Batches (kurze Transaktionen)"""
+        deleted = 0
+        freed = 0
+        after = ""
+        async with AdvisoryLock(self.engine, GC_LOCK_KEY):
+            while True:
+                try:
+                    async with self.engine.begin() as conn:
+                        row = (await conn.execute(text(
+                            "WITH batch AS ("
+                            "  SELECT hash, created_at FROM content_blobs"
+                            "  WHERE hash > :after ORDER BY hash LIMIT :batch"
+                            "), garbage AS ("
+                            "  SELECT b.hash FROM content_blobs b JOIN batch USING (hash)"
+                            "  WHERE batch.created_at < NOW() - make_interval(secs => :grace)"
+                            "    AND NOT EXISTS (SELECT 1 FROM contents c WHERE c.blob_hash = b.hash)"
+                            "  FOR UPDATE OF b SKIP LOCKED"
+                            "), removed AS ("
+                            "  DELETE FROM content_blobs b USING garbage g WHERE b.hash = g.hash"
+                            "  RETURNING octet_length(b.data::text) AS size"
+                            ") "
+                            "SELECT (SELECT MAX(hash) FROM batch) AS last_hash, "
+                            "       (SELECT COUNT(*) FROM removed) AS deleted, "
+                            "       (SELECT COALESCE(SUM(size), 0) FROM removed) AS freed"
+                        ), {"after": after, "grace": self.grace_seconds, "batch": self.BATCH_SIZE})).one()
+                except IntegrityError as e:
+                    # Neuer Verweis zwischen Snapshot und DELETE → Batch beim nächsten Lauf erneut prüfen
+                    logger.info("Content Blob GC: Batch nach %s übersprungen: %s", after or "-", e.orig)
+                    row = await self._next_batch_start(after)
+                    if row is None:
+                        break
+                    after = row
+                    continue
+
+                if row.last_hash is None:
+                    break
+                deleted += row.deleted
+                freed += int(row.freed)
+                after = row.last_hash
+
+        self._deleted.inc(deleted)
+        self._freed.inc(freed)
+        return BlobGCResult(deleted=deleted, freed_bytes=freed)
+
+    async def _next_batch_start(self, after: str) -> Optional[str]:
+        """Letzter Hash des Batches nach `after` (None = Ende erreicht)"""
+        async with self.engine.connect() as conn:
+            return (await conn.execute(text(
+                "SELECT MAX(hash) FROM (SELECT hash FROM content_blobs WHERE hash > :after ORDER BY hash LIMIT :batch) b"
+            ), {"after": after, "batch": self.BATCH_SIZE})).scalar_one()
+
+
+async def _main(argv: Optional[List[str]] = None) -> None:
+    from ..database.postgres.config import engine
+
+    parser = argparse.ArgumentParser(description="Content Blob Garbage Collection")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    collect = sub.add_parser("collect", help="Unreferenzierte Blobs löschen")
+    collect.add_argument("--grace-seconds", type=int, default=None)
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "collect":
+            result = await ContentBlobGCJob(engine, grace_seconds=args.grace_seconds).collect()
+            print(f"{result.deleted} Blobs gelöscht, {result.freed_bytes} Bytes freigegeben")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
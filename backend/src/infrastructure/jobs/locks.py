@@ -0,0 +1,28 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class AdvisoryLock:
+    """
+    Postgres Session-Level Advisory Lock für Batch Jobs.
+    Ein zweiter paralleler Lauf (auch auf einer anderen Instanz) bricht sofort ab.
+    """
+
+    def __init__(self, engine: AsyncEngine, key: int):
+        self.engine = engine
+        self.key = key
+        self._conn = None
+
+    async def __aenter__(self):
+        self._conn = await self.engine.connect()
+        acquired = (await self._conn.execute(text("SELECT pg_try_advisory_lock(:k)"), {"k": self.key})).scalar_one()
+        if not acquired:
+            await self._conn.close()
+            raise RuntimeError("Ein anderer Lauf dieses Jobs ist bereits aktiv")
+        return self
+
+    async def __aexit__(self, *exc):
+        try:
+            await self._conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": self.key})
+        finally:
+            await self._conn.close()
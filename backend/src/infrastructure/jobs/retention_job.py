@@ -0,0 +1,306 @@
+"""
+Retention & Purge Job.
+
+Löscht Contents nach der Aufbewahrungsdauer des Plans (PlanLimits.content_retention_days)
+und verdichtet alte Usage-Perioden zu Jahreszeilen. Alle Deletes laufen set-basiert in
+kleinen Batches mit Pausen, damit weder Lock-Stürme noch Replikationsverzögerung entstehen.
+
+Usage:
+    python -m src.infrastructure.jobs.retention_job run
+    python -m src.infrastructure.jobs.retention_job run --dry-run
+    python -m src.infrastructure.jobs.retention_job contents
+    python -m src.infrastructure.jobs.retention_job usage
+"""
+import argparse
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from ...domain.entities.subscription import PLAN_LIMITS
+from ..monitoring import metrics
+from .locks import AdvisoryLock
+
+
+logger = logging.getLogger(__name__)
+
+RETENTION_LOCK_KEY = 72_036_001
+
+# Effektiver Plan eines Users ({user_id}): aktuellste aktive Subscription, sonst free
+_EFFECTIVE_PLAN_SQL = (
+    "COALESCE(("
+    "  SELECT s.plan FROM subscriptions s"
+    "  WHERE s.user_id = {user_id} AND s.status IN ('active', 'trialing')"
+    "  ORDER BY s.created_at DESC LIMIT 1"
+    "), 'free')"
+)
+
+# Bereits verdichtete Usage-Zeilen umfassen ein Jahr, normale Perioden höchstens einen Monat
+_MONTHLY_PERIOD_SQL = "period_end - period_start < INTERVAL '32 days'"
+
+
+@dataclass
+class RetentionResult:
+    """Ergebnis eines Retention-Laufs"""
+    contents_deleted: Dict[str, int] = field(default_factory=dict)
+    usage_rows_compacted: int = 0
+    dry_run: bool = False
+
+
+class RetentionJob:
+    """
+    Batched Retention für contents und usage_tracking.
+
+    Contents: pro Plan mit begrenzter Aufbewahrung werden zuerst die User des Plans
+    aufgelöst (Keyset über users.id, effektiver Plan aus subscriptions), dann deren Contents
+    vor dem Cutoff über den Index (user_id, created_at) gelöscht. Gelesen und gesperrt
+    werden damit nur Zeilen, die auch gelöscht werden - Contents anderer Pläne (z.B. die
+    gesamte Historie von Pro-Usern) fasst der Job nie an. Jeder Batch ist eine eigene kurze
+    Transaktion mit FOR UPDATE SKIP LOCKED und prüft den Plan der User erneut (Upgrade
+    während des Laufs). Nicht mehr referenzierte Blobs entfernt der ContentBlobGCJob,
+    ganze alte Monate verschiebt weiterhin der Archival Job.
+
+    Usage: abgeschlossene Monatsperioden älter als compact_after_months werden pro
+    (User, Content-Typ, Jahr) zu einer Zeile zusammengefasst. Die aktuelle Periode und
+    damit die Rate-Limits bleiben unberührt.
+
+    Zwischen den Batches wird pause_seconds gewartet; liegt die Replikationsverzögerung
+    über max_replication_lag_seconds, wartet der Job bis die Replica aufgeholt hat.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        batch_size: Optional[int] = None,
+        pause_seconds: Optional[float] = None,
+        max_replication_lag_seconds: Optional[float] = None,
+        compact_after_months: Optional[int] = None
+    ):
+        self.engine = engine
+        self.batch_size = batch_size or int(os.getenv("RETENTION_BATCH_SIZE", "1000"))
+        self.pause_seconds = pause_seconds if pause_seconds is not None else float(
+            os.getenv("RETENTION_BATCH_PAUSE_SECONDS", "0.2")
+        )
+        self.max_replication_lag_seconds = max_replication_lag_seconds if max_replication_lag_seconds is not None else float(
+            os.getenv("RETENTION_MAX_REPLICATION_LAG_SECONDS", "10")
+        )
+        self.compact_after_months = compact_after_months if compact_after_months is not None else int(
+            os.getenv("USAGE_COMPACT_AFTER_MONTHS", "3")
+        )
+        self._deleted = metrics.counter("retention_deleted_rows_total", "Von der Retention gelöschte Zeilen")
+        self._batches = metrics.histogram("retention_batch_duration_seconds", "Dauer eines Retention-Batches")
+        self._throttled = metrics.counter("retention_throttle_waits_total", "Wartezeiten wegen Replikationsverzögerung")
+        self._progress = metrics.gauge("retention_progress_rows", "Bisher verarbeitete Zeilen des laufenden Laufs")
+
+    def policies(self) -> Dict[str, int]:
+        """Plan → Aufbewahrung in Tagen (nur Pläne mit begrenzter Aufbewahrung)"""
+        return {
+            plan.value: limits.content_retention_days
+            for plan, limits in PLAN_LIMITS.items()
+            if limits.content_retention_days > 0
+        }
+
+    async def run(self, dry_run: bool = False) -> RetentionResult:
+        """Contents löschen und Usage verdichten"""
+        async with AdvisoryLock(self.engine, RETENTION_LOCK_KEY):
+            result = RetentionResult(dry_run=dry_run)
+            result.contents_deleted = await self._purge_contents(dry_run)
+            result.usage_rows_compacted = await self._compact_usage(dry_run)
+            return result
+
+    async def purge_contents(self, dry_run: bool = False) -> Dict[str, int]:
+        async with AdvisoryLock(self.engine, RETENTION_LOCK_KEY):
+            return await self._purge_contents(dry_run)
+
+    async def compact_usage(self, dry_run: bool = False) -> int:
+        async with AdvisoryLock(self.engine, RETENTION_LOCK_KEY):
+            return await self._compact_usage(dry_run)
+
+    async def _purge_contents(self, dry_run: bool) -> Dict[str, int]:
+        now = datetime.now(timezone.utc)
+        deleted: Dict[str, int] = {}
+
+        for plan, days in self.policies().items():
+            cutoff = now - timedelta(days=days)
+            total = 0
+            # Keyset-Cursor über users.id - startet vor der kleinsten UUID
+            after_user_id = "00000000-0000-0000-0000-000000000000"
+            while True:
+                async with self.engine.connect() as conn:
+                    user_ids = (await conn.execute(text(
+                        "SELECT u.id FROM users u"
+                        "  WHERE u.id > CAST(:after_user_id AS UUID)"
+                        "    AND " + _EFFECTIVE_PLAN_SQL.format(user_id="u.id") + " = :plan"
+                        "  ORDER BY u.id"
+                        "  LIMIT :batch"
+                    ), {"after_user_id": after_user_id, "plan": plan, "batch": self.batch_size})).scalars().all()
+                    if user_ids and dry_run:
+                        total += (await conn.execute(text(
+                            "SELECT COUNT(*) FROM contents c"
+                            "  WHERE c.user_id = ANY(CAST(:user_ids AS UUID[])) AND c.created_at < :cutoff"
+                        ), {"user_ids": user_ids, "cutoff": cutoff})).scalar_one()
+
+                if user_ids and not dry_run:
+                    total += await self._purge_users(plan, user_ids, cutoff)
+                if len(user_ids) < self.batch_size:
+                    break
+                after_user_id = str(user_ids[-1])
+
+            deleted[plan] = total
+
+        return deleted
+
+    async def _purge_users(self, plan: str, user_ids: List, cutoff: datetime) -> int:
+        """Löscht die Contents einer Gruppe von Usern vor dem Cutoff in Batches"""
+        total = 0
+        while True:
+            started = time.perf_counter()
+            async with self.engine.begin() as conn:
+                # Plan erneut prüfen, dann nur Zeilen dieser User per (user_id, created_at) sperren und löschen
+                purged = (await conn.execute(text(
+                    "WITH plan_users AS ("
+                    "  SELECT u.id FROM unnest(CAST(:user_ids AS UUID[])) AS u(id)"
+                    "  WHERE " + _EFFECTIVE_PLAN_SQL.format(user_id="u.id") + " = :plan"
+                    "), batch AS ("
+                    "  SELECT c.id, c.created_at FROM contents c"
+                    "  WHERE c.user_id = ANY(ARRAY(SELECT id FROM plan_users)) AND c.created_at < :cutoff"
+                    "  LIMIT :batch"
+                    "  FOR UPDATE OF c SKIP LOCKED"
+                    ") "
+                    "DELETE FROM contents c USING batch b WHERE c.id = b.id AND c.created_at = b.created_at"
+                ), {"user_ids": user_ids, "plan": plan, "cutoff": cutoff, "batch": self.batch_size})).rowcount
+
+            self._batches.observe(time.perf_counter() - started, table="contents")
+            total += purged
+            self._deleted.inc(purged, table="contents", plan=plan)
+            self._progress.inc(purged, table="contents", plan=plan)
+
+            if purged == 0:
+                break
+            logger.info("Retention %s: %d Contents gelöscht (User bis %s)", plan, total, user_ids[-1])
+            await self._throttle()
+            if purged < self.batch_size:
+                break
+
+        return total
+
+    async def _compact_usage(self, dry_run: bool) -> int:
+        # Monatsanfang vor compact_after_months Monaten (aktuelle Periode nicht mitgezählt)
+        now = datetime.now(timezone.utc)
+        months = now.year * 12 + now.month - 1 - self.compact_after_months
+        cutoff = datetime(months // 12, months % 12 + 1, 1, tzinfo=timezone.utc)
+
+        if dry_run:
+            async with self.engine.connect() as conn:
+                return (await conn.execute(text(
+                    f"SELECT COUNT(*) FROM usage_tracking WHERE period_end < :cutoff AND {_MONTHLY_PERIOD_SQL}"
+                ), {"cutoff": cutoff})).scalar_one()
+
+        total = 0
+        while True:
+            started = time.perf_counter()
+            async with self.engine.begin() as conn:
+                # Monatszeilen eines Batches löschen und als Jahreszeilen (UTC) wieder einfügen bzw. aufaddieren
+                compacted = (await conn.execute(text(
+                    "WITH old AS ("
+                    "  DELETE FROM usage_tracking WHERE id IN ("
+                    "    SELECT id FROM usage_tracking"
+                    f"    WHERE period_end < :cutoff AND {_MONTHLY_PERIOD_SQL}"
+                    "    ORDER BY id"
+                    "    LIMIT :batch"
+                    "    FOR UPDATE SKIP LOCKED"
+                    "  )"
+                    "  RETURNING user_id, content_type, date_trunc('year', period_start AT TIME ZONE 'UTC') AS year, count"
+                    "), merged AS ("
+                    "  INSERT INTO usage_tracking (user_id, content_type, period_start, period_end, count) "
+                    "  SELECT user_id, content_type, year AT TIME ZONE 'UTC', "
+                    "         (year + INTERVAL '1 year' - INTERVAL '1 second') AT TIME ZONE 'UTC', SUM(COALESCE(count, 0)) "
+                    "  FROM old GROUP BY user_id, content_type, year "
+                    "  ON CONFLICT (user_id, content_type, period_start, period_end) "
+                    "  DO UPDATE SET count = usage_tracking.count + EXCLUDED.count "
+                    "  RETURNING 1"
+                    ") "
+                    "SELECT COUNT(*) FROM old"
+                ), {"cutoff": cutoff, "batch": self.batch_size})).scalar_one()
+
+            self._batches.observe(time.perf_counter() - started, table="usage_tracking")
+            total += compacted
+            self._deleted.inc(compacted, table="usage_tracking", plan="all")
+            self._progress.set(total, table="usage_tracking", plan="all")
+
+            if compacted < self.batch_size:
+                break
+            logger.info("Retention usage: %d Perioden verdichtet", total)
+            await self._throttle()
+
+        return total
+
+    async def _throttle(self) -> None:
+        """Pause zwischen Batches, verlängert solange die Replicas zu weit hinterherhängen"""
+        await asyncio.sleep(self.pause_seconds)
+        if self.max_replication_lag_seconds <= 0:
+            return
+        waited = 0.0
+        while waited < 300:
+            lag = await self._replication_lag()
+            if lag is None or lag <= self.max_replication_lag_seconds:
+                return
+            self._throttled.inc()
+            logger.info("Retention pausiert: Replikationsverzögerung %.1fs", lag)
+            await asyncio.sleep(min(lag, 10))
+            waited += min(lag, 10)
+
+    async def _replication_lag(self) -> Optional[float]:
+        """Maximale replay_lag aller Replicas in Sekunden (None ohne Replicas/Berechtigung)"""
+        try:
+            async with self.engine.connect() as conn:
+                return (await conn.execute(text(
+                    "SELECT EXTRACT(EPOCH FROM MAX(replay_lag)) FROM pg_stat_replication"
+                ))).scalar_one()
+        except Exception:
+            return None
+
+
+async def _main(argv: Optional[List[str]] = None) -> None:
+    from ..database.postgres.config import engine
+
+    parser = argparse.ArgumentParser(description="Retention & Purge für Contents und Usage")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (
+        ("run", "Contents löschen und Usage verdichten"),
+        ("contents", "Nur Contents nach Plan-Aufbewahrung löschen"),
+        ("usage", "Nur alte Usage-Perioden verdichten"),
+    ):
+        command = sub.add_parser(name, help=help_text)
+        command.add_argument("--dry-run", action="store_true", help="Nur zählen, nichts löschen")
+        command.add_argument("--batch-size", type=int, default=None)
+
+    args = parser.parse_args(argv)
+    job = RetentionJob(engine, batch_size=args.batch_size)
+
+    try:
+        deleted: Dict[str, int] = {}
+        compacted: Optional[int] = None
+        if args.command == "run":
+            result = await job.run(dry_run=args.dry_run)
+            deleted, compacted = result.contents_deleted, result.usage_rows_compacted
+        elif args.command == "contents":
+            deleted = await job.purge_contents(dry_run=args.dry_run)
+        else:
+            compacted = await job.compact_usage(dry_run=args.dry_run)
+
+        prefix = "[dry-run] " if args.dry_run else ""
+        for plan, count in deleted.items():
+            print(f"{prefix}{plan}: {count} Contents gelöscht")
+        if compacted is not None:
+            print(f"{prefix}{compacted} Usage-Perioden verdichtet")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,148 @@
+"""
+Usage Rollup Job.
+
+Pflegt usage_daily_rollups (Abschluss-Tag, Content-Typ, Plan, User → Anzahl) inkrementell
+aus contents. Läuft per Cron (z.B. alle 5 Minuten) und darf beliebig oft wiederholt werden.
+
+Usage:
+    python -m src.infrastructure.jobs.usage_rollup_job run
+    python -m src.infrastructure.jobs.usage_rollup_job rebuild --since 2024-01-01
+"""
+import argparse
+import asyncio
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from ..database.postgres.usage_analytics_repository import ROLLUP_WATERMARK_NAME
+from ..monitoring import metrics
+from .locks import AdvisoryLock
+
+
+ROLLUP_LOCK_KEY = 72_032_001
+
+
+@dataclass
+class RollupResult:
+    """Ergebnis eines Rollup-Laufs"""
+    from_day: Optional[date]
+    until: datetime
+    rows: int
+
+
+class UsageRollupJob:
+    """
+    Inkrementelle Tages-Aggregation von contents.
+
+    Jeder Lauf berechnet alle Tage ab dem Tag des letzten Watermarks komplett neu
+    (DELETE + INSERT ... SELECT in einer Transaktion) und setzt das Watermark auf
+    "jetzt - lag". Dadurch ist der Job idempotent: ein wiederholter oder abgebrochener
+    Lauf ersetzt die Aggregate statt sie doppelt zu zählen. Der lag lässt laufenden
+    Transaktionen Zeit, ihre Contents zu committen, bevor ihr Zeitraum abgeschlossen wird.
+
+    Gefenstert und gezählt wird nach completed_at (erster Abschluss, per Trigger gesetzt):
+    jeder Content einmal, am Tag an dem er fertig wurde. Asynchrone Generierungen, deren
+    Platzhalter erst nach dem Weiterwandern des Watermarks abgeschlossen wird, landen so im
+    aktuellen Fenster statt in einem bereits abgeschlossenen Tag. Platzhalter und nie
+    abgeschlossene (fehlgeschlagene) Contents haben kein completed_at und zählen nicht.
+
+    Der Plan wird zum Zeitpunkt des Rollups aus der aktuellsten Subscription des Users
+    gelesen (ohne Subscription: free). Tage vor dem Watermark bleiben unverändert - auch
+    wenn Partitionen archiviert werden.
+    """
+
+    def __init__(self, engine: AsyncEngine, lag_seconds: Optional[int] = None):
+        self.engine = engine
+        self.lag_seconds = lag_seconds if lag_seconds is not None else int(
+            os.getenv("USAGE_ROLLUP_LAG_SECONDS", "300")
+        )
+        self._runs = metrics.counter("usage_rollup_runs_total", "Usage Rollup Läufe")
+        self._rows = metrics.counter("usage_rollup_rows_total", "Geschriebene Rollup-Zeilen")
+        self._duration = metrics.histogram("usage_rollup_duration_seconds", "Dauer eines Rollup-Laufs")
+
+    async def run(self, since: Optional[date] = None) -> RollupResult:
+        """
+        Aktualisiert die Rollups bis (jetzt - lag).
+
+        Args:
+            since: Optional - Neuberechnung ab diesem Tag erzwingen (statt ab Watermark).
+                Achtung: Tage deren Partition bereits archiviert ist, würden dabei auf 0 fallen.
+        """
+        started = datetime.now(timezone.utc)
+        until = started - timedelta(seconds=self.lag_seconds)
+
+        async with AdvisoryLock(self.engine, ROLLUP_LOCK_KEY):
+            async with self.engine.begin() as conn:
+                if since is None:
+                    watermark = (await conn.execute(
+                        text("SELECT watermark FROM job_watermarks WHERE name = :name"),
+                        {"name": ROLLUP_WATERMARK_NAME}
+                    )).scalar_one_or_none()
+                    if watermark is None:
+                        # Erster Lauf: ab dem ältesten abgeschlossenen Content
+                        watermark = (await conn.execute(text("SELECT MIN(completed_at) FROM contents"))).scalar_one()
+                    since = (watermark.astimezone(timezone.utc).date() if watermark else None)
+
+                rows = 0
+                if since is not None and since <= until.date():
+                    window = {
+                        "from_day": since,
+                        "from_ts": datetime.combine(since, time.min, tzinfo=timezone.utc),
+                        "until": until
+                    }
+                    await conn.execute(
+                        text("DELETE FROM usage_daily_rollups WHERE day >= :from_day"),
+                        window
+                    )
+                    result = await conn.execute(text(
+                        "INSERT INTO usage_daily_rollups (day, content_type, plan, user_id, count) "
+                        "SELECT (c.completed_at AT TIME ZONE 'UTC')::date, c.type, COALESCE(s.plan, 'free'), c.user_id, COUNT(*) "
+                        "FROM contents c "
+                        "LEFT JOIN LATERAL ("
+                        "  SELECT plan FROM subscriptions WHERE user_id = c.user_id ORDER BY created_at DESC LIMIT 1"
+                        ") s ON true "
+                        "WHERE c.completed_at >= :from_ts "
+                        "  AND c.completed_at < :until "
+                        "  AND c.created_at < :until "  # created_at <= completed_at: Partition Pruning
+                        "GROUP BY 1, 2, 3, 4"
+                    ), window)
+                    rows = result.rowcount
+
+                await conn.execute(text(
+                    "INSERT INTO job_watermarks (name, watermark) VALUES (:name, :until) "
+                    "ON CONFLICT (name) DO UPDATE SET watermark = EXCLUDED.watermark, updated_at = NOW()"
+                ), {"name": ROLLUP_WATERMARK_NAME, "until": until})
+
+        self._runs.inc()
+        self._rows.inc(rows)
+        self._duration.observe((datetime.now(timezone.utc) - started).total_seconds())
+        return RollupResult(from_day=since, until=until, rows=rows)
+
+
+async def _main(argv: Optional[List[str]] = None) -> None:
+    from ..database.postgres.config import engine
+
+    parser = argparse.ArgumentParser(description="Usage Daily Rollups")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("run", help="Rollups ab dem letzten Watermark aktualisieren")
+    rebuild = sub.add_parser("rebuild", help="Rollups ab einem Tag neu berechnen (YYYY-MM-DD)")
+    rebuild.add_argument("--since", required=True)
+
+    args = parser.parse_args(argv)
+    job = UsageRollupJob(engine)
+
+    try:
+        if args.command == "run":
+            result = await job.run()
+        else:
+            result = await job.run(since=date.fromisoformat(args.since))
+        print(f"Rollups ab {result.from_day or '-'} bis {result.until.isoformat()}: {result.rows} Zeilen")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
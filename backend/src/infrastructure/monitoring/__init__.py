@@ -0,0 +1,3 @@
+from .metrics import metrics, MetricsRegistry, Counter, Gauge, Histogram
+
+__all__ = ["metrics", "MetricsRegistry", "Counter", "Gauge", "Histogram"]
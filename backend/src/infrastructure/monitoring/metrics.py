@@ -0,0 +1,153 @@
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Counter:
+    """Monoton steigender Zähler mit optionalen Labels"""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0)
+
+    def snapshot(self) -> dict:
+        return {
+            "type": "counter",
+            "description": self.description,
+            "values": [{"labels": dict(k), "value": v} for k, v in self._values.items()]
+        }
+
+
+class Gauge:
+    """Momentaufnahme eines Wertes (z.B. Queue-Länge)"""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0)
+
+    def snapshot(self) -> dict:
+        return {
+            "type": "gauge",
+            "description": self.description,
+            "values": [{"labels": dict(k), "value": v} for k, v in self._values.items()]
+        }
+
+
+class Histogram:
+    """Verteilung von Messwerten (z.B. Latenzen in Sekunden)"""
+
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, name: str, description: str, buckets: Optional[Tuple[float, ...]] = None):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets or self.DEFAULT_BUCKETS)
+        self._series: Dict[LabelKey, dict] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {"count": 0, "sum": 0.0, "max": 0.0, "buckets": [0] * len(self.buckets)}
+                self._series[key] = series
+            series["count"] += 1
+            series["sum"] += value
+            series["max"] = max(series["max"], value)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["buckets"][i] += 1
+
+    def snapshot(self) -> dict:
+        values = []
+        for key, series in self._series.items():
+            count = series["count"]
+            values.append({
+                "labels": dict(key),
+                "count": count,
+                "sum": series["sum"],
+                "avg": series["sum"] / count if count else 0.0,
+                "max": series["max"],
+                "buckets": dict(zip((str(b) for b in self.buckets), series["buckets"]))
+            })
+        return {"type": "histogram", "description": self.description, "values": values}
+
+
+class MetricsRegistry:
+    """
+    Prozess-lokale Metrics Registry.
+    Metriken werden einmal registriert (idempotent) und über /metrics als JSON ausgegeben.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: Dict[str, Callable[[], dict]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, description))
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        return self._get_or_create(name, lambda: Gauge(name, description))
+
+    def histogram(self, name: str, description: str = "", buckets: Optional[Tuple[float, ...]] = None) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(name, description, buckets))
+
+    def register_collector(self, name: str, collector: Callable[[], dict]) -> None:
+        """Registriert eine Funktion die beim Snapshot abgeleitete Werte liefert (z.B. Hit-Ratios)"""
+        self._collectors[name] = collector
+
+    def snapshot(self) -> dict:
+        result = {name: metric.snapshot() for name, metric in sorted(self._metrics.items())}
+        for name, collector in self._collectors.items():
+            result[name] = collector()
+        return result
+
+    def names(self) -> List[str]:
+        return sorted(list(self._metrics) + list(self._collectors))
+
+    def _get_or_create(self, name: str, factory):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            return metric
+
+
+# Globale Registry (pro Worker-Prozess)
+metrics = MetricsRegistry()
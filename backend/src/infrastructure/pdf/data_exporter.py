@@ -0,0 +1,239 @@
+import csv
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from ...domain.entities.content import ContentType
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    """Maschinenlesbares Export-Format (bzw. PDF) mit Media Type und Dateiendung"""
+    name: str
+    media_type: str
+    extension: str
+
+
+CSV = ExportFormat("csv", "text/csv", "csv")
+ICS = ExportFormat("ics", "text/calendar", "ics")
+SRT = ExportFormat("srt", "application/x-subrip", "srt")
+VTT = ExportFormat("vtt", "text/vtt", "vtt")
+PDF = ExportFormat("pdf", "application/pdf", "pdf")
+FORMATS: Dict[str, ExportFormat] = {export_format.name: export_format for export_format in (CSV, ICS, SRT, VTT, PDF)}
+
+# CSV: Content Type → (Liste in content.data, Spaltenüberschriften)
+CSV_COLUMNS: Dict[ContentType, Tuple[str, Tuple[str, str]]] = {
+    ContentType.HOOK: ("hooks", ("Nr", "Hook")),
+    ContentType.BROLL: ("ideas", ("Nr", "Idee")),
+    ContentType.SHOTLIST: ("shots", ("Nr", "Shot")),
+}
+
+# Zeichen, mit denen Tabellenkalkulationen eine Zelle als Formel lesen (CSV Injection)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _Line:
+    """Datei-Ersatz für csv.writer: writerow() gibt die formatierte Zeile direkt zurück"""
+
+    @staticmethod
+    def write(line: str) -> str:
+        return line
+
+
+class DataExporter:
+    """
+    Render-freie Alternativen zum PDF für den Import in andere Tools:
+    ICS für Kalender (30 ganztägige Termine), SRT/VTT für Script-Szenen (Timings kumuliert
+    aus duration_seconds) und CSV für Hooks, B-Roll und Shotlists.
+
+    Die Serializer sind Generatoren über Zeilen (str) und arbeiten direkt auf content.data
+    (Form nach dem JSON-Roundtrip, z.B. String-Keys im Kalender) - ein Export kostet
+    Mikrosekunden statt eines ReportLab Renders. Für PDF bleibt PDFGenerator zuständig;
+    PDF steht trotzdem in formats(), damit negotiate() es als Alternative anbieten kann.
+    """
+
+    ICS_PRODID = "-//AI Reels Generator//Content Kalender//DE"
+    ICS_LINE_OCTETS = 75
+
+    def __init__(self):
+        # (Content Type, Format) → Serializer, in Reihenfolge der Server-Präferenz
+        self._serializers: Dict[ContentType, Dict[str, Callable[..., Iterator[str]]]] = {
+            content_type: {CSV.name: self.to_csv} for content_type in CSV_COLUMNS
+        }
+        self._serializers[ContentType.CALENDAR] = {ICS.name: self.to_ics}
+        self._serializers[ContentType.SCRIPT] = {SRT.name: self.to_srt, VTT.name: self.to_vtt}
+
+    def formats(self, content_type: ContentType) -> List[ExportFormat]:
+        """Verfügbare Formate für diesen Content Type (bevorzugtes zuerst, PDF zuletzt)"""
+        return [FORMATS[name] for name in self._serializers.get(content_type, {})] + [PDF]
+
+    def negotiate(self, content_type: ContentType, accept: Optional[str]) -> Optional[ExportFormat]:
+        """
+        Wählt das Format per Accept Header (RFC 9110: q-Werte, type/* und */*, spezifischster
+        Eintrag zählt). Bei gleichem q entscheidet die Reihenfolge von formats().
+
+        Returns: ExportFormat oder None (nichts davon akzeptabel → 406)
+        """
+        offered = self.formats(content_type)
+        if not accept:
+            return offered[0]
+
+        ranges: List[Tuple[str, str, float]] = []
+        for part in accept.split(","):
+            media_range, *params = [piece.strip() for piece in part.split(";")]
+            if "/" not in media_range:
+                continue
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            main_type, _, sub_type = media_range.lower().partition("/")
+            ranges.append((main_type, sub_type, quality))
+
+        best, best_quality = None, 0.0
+        for export_format in offered:
+            main_type, _, sub_type = export_format.media_type.partition("/")
+            # Spezifität: 2 = exakt, 1 = type/*, 0 = */*
+            matches = [
+                (2 if (m, s) == (main_type, sub_type) else 1 if (m, s) == (main_type, "*") else 0, quality)
+                for m, s, quality in ranges
+                if (m, s) in ((main_type, sub_type), (main_type, "*"), ("*", "*"))
+            ]
+            if not matches:
+                continue
+            quality = max(matches)[1]
+            if quality > best_quality:
+                best, best_quality = export_format, quality
+        return best
+
+    def serialize(
+        self,
+        content_type: ContentType,
+        export_format: ExportFormat,
+        data: dict,
+        content_id: str,
+        generated_at: datetime,
+        start: Optional[date] = None
+    ) -> Iterator[str]:
+        """
+        Returns: Zeilen des Exports
+
+        Raises:
+            ValueError: Wenn das Format für diesen Content Type nicht (render-frei) verfügbar ist
+        """
+        serializer = self._serializers.get(content_type, {}).get(export_format.name)
+        if serializer is None:
+            raise ValueError(f"{export_format.name.upper()} ist für {content_type.value} nicht verfügbar")
+        return serializer(content_type=content_type, data=data, content_id=content_id,
+                          generated_at=generated_at, start=start)
+
+    # ---------- CSV ----------
+
+    def to_csv(self, content_type: ContentType, data: dict, **_) -> Iterator[str]:
+        """Eine Zeile pro Eintrag (Nr, Text), RFC 4180 mit CRLF"""
+        source, header = CSV_COLUMNS[content_type]
+        writer = csv.writer(_Line())
+        yield writer.writerow(header)
+        for i, item in enumerate(data[source], 1):
+            yield writer.writerow((i, self._csv_cell(item)))
+
+    @staticmethod
+    def _csv_cell(text: str) -> str:
+        return f"'{text}" if text.startswith(_FORMULA_PREFIXES) else text
+
+    # ---------- ICS ----------
+
+    def to_ics(
+        self, data: dict, content_id: str, generated_at: datetime, start: Optional[date] = None, **_
+    ) -> Iterator[str]:
+        """
+        RFC 5545 Kalender mit einem ganztägigen Termin pro Tag (Thema als Titel, Hook als
+        Beschreibung). Tag 1 ist start, ohne start der Tag nach der Generierung.
+        """
+        start = start or (generated_at.date() + timedelta(days=1))
+        stamp = generated_at.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        days = {int(day_num): day for day_num, day in data["days"].items()}
+
+        yield "BEGIN:VCALENDAR\r\n"
+        yield "VERSION:2.0\r\n"
+        yield f"PRODID:{self.ICS_PRODID}\r\n"
+        yield "CALSCALE:GREGORIAN\r\n"
+        yield self._ics_line(f"X-WR-CALNAME:Content Kalender: {self._ics_text(data['niche'])}")
+        for day_num in sorted(days):
+            day = days[day_num]
+            event_date = start + timedelta(days=day_num - 1)
+            yield "BEGIN:VEVENT\r\n"
+            yield f"UID:{content_id}-{day_num}@reels-generator\r\n"
+            yield f"DTSTAMP:{stamp}\r\n"
+            yield f"DTSTART;VALUE=DATE:{self._ics_date(event_date)}\r\n"
+            yield f"DTEND;VALUE=DATE:{self._ics_date(event_date + timedelta(days=1))}\r\n"
+            yield self._ics_line(f"SUMMARY:Tag {day_num}: {self._ics_text(day['theme'])}")
+            yield self._ics_line(f"DESCRIPTION:{self._ics_text(day['hook'])}")
+            yield "END:VEVENT\r\n"
+        yield "END:VCALENDAR\r\n"
+
+    @staticmethod
+    def _ics_date(day: date) -> str:
+        # isoformat statt strftime - deutlich schneller, und das 60x pro Kalender
+        return day.isoformat().replace("-", "")
+
+    @staticmethod
+    def _ics_text(text: str) -> str:
+        return (
+            text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n")
+        )
+
+    def _ics_line(self, line: str) -> str:
+        """Faltet Zeilen nach 75 Oktetts (Fortsetzung mit Leerzeichen), ohne UTF-8 Zeichen zu trennen"""
+        if len(line) * 4 <= self.ICS_LINE_OCTETS:
+            return line + "\r\n"
+        encoded = line.encode("utf-8")
+        if len(encoded) <= self.ICS_LINE_OCTETS:
+            return line + "\r\n"
+        parts: List[bytes] = []
+        start, limit = 0, self.ICS_LINE_OCTETS
+        while len(encoded) - start > limit:
+            end = start + limit
+            # Nicht vor einem Folgebyte (0b10xxxxxx) trennen
+            while encoded[end] & 0xC0 == 0x80:
+                end -= 1
+            parts.append(encoded[start:end])
+            # Folgezeilen beginnen mit einem Leerzeichen, das mitzählt
+            start, limit = end, self.ICS_LINE_OCTETS - 1
+        parts.append(encoded[start:])
+        return b"\r\n ".join(parts).decode("utf-8") + "\r\n"
+
+    # ---------- SRT / VTT ----------
+
+    def to_srt(self, data: dict, **_) -> Iterator[str]:
+        """Ein Untertitel pro Szene, Start/Ende kumuliert aus duration_seconds"""
+        for i, (start_ms, end_ms, lines) in enumerate(self._cues(data), 1):
+            yield f"{i}\n{self._timestamp(start_ms, ',')} --> {self._timestamp(end_ms, ',')}\n" + "\n".join(lines) + "\n\n"
+
+    def to_vtt(self, data: dict, **_) -> Iterator[str]:
+        """Wie to_srt(), als WebVTT (Cue-Text escaped)"""
+        yield "WEBVTT\n\n"
+        for i, (start_ms, end_ms, lines) in enumerate(self._cues(data), 1):
+            text = "\n".join(line.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;") for line in lines)
+            yield f"{i}\n{self._timestamp(start_ms, '.')} --> {self._timestamp(end_ms, '.')}\n{text}\n\n"
+
+    @staticmethod
+    def _cues(data: dict) -> Iterator[Tuple[int, int, List[str]]]:
+        """(Start ms, Ende ms, Textzeilen) pro Szene; Leerzeilen würden den Cue beenden"""
+        start_ms = 0
+        for scene in sorted(data["scenes"], key=lambda scene: scene["scene_number"]):
+            end_ms = start_ms + round(float(scene["duration_seconds"]) * 1000)
+            lines = [line.strip() for line in scene["text"].splitlines() if line.strip()]
+            yield start_ms, end_ms, lines or [""]
+            start_ms = end_ms
+
+    @staticmethod
+    def _timestamp(ms: int, separator: str) -> str:
+        seconds, ms = divmod(ms, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{ms:03d}"
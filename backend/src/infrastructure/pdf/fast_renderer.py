@@ -0,0 +1,244 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from io import BytesIO
+from typing import List, Optional, Tuple
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm, inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from ...domain.entities.content import ContentType
+
+
+# Ein Wort einer Zeile: (Font, Text)
+Word = Tuple[str, str]
+
+
+@dataclass
+class _Block:
+    """Absatz (oder Spacer ohne lines) mit den Metriken des entsprechenden Platypus Styles"""
+    lines: List[List[Word]] = field(default_factory=list)
+    widths: List[float] = field(default_factory=list)
+    font_size: float = 0
+    leading: float = 0
+    space_before: float = 0
+    space_after: float = 0
+    left_indent: float = 0
+    alignment: str = "left"
+    color: colors.Color = colors.black
+    height: float = 0
+
+
+class ListPDFRenderer:
+    """
+    Schneller Renderer für Content-Typen, die nur aus Überschrift + Text/Liste bestehen
+    (Hooks, B-Roll, Caption). Schreibt direkt auf den Canvas statt über Platypus
+    (SimpleDocTemplate, Paragraph, Stylesheet).
+
+    Das Layout bildet PDFGenerator exakt nach: gleiche Seitenränder, Styles, Abstände
+    und der Zeilenumbruch von Paragraph (inkl. 5 % Space Shrinkage) - die PDFs sehen
+    identisch aus. Fälle, die der Fast Path nicht abdeckt (Markup-Zeichen im Text,
+    Wörter breiter als eine Zeile, mehr als eine Seite), liefern None - dann rendert
+    PDFGenerator wie bisher mit Platypus.
+    """
+
+    CONTENT_TYPES = frozenset({ContentType.HOOK, ContentType.BROLL, ContentType.CAPTION})
+
+    # Seitengeometrie von SimpleDocTemplate (1 inch Rand) + Frame Padding (6pt)
+    FRAME_PADDING = 6
+    PAGE_WIDTH, PAGE_HEIGHT = A4
+    LEFT = inch + FRAME_PADDING
+    TOP = PAGE_HEIGHT - inch - FRAME_PADDING
+    BOTTOM = inch + FRAME_PADDING
+    WIDTH = PAGE_WIDTH - 2 * LEFT
+
+    REGULAR = "Helvetica"
+    BOLD = "Helvetica-Bold"
+    BOLD_OBLIQUE = "Helvetica-BoldOblique"
+    SPACE_SHRINKAGE = 0.05
+
+    TITLE_COLOR = colors.HexColor('#0284c7')
+    SUBTITLE_COLOR = colors.HexColor('#0369a1')
+
+    def __init__(self):
+        self._space_widths = {}
+        # Konstante Blöcke einmal vorberechnen (Header-Zeilen, Spacer)
+        self._title = self._paragraph(
+            self._words(self.BOLD, "AI Reels Generator"), font_size=24, leading=22, space_after=30,
+            alignment="center", color=self.TITLE_COLOR
+        )
+        self._spacer_small = _Block(height=0.5 * cm)
+        self._spacer_footer = _Block(height=1 * cm)
+
+    def render(
+        self,
+        content_type: ContentType,
+        data: dict,
+        prompt: str,
+        generated_at: Optional[datetime] = None
+    ) -> Optional[bytes]:
+        """Returns: PDF bytes oder None, wenn der Inhalt den Platypus-Pfad braucht"""
+        texts = [prompt]
+        if content_type == ContentType.HOOK:
+            title, items = "10 Virale Hooks", data["hooks"]
+        elif content_type == ContentType.BROLL:
+            title, items = "B-Roll Ideen", data["ideas"]
+        elif content_type == ContentType.CAPTION:
+            title, items = "Instagram Caption", None
+        else:
+            return None
+        texts.extend(items if items is not None else [data["caption"], *data["hashtags"]])
+        # Paragraph interpretiert < und & als Markup - das bildet der Fast Path nicht nach
+        if any("<" in text or "&" in text for text in texts):
+            return None
+
+        try:
+            blocks = [
+                self._title,
+                self._paragraph(self._words(self.BOLD, title), font_size=16, leading=18, space_before=12, space_after=20,
+                                color=self.SUBTITLE_COLOR),
+                self._spacer_small,
+                self._paragraph(self._words(self.REGULAR, prompt, prefix=(self.BOLD, "Thema:")), font_size=10, leading=12),
+                self._spacer_small,
+            ]
+            if items is not None:
+                for i, item in enumerate(items, 1):
+                    blocks.append(self._paragraph(
+                        self._words(self.REGULAR, item, prefix=(self.BOLD, f"{i}.")),
+                        font_size=11, leading=12, space_after=10, left_indent=20
+                    ))
+            else:
+                blocks.extend([
+                    self._heading3("Caption:"),
+                    self._paragraph(self._words(self.REGULAR, data["caption"]), font_size=10, leading=12),
+                    self._spacer_small,
+                    self._heading3("Hashtags:"),
+                    self._paragraph(self._words(self.REGULAR, " ".join(data["hashtags"])), font_size=10, leading=12),
+                ])
+        except _LongWord:
+            return None
+
+        generated_at = generated_at or datetime.now()
+        blocks.append(self._spacer_footer)
+        blocks.append(self._paragraph(
+            self._words(self.REGULAR, f"Generiert am {generated_at.strftime('%d.%m.%Y um %H:%M')} Uhr"),
+            font_size=9, leading=12, alignment="right", color=colors.grey
+        ))
+
+        positions = self._layout(blocks)
+        if positions is None:
+            return None
+        return self._draw(blocks, positions)
+
+    # ---------- Layout ----------
+
+    def _heading3(self, text: str) -> _Block:
+        # Heading3 des Sample Stylesheets (Helvetica-BoldOblique 12/14, davor 12, danach 6)
+        return self._paragraph(self._words(self.BOLD_OBLIQUE, text), font_size=12, leading=14, space_before=12, space_after=6)
+
+    @staticmethod
+    def _words(font: str, text: str, prefix: Optional[Word] = None) -> List[Word]:
+        words = [(font, word) for word in text.split()]
+        return [prefix] + words if prefix else words
+
+    def _paragraph(self, words: List[Word], font_size: float, leading: float, **style) -> _Block:
+        block = _Block(font_size=font_size, leading=leading, **style)
+        block.lines, block.widths = self._break_lines(words, font_size, self.WIDTH - block.left_indent)
+        block.height = len(block.lines) * leading
+        return block
+
+    def _space_width(self, font: str, font_size: float) -> float:
+        key = (font, font_size)
+        if key not in self._space_widths:
+            self._space_widths[key] = stringWidth(" ", font, font_size)
+        return self._space_widths[key]
+
+    def _break_lines(
+        self, words: List[Word], font_size: float, max_width: float
+    ) -> Tuple[List[List[Word]], List[float]]:
+        """Zeilenumbruch wie Paragraph.breakLines (ohne Silbentrennung). Returns: (Zeilen, Zeilenbreiten)"""
+        lines: List[List[Word]] = []
+        widths: List[float] = []
+        line: List[Word] = []
+        width = 0.0
+        space = 0.0
+        for font, text in words:
+            word_width = stringWidth(text, font, font_size)
+            if word_width > max_width:
+                raise _LongWord()
+            # Paragraph erlaubt pro Leerzeichen der Zeile 5 % Stauchung
+            limit = max_width + self.SPACE_SHRINKAGE * space * len(line)
+            if line and width + space + word_width > limit:
+                lines.append(line)
+                widths.append(width)
+                line, width = [], 0.0
+            width = width + space + word_width if line else word_width
+            line.append((font, text))
+            space = self._space_width(font, font_size)
+        if line:
+            lines.append(line)
+            widths.append(width)
+        return lines, widths
+
+    def _layout(self, blocks: List[_Block]) -> Optional[List[float]]:
+        """Unterkante jedes Blocks wie im Platypus Frame; None wenn nicht alles auf eine Seite passt"""
+        positions = []
+        y = self.TOP
+        previous_after = None
+        for block in blocks:
+            if previous_after is not None:
+                y -= max(previous_after, block.space_before)
+            y -= block.height
+            if y < self.BOTTOM:
+                return None
+            positions.append(y)
+            previous_after = block.space_after
+        return positions
+
+    # ---------- Zeichnen ----------
+
+    def _draw(self, blocks: List[_Block], positions: List[float]) -> bytes:
+        buffer = BytesIO()
+        canvas = Canvas(buffer, pagesize=A4, invariant=True)
+        # Metadaten wie bei SimpleDocTemplate
+        canvas.setTitle("(anonymous)")
+        canvas.setAuthor("(anonymous)")
+        canvas.setSubject("(unspecified)")
+        canvas.setCreator("(unspecified)")
+
+        for block, bottom in zip(blocks, positions):
+            if not block.lines:
+                continue
+            canvas.setFillColor(block.color)
+            baseline = bottom + block.height - block.font_size
+            for line, width in zip(block.lines, block.widths):
+                x = self.LEFT + block.left_indent
+                if block.alignment != "left":
+                    free = self.WIDTH - block.left_indent - width
+                    x += free / 2 if block.alignment == "center" else free
+                text = canvas.beginText(x, baseline)
+                # Ein textOut pro Font-Wechsel statt pro Wort; das Leerzeichen gehört zum folgenden Run
+                for index, (font, run) in enumerate(self._runs(line)):
+                    text.setFont(font, block.font_size, block.leading)
+                    text.textOut(f" {run}" if index else run)
+                canvas.drawText(text)
+                baseline -= block.leading
+
+        canvas.showPage()
+        canvas.save()
+        return buffer.getvalue()
+
+    @staticmethod
+    def _runs(line: List[Word]) -> List[Word]:
+        """Fasst aufeinanderfolgende Wörter mit gleichem Font zusammen"""
+        runs: List[Word] = []
+        for font, word in line:
+            if runs and runs[-1][0] == font:
+                runs[-1] = (font, f"{runs[-1][1]} {word}")
+            else:
+                runs.append((font, word))
+        return runs
+
+
+class _LongWord(Exception):
+    """Wort breiter als die Zeile - Paragraph würde es trennen"""
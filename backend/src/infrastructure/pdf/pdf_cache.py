@@ -0,0 +1,283 @@
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import BinaryIO, Optional, Tuple
+from ..monitoring import metrics
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - nur POSIX
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class PDFDiskCache:
+    """
+    Größenbegrenzter Disk Cache für gerenderte PDFs mit LRU-Verdrängung.
+
+    Key ist (Content-ID, Version, Template-Version) - eine Version ist nach der
+    Generierung unveränderlich und PDFGenerator rendert deterministisch, ein Eintrag
+    wird also nie ungültig, sondern nur verdrängt. Dateien werden atomar per rename
+    geschrieben, Treffer setzen die mtime neu - die mtime ist die LRU-Reihenfolge.
+
+    Mehrere Prozesse (uvicorn Worker, Generation Worker) teilen sich ein Verzeichnis und
+    ein gemeinsames Budget: verdrängt wird nur bei einem Rescan des ganzen Verzeichnisses
+    unter einer Dateisperre (.lock, fcntl), nach mtime über die Dateien aller Prozesse.
+    Ein Rescan läuft beim ersten Zugriff, sobald die eigene Sicht (letzter Scan + eigene
+    Writes) das Budget überschreitet, spätestens aber alle rescan_seconds - Writes anderer
+    Prozesse überziehen das Budget also höchstens bis zum nächsten Rescan. Dabei werden
+    auch Spool-Dateien abgestürzter Writer entfernt.
+
+    Für Downloads ohne Umweg über den Speicher liefert open() die geöffnete Datei - eine
+    Verdrängung danach löscht nur den Verzeichniseintrag, der offene Descriptor bleibt
+    lesbar. Große Einträge (Bundles) werden per spool() + put_file() direkt auf die
+    Platte geschrieben. Eine zweite Instanz mit eigenem Verzeichnis, suffix und name
+    dient als Bundle Cache.
+    """
+
+    # Spool-Dateien ohne Schreibzugriff seit so vielen Sekunden gehören einem abgestürzten Writer
+    STALE_SPOOL_SECONDS = 3600
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        suffix: str = ".pdf",
+        name: str = "pdf_cache",
+        rescan_seconds: Optional[float] = None
+    ):
+        self.directory = directory or os.getenv("PDF_CACHE_DIR") or os.path.join(
+            tempfile.gettempdir(), "reels-pdf-cache"
+        )
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            float(os.getenv("PDF_CACHE_MAX_MB", "256")) * 1024 * 1024
+        )
+        self.suffix = suffix
+        self.rescan_seconds = rescan_seconds if rescan_seconds is not None else float(
+            os.getenv("PDF_CACHE_RESCAN_SECONDS", "30")
+        )
+        # Index aus dem letzten Rescan plus eigene Writes seitdem (Key → Größe, nach mtime)
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._scanned_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+
+        self._requests = metrics.counter(f"{name}_requests_total", "Cache Lookups nach Ergebnis")
+        self._evictions = metrics.counter(f"{name}_evictions_total", "Aus dem Cache verdrängte Dateien")
+        self._rescans = metrics.counter(f"{name}_rescans_total", "Rescans des Cache-Verzeichnisses")
+        metrics.register_collector(name, self.stats)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @staticmethod
+    def key(content_id: str, version: int, template_version: int) -> str:
+        return f"{content_id}-v{version}-t{template_version}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Returns: PDF bytes oder None (Miss)"""
+        if not self.enabled:
+            return None
+        data = await asyncio.to_thread(self._get, key)
+        self._requests.inc(result="hit" if data is not None else "miss")
+        return data
+
+    async def open(self, key: str) -> Optional[BinaryIO]:
+        """Returns: geöffnete Datei (Aufrufer schließt sie) oder None (Miss)"""
+        if not self.enabled:
+            return None
+        file = await asyncio.to_thread(self._open, key)
+        self._requests.inc(result="hit" if file is not None else "miss")
+        return file
+
+    async def contains(self, key: str) -> bool:
+        """Prüft nur, ob die Datei existiert (zählt nicht als Lookup und ändert die LRU-Reihenfolge nicht)"""
+        if not self.enabled:
+            return False
+        return await asyncio.to_thread(os.path.exists, self._path(key))
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Speichert ein PDF und verdrängt die am längsten nicht genutzten Einträge"""
+        if not self.enabled or len(data) > self.max_bytes:
+            return
+        try:
+            await asyncio.to_thread(self._put, key, data)
+        except OSError as e:
+            # Cache ist optional - ein volles/nicht beschreibbares Verzeichnis darf den Export nicht brechen
+            logger.warning("PDF Cache konnte %s nicht schreiben: %s", key, e)
+
+    async def spool(self) -> Optional[Tuple[BinaryIO, str]]:
+        """
+        Temporäre Datei im Cache-Verzeichnis für große Einträge, die direkt auf die Platte gestreamt werden.
+        Danach put_file() oder discard(). Returns: (Datei, Pfad) bzw. None wenn der Cache aus ist.
+        """
+        if not self.enabled:
+            return None
+        try:
+            return await asyncio.to_thread(self._spool)
+        except OSError as e:
+            logger.warning("Cache Spool-Datei konnte nicht angelegt werden: %s", e)
+            return None
+
+    async def put_file(self, key: str, tmp_path: str) -> None:
+        """Übernimmt eine fertig geschriebene Spool-Datei als Eintrag key"""
+        try:
+            await asyncio.to_thread(self._commit, key, tmp_path)
+        except OSError as e:
+            logger.warning("Cache konnte %s nicht übernehmen: %s", key, e)
+            self.discard(tmp_path)
+
+    @staticmethod
+    def discard(tmp_path: str) -> None:
+        """Verwirft eine (unvollständige) Spool-Datei"""
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "bytes": self._size, "max_bytes": self.max_bytes}
+
+    # ---------- Dateisystem (läuft in Threads) ----------
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.suffix}")
+
+    def _open(self, key: str) -> Optional[BinaryIO]:
+        self._load()
+        path = self._path(key)
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            # Von einem anderen Prozess verdrängt
+            with self._lock:
+                self._size -= self._entries.pop(key, 0)
+            return None
+
+        size = os.fstat(file.fileno()).st_size
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = size
+                self._size += size
+            self._entries.move_to_end(key)
+        return file
+
+    def _get(self, key: str) -> Optional[bytes]:
+        file = self._open(key)
+        if file is None:
+            return None
+        with file:
+            return file.read()
+
+    def _spool(self) -> Tuple[BinaryIO, str]:
+        self._load()
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        return os.fdopen(fd, "wb"), tmp_path
+
+    def _put(self, key: str, data: bytes) -> None:
+        file, tmp_path = self._spool()
+        try:
+            with file:
+                file.write(data)
+        except BaseException:
+            self.discard(tmp_path)
+            raise
+        self._commit(key, tmp_path)
+
+    def _commit(self, key: str, tmp_path: str) -> None:
+        """Benennt die Spool-Datei atomar in den Eintrag um und verdrängt bei Bedarf"""
+        size = os.path.getsize(tmp_path)
+        if size > self.max_bytes:
+            self.discard(tmp_path)
+            return
+        try:
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self.discard(tmp_path)
+            raise
+
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._size += size
+            over_budget = self._size > self.max_bytes
+        if over_budget or self._rescan_due():
+            self._rescan()
+
+    def _rescan_due(self) -> bool:
+        return self._scanned_at is None or time.monotonic() - self._scanned_at >= self.rescan_seconds
+
+    def _load(self) -> None:
+        """Erster Zugriff: Verzeichnis anlegen und einlesen (danach nur noch per Rescan)"""
+        if self._scanned_at is None:
+            self._rescan()
+
+    def _rescan(self) -> None:
+        """
+        Liest das Verzeichnis aller Prozesse ein und verdrängt nach mtime bis das gemeinsame
+        Budget passt. Unter der Dateisperre läuft immer nur ein Rescan gleichzeitig.
+        """
+        with self._scan_lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, ".lock"), "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    files, total = self._scan()
+                    oldest = evicted = 0
+                    while total > self.max_bytes and oldest < len(files):
+                        _, key, size = files[oldest]
+                        try:
+                            os.remove(self._path(key))
+                            evicted += 1
+                        except FileNotFoundError:
+                            pass
+                        total -= size
+                        oldest += 1
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+            entries: "OrderedDict[str, int]" = OrderedDict()
+            for _, key, size in files[oldest:]:
+                entries[key] = size
+            with self._lock:
+                self._entries = entries
+                self._size = total
+            self._scanned_at = time.monotonic()
+        self._rescans.inc()
+        if evicted:
+            self._evictions.inc(evicted)
+
+    def _scan(self) -> Tuple[list, int]:
+        """Returns: ([(mtime, key, size)] älteste zuerst, Gesamtgröße) - entfernt verwaiste Spool-Dateien"""
+        files = []
+        total = 0
+        stale_before = time.time() - self.STALE_SPOOL_SECONDS
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith(self.suffix):
+                    files.append((stat.st_mtime, entry.name[:-len(self.suffix)], stat.st_size))
+                    total += stat.st_size
+                elif entry.name.endswith(".tmp") and stat.st_mtime < stale_before:
+                    self.discard(entry.path)
+        files.sort()
+        return files, total
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from ...domain.entities.content import Content, ContentType, ContentStatus
+from ...domain.entities.subscription import SubscriptionPlan
+from ..monitoring import metrics
+from .pdf_cache import PDFDiskCache
+from .pdf_generator import PDFGenerator
+from .render_pool import PDFRenderPool
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _ExportRate:
+    """Generierte vs. exportierte Contents (halbiert sich alle window Generierungen)"""
+    generated: float = 0.0
+    exported: float = 0.0
+
+    def rate(self) -> Optional[float]:
+        return min(self.exported / self.generated, 1.0) if self.generated else None
+
+
+class PDFPrerenderer:
+    """
+    Rendert PDFs direkt nach einer Generierung spekulativ in den PDFDiskCache, damit der
+    Download für Pro/Enterprise sofort aus dem Cache kommt.
+
+    Zulassung: pro (User, Content Type) wird gezählt, welcher Anteil der generierten
+    Contents (bzw. Versionen) später exportiert wird. Vorgerendert wird nur ab
+    PDF_PRERENDER_MIN_RATE. Mit wenig Historie wird die Rate des Users mit der Rate aller
+    User für diesen Typ geglättet (PRIOR_WEIGHT Pseudo-Beobachtungen), ganz ohne Historie
+    gilt INITIAL_RATE. Die Zähler halbieren sich regelmäßig - alte Gewohnheiten verlieren
+    an Gewicht.
+
+    Niedrige Priorität: Aufträge landen in einer begrenzten Queue (voll → verworfen) und
+    werden nur gerendert, wenn im PDFRenderPool ein Worker frei ist. Ein echter Export
+    wartet also höchstens auf einen bereits laufenden spekulativen Render.
+
+    Trefferquote: vorgerenderte Cache-Keys werden gemerkt, der erste Export, der einen
+    davon aus dem Cache bedient, zählt als Treffer.
+
+    Zähler sind prozesslokal. Aufträge nimmt nur ein gestarteter Prerenderer an (lifespan
+    des API-Prozesses) - ein als eigener Prozess laufender Generation Worker rendert nicht vor.
+    """
+
+    PLANS = frozenset({SubscriptionPlan.PRO, SubscriptionPlan.ENTERPRISE})
+    PRIOR_WEIGHT = 5
+    INITIAL_RATE = 0.5
+    USER_WINDOW = 50
+    TYPE_WINDOW = 1000
+    MAX_TRACKED = 10_000
+    IDLE_POLL_SECONDS = 0.05
+
+    def __init__(
+        self,
+        pdf_render_pool: PDFRenderPool,
+        pdf_cache: PDFDiskCache,
+        min_rate: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        max_age_seconds: Optional[float] = None
+    ):
+        self.pdf_render_pool = pdf_render_pool
+        self.pdf_cache = pdf_cache
+        self.enabled = os.getenv("PDF_PRERENDER_ENABLED", "true").lower() == "true"
+        self.min_rate = min_rate if min_rate is not None else float(os.getenv("PDF_PRERENDER_MIN_RATE", "0.3"))
+        self.max_pending = max_pending or int(os.getenv("PDF_PRERENDER_MAX_PENDING", "100"))
+        self.max_age_seconds = max_age_seconds or float(os.getenv("PDF_PRERENDER_MAX_AGE_SECONDS", "120"))
+
+        self._user_rates: "OrderedDict[Tuple[str, ContentType], _ExportRate]" = OrderedDict()
+        self._type_rates: Dict[ContentType, _ExportRate] = {}
+        # Bereits gezählte Exports bzw. vorgerenderte, noch nicht abgerufene PDFs (Cache-Keys)
+        self._exported: "OrderedDict[str, None]" = OrderedDict()
+        self._prerendered: "OrderedDict[str, ContentType]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._rendered = 0
+        self._hits = 0
+
+        self._admissions = metrics.counter(
+            "pdf_prerender_admissions_total", "Zulassungsentscheidungen nach Generierungen (queued, low_rate, dropped)"
+        )
+        self._renders = metrics.counter("pdf_prerender_renders_total", "Spekulative Renders nach Content Type und Ergebnis")
+        self._hits_total = metrics.counter("pdf_prerender_hits_total", "Exports, die ein vorgerendertes PDF aus dem Cache bekamen")
+        metrics.register_collector("pdf_prerender", self.stats)
+
+    # ---------- Lifecycle ----------
+
+    async def start(self) -> None:
+        """Startet den Hintergrund-Task (im FastAPI lifespan nach dem PDFRenderPool aufrufen)"""
+        if self._task is not None or not self.enabled or not self.pdf_cache.enabled:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._task = asyncio.create_task(self._run())
+        logger.info("PDF Prerenderer gestartet (min. Export-Rate %.2f)", self.min_rate)
+
+    async def close(self) -> None:
+        """Bricht den Hintergrund-Task ab; noch wartende Aufträge werden verworfen"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._queue = None
+
+    def stats(self) -> dict:
+        return {
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "tracked": len(self._user_rates),
+            "rendered": self._rendered,
+            "hits": self._hits,
+            "hit_rate": round(self._hits / self._rendered, 3) if self._rendered else None,
+        }
+
+    # ---------- Beobachtung & Zulassung ----------
+
+    def submit(self, content: Content, plan: SubscriptionPlan) -> bool:
+        """
+        Nach dem Commit einer Generierung aufrufen. Blockiert nicht.
+
+        Returns: True wenn ein spekulativer Render eingestellt wurde
+        """
+        if self._queue is None or plan not in self.PLANS or content.status != ContentStatus.COMPLETED:
+            return False
+
+        rate = self.export_rate(content.user_id, content.type)
+        self._observe_generation(content.user_id, content.type)
+        if rate < self.min_rate:
+            self._admissions.inc(decision="low_rate")
+            return False
+        try:
+            self._queue.put_nowait((time.monotonic(), content))
+        except asyncio.QueueFull:
+            self._admissions.inc(decision="dropped")
+            return False
+        self._admissions.inc(decision="queued")
+        return True
+
+    def record_export(self, user_id: str, content_type: ContentType, cache_key: str, cache_hit: bool) -> None:
+        """Von den Export Use Cases pro ausgeliefertem PDF aufrufen (nicht bei 304)"""
+        prerendered = self._prerendered.pop(cache_key, None)
+        if prerendered is not None and cache_hit:
+            self._hits += 1
+            self._hits_total.inc(type=content_type.value)
+
+        # Pro Content-Version nur der erste Export zählt für die Rate
+        if cache_key in self._exported:
+            self._exported.move_to_end(cache_key)
+            return
+        self._remember(self._exported, cache_key, None)
+        user_rate = self._user_rates.get((user_id, content_type))
+        if user_rate is not None:
+            user_rate.exported += 1
+        self._type_rates.setdefault(content_type, _ExportRate()).exported += 1
+
+    def export_rate(self, user_id: str, content_type: ContentType) -> float:
+        """Geschätzter Anteil der Contents dieses Users/Typs, die exportiert werden"""
+        type_rate = self._type_rates.get(content_type)
+        prior = type_rate.rate() if type_rate is not None else None
+        if prior is None:
+            prior = self.INITIAL_RATE
+        user_rate = self._user_rates.get((user_id, content_type)) or _ExportRate()
+        return min((user_rate.exported + self.PRIOR_WEIGHT * prior) / (user_rate.generated + self.PRIOR_WEIGHT), 1.0)
+
+    def _observe_generation(self, user_id: str, content_type: ContentType) -> None:
+        key = (user_id, content_type)
+        user_rate = self._user_rates.get(key)
+        if user_rate is None:
+            user_rate = self._remember(self._user_rates, key, _ExportRate())
+        else:
+            self._user_rates.move_to_end(key)
+        type_rate = self._type_rates.setdefault(content_type, _ExportRate())
+        for rate, window in ((user_rate, self.USER_WINDOW), (type_rate, self.TYPE_WINDOW)):
+            rate.generated += 1
+            if rate.generated >= window:
+                rate.generated /= 2
+                rate.exported /= 2
+
+    def _remember(self, entries: OrderedDict, key, value):
+        entries[key] = value
+        if len(entries) > self.MAX_TRACKED:
+            entries.popitem(last=False)
+        return value
+
+    # ---------- Rendering ----------
+
+    async def _run(self) -> None:
+        while True:
+            queued_at, content = await self._queue.get()
+            try:
+                await self._prerender(content, queued_at)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._renders.inc(type=content.type.value, outcome="error")
+                logger.warning("Spekulativer PDF-Render für %s fehlgeschlagen: %s", content.id, e)
+
+    async def _prerender(self, content: Content, queued_at: float) -> None:
+        cache_key = self.pdf_cache.key(content.id, content.version, PDFGenerator.TEMPLATE_VERSION)
+        if await self.pdf_cache.contains(cache_key):
+            self._renders.inc(type=content.type.value, outcome="cached")
+            return
+
+        # Nur freie Worker nutzen - echte Exports haben Vorrang
+        while True:
+            if time.monotonic() - queued_at > self.max_age_seconds:
+                self._renders.inc(type=content.type.value, outcome="expired")
+                return
+            if self.pdf_render_pool.idle:
+                try:
+                    # Wie beim Export: Daten so rendern, wie sie aus JSONB zurückkommen (z.B. String-Keys)
+                    pdf_bytes = await self.pdf_render_pool.render(
+                        content.type, json.loads(json.dumps(content.data)), content.prompt,
+                        generated_at=content.created_at
+                    )
+                    break
+                except asyncio.QueueFull:
+                    pass
+            await asyncio.sleep(self.IDLE_POLL_SECONDS)
+
+        await self.pdf_cache.put(cache_key, pdf_bytes)
+        self._remember(self._prerendered, cache_key, content.type)
+        self._rendered += 1
+        self._renders.inc(type=content.type.value, outcome="ok")
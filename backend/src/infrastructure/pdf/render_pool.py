@@ -0,0 +1,216 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Optional, Tuple
+from ...domain.entities.content import ContentType
+from ..monitoring import metrics
+from .pdf_generator import PDFGenerator
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============== Worker-Prozess ==============
+
+# Pro Worker-Prozess einmal aufgebaut (Styles, Fonts) und für alle Renders wiederverwendet
+_generator: Optional[PDFGenerator] = None
+
+
+def _init_worker() -> None:
+    global _generator
+    _generator = PDFGenerator()
+
+
+def _get_generator() -> PDFGenerator:
+    global _generator
+    if _generator is None:
+        _generator = PDFGenerator()
+    return _generator
+
+
+def _warmup() -> int:
+    """Rendert ein Mini-PDF, damit ReportLab Module und Fonts vor dem ersten Export geladen sind"""
+    _get_generator().generate_pdf(ContentType.HOOK, {"hooks": ["Warmup"]}, "Warmup")
+    return os.getpid()
+
+
+def _render(content_type: str, data: dict, prompt: str, generated_at: Optional[datetime]) -> Tuple[bytes, float]:
+    """Läuft im Worker. Returns: (PDF bytes, reine Renderzeit in Sekunden)"""
+    started = time.perf_counter()
+    pdf_bytes = _get_generator().generate_pdf(ContentType(content_type), data, prompt, generated_at)
+    return pdf_bytes, time.perf_counter() - started
+
+
+# ============== Pool ==============
+
+class PDFRenderPool:
+    """
+    Rendert PDFs außerhalb des Event Loops in einem ProcessPoolExecutor.
+
+    ReportLab (doc.build) ist reine CPU-Arbeit und würde den uvicorn Worker mit allen
+    anderen Requests blockieren. Die Worker-Prozesse halten je einen fertigen
+    PDFGenerator und werden in start() vorgewärmt; der Durchsatz skaliert mit den Kernen.
+
+    Es sind höchstens workers + max_queue Renders gleichzeitig angenommen - darüber
+    hinaus wird sofort mit asyncio.QueueFull abgelehnt (→ 503), statt die Wartezeit
+    unbegrenzt wachsen zu lassen. Ein Slot wird erst frei, wenn der Worker fertig ist -
+    nach einem Timeout rendert er weiter und belegt den Slot bis dahin. Mit workers=0
+    wird in einem Thread des API-Prozesses gerendert (z.B. wenn keine Subprozesse erlaubt sind).
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        timeout_seconds: Optional[float] = None
+    ):
+        self.workers = workers if workers is not None else int(
+            os.getenv("PDF_RENDER_WORKERS", str(min(os.cpu_count() or 1, 4)))
+        )
+        self.max_queue = max_queue if max_queue is not None else int(
+            os.getenv("PDF_RENDER_MAX_QUEUE", str(max(self.workers, 1) * 4))
+        )
+        self.timeout_seconds = timeout_seconds or float(os.getenv("PDF_RENDER_TIMEOUT_SECONDS", "30"))
+        self.capacity = max(self.workers, 1) + self.max_queue
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+
+        self._renders = metrics.counter("pdf_renders_total", "PDF-Renders nach Content Type und Ergebnis")
+        self._rejected = metrics.counter("pdf_render_rejected_total", "Wegen voller Render-Queue abgelehnte Exports")
+        self._render_time = metrics.histogram(
+            "pdf_render_seconds", "Reine Renderzeit im Worker nach Content Type",
+            buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+        )
+        self._queue_wait = metrics.histogram(
+            "pdf_render_queue_wait_seconds", "Wartezeit auf einen freien Worker (inkl. IPC)",
+            buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+        )
+        metrics.register_collector("pdf_render_pool", self.stats)
+
+    # ---------- Lifecycle ----------
+
+    async def start(self) -> None:
+        """Startet und wärmt die Worker-Prozesse vor (im FastAPI lifespan aufrufen)"""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            pids = await asyncio.gather(*(
+                loop.run_in_executor(executor, _warmup) for _ in range(max(self.workers, 1))
+            ))
+        except BrokenProcessPool:
+            # Startet nicht (z.B. keine Subprozesse erlaubt) - der nächste Export versucht es erneut
+            logger.exception("PDF Render Pool konnte nicht vorgewärmt werden")
+            self._reset_executor(executor)
+            return
+        logger.info(
+            "PDF Render Pool gestartet (%d Worker, %d Prozesse, %.2fs)",
+            self.workers, len(set(pids)), time.perf_counter() - started
+        )
+
+    async def close(self) -> None:
+        """Beendet die Worker-Prozesse; noch wartende Renders werden abgebrochen"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    @property
+    def saturated(self) -> bool:
+        """True wenn ein weiterer Render sofort mit QueueFull abgelehnt würde"""
+        return self._in_flight >= self.capacity
+
+    @property
+    def idle(self) -> bool:
+        """True wenn mindestens ein Worker frei ist (für Renders mit niedriger Priorität)"""
+        return self._in_flight < max(self.workers, 1)
+
+    def stats(self) -> dict:
+        return {"workers": self.workers, "in_flight": self._in_flight, "capacity": self.capacity}
+
+    # ---------- Rendering ----------
+
+    async def render(
+        self,
+        content_type: ContentType,
+        data: dict,
+        prompt: str,
+        generated_at: Optional[datetime] = None
+    ) -> bytes:
+        """
+        Rendert ein PDF im Pool.
+
+        Raises:
+            asyncio.QueueFull: Wenn bereits workers + max_queue Renders laufen bzw. warten
+            asyncio.TimeoutError: Wenn der Render länger als timeout_seconds dauert
+            ValueError: Bei unbekanntem Content Type
+        """
+        if self.saturated:
+            self._rejected.inc()
+            raise asyncio.QueueFull("PDF-Export ist gerade ausgelastet, bitte gleich nochmal versuchen")
+
+        self._in_flight += 1
+        submitted = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        slot_released_by_future = False
+        try:
+            executor = self._get_executor()
+            future = executor.submit(_render, content_type.value, data, prompt, generated_at)
+            # Slot erst freigeben, wenn der Worker wirklich fertig ist (nicht schon beim Timeout)
+            future.add_done_callback(lambda _: self._release_slot(loop))
+            slot_released_by_future = True
+            pdf_bytes, render_seconds = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout_seconds)
+        except BrokenProcessPool:
+            # Ein Worker ist abgestürzt (z.B. OOM) - Pool für die nächsten Renders neu aufbauen
+            self._renders.inc(type=content_type.value, outcome="error")
+            self._reset_executor(executor)
+            raise
+        except asyncio.TimeoutError:
+            # Der Worker rendert trotzdem zu Ende - Prozesse lassen sich nicht abbrechen
+            self._renders.inc(type=content_type.value, outcome="timeout")
+            raise asyncio.TimeoutError(f"PDF-Rendering dauerte länger als {self.timeout_seconds:.0f}s") from None
+        except Exception:
+            self._renders.inc(type=content_type.value, outcome="error")
+            raise
+        finally:
+            if not slot_released_by_future:
+                self._in_flight -= 1
+
+        self._renders.inc(type=content_type.value, outcome="ok")
+        self._render_time.observe(render_seconds, type=content_type.value)
+        self._queue_wait.observe(max(time.perf_counter() - submitted - render_seconds, 0.0))
+        return pdf_bytes
+
+    def _release_slot(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Done Callback des Executor Futures - läuft im Thread des Executors"""
+        try:
+            loop.call_soon_threadsafe(self._decrement_in_flight)
+        except RuntimeError:
+            # Event Loop bereits geschlossen (Shutdown) - es zählt niemand mehr
+            pass
+
+    def _decrement_in_flight(self) -> None:
+        self._in_flight -= 1
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.workers <= 0:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-render")
+            else:
+                # spawn statt fork: der API-Prozess hat bereits Threads und einen laufenden Event Loop
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker
+                )
+        return self._executor
+
+    def _reset_executor(self, broken: Executor) -> None:
+        if self._executor is broken:
+            logger.error("PDF Render Pool defekt (Worker abgestürzt) - wird neu gestartet")
+            self._executor = None
+            broken.shutdown(wait=False, cancel_futures=True)
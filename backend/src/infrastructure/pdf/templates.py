@@ -0,0 +1,198 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from reportlab.lib.units import cm
+from ...domain.entities.content import ContentType
+
+
+# ============== Bausteine ==============
+
+@dataclass(frozen=True)
+class TextSpec:
+    """Absatz. template wird mit dem Kontext formatiert (str.format_map) und darf ReportLab Markup enthalten"""
+    template: str
+    style: str = "Normal"
+
+
+@dataclass(frozen=True)
+class SpacerSpec:
+    height: float
+
+
+@dataclass(frozen=True)
+class PageBreakSpec:
+    pass
+
+
+@dataclass(frozen=True)
+class RepeatSpec:
+    """
+    Rendert elements für jeden Eintrag der Liste source.
+    Im Kontext stehen zusätzlich i (ab 1), item und bei dicts deren Felder.
+    """
+    source: str
+    elements: Tuple["ElementSpec", ...]
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """Tabelle mit Kopfzeile und einer Zeile pro Eintrag von source (Zellen-Kontext wie bei RepeatSpec)"""
+    source: str
+    header: Tuple[str, ...]
+    cells: Tuple[str, ...]
+    col_widths: Tuple[float, ...]
+    style: str
+
+
+ElementSpec = Union[TextSpec, SpacerSpec, PageBreakSpec, RepeatSpec, TableSpec]
+
+
+@dataclass(frozen=True)
+class TemplateSpec:
+    """
+    Layout eines Content Types. Header (Branding + title) und Footer ergänzt PDFGenerator.
+    context leitet aus content.data zusätzliche Werte ab, die sich nicht per Template ausdrücken lassen.
+    """
+    title: str
+    elements: Tuple[ElementSpec, ...]
+    context: Optional[Callable[[dict], dict]] = None
+
+
+# ============== Styles ==============
+
+# Name → (Parent im Sample Stylesheet, Optionen); werden einmal pro PDFGenerator kompiliert
+PARAGRAPH_STYLES: Dict[str, Tuple[str, dict]] = {
+    "CustomTitle": ("Heading1", dict(
+        fontSize=24, textColor=colors.HexColor('#0284c7'), spaceAfter=30, alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )),
+    "CustomSubtitle": ("Heading2", dict(
+        fontSize=16, textColor=colors.HexColor('#0369a1'), spaceAfter=20, fontName='Helvetica-Bold'
+    )),
+    "CustomItem": ("Normal", dict(fontSize=11, spaceAfter=10, leftIndent=20)),
+    "VoiceoverBox": ("Normal", dict(fontSize=12, leading=18, leftIndent=20, rightIndent=20, spaceAfter=10)),
+    "Footer": ("Normal", dict(fontSize=9, textColor=colors.grey, alignment=TA_RIGHT)),
+}
+
+
+def _table_style(header_font_size: int) -> List[tuple]:
+    return [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0284c7')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ]
+
+
+# Name → TableStyle Kommandos
+TABLE_STYLES: Dict[str, List[tuple]] = {
+    "shotlist": _table_style(header_font_size=12),
+    "calendar": _table_style(header_font_size=10) + [('VALIGN', (0, 0), (-1, -1), 'TOP')],
+}
+
+
+# ============== Templates ==============
+
+def _topic(*extra: TextSpec) -> Tuple[ElementSpec, ...]:
+    """Thema-Zeile (+ optionale Zusatzzeilen) und Abstand zum Inhalt"""
+    return (TextSpec("<b>Thema:</b> {prompt}"), *extra, SpacerSpec(0.5 * cm))
+
+
+def _calendar_context(data: dict) -> dict:
+    """Kalender auf zwei Seiten: Tag 1-15 und 16-30 (Keys sind nach dem JSON-Roundtrip Strings)"""
+    days = {int(day_num): day for day_num, day in data["days"].items()}
+    return {
+        "first_half": [{**days[day_num], "number": day_num} for day_num in range(1, 16)],
+        "second_half": [{**days[day_num], "number": day_num} for day_num in range(16, 31)],
+    }
+
+
+def _calendar_table(source: str) -> TableSpec:
+    return TableSpec(
+        source=source,
+        header=('Tag', 'Hook', 'Thema'),
+        cells=("{number}", "{hook}", "{theme}"),
+        col_widths=(1.5 * cm, 7 * cm, 7 * cm),
+        style="calendar"
+    )
+
+
+TEMPLATES: Dict[ContentType, TemplateSpec] = {
+    ContentType.HOOK: TemplateSpec(
+        title="10 Virale Hooks",
+        elements=(
+            *_topic(),
+            RepeatSpec("hooks", (TextSpec("<b>{i}.</b> {item}", "CustomItem"),)),
+        )
+    ),
+    ContentType.SCRIPT: TemplateSpec(
+        title="Reel Script",
+        elements=(
+            *_topic(TextSpec("<b>Gesamtdauer:</b> {total_duration} Sekunden")),
+            RepeatSpec("scenes", (
+                TextSpec("<b>Szene {scene_number}</b> ({type}) - {duration_seconds}s", "Heading3"),
+                TextSpec("<b>Text:</b> {text}"),
+                TextSpec("<b>Visual:</b> {visual_description}"),
+                SpacerSpec(0.3 * cm),
+            )),
+            SpacerSpec(0.3 * cm),
+            TextSpec("<b>Call to Action:</b>", "Heading3"),
+            TextSpec("{cta}"),
+        )
+    ),
+    ContentType.SHOTLIST: TemplateSpec(
+        title="Shot List",
+        elements=(
+            *_topic(),
+            TableSpec(
+                source="shots",
+                header=('#', 'Shot Beschreibung'),
+                cells=("{i}", "{item}"),
+                col_widths=(1 * cm, 15 * cm),
+                style="shotlist"
+            ),
+        )
+    ),
+    ContentType.VOICEOVER: TemplateSpec(
+        title="Voiceover Script",
+        elements=(
+            *_topic(TextSpec("<b>Dauer:</b> ca. {estimated_duration} Sekunden")),
+            TextSpec("{text}", "VoiceoverBox"),
+        )
+    ),
+    ContentType.CAPTION: TemplateSpec(
+        title="Instagram Caption",
+        elements=(
+            *_topic(),
+            TextSpec("<b>Caption:</b>", "Heading3"),
+            TextSpec("{caption}"),
+            SpacerSpec(0.5 * cm),
+            TextSpec("<b>Hashtags:</b>", "Heading3"),
+            TextSpec("{hashtags_text}"),
+        ),
+        context=lambda data: {"hashtags_text": " ".join(data["hashtags"])}
+    ),
+    ContentType.BROLL: TemplateSpec(
+        title="B-Roll Ideen",
+        elements=(
+            *_topic(),
+            RepeatSpec("ideas", (TextSpec("<b>{i}.</b> {item}", "CustomItem"),)),
+        )
+    ),
+    ContentType.CALENDAR: TemplateSpec(
+        title="30-Tage Content Kalender",
+        elements=(
+            TextSpec("<b>Nische:</b> {niche}"),
+            SpacerSpec(0.5 * cm),
+            _calendar_table("first_half"),
+            PageBreakSpec(),
+            _calendar_table("second_half"),
+        ),
+        context=_calendar_context
+    ),
+}
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+from ..monitoring import metrics
+
+
+class JWTClaimsCache:
+    """
+    LRU Cache für bereits verifizierte Access Token Claims - das Frontend pollt Status und
+    History hunderte Male pro Stunde mit demselben Token, die Signaturprüfung (jwt.decode)
+    läuft so nur einmal pro Token und Worker.
+
+    Key ist der SHA-256 Digest des Tokens (der Token selbst wird nicht gehalten). Ein
+    Eintrag gilt bis exp des Tokens, höchstens ttl_seconds. Abgelehnte Tokens werden nie
+    gecacht. Thread-safe (sync Dependencies laufen im Threadpool).
+
+    Revocation: revoke() entfernt einen Token, revoke_user() alle Tokens eines Users
+    (z.B. bei Logout, Password-Änderung, Deaktivierung) - danach wird wieder voll geprüft.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries or int(os.getenv("JWT_CLAIMS_CACHE_MAX_ENTRIES", "10000"))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("JWT_CLAIMS_CACHE_TTL_SECONDS", "3600")
+        )
+        # Digest → (gültig bis, Unix-Zeit wie exp; Claims)
+        self._entries: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self._by_user: Dict[str, Set[bytes]] = {}
+        self._lock = threading.Lock()
+
+        self._requests = metrics.counter("jwt_claims_cache_requests_total", "JWT Claims Cache Lookups nach Ergebnis")
+        self._revocations = metrics.counter("jwt_claims_cache_revocations_total", "Entfernte Einträge nach Anlass")
+        metrics.register_collector("jwt_claims_cache", self.stats)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, digest: bytes) -> Optional[dict]:
+        """Returns: Kopie der Claims oder None (Miss bzw. abgelaufen)"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                expires_at, claims = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(digest)
+                    self._requests.inc(result="hit")
+                    return dict(claims)
+                self._remove(digest)
+        self._requests.inc(result="miss")
+        return None
+
+    def put(self, digest: bytes, claims: dict, exp: Optional[float]) -> None:
+        """Speichert verifizierte Claims bis exp (Unix-Zeit), höchstens ttl_seconds"""
+        if not self.enabled or not claims.get("user_id"):
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        with self._lock:
+            self._remove(digest)
+            self._entries[digest] = (expires_at, dict(claims))
+            self._by_user.setdefault(claims["user_id"], set()).add(digest)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def revoke(self, token: str) -> None:
+        """Entfernt den Eintrag eines Tokens (z.B. Logout)"""
+        with self._lock:
+            if self._remove(self.digest(token)):
+                self._revocations.inc(reason="token")
+
+    def revoke_user(self, user_id: str) -> None:
+        """Entfernt alle Einträge eines Users (Password-Änderung, Deaktivierung, Rollenwechsel)"""
+        with self._lock:
+            digests = self._by_user.get(str(user_id), set())
+            removed = sum(1 for digest in list(digests) if self._remove(digest))
+        if removed:
+            self._revocations.inc(removed, reason="user")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def stats(self) -> dict:
+        hits = self._requests.value(result="hit")
+        misses = self._requests.value(result="miss")
+        total = hits + misses
+        return {
+            "entries": len(self._entries),
+            "users": len(self._by_user),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 3) if total else 0.0,
+        }
+
+    def _remove(self, digest: bytes) -> bool:
+        """Entfernt einen Eintrag samt User-Index (Lock muss gehalten werden)"""
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return False
+        user_id = entry[1]["user_id"]
+        digests = self._by_user.get(user_id)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._by_user[user_id]
+        return True
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+from passlib.context import CryptContext
+from ..monitoring import metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasher:
+    """
+    bcrypt Hashing/Verifikation außerhalb des Event Loops in einem eigenen ThreadPoolExecutor.
+
+    Ein bcrypt-Aufruf kostet je nach Cost Factor 100-300 ms reine CPU-Zeit. Direkt im
+    Event Loop würde ein Login-Schwall alle anderen Requests des Workers blockieren;
+    bcrypt gibt während des Hashens den GIL frei, in Threads läuft der Loop also weiter.
+
+    Es laufen höchstens workers Hashes gleichzeitig, max_queue weitere warten - darüber
+    hinaus wird sofort mit asyncio.QueueFull abgelehnt (→ 503), statt dass sich die
+    Wartezeit (und die CPU-Last) unbegrenzt aufstaut.
+
+    Cost Factor kommt aus BCRYPT_ROUNDS. Hashes mit anderem Cost Factor werden beim
+    nächsten erfolgreichen Login neu berechnet (verify_and_update), in beide Richtungen.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        rounds: Optional[int] = None
+    ):
+        self.workers = workers or int(os.getenv("PASSWORD_HASH_WORKERS", str(min(os.cpu_count() or 1, 4))))
+        self.max_queue = max_queue if max_queue is not None else int(
+            os.getenv("PASSWORD_HASH_MAX_QUEUE", str(self.workers * 16))
+        )
+        self.rounds = rounds or int(os.getenv("BCRYPT_ROUNDS", "12"))
+        self.capacity = self.workers + self.max_queue
+        # min/max = default: passlib meldet nur dann needs_update, wenn der Cost Factor abweicht
+        self.pwd_context = CryptContext(
+            schemes=["bcrypt"], deprecated="auto",
+            bcrypt__default_rounds=self.rounds, bcrypt__min_rounds=self.rounds, bcrypt__max_rounds=self.rounds
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+
+        self._hashes = metrics.counter("password_hashes_total", "bcrypt Operationen (hash, verify, rehash) nach Ergebnis")
+        self._rejected = metrics.counter("password_hash_rejected_total", "Wegen voller Queue abgelehnte Hash-Operationen")
+        self._hash_time = metrics.histogram(
+            "password_hash_seconds", "Reine bcrypt-Zeit im Thread nach Operation",
+            buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+        )
+        self._queue_wait = metrics.histogram(
+            "password_hash_queue_wait_seconds", "Wartezeit auf einen freien Hash-Thread",
+            buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+        )
+        metrics.register_collector("password_hasher", self.stats)
+
+    # ---------- Lifecycle ----------
+
+    async def close(self) -> None:
+        """Beendet die Threads (im FastAPI lifespan aufrufen); wartende Operationen werden abgebrochen"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "in_flight": self._in_flight,
+            "queued": max(self._in_flight - self.workers, 0),
+            "capacity": self.capacity,
+            "rounds": self.rounds,
+        }
+
+    # ---------- Hashing ----------
+
+    async def hash(self, password: str) -> str:
+        """
+        Raises:
+            asyncio.QueueFull: Wenn bereits workers + max_queue Operationen laufen bzw. warten
+        """
+        return await self._run("hash", self.pwd_context.hash, password)
+
+    async def verify_and_update(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Prüft das Password; stimmt es und hat der Hash einen anderen Cost Factor, wird er
+        im selben Thread-Aufruf mit dem aktuellen neu berechnet.
+
+        Returns: (korrekt, neuer Hash oder None)
+
+        Raises:
+            asyncio.QueueFull: Wenn bereits workers + max_queue Operationen laufen bzw. warten
+        """
+        if not password_hash:
+            return False, None
+        valid, new_hash = await self._run("verify", self.pwd_context.verify_and_update, password, password_hash)
+        if new_hash is not None:
+            self._hashes.inc(operation="rehash", outcome="ok")
+        return valid, new_hash
+
+    async def _run(self, operation: str, function, *args):
+        if self._in_flight >= self.capacity:
+            self._rejected.inc(operation=operation)
+            raise asyncio.QueueFull("Login ist gerade ausgelastet, bitte gleich nochmal versuchen")
+
+        self._in_flight += 1
+        submitted = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        def timed():
+            started = time.perf_counter()
+            result = function(*args)
+            return result, started, time.perf_counter()
+
+        try:
+            future = self._get_executor().submit(timed)
+        except Exception:
+            self._in_flight -= 1
+            self._hashes.inc(operation=operation, outcome="error")
+            raise
+        # Slot erst freigeben, wenn der Thread wirklich fertig ist (nicht schon beim Abbruch des Requests)
+        future.add_done_callback(lambda _: self._release_slot(loop))
+
+        try:
+            result, started, finished = await asyncio.wrap_future(future)
+        except Exception:
+            self._hashes.inc(operation=operation, outcome="error")
+            raise
+
+        self._hashes.inc(operation=operation, outcome="ok")
+        self._queue_wait.observe(started - submitted)
+        self._hash_time.observe(finished - started, operation=operation)
+        return result
+
+    def _release_slot(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Done Callback des Executor Futures - läuft im Hash-Thread"""
+        try:
+            loop.call_soon_threadsafe(self._decrement_in_flight)
+        except RuntimeError:
+            # Event Loop bereits geschlossen (Shutdown) - es zählt niemand mehr
+            pass
+
+    def _decrement_in_flight(self) -> None:
+        self._in_flight -= 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
@@ -13,9 +13,22 @@ from .presentation.controllers.content_controller import router as content_route
 from .presentation.controllers.auth_controller import router as auth_router
 from .presentation.controllers.subscription_controller import router as subscription_router
 from .presentation.controllers.export_controller import router as export_router
+from .presentation.controllers.analytics_controller import router as analytics_router
+from .presentation.controllers.progress_controller import router as progress_router
 
 # Database
-from .infrastructure.database.postgres.config import engine, Base
+from .infrastructure.database.postgres.config import engine, replica_engine, Base
+from .infrastructure.database.postgres.pool_metrics import instrument_pool
+
+# Cache & Monitoring
+from .presentation.dependencies import (
+    get_entity_cache, get_database_router, get_progress_broker, get_pdf_render_pool, get_pdf_prerenderer,
+    get_password_hasher, get_jwt_claims_cache
+)
+from .infrastructure.monitoring import metrics
+
+# Workers
+from .presentation.workers.generation_worker import GenerationWorker
 
 
 @asynccontextmanager
@@ -27,10 +40,51 @@ async def lifespan(app: FastAPI):
         # await conn.run_sync(Base.metadata.create_all)
         pass
 
+    # Startup: Pool-Metrics (Checkout-Haltezeiten, Auslastung) für /metrics
+    instrument_pool(engine)
+    if replica_engine is not None:
+        instrument_pool(replica_engine, name="replica")
+
+    # Startup: Read Replica prüfen (nicht erreichbar → alle Reads an den Primary)
+    database_router = get_database_router()
+    await database_router.check_replica()
+
+    # Startup: Entity Cache Pub/Sub Listener (Invalidierungen anderer Worker)
+    entity_cache = get_entity_cache()
+    await entity_cache.start()
+    # JWT Claims Cache an User-Invalidierungen koppeln (Password-Änderung, Deaktivierung → neu verifizieren)
+    get_jwt_claims_cache()
+
+    # Startup: Progress Broker (Redis Pub/Sub Fan-out der Live-Events an alle Worker)
+    progress_broker = get_progress_broker()
+    await progress_broker.start()
+
+    # Startup: PDF Render Pool (Worker-Prozesse vorwärmen, damit der erste Export nicht wartet)
+    pdf_render_pool = get_pdf_render_pool()
+    await pdf_render_pool.start()
+
+    # Startup: Spekulatives Vorrendern für Pro/Enterprise (füllt den PDF Cache, wenn Worker frei sind)
+    pdf_prerenderer = get_pdf_prerenderer()
+    await pdf_prerenderer.start()
+
+    # Startup: Worker für asynchrone Generierungen (GENERATION_WORKER_CONCURRENCY=0 → eigener Prozess)
+    generation_worker = GenerationWorker()
+    await generation_worker.start()
+
     yield
 
-    # Shutdown: Close connections
+    # Shutdown: Laufende Generierungen beenden, dann Connections schließen
+    await generation_worker.close()
+    await pdf_prerenderer.close()
+    await pdf_render_pool.close()
+    await get_password_hasher().close()
+    await progress_broker.close()
+    await entity_cache.close()
+    if database_router.guard is not None:
+        await database_router.guard.close()
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
 
 
 app = FastAPI(
@@ -70,6 +124,8 @@ app.include_router(content_router)      # /api/content/*
 app.include_router(auth_router)         # /api/auth/*
 app.include_router(subscription_router) # /api/subscription/*
 app.include_router(export_router)       # /api/export/*
+app.include_router(analytics_router)    # /api/admin/analytics/*
+app.include_router(progress_router)     # /api/progress/ws
 
 
 # ============== Root Endpoints ==============
@@ -85,7 +141,8 @@ async def root():
             "content": "/api/content",
             "auth": "/api/auth",
             "subscription": "/api/subscription",
-            "export": "/api/export"
+            "export": "/api/export",
+            "progress": "/api/progress/ws"
         }
     }
 
@@ -97,3 +154,9 @@ async def health_check():
         "status": "healthy",
         "version": "2.0.0"
     }
+
+
+@app.get("/metrics")
+async def metrics_snapshot():
+    """Prozess-lokale Metrics (Cache Hit-Ratios, Latenzen, Queues) als JSON"""
+    return metrics.snapshot()
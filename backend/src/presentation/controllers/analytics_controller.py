@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from ...application.dto.analytics_dto import UsageAnalyticsRequestDTO, UsageAnalyticsResponseDTO
+from ...application.use_cases.get_usage_analytics_use_case import GetUsageAnalyticsUseCase
+from ..middlewares import get_current_admin
+from ..dependencies import get_get_usage_analytics_use_case
+
+
+router = APIRouter(prefix="/api/admin/analytics", tags=["admin"])
+
+
+# ============== Endpoints ==============
+
+@router.get("/usage", response_model=UsageAnalyticsResponseDTO)
+async def get_usage_analytics(
+    start: Optional[date] = Query(None, description="Erster Tag (inklusive), Default: vor 30 Tagen"),
+    end: Optional[date] = Query(None, description="Letzter Tag (inklusive), Default: heute"),
+    group_by: List[str] = Query(["day"], description="day, content_type, plan, user_id (mehrfach möglich)"),
+    content_type: Optional[str] = Query(None),
+    plan: Optional[str] = Query(None),
+    user_id: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    current_user: dict = Depends(get_current_admin),
+    use_case: GetUsageAnalyticsUseCase = Depends(get_get_usage_analytics_use_case)
+):
+    """
+    Generierte Contents pro Tag / Typ / Plan / User aus den Tages-Rollups.
+
+    Beispiel: Scripts von Pro-Usern letzte Woche
+    /api/admin/analytics/usage?start=2025-03-03&end=2025-03-09&content_type=script&plan=pro
+
+    Requires: Admin (ADMIN_USER_IDS)
+
+    Returns:
+    - rows: aggregierte Zeilen
+    - total: Summe über alle Zeilen
+    - data_until: Stand der Rollups (neuere Contents fehlen noch)
+
+    Errors:
+    - 400: Ungültiger Zeitraum, Dimension oder Filter
+    - 403: Kein Admin
+    """
+    try:
+        end = end or date.today()
+        dto = UsageAnalyticsRequestDTO(
+            start=start or end - timedelta(days=29),
+            end=end,
+            group_by=group_by,
+            content_type=content_type,
+            plan=plan,
+            user_id=user_id,
+            limit=limit
+        )
+        result = await use_case.execute(dto)
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Fehler bei der Auswertung: {str(e)}"
+        )
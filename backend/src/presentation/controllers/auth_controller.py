@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr
 from ...application.dto.auth_dto import (
@@ -47,6 +48,7 @@ async def register(
     Errors:
     - 400: Email bereits registriert oder Validierung fehlgeschlagen
     - 500: Server Error
+    - 503: Password-Hashing ausgelastet (Retry-After)
     """
     try:
         dto = RegisterRequestDTO(
@@ -56,6 +58,12 @@ async def register(
         )
         result = await use_case.execute(dto)
         return result
+    except asyncio.QueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"}
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -84,6 +92,7 @@ async def login(
     - 401: Email oder Password falsch
     - 403: User Account deaktiviert
     - 500: Server Error
+    - 503: Password-Hashing ausgelastet (Retry-After)
     """
     try:
         dto = LoginRequestDTO(
@@ -92,6 +101,12 @@ async def login(
         )
         result = await use_case.execute(dto)
         return result
+    except asyncio.QueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"}
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
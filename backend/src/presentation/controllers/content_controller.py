@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.encoders import jsonable_encoder
 from typing import List, Optional
+import uuid
 from ...application.dto.content_dto import (
     GenerateHookRequestDTO,
     GenerateScriptRequestDTO,
@@ -16,8 +19,19 @@ from ...application.dto.content_dto import (
     BRollResponseDTO,
     CalendarResponseDTO,
     ContentListItemDTO,
-    ContentDetailDTO
+    ContentDetailDTO,
+    ContentVersionRequestDTO,
+    ContentVersionListDTO,
+    SearchContentRequestDTO,
+    ContentSearchResponseDTO,
+    ImportContentRequestDTO,
+    ImportContentResponseDTO,
+    EnqueueGenerationRequestDTO,
+    GenerationJobResponseDTO,
+    ContentStatusRequestDTO,
+    ContentStatusDTO
 )
+from ...domain.entities.content import ContentType
 from ...application.use_cases.generate_hook_use_case import GenerateHookUseCase
 from ...application.use_cases.generate_script_use_case import GenerateScriptUseCase
 from ...application.use_cases.generate_shotlist_use_case import GenerateShotlistUseCase
@@ -25,7 +39,15 @@ from ...application.use_cases.generate_voiceover_use_case import GenerateVoiceov
 from ...application.use_cases.generate_caption_use_case import GenerateCaptionUseCase
 from ...application.use_cases.generate_broll_use_case import GenerateBRollUseCase
 from ...application.use_cases.generate_calendar_use_case import GenerateCalendarUseCase
+from ...application.use_cases.search_content_use_case import SearchContentUseCase
+from ...application.use_cases.export_content_use_case import ExportContentUseCase
+from ...application.use_cases.import_content_use_case import ImportContentUseCase
+from ...application.use_cases.list_content_versions_use_case import ListContentVersionsUseCase
+from ...application.use_cases.get_content_version_use_case import GetContentVersionUseCase
+from ...application.use_cases.enqueue_generation_use_case import EnqueueGenerationUseCase
+from ...application.use_cases.get_content_status_use_case import GetContentStatusUseCase
 from ..middlewares import get_current_user
+from ..streaming import buffer_chunks, gzip_chunks, gunzip_chunks
 from ..dependencies import (
     get_generate_hook_use_case,
     get_generate_script_use_case,
@@ -33,7 +55,14 @@ from ..dependencies import (
     get_generate_voiceover_use_case,
     get_generate_caption_use_case,
     get_generate_broll_use_case,
-    get_generate_calendar_use_case
+    get_generate_calendar_use_case,
+    get_search_content_use_case,
+    get_export_content_use_case,
+    get_import_content_use_case,
+    get_list_content_versions_use_case,
+    get_get_content_version_use_case,
+    get_enqueue_generation_use_case,
+    get_get_content_status_use_case
 )
 from pydantic import BaseModel
 
@@ -46,62 +75,108 @@ router = APIRouter(prefix="/api/content", tags=["content"])
 class HookRequest(BaseModel):
     prompt: str
     context: Optional[str] = None
+    content_id: Optional[str] = None  # Regenerierung: neue Version dieses Contents
 
 
 class ScriptRequest(BaseModel):
     prompt: str
     context: Optional[str] = None
     duration_seconds: int = 15
+    content_id: Optional[str] = None  # Regenerierung: neue Version dieses Contents
 
 
 class ShotlistRequest(BaseModel):
     prompt: str
     context: Optional[str] = None
     script: Optional[str] = None
+    content_id: Optional[str] = None  # Regenerierung: neue Version dieses Contents
 
 
 class VoiceoverRequest(BaseModel):
     prompt: str
     context: Optional[str] = None
     script: Optional[str] = None
+    content_id: Optional[str] = None  # Regenerierung: neue Version dieses Contents
 
 
 class CaptionRequest(BaseModel):
     prompt: str
     context: Optional[str] = None
     include_emojis: bool = True
+    content_id: Optional[str] = None  # Regenerierung: neue Version dieses Contents
 
 
 class BRollRequest(BaseModel):
     prompt: str
     context: Optional[str] = None
+    content_id: Optional[str] = None  # Regenerierung: neue Version dieses Contents
 
 
 class CalendarRequest(BaseModel):
     niche: str
     prompt: str
     context: Optional[str] = None
+    content_id: Optional[str] = None  # Regenerierung: neue Version dieses Contents
+
+
+# ============== Async Generation ==============
+
+ASYNC_DESCRIPTION = "Asynchron generieren: 202 mit Content-ID, Ergebnis über /api/content/{content_id}/status"
+ASYNC_RESPONSES = {202: {"model": GenerationJobResponseDTO, "description": "Generierung eingestellt (?async=true)"}}
+
+
+async def _enqueue(
+    use_case: EnqueueGenerationUseCase,
+    user_id: str,
+    content_type: ContentType,
+    request: BaseModel
+) -> JSONResponse:
+    """Stellt die Generierung für den GenerationWorker ein - 202 + Location des Status-Endpoints"""
+    result = await use_case.execute(EnqueueGenerationRequestDTO(
+        user_id=user_id,
+        content_type=content_type,
+        prompt=request.prompt,
+        params=request.model_dump(exclude={"prompt", "content_id"}),
+        content_id=request.content_id
+    ))
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=jsonable_encoder(result),
+        headers={"Location": f"{router.prefix}/{result.content_id}/status"}
+    )
 
 
 # ============== Endpoints ==============
 
-@router.post("/hook", response_model=HookResponseDTO)
+@router.post("/hook", response_model=HookResponseDTO, responses=ASYNC_RESPONSES)
 async def generate_hook(
     request: HookRequest,
+    run_async: bool = Query(False, alias="async", description=ASYNC_DESCRIPTION),
     current_user: dict = Depends(get_current_user),
-    use_case: GenerateHookUseCase = Depends(get_generate_hook_use_case)
+    use_case: GenerateHookUseCase = Depends(get_generate_hook_use_case),
+    enqueue_use_case: EnqueueGenerationUseCase = Depends(get_enqueue_generation_use_case)
 ):
     """
     Generiert 10 virale Hooks (5-10 Wörter).
 
     Requires: Authentication
     Rate-Limited: Ja (basierend auf Subscription Plan)
+
+    Mit content_id wird der bestehende Content regeneriert: gleiche ID, neue Version
+    (Historie unter /api/content/{content_id}/versions).
+
+    Mit ?async=true (alle Generate-Endpoints) antwortet der Endpoint sofort mit 202
+    und der Content-ID (Status generating); generiert wird im GenerationWorker.
     """
     try:
+        if run_async:
+            return await _enqueue(enqueue_use_case, current_user["user_id"], ContentType.HOOK, request)
+
         dto = GenerateHookRequestDTO(
             user_id=current_user["user_id"],
             prompt=request.prompt,
-            context=request.context
+            context=request.context,
+            content_id=request.content_id
         )
         result = await use_case.execute(dto)
         return result
@@ -122,11 +197,13 @@ async def generate_hook(
         )
 
 
-@router.post("/script", response_model=ScriptResponseDTO)
+@router.post("/script", response_model=ScriptResponseDTO, responses=ASYNC_RESPONSES)
 async def generate_script(
     request: ScriptRequest,
+    run_async: bool = Query(False, alias="async", description=ASYNC_DESCRIPTION),
     current_user: dict = Depends(get_current_user),
-    use_case: GenerateScriptUseCase = Depends(get_generate_script_use_case)
+    use_case: GenerateScriptUseCase = Depends(get_generate_script_use_case),
+    enqueue_use_case: EnqueueGenerationUseCase = Depends(get_enqueue_generation_use_case)
 ):
     """
     Generiert Reel-Script mit 2-4 Szenen (10-20 Sekunden).
@@ -135,11 +212,15 @@ async def generate_script(
     Rate-Limited: Ja
     """
     try:
+        if run_async:
+            return await _enqueue(enqueue_use_case, current_user["user_id"], ContentType.SCRIPT, request)
+
         dto = GenerateScriptRequestDTO(
             user_id=current_user["user_id"],
             prompt=request.prompt,
             context=request.context,
-            duration_seconds=request.duration_seconds
+            duration_seconds=request.duration_seconds,
+            content_id=request.content_id
         )
         result = await use_case.execute(dto)
         return result
@@ -160,11 +241,13 @@ async def generate_script(
         )
 
 
-@router.post("/shotlist", response_model=ShotlistResponseDTO)
+@router.post("/shotlist", response_model=ShotlistResponseDTO, responses=ASYNC_RESPONSES)
 async def generate_shotlist(
     request: ShotlistRequest,
+    run_async: bool = Query(False, alias="async", description=ASYNC_DESCRIPTION),
     current_user: dict = Depends(get_current_user),
-    use_case: GenerateShotlistUseCase = Depends(get_generate_shotlist_use_case)
+    use_case: GenerateShotlistUseCase = Depends(get_generate_shotlist_use_case),
+    enqueue_use_case: EnqueueGenerationUseCase = Depends(get_enqueue_generation_use_case)
 ):
     """
     Generiert Shotlist mit 3-4 Shot Beschreibungen.
@@ -173,11 +256,15 @@ async def generate_shotlist(
     Rate-Limited: Ja
     """
     try:
+        if run_async:
+            return await _enqueue(enqueue_use_case, current_user["user_id"], ContentType.SHOTLIST, request)
+
         dto = GenerateShotlistRequestDTO(
             user_id=current_user["user_id"],
             prompt=request.prompt,
             context=request.context,
-            script=request.script
+            script=request.script,
+            content_id=request.content_id
         )
         result = await use_case.execute(dto)
         return result
@@ -198,11 +285,13 @@ async def generate_shotlist(
         )
 
 
-@router.post("/voiceover", response_model=VoiceoverResponseDTO)
+@router.post("/voiceover", response_model=VoiceoverResponseDTO, responses=ASYNC_RESPONSES)
 async def generate_voiceover(
     request: VoiceoverRequest,
+    run_async: bool = Query(False, alias="async", description=ASYNC_DESCRIPTION),
     current_user: dict = Depends(get_current_user),
-    use_case: GenerateVoiceoverUseCase = Depends(get_generate_voiceover_use_case)
+    use_case: GenerateVoiceoverUseCase = Depends(get_generate_voiceover_use_case),
+    enqueue_use_case: EnqueueGenerationUseCase = Depends(get_enqueue_generation_use_case)
 ):
     """
     Generiert Voiceover Text (10-20 Sekunden).
@@ -211,11 +300,15 @@ async def generate_voiceover(
     Rate-Limited: Ja
     """
     try:
+        if run_async:
+            return await _enqueue(enqueue_use_case, current_user["user_id"], ContentType.VOICEOVER, request)
+
         dto = GenerateVoiceoverRequestDTO(
             user_id=current_user["user_id"],
             prompt=request.prompt,
             context=request.context,
-            script=request.script
+            script=request.script,
+            content_id=request.content_id
         )
         result = await use_case.execute(dto)
         return result
@@ -236,11 +329,13 @@ async def generate_voiceover(
         )
 
 
-@router.post("/caption", response_model=CaptionResponseDTO)
+@router.post("/caption", response_model=CaptionResponseDTO, responses=ASYNC_RESPONSES)
 async def generate_caption(
     request: CaptionRequest,
+    run_async: bool = Query(False, alias="async", description=ASYNC_DESCRIPTION),
     current_user: dict = Depends(get_current_user),
-    use_case: GenerateCaptionUseCase = Depends(get_generate_caption_use_case)
+    use_case: GenerateCaptionUseCase = Depends(get_generate_caption_use_case),
+    enqueue_use_case: EnqueueGenerationUseCase = Depends(get_enqueue_generation_use_case)
 ):
     """
     Generiert Instagram Caption mit 15 Hashtags.
@@ -249,11 +344,15 @@ async def generate_caption(
     Rate-Limited: Ja
     """
     try:
+        if run_async:
+            return await _enqueue(enqueue_use_case, current_user["user_id"], ContentType.CAPTION, request)
+
         dto = GenerateCaptionRequestDTO(
             user_id=current_user["user_id"],
             prompt=request.prompt,
             context=request.context,
-            include_emojis=request.include_emojis
+            include_emojis=request.include_emojis,
+            content_id=request.content_id
         )
         result = await use_case.execute(dto)
         return result
@@ -274,11 +373,13 @@ async def generate_caption(
         )
 
 
-@router.post("/broll", response_model=BRollResponseDTO)
+@router.post("/broll", response_model=BRollResponseDTO, responses=ASYNC_RESPONSES)
 async def generate_broll(
     request: BRollRequest,
+    run_async: bool = Query(False, alias="async", description=ASYNC_DESCRIPTION),
     current_user: dict = Depends(get_current_user),
-    use_case: GenerateBRollUseCase = Depends(get_generate_broll_use_case)
+    use_case: GenerateBRollUseCase = Depends(get_generate_broll_use_case),
+    enqueue_use_case: EnqueueGenerationUseCase = Depends(get_enqueue_generation_use_case)
 ):
     """
     Generiert 10 B-Roll Ideen (3-5 Wörter).
@@ -287,10 +388,14 @@ async def generate_broll(
     Rate-Limited: Ja
     """
     try:
+        if run_async:
+            return await _enqueue(enqueue_use_case, current_user["user_id"], ContentType.BROLL, request)
+
         dto = GenerateBRollRequestDTO(
             user_id=current_user["user_id"],
             prompt=request.prompt,
-            context=request.context
+            context=request.context,
+            content_id=request.content_id
         )
         result = await use_case.execute(dto)
         return result
@@ -311,11 +416,13 @@ async def generate_broll(
         )
 
 
-@router.post("/calendar", response_model=CalendarResponseDTO)
+@router.post("/calendar", response_model=CalendarResponseDTO, responses=ASYNC_RESPONSES)
 async def generate_calendar(
     request: CalendarRequest,
+    run_async: bool = Query(False, alias="async", description=ASYNC_DESCRIPTION),
     current_user: dict = Depends(get_current_user),
-    use_case: GenerateCalendarUseCase = Depends(get_generate_calendar_use_case)
+    use_case: GenerateCalendarUseCase = Depends(get_generate_calendar_use_case),
+    enqueue_use_case: EnqueueGenerationUseCase = Depends(get_enqueue_generation_use_case)
 ):
     """
     Generiert 30-Tage Content-Kalender.
@@ -324,11 +431,15 @@ async def generate_calendar(
     Rate-Limited: Ja
     """
     try:
+        if run_async:
+            return await _enqueue(enqueue_use_case, current_user["user_id"], ContentType.CALENDAR, request)
+
         dto = GenerateCalendarRequestDTO(
             user_id=current_user["user_id"],
             niche=request.niche,
             prompt=request.prompt,
-            context=request.context
+            context=request.context,
+            content_id=request.content_id
         )
         result = await use_case.execute(dto)
         return result
@@ -349,6 +460,239 @@ async def generate_calendar(
         )
 
 
+@router.get("/search", response_model=ContentSearchResponseDTO)
+async def search_content(
+    q: str = Query(..., description="Suchbegriff (websearch-Syntax, z.B. \"morgenroutine -kaffee\")"),
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor der vorherigen Seite"),
+    current_user: dict = Depends(get_current_user),
+    use_case: SearchContentUseCase = Depends(get_search_content_use_case)
+):
+    """
+    Volltextsuche über alle generierten Contents des Users.
+
+    Durchsucht Prompt, Hooks, Szenen-Texte, Captions, Hashtags,
+    B-Roll Ideen und Kalender-Hooks/-Themen (deutsche Text Search Config).
+
+    Requires: Authentication
+
+    Returns:
+    - items: Treffer nach Relevanz sortiert
+    - next_cursor: Cursor für die nächste Seite (null = Ende)
+
+    Errors:
+    - 400: Suchbegriff oder Cursor ungültig
+    """
+    try:
+        dto = SearchContentRequestDTO(
+            user_id=current_user["user_id"],
+            query=q,
+            limit=limit,
+            cursor=cursor
+        )
+        result = await use_case.execute(dto)
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Fehler bei der Suche: {str(e)}"
+        )
+
+
+@router.get("/export.ndjson")
+async def export_content(
+    gzip: bool = Query(False, description="Export gzip-komprimiert als .ndjson.gz"),
+    job_id: Optional[str] = Query(None, max_length=64, description="ID für Fortschritts-Events (WebSocket)"),
+    current_user: dict = Depends(get_current_user),
+    use_case: ExportContentUseCase = Depends(get_export_content_use_case)
+):
+    """
+    Exportiert alle Contents des Users als NDJSON (eine Zeile pro Content).
+
+    Die Zeilen werden direkt aus einem Server-Side Cursor gestreamt -
+    der Speicherverbrauch ist unabhängig von der Anzahl der Contents.
+    Fortschritt live über /api/progress/ws (Header X-Job-Id).
+
+    Requires: Authentication
+    """
+    job_id = job_id or str(uuid.uuid4())
+    chunks = buffer_chunks(use_case.stream(current_user["user_id"], job_id=job_id))
+    filename = "content-export.ndjson"
+    media_type = "application/x-ndjson"
+
+    if gzip:
+        chunks = gzip_chunks(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+            "X-Job-Id": job_id
+        }
+    )
+
+
+@router.post("/import.ndjson", response_model=ImportContentResponseDTO)
+async def import_content(
+    http_request: Request,
+    job_id: Optional[str] = Query(None, max_length=64, description="ID für Fortschritts-Events (WebSocket)"),
+    current_user: dict = Depends(get_current_user),
+    use_case: ImportContentUseCase = Depends(get_import_content_use_case)
+):
+    """
+    Importiert Contents aus NDJSON (Format von /export.ndjson).
+
+    Der Request-Body wird gestreamt und batchweise per COPY importiert.
+    created_at und version werden neu vergeben, die Originale stehen in metadata.imported.
+    gzip-Bodies werden über "Content-Encoding: gzip" oder
+    "Content-Type: application/gzip" erkannt.
+    Fortschritt (je geschriebenem Batch) live über /api/progress/ws mit job_id.
+
+    Requires: Authentication
+
+    Errors:
+    - 400: Ungültiger Stream, zu viele ungültige Zeilen oder Limit überschritten
+      (in diesem Fall wird nichts importiert)
+    """
+    try:
+        chunks = http_request.stream()
+        content_encoding = http_request.headers.get("content-encoding", "").lower()
+        content_type = http_request.headers.get("content-type", "").lower()
+        if content_encoding == "gzip" or content_type.startswith("application/gzip"):
+            chunks = gunzip_chunks(chunks)
+
+        dto = ImportContentRequestDTO(
+            user_id=current_user["user_id"],
+            chunks=chunks,
+            job_id=job_id
+        )
+        result = await use_case.execute(dto)
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Fehler beim Import: {str(e)}"
+        )
+
+
+@router.get("/{content_id}/versions", response_model=ContentVersionListDTO)
+async def list_content_versions(
+    content_id: str,
+    current_user: dict = Depends(get_current_user),
+    use_case: ListContentVersionsUseCase = Depends(get_list_content_versions_use_case)
+):
+    """
+    Versions-Historie eines Contents (neueste zuerst).
+
+    Jede Regenerierung (Generate-Endpoint mit content_id) erzeugt eine neue Version.
+
+    Requires: Authentication
+
+    Errors:
+    - 404: Content nicht gefunden
+    """
+    try:
+        dto = ContentVersionRequestDTO(
+            user_id=current_user["user_id"],
+            content_id=content_id
+        )
+        return await use_case.execute(dto)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Fehler beim Laden der Versionen: {str(e)}"
+        )
+
+
+@router.get("/{content_id}/versions/{version}", response_model=ContentDetailDTO)
+async def get_content_version(
+    content_id: str,
+    version: int,
+    current_user: dict = Depends(get_current_user),
+    use_case: GetContentVersionUseCase = Depends(get_get_content_version_use_case)
+):
+    """
+    Content im Stand einer bestimmten Version.
+
+    Requires: Authentication
+
+    Errors:
+    - 404: Content oder Version nicht gefunden
+    """
+    try:
+        dto = ContentVersionRequestDTO(
+            user_id=current_user["user_id"],
+            content_id=content_id,
+            version=version
+        )
+        return await use_case.execute(dto)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Fehler beim Laden der Version: {str(e)}"
+        )
+
+
+@router.get("/{content_id}/status", response_model=ContentStatusDTO)
+async def get_content_status(
+    content_id: str,
+    current_user: dict = Depends(get_current_user),
+    use_case: GetContentStatusUseCase = Depends(get_get_content_status_use_case)
+):
+    """
+    Generierungs-Status eines Contents (Polling nach ?async=true).
+
+    - generating: Generierung läuft noch
+    - completed: data enthält den Content (bei Regenerierung: neue Version)
+    - failed: error enthält den Grund
+
+    Requires: Authentication
+
+    Errors:
+    - 404: Content nicht gefunden
+    """
+    try:
+        dto = ContentStatusRequestDTO(
+            user_id=current_user["user_id"],
+            content_id=content_id
+        )
+        return await use_case.execute(dto)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Fehler beim Laden des Status: {str(e)}"
+        )
+
+
 # TODO: Implement content history and detail endpoints
 # @router.get("/history", response_model=List[ContentListItemDTO])
 # @router.get("/{content_id}", response_model=ContentDetailDTO)
@@ -1,20 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import io
+from datetime import date
+from uuid import UUID
+from typing import AsyncIterator, Callable, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Header, Query, Response
 from fastapi.responses import StreamingResponse
-from io import BytesIO
-from ...application.dto.content_dto import ExportPDFRequestDTO, ExportPDFResponseDTO
+from pydantic import BaseModel, Field
+from ...application.dto.content_dto import (
+    ExportPDFRequestDTO, ExportPDFResponseDTO, ExportBundleRequestDTO, ExportDataRequestDTO
+)
 from ...application.use_cases.export_pdf_use_case import ExportPDFUseCase
+from ...application.use_cases.export_data_use_case import ExportDataUseCase
+from ...application.use_cases.export_bundle_use_case import ExportBundleUseCase
 from ..middlewares import get_current_user
-from ..dependencies import get_export_pdf_use_case
+from ..dependencies import (
+    get_export_pdf_use_case, get_export_pdf_use_case_provider, get_export_bundle_use_case, get_export_data_use_case
+)
+from ..streaming import RangeFileResponse, zip_chunks
 
 
 router = APIRouter(prefix="/api/export", tags=["export"])
 
 
+# ============== Request Models ==============
+
+class BundleRequest(BaseModel):
+    content_ids: List[UUID] = Field(..., min_length=1, max_length=ExportBundleUseCase.MAX_CONTENTS)
+
+
 # ============== Endpoints ==============
 
 @router.get("/pdf/{content_id}")
 async def export_pdf(
     content_id: str,
+    if_none_match: Optional[str] = Header(None),
+    range: Optional[str] = Header(None),
+    if_range: Optional[str] = Header(None),
     current_user: dict = Depends(get_current_user),
     use_case: ExportPDFUseCase = Depends(get_export_pdf_use_case)
 ):
@@ -36,32 +57,196 @@ async def export_pdf(
     Returns:
     - PDF File (application/pdf)
     - Content-Disposition: attachment mit Filename
+    - ETag (Content-Version + Template-Version); mit If-None-Match → 304 ohne Body
+    - Content-Length + Accept-Ranges; mit Range (optional If-Range) → 206 bzw. 416
+    - Aus dem Cache direkt von der Platte (sendfile, wenn der Server es anbietet)
 
     Errors:
     - 401: Not authenticated
     - 403: Content gehört nicht diesem User
-    - 404: Content nicht gefunden
+    - 404: Content nicht gefunden bzw. noch nicht fertig generiert
     - 429: PDF-Limit erreicht
     - 500: PDF Generation Error
+    - 503: PDF-Rendering ausgelastet (Retry-After)
+    """
+    return await _export_pdf(content_id, if_none_match, range, if_range, current_user, use_case)
+
+
+@router.get("/content/{content_id}")
+async def export_content(
+    content_id: str,
+    format: Optional[str] = Query(None, description="csv, ics, srt, vtt oder pdf (sonst per Accept Header)"),
+    start: Optional[date] = Query(None, description="ICS: Datum von Tag 1 (Default: Tag nach der Generierung)"),
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    range: Optional[str] = Header(None),
+    if_range: Optional[str] = Header(None),
+    current_user: dict = Depends(get_current_user),
+    use_case: ExportDataUseCase = Depends(get_export_data_use_case),
+    pdf_use_case: Callable[[], ExportPDFUseCase] = Depends(get_export_pdf_use_case_provider)
+):
+    """
+    Exportiert Content maschinenlesbar zum Import in andere Tools - ohne PDF-Rendering.
+
+    Requires: Authentication
+
+    Formate (Auswahl per ?format= oder Content Negotiation über Accept):
+    - Calendar: text/calendar (ICS, 30 ganztägige Termine)
+    - Script: application/x-subrip (SRT) bzw. text/vtt (WebVTT), Timings aus den Szenen-Dauern
+    - Hook, B-Roll, Shotlist: text/csv
+    - Alle: application/pdf (wie /api/export/pdf/{content_id}); ohne Accept gewinnt das
+      render-freie Format, Voiceover und Caption gibt es nur als PDF
+
+    Errors:
+    - 401: Not authenticated
+    - 403: Content gehört nicht diesem User
+    - 404: Content nicht gefunden bzw. noch nicht fertig generiert
+    - 406: Kein verfügbares Format akzeptabel (verfügbare Formate im detail)
+    - 500: Export Error
+    """
+    try:
+        dto = ExportDataRequestDTO(
+            user_id=current_user["user_id"],
+            content_id=content_id,
+            format=format,
+            accept=accept,
+            start=start
+        )
+        result = await use_case.execute(dto)
+
+    except PermissionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Fehler beim Export: {str(e)}"
+        )
+
+    if result.format is None:
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail=f"Verfügbare Formate für {result.content_type.value}: {', '.join(result.available)}"
+        )
+    if result.format == "pdf":
+        # Ausgehandeltes PDF hängt vom Accept Header ab - Caches müssen danach unterscheiden
+        return await _export_pdf(
+            content_id, if_none_match, range, if_range, current_user, pdf_use_case(), extra_headers={"Vary": "Accept"}
+        )
+
+    return Response(
+        content=result.body,
+        media_type=result.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{result.filename}"',
+            "Cache-Control": "private, no-cache",
+            "Vary": "Accept"
+        }
+    )
+
+
+@router.post("/bundle")
+async def export_bundle(
+    request: BundleRequest,
+    job_id: Optional[str] = Query(None, max_length=64, description="ID für Fortschritts-Events (WebSocket)"),
+    current_user: dict = Depends(get_current_user),
+    use_case: ExportBundleUseCase = Depends(get_export_bundle_use_case)
+):
+    """
+    Exportiert mehrere Contents als ZIP mit einem PDF pro Content (z.B. ein Reel-Paket oder einen Monat).
+
+    Alle Contents werden in einer Query geladen und parallel im PDF Render Pool gerendert.
+    Das ZIP wird gestreamt, während es entsteht - jede fertige Datei geht sofort raus.
+    Fortschritt live über /api/progress/ws (Header X-Job-Id).
+
+    Das fertige ZIP wird zwischengespeichert: dasselbe Bundle kommt beim nächsten Mal als
+    Datei mit Content-Length, fortsetzbar über GET /api/export/bundle (Range).
+
+    Requires: Authentication
+
+    Errors:
+    - 401: Not authenticated
+    - 404: Content nicht gefunden bzw. noch nicht fertig generiert
+    - 422: Ungültige Content-IDs bzw. mehr als 100 Contents
+    - 503: PDF-Rendering ausgelastet (Retry-After)
+    """
+    return await _export_bundle(request.content_ids, job_id, None, None, current_user, use_case)
+
+
+@router.get("/bundle")
+async def download_bundle(
+    content_ids: List[UUID] = Query(..., min_length=1, max_length=ExportBundleUseCase.MAX_CONTENTS),
+    job_id: Optional[str] = Query(None, max_length=64, description="ID für Fortschritts-Events (WebSocket)"),
+    range: Optional[str] = Header(None),
+    if_range: Optional[str] = Header(None),
+    current_user: dict = Depends(get_current_user),
+    use_case: ExportBundleUseCase = Depends(get_export_bundle_use_case)
+):
+    """
+    Wie POST /api/export/bundle, aber per GET mit ?content_ids=...&content_ids=... - damit
+    Browser und Download-Manager abgebrochene Downloads per Range fortsetzen können.
+
+    Returns:
+    - ZIP (application/zip) mit ETag und Accept-Ranges
+    - Mit Range (optional If-Range) → 206 bzw. 416; ein noch nicht gespeichertes Bundle
+      wird dafür zuerst komplett gebaut
+
+    Requires: Authentication
+
+    Errors:
+    - 401: Not authenticated
+    - 404: Content nicht gefunden bzw. noch nicht fertig generiert
+    - 422: Ungültige Content-IDs bzw. mehr als 100 Contents
+    - 503: PDF-Rendering ausgelastet (Retry-After)
     """
+    return await _export_bundle(content_ids, job_id, range, if_range, current_user, use_case)
+
+
+async def _export_pdf(
+    content_id: str,
+    if_none_match: Optional[str],
+    range_header: Optional[str],
+    if_range: Optional[str],
+    current_user: dict,
+    use_case: ExportPDFUseCase,
+    extra_headers: Optional[Dict[str, str]] = None
+):
     try:
         dto = ExportPDFRequestDTO(
             user_id=current_user["user_id"],
-            content_id=content_id
+            content_id=content_id,
+            if_none_match=if_none_match
         )
         result = await use_case.execute(dto)
 
-        # PDF als StreamingResponse zurückgeben
-        pdf_stream = BytesIO(result.pdf_bytes)
+        # private: nur der Browser des Users darf cachen, no-cache: vor Verwendung revalidieren
+        headers = {"ETag": result.etag, "Cache-Control": "private, no-cache", **(extra_headers or {})}
+        if result.not_modified:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-        return StreamingResponse(
-            pdf_stream,
+        headers["Content-Disposition"] = f'attachment; filename="{result.filename}"'
+        return RangeFileResponse(
+            result.pdf_file or io.BytesIO(result.pdf_bytes),
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="{result.filename}"'
-            }
+            etag=result.etag,
+            range_header=range_header,
+            if_range=if_range,
+            headers=headers
         )
 
+    except asyncio.QueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"}
+        )
     except PermissionError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -77,3 +262,65 @@ async def export_pdf(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Fehler beim PDF-Export: {str(e)}"
         )
+
+
+async def _export_bundle(
+    content_ids: List[UUID],
+    job_id: Optional[str],
+    range_header: Optional[str],
+    if_range: Optional[str],
+    current_user: dict,
+    use_case: ExportBundleUseCase
+):
+    try:
+        dto = ExportBundleRequestDTO(
+            user_id=current_user["user_id"],
+            content_ids=[str(content_id) for content_id in content_ids],
+            job_id=job_id
+        )
+        result = await use_case.execute(dto)
+
+        async def files() -> AsyncIterator[tuple]:
+            async for file in result.files:
+                yield file.filename, file.created_at, file.pdf_bytes
+
+        # Teil eines noch nicht gespeicherten Bundles: erst komplett bauen, dann den Bereich senden
+        if result.bundle_file is None and range_header:
+            result.bundle_file = await use_case.build(result, zip_chunks(files()))
+    except asyncio.QueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Fehler beim Bundle-Export: {str(e)}"
+        )
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="{result.filename}"',
+        "Cache-Control": "private, no-cache",
+        "X-Job-Id": result.job_id
+    }
+    if result.bundle_file is not None:
+        return RangeFileResponse(
+            result.bundle_file,
+            media_type="application/zip",
+            etag=result.etag,
+            range_header=range_header,
+            if_range=if_range,
+            headers=headers
+        )
+
+    return StreamingResponse(
+        use_case.store(result, zip_chunks(files())),
+        media_type="application/zip",
+        headers={**headers, "ETag": result.etag, "Accept-Ranges": "bytes"}
+    )
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import os
+import time
+from fastapi import APIRouter, Depends, WebSocket, WebSocketException, status
+from ...infrastructure.events import ProgressBroker, ProgressSubscription
+from ...infrastructure.events.progress_broker import CLOSE_EXPIRED, CLOSE_OVERFLOW, CLOSE_REVOKED, encode_event
+from ..middlewares import get_websocket_user
+from ..dependencies import get_progress_broker
+
+
+router = APIRouter(prefix="/api/progress", tags=["progress"])
+
+# Ping an idle Clients (hält Proxies/Load Balancer offen, erkennt tote Verbindungen)
+HEARTBEAT_SECONDS = float(os.getenv("PROGRESS_HEARTBEAT_SECONDS", "25"))
+# Braucht ein einzelner Send länger, gilt der Client als zu langsam
+SEND_TIMEOUT_SECONDS = float(os.getenv("PROGRESS_SEND_TIMEOUT_SECONDS", "10"))
+
+# ProgressSubscription.closed_reason → Close Code und Grund
+CLOSE_CODES = {
+    CLOSE_OVERFLOW: (status.WS_1013_TRY_AGAIN_LATER, "Client zu langsam"),
+    CLOSE_EXPIRED: (status.WS_1008_POLICY_VIOLATION, "Token expired"),
+    CLOSE_REVOKED: (status.WS_1008_POLICY_VIOLATION, "Session invalidated"),
+}
+
+
+# ============== Endpoints ==============
+
+@router.websocket("/ws")
+async def progress_socket(
+    websocket: WebSocket,
+    current_user: dict = Depends(get_websocket_user),
+    broker: ProgressBroker = Depends(get_progress_broker)
+):
+    """
+    Live-Fortschritt aller laufenden Jobs des Users über eine WebSocket pro Browser-Session.
+
+    Verbindung: ws(s)://.../api/progress/ws?token=<access_token>
+
+    Server → Client (JSON):
+    - {"type": "progress", "job_id", "kind", "status", "data", "created_at"}
+      kind: generation (job_id = Content-ID), export, import (job_id = X-Job-Id bzw. ?job_id=)
+      status: queued, started, partial, completed, failed
+    - {"type": "ping"} nach HEARTBEAT_SECONDS ohne Event
+
+    Langsame Clients bekommen pro Job nur den neuesten Zwischenstand; läuft die
+    Queue trotzdem über, wird die Verbindung mit 1013 geschlossen - nach dem
+    Reconnect den Stand über /api/content/{content_id}/status nachladen.
+
+    Die Verbindung lebt höchstens bis exp des Tokens und wird bei einer Invalidierung
+    des Users (Logout, Passwort-Änderung, Deaktivierung - auch auf anderen Workern)
+    geschlossen, jeweils mit 1008; danach mit frischem Token neu verbinden.
+    Pro User und Worker sind PROGRESS_MAX_SOCKETS_PER_USER Verbindungen offen,
+    weitere Handshakes werden mit 1013 abgelehnt.
+
+    Requires: Authentication (Handshake mit 1008 abgelehnt wenn Token fehlt/ungültig)
+    """
+    try:
+        subscription = broker.subscribe(current_user["user_id"])
+    except PermissionError as e:
+        raise WebSocketException(code=status.WS_1013_TRY_AGAIN_LATER, reason=str(e))
+
+    # Bei exp endet die Subscription - der Sender schließt die Verbindung
+    expiry = None
+    if current_user.get("exp") is not None:
+        expiry = asyncio.get_running_loop().call_later(
+            max(float(current_user["exp"]) - time.time(), 0), subscription.close, CLOSE_EXPIRED
+        )
+
+    sender = receiver = None
+    try:
+        await websocket.accept()
+        sender = asyncio.create_task(_send_events(websocket, subscription))
+        receiver = asyncio.create_task(_receive_until_disconnect(websocket))
+        await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        if expiry is not None:
+            expiry.cancel()
+        broker.unsubscribe(subscription)
+        tasks = [task for task in (sender, receiver) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _send_events(websocket: WebSocket, subscription: ProgressSubscription) -> None:
+    while True:
+        try:
+            event = await asyncio.wait_for(subscription.get(), timeout=HEARTBEAT_SECONDS)
+        except asyncio.TimeoutError:
+            message = {"type": "ping"}
+        else:
+            if event is None:
+                code, reason = CLOSE_CODES[subscription.closed_reason]
+                await websocket.close(code=code, reason=reason)
+                return
+            message = {"type": "progress", **encode_event(event)}
+
+        try:
+            await asyncio.wait_for(
+                websocket.send_text(json.dumps(message, ensure_ascii=False, default=str)),
+                timeout=SEND_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="Client zu langsam")
+            return
+
+
+async def _receive_until_disconnect(websocket: WebSocket) -> None:
+    """Client-Nachrichten werden ignoriert - der Loop erkennt nur den Disconnect"""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from pydantic import BaseModel
 from ...application.dto.subscription_dto import (
     CreateCheckoutSessionRequestDTO,
@@ -15,6 +15,7 @@ from ...application.use_cases.create_portal_session_use_case import CreatePortal
 from ...application.use_cases.handle_subscription_webhook_use_case import HandleSubscriptionWebhookUseCase
 from ...application.use_cases.get_subscription_status_use_case import GetSubscriptionStatusUseCase
 from ..middlewares import get_current_user
+from ..http_cache import compute_etag, etag_matches
 from ..dependencies import (
     get_create_checkout_session_use_case,
     get_create_portal_session_use_case,
@@ -192,6 +193,8 @@ async def handle_stripe_webhook(
 
 @router.get("/status", response_model=SubscriptionStatusResponseDTO)
 async def get_subscription_status(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     use_case: GetSubscriptionStatusUseCase = Depends(get_get_subscription_status_use_case)
 ):
@@ -206,6 +209,10 @@ async def get_subscription_status(
     - current_usage: Aktuelle Usage diesen Monat
     - remaining: Verbleibende Quota
 
+    Conditional GET:
+    - Response enthält einen ETag
+    - Mit If-None-Match und unverändertem Status → 304 Not Modified (ohne Body)
+
     Errors:
     - 401: Not authenticated
     - 404: User oder Subscription nicht gefunden
@@ -213,6 +220,13 @@ async def get_subscription_status(
     """
     try:
         result = await use_case.execute(current_user["user_id"])
+
+        etag = compute_etag(result)
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+        response.headers.update(cache_headers)
         return result
     except ValueError as e:
         raise HTTPException(
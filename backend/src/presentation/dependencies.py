@@ -2,17 +2,43 @@
 Dependency Injection Setup für FastAPI.
 Erstellt Use Cases mit ihren Dependencies (Repositories, Services).
 """
+import os
+import tempfile
 from functools import lru_cache
-from ..infrastructure.database.postgres.config import async_session_maker
+from typing import Callable
+from fastapi import Depends
+from ..infrastructure.database.postgres.config import async_session_maker, replica_session_maker
+from ..infrastructure.database.postgres.unit_of_work import SqlAlchemyUnitOfWork
+from ..infrastructure.database.postgres.routing import DatabaseRouter, ReadYourWritesGuard
 from ..infrastructure.database.postgres.content_repository import PostgresContentRepository
 from ..infrastructure.database.postgres.user_repository import PostgresUserRepository
 from ..infrastructure.database.postgres.subscription_repository import PostgresSubscriptionRepository
 from ..infrastructure.database.postgres.usage_repository import PostgresUsageRepository
+from ..infrastructure.database.postgres.usage_analytics_repository import PostgresUsageAnalyticsRepository
+from ..infrastructure.database.postgres.generation_job_repository import PostgresGenerationJobRepository
 from ..infrastructure.ai_services.claude_service import ClaudeService
 from ..infrastructure.payment.stripe_service import StripeService
-from ..infrastructure.pdf.pdf_generator import PDFGenerator
+from ..infrastructure.pdf.pdf_cache import PDFDiskCache
+from ..infrastructure.pdf.render_pool import PDFRenderPool
+from ..infrastructure.pdf.prerender import PDFPrerenderer
+from ..infrastructure.pdf.data_exporter import DataExporter
+from ..infrastructure.security.password_hasher import PasswordHasher
+from ..infrastructure.security.jwt_claims_cache import JWTClaimsCache
+from ..infrastructure.cache import (
+    EntityCache,
+    SubscriptionStatusCache,
+    CachedUserRepository,
+    CachedSubscriptionRepository,
+    CachedUsageRepository
+)
+from ..infrastructure.cache.entity_cache import (
+    USER_NAMESPACE, SUBSCRIPTION_NAMESPACE, USAGE_NAMESPACE, SESSION_REVOKING_SOURCES
+)
+from ..infrastructure.events import ProgressBroker
 from ..domain.services.rate_limiter import RateLimiter
 from ..domain.services.content_validator import ContentValidator
+from .middlewares import get_current_user
+from .middlewares.auth_middleware import auth_middleware
 
 # Application Layer
 from ..application.use_cases.generate_hook_use_case import GenerateHookUseCase
@@ -29,6 +55,16 @@ from ..application.use_cases.create_portal_session_use_case import CreatePortalS
 from ..application.use_cases.handle_subscription_webhook_use_case import HandleSubscriptionWebhookUseCase
 from ..application.use_cases.get_subscription_status_use_case import GetSubscriptionStatusUseCase
 from ..application.use_cases.export_pdf_use_case import ExportPDFUseCase
+from ..application.use_cases.export_data_use_case import ExportDataUseCase
+from ..application.use_cases.export_bundle_use_case import ExportBundleUseCase
+from ..application.use_cases.search_content_use_case import SearchContentUseCase
+from ..application.use_cases.export_content_use_case import ExportContentUseCase
+from ..application.use_cases.import_content_use_case import ImportContentUseCase
+from ..application.use_cases.list_content_versions_use_case import ListContentVersionsUseCase
+from ..application.use_cases.get_content_version_use_case import GetContentVersionUseCase
+from ..application.use_cases.enqueue_generation_use_case import EnqueueGenerationUseCase
+from ..application.use_cases.get_content_status_use_case import GetContentStatusUseCase
+from ..application.use_cases.get_usage_analytics_use_case import GetUsageAnalyticsUseCase
 
 
 # ============== Shared Services (Singleton) ==============
@@ -46,9 +82,44 @@ def get_stripe_service() -> StripeService:
 
 
 @lru_cache()
-def get_pdf_generator() -> PDFGenerator:
-    """PDF Generator Singleton"""
-    return PDFGenerator()
+def get_pdf_render_pool() -> PDFRenderPool:
+    """PDF Render Pool Singleton (Worker-Prozesse mit vorgewärmtem PDFGenerator)"""
+    return PDFRenderPool()
+
+
+@lru_cache()
+def get_pdf_cache() -> PDFDiskCache:
+    """Disk Cache für gerenderte PDFs (Singleton)"""
+    return PDFDiskCache()
+
+
+@lru_cache()
+def get_bundle_cache() -> PDFDiskCache:
+    """Disk Cache für fertige Bundle-ZIPs (Singleton, Range-Requests / fortgesetzte Downloads)"""
+    return PDFDiskCache(
+        directory=os.getenv("PDF_BUNDLE_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "reels-bundle-cache"),
+        max_bytes=int(float(os.getenv("PDF_BUNDLE_CACHE_MAX_MB", "512")) * 1024 * 1024),
+        suffix=".zip",
+        name="bundle_cache"
+    )
+
+
+@lru_cache()
+def get_pdf_prerenderer() -> PDFPrerenderer:
+    """Spekulatives Vorrendern nach Generierungen (Singleton, nimmt erst nach start() Aufträge an)"""
+    return PDFPrerenderer(get_pdf_render_pool(), get_pdf_cache())
+
+
+@lru_cache()
+def get_password_hasher() -> PasswordHasher:
+    """bcrypt in eigenen Threads mit begrenzter Queue (Singleton)"""
+    return PasswordHasher()
+
+
+@lru_cache()
+def get_data_exporter() -> DataExporter:
+    """Render-freie Exports: CSV, ICS, SRT/VTT (Singleton)"""
+    return DataExporter()
 
 
 @lru_cache()
@@ -63,185 +134,406 @@ def get_content_validator() -> ContentValidator:
     return ContentValidator()
 
 
+@lru_cache()
+def get_entity_cache() -> EntityCache:
+    """User/Subscription Entity Cache Singleton (Local Tier + Redis)"""
+    return EntityCache()
+
+
+@lru_cache()
+def get_progress_broker() -> ProgressBroker:
+    """
+    Progress Broker Singleton (Live-Events für WebSockets, Fan-out per Redis).
+    Beendete Sessions (Löschung, Deaktivierung, Passwortwechsel - auch von anderen Workern)
+    schließen die WebSockets des Users, andere User-Invalidierungen nicht.
+    """
+    broker = ProgressBroker()
+
+    def _on_entity_invalidated(namespace: str, key: str, source: str) -> None:
+        if namespace == USER_NAMESPACE and source in SESSION_REVOKING_SOURCES:
+            broker.close_user(key)
+
+    get_entity_cache().add_invalidation_listener(_on_entity_invalidated)
+    return broker
+
+
+@lru_cache()
+def get_subscription_status_cache() -> SubscriptionStatusCache:
+    """
+    Kurzlebiger Cache für /api/subscription/status pro User.
+    Wird bei User/Subscription/Usage-Invalidierungen (auch von anderen Workern) geleert.
+    """
+    cache = SubscriptionStatusCache(
+        get_entity_cache(),
+        ttl_seconds=float(os.getenv("SUBSCRIPTION_STATUS_CACHE_TTL_SECONDS", "5"))
+    )
+
+    def _on_entity_invalidated(namespace: str, key: str, source: str) -> None:
+        if namespace in (USER_NAMESPACE, SUBSCRIPTION_NAMESPACE, USAGE_NAMESPACE):
+            cache.evict_local(key)
+
+    get_entity_cache().add_invalidation_listener(_on_entity_invalidated)
+    return cache
+
+
+@lru_cache()
+def get_jwt_claims_cache() -> JWTClaimsCache:
+    """
+    Verifizierte JWT Claims (geteilt von allen Auth Dependencies).
+    User-Invalidierungen (auch von anderen Workern) entfernen die Tokens des Users.
+    """
+    cache = auth_middleware.claims_cache
+
+    def _on_entity_invalidated(namespace: str, key: str, source: str) -> None:
+        if namespace == USER_NAMESPACE:
+            cache.revoke_user(key)
+
+    get_entity_cache().add_invalidation_listener(_on_entity_invalidated)
+    return cache
+
+
 # ============== Database Session ==============
 
+@lru_cache()
+def get_database_router() -> DatabaseRouter:
+    """Primary/Replica Routing Singleton (ohne REPLICA_DATABASE_URL: nur Primary)"""
+    return DatabaseRouter(
+        primary=async_session_maker,
+        replica=replica_session_maker,
+        guard=ReadYourWritesGuard()
+    )
+
+
 async def get_session():
     """Provides async database session"""
     async with async_session_maker() as session:
         yield session
 
 
+async def get_unit_of_work():
+    """
+    Unit of Work pro Request - alle Repositories eines Requests teilen sich ihre Session.
+    Die Pool-Connection wird nur während DB-Phasen gehalten; was die Use Cases
+    nicht committen, wird am Ende des Requests verworfen.
+    """
+    async with SqlAlchemyUnitOfWork(async_session_maker, guard=get_database_router().guard) as uow:
+        yield uow
+
+
+async def get_read_only_unit_of_work(current_user: dict = Depends(get_current_user)):
+    """
+    Unit of Work für Requests die nur lesen - läuft gegen die Replica, außer der
+    User hat kürzlich geschrieben (Read-Your-Writes) oder es gibt keine Replica.
+    """
+    session_factory = await get_database_router().session_factory(
+        read_only=True,
+        user_id=current_user["user_id"]
+    )
+    async with SqlAlchemyUnitOfWork(session_factory, read_only=True) as uow:
+        yield uow
+
+
+# ============== Cached Repositories ==============
+
+def _user_repository(uow: SqlAlchemyUnitOfWork) -> CachedUserRepository:
+    """User Repository mit Read-Through Cache für get_by_id"""
+    return CachedUserRepository(PostgresUserRepository(uow.session), get_entity_cache(), unit_of_work=uow)
+
+
+def _subscription_repository(uow: SqlAlchemyUnitOfWork) -> CachedSubscriptionRepository:
+    """Subscription Repository mit Read-Through Cache für get_by_user_id"""
+    return CachedSubscriptionRepository(PostgresSubscriptionRepository(uow.session), get_entity_cache(), unit_of_work=uow)
+
+
+def _usage_repository(uow: SqlAlchemyUnitOfWork) -> CachedUsageRepository:
+    """Usage Repository, Writes invalidieren den Subscription Status Cache (nach dem Commit)"""
+    return CachedUsageRepository(PostgresUsageRepository(uow.session), get_subscription_status_cache(), unit_of_work=uow)
+
+
 # ============== Use Case Dependencies ==============
 
 # Content Generation Use Cases
 
-async def get_generate_hook_use_case():
+async def get_generate_hook_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for GenerateHookUseCase"""
-    async with async_session_maker() as session:
-        return GenerateHookUseCase(
-            content_repository=PostgresContentRepository(session),
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            usage_repository=PostgresUsageRepository(session),
-            claude_service=get_claude_service(),
-            rate_limiter=get_rate_limiter(),
-            content_validator=get_content_validator()
-        )
-
-
-async def get_generate_script_use_case():
+    return GenerateHookUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        claude_service=get_claude_service(),
+        rate_limiter=get_rate_limiter(),
+        content_validator=get_content_validator(),
+        unit_of_work=uow,
+        pdf_prerenderer=get_pdf_prerenderer()
+    )
+
+
+async def get_generate_script_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for GenerateScriptUseCase"""
-    async with async_session_maker() as session:
-        return GenerateScriptUseCase(
-            content_repository=PostgresContentRepository(session),
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            usage_repository=PostgresUsageRepository(session),
-            claude_service=get_claude_service(),
-            rate_limiter=get_rate_limiter(),
-            content_validator=get_content_validator()
-        )
-
-
-async def get_generate_shotlist_use_case():
+    return GenerateScriptUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        claude_service=get_claude_service(),
+        rate_limiter=get_rate_limiter(),
+        content_validator=get_content_validator(),
+        unit_of_work=uow,
+        pdf_prerenderer=get_pdf_prerenderer()
+    )
+
+
+async def get_generate_shotlist_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for GenerateShotlistUseCase"""
-    async with async_session_maker() as session:
-        return GenerateShotlistUseCase(
-            content_repository=PostgresContentRepository(session),
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            usage_repository=PostgresUsageRepository(session),
-            claude_service=get_claude_service(),
-            rate_limiter=get_rate_limiter(),
-            content_validator=get_content_validator()
-        )
-
-
-async def get_generate_voiceover_use_case():
+    return GenerateShotlistUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        claude_service=get_claude_service(),
+        rate_limiter=get_rate_limiter(),
+        content_validator=get_content_validator(),
+        unit_of_work=uow,
+        pdf_prerenderer=get_pdf_prerenderer()
+    )
+
+
+async def get_generate_voiceover_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for GenerateVoiceoverUseCase"""
-    async with async_session_maker() as session:
-        return GenerateVoiceoverUseCase(
-            content_repository=PostgresContentRepository(session),
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            usage_repository=PostgresUsageRepository(session),
-            claude_service=get_claude_service(),
-            rate_limiter=get_rate_limiter(),
-            content_validator=get_content_validator()
-        )
-
-
-async def get_generate_caption_use_case():
+    return GenerateVoiceoverUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        claude_service=get_claude_service(),
+        rate_limiter=get_rate_limiter(),
+        content_validator=get_content_validator(),
+        unit_of_work=uow,
+        pdf_prerenderer=get_pdf_prerenderer()
+    )
+
+
+async def get_generate_caption_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for GenerateCaptionUseCase"""
-    async with async_session_maker() as session:
-        return GenerateCaptionUseCase(
-            content_repository=PostgresContentRepository(session),
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            usage_repository=PostgresUsageRepository(session),
-            claude_service=get_claude_service(),
-            rate_limiter=get_rate_limiter(),
-            content_validator=get_content_validator()
-        )
-
-
-async def get_generate_broll_use_case():
+    return GenerateCaptionUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        claude_service=get_claude_service(),
+        rate_limiter=get_rate_limiter(),
+        content_validator=get_content_validator(),
+        unit_of_work=uow,
+        pdf_prerenderer=get_pdf_prerenderer()
+    )
+
+
+async def get_generate_broll_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for GenerateBRollUseCase"""
-    async with async_session_maker() as session:
-        return GenerateBRollUseCase(
-            content_repository=PostgresContentRepository(session),
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            usage_repository=PostgresUsageRepository(session),
-            claude_service=get_claude_service(),
-            rate_limiter=get_rate_limiter(),
-            content_validator=get_content_validator()
-        )
-
-
-async def get_generate_calendar_use_case():
+    return GenerateBRollUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        claude_service=get_claude_service(),
+        rate_limiter=get_rate_limiter(),
+        content_validator=get_content_validator(),
+        unit_of_work=uow,
+        pdf_prerenderer=get_pdf_prerenderer()
+    )
+
+
+async def get_generate_calendar_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for GenerateCalendarUseCase"""
-    async with async_session_maker() as session:
-        return GenerateCalendarUseCase(
-            content_repository=PostgresContentRepository(session),
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            usage_repository=PostgresUsageRepository(session),
-            claude_service=get_claude_service(),
-            rate_limiter=get_rate_limiter(),
-            content_validator=get_content_validator()
-        )
+    return GenerateCalendarUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        claude_service=get_claude_service(),
+        rate_limiter=get_rate_limiter(),
+        content_validator=get_content_validator(),
+        unit_of_work=uow,
+        pdf_prerenderer=get_pdf_prerenderer()
+    )
+
+
+async def get_enqueue_generation_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
+    """Dependency for EnqueueGenerationUseCase (?async=true auf den Generate-Endpoints)"""
+    return EnqueueGenerationUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        generation_job_repository=PostgresGenerationJobRepository(uow.session),
+        rate_limiter=get_rate_limiter(),
+        unit_of_work=uow,
+        progress_publisher=get_progress_broker()
+    )
+
+
+async def get_get_content_status_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
+    """Dependency for GetContentStatusUseCase (Primary - Polling darf keinen Replica-Lag sehen)"""
+    return GetContentStatusUseCase(
+        content_repository=PostgresContentRepository(uow.session)
+    )
+
+
+async def get_search_content_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)):
+    """Dependency for SearchContentUseCase"""
+    return SearchContentUseCase(
+        content_repository=PostgresContentRepository(uow.session)
+    )
+
+
+async def get_export_content_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)):
+    """Dependency for ExportContentUseCase (der Stream verwaltet seine Session selbst)"""
+    return ExportContentUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        progress_publisher=get_progress_broker()
+    )
+
+
+async def get_import_content_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
+    """Dependency for ImportContentUseCase"""
+    return ImportContentUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        content_validator=get_content_validator(),
+        unit_of_work=uow,
+        progress_publisher=get_progress_broker()
+    )
+
+
+async def get_list_content_versions_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)):
+    """Dependency for ListContentVersionsUseCase"""
+    return ListContentVersionsUseCase(
+        content_repository=PostgresContentRepository(uow.session)
+    )
+
+
+async def get_get_content_version_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)):
+    """Dependency for GetContentVersionUseCase"""
+    return GetContentVersionUseCase(
+        content_repository=PostgresContentRepository(uow.session)
+    )
 
 
 # Authentication Use Cases
 
-async def get_register_user_use_case():
+async def get_register_user_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for RegisterUserUseCase"""
-    async with async_session_maker() as session:
-        return RegisterUserUseCase(
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session)
-        )
+    return RegisterUserUseCase(
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        unit_of_work=uow,
+        password_hasher=get_password_hasher()
+    )
 
 
-async def get_login_user_use_case():
+async def get_login_user_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for LoginUserUseCase"""
-    async with async_session_maker() as session:
-        return LoginUserUseCase(
-            user_repository=PostgresUserRepository(session)
-        )
+    return LoginUserUseCase(
+        user_repository=_user_repository(uow),
+        password_hasher=get_password_hasher(),
+        unit_of_work=uow
+    )
 
 
 # Subscription Use Cases
 
-async def get_create_checkout_session_use_case():
+async def get_create_checkout_session_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for CreateCheckoutSessionUseCase"""
-    async with async_session_maker() as session:
-        return CreateCheckoutSessionUseCase(
-            user_repository=PostgresUserRepository(session),
-            stripe_service=get_stripe_service()
-        )
+    return CreateCheckoutSessionUseCase(
+        user_repository=_user_repository(uow),
+        stripe_service=get_stripe_service()
+    )
 
 
-async def get_create_portal_session_use_case():
+async def get_create_portal_session_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for CreatePortalSessionUseCase"""
-    async with async_session_maker() as session:
-        return CreatePortalSessionUseCase(
-            user_repository=PostgresUserRepository(session),
-            stripe_service=get_stripe_service()
-        )
+    return CreatePortalSessionUseCase(
+        user_repository=_user_repository(uow),
+        stripe_service=get_stripe_service()
+    )
 
 
-async def get_handle_subscription_webhook_use_case():
+async def get_handle_subscription_webhook_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)):
     """Dependency for HandleSubscriptionWebhookUseCase"""
-    async with async_session_maker() as session:
-        return HandleSubscriptionWebhookUseCase(
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            stripe_service=get_stripe_service()
-        )
+    return HandleSubscriptionWebhookUseCase(
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        stripe_service=get_stripe_service(),
+        unit_of_work=uow,
+        entity_cache=get_entity_cache()
+    )
 
 
-async def get_get_subscription_status_use_case():
+async def get_get_subscription_status_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)):
     """Dependency for GetSubscriptionStatusUseCase"""
-    async with async_session_maker() as session:
-        return GetSubscriptionStatusUseCase(
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            usage_repository=PostgresUsageRepository(session)
-        )
+    return GetSubscriptionStatusUseCase(
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        status_cache=get_subscription_status_cache()
+    )
 
 
 # Export Use Cases
 
-async def get_export_pdf_use_case():
+async def get_export_pdf_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)):
     """Dependency for ExportPDFUseCase"""
-    async with async_session_maker() as session:
-        return ExportPDFUseCase(
-            content_repository=PostgresContentRepository(session),
-            user_repository=PostgresUserRepository(session),
-            subscription_repository=PostgresSubscriptionRepository(session),
-            usage_repository=PostgresUsageRepository(session),
-            pdf_generator=get_pdf_generator(),
-            rate_limiter=get_rate_limiter()
-        )
+    return _export_pdf_use_case(uow)
+
+
+async def get_export_pdf_use_case_provider(
+    uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)
+) -> Callable[[], ExportPDFUseCase]:
+    """Dependency: baut ExportPDFUseCase erst bei Bedarf (z.B. nur im PDF-Zweig der Content Negotiation)"""
+    return lambda: _export_pdf_use_case(uow)
+
+
+def _export_pdf_use_case(uow: SqlAlchemyUnitOfWork) -> ExportPDFUseCase:
+    return ExportPDFUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        usage_repository=_usage_repository(uow),
+        pdf_render_pool=get_pdf_render_pool(),
+        pdf_cache=get_pdf_cache(),
+        rate_limiter=get_rate_limiter(),
+        unit_of_work=uow,
+        pdf_prerenderer=get_pdf_prerenderer()
+    )
+
+
+async def get_export_data_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)):
+    """Dependency for ExportDataUseCase"""
+    return ExportDataUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        data_exporter=get_data_exporter(),
+        unit_of_work=uow
+    )
+
+
+async def get_export_bundle_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)):
+    """Dependency for ExportBundleUseCase"""
+    return ExportBundleUseCase(
+        content_repository=PostgresContentRepository(uow.session),
+        user_repository=_user_repository(uow),
+        subscription_repository=_subscription_repository(uow),
+        pdf_render_pool=get_pdf_render_pool(),
+        pdf_cache=get_pdf_cache(),
+        bundle_cache=get_bundle_cache(),
+        unit_of_work=uow,
+        progress_publisher=get_progress_broker(),
+        pdf_prerenderer=get_pdf_prerenderer()
+    )
+
+# Admin Use Cases
+
+async def get_get_usage_analytics_use_case(uow: SqlAlchemyUnitOfWork = Depends(get_read_only_unit_of_work)):
+    """Dependency for GetUsageAnalyticsUseCase"""
+    return GetUsageAnalyticsUseCase(
+        analytics_repository=PostgresUsageAnalyticsRepository(uow.session)
+    )
@@ -0,0 +1,24 @@
+"""
+HTTP Caching Helpers (ETag / Conditional GET).
+"""
+import hashlib
+import json
+from typing import Any, Optional
+from fastapi.encoders import jsonable_encoder
+
+
+def compute_etag(payload: Any) -> str:
+    """Starker ETag über die kanonische JSON-Repräsentation eines Response-Objekts"""
+    canonical = json.dumps(jsonable_encoder(payload), sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha256(canonical.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Prüft einen If-None-Match Header (Liste oder *) gegen den aktuellen ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # Weak-Vergleich wie in RFC 9110 für If-None-Match vorgesehen
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
@@ -1,3 +1,3 @@
-from .auth_middleware import get_current_user, get_current_user_optional
+from .auth_middleware import get_current_user, get_current_user_optional, get_current_admin, get_websocket_user
 
-__all__ = ["get_current_user", "get_current_user_optional"]
+__all__ = ["get_current_user", "get_current_user_optional", "get_current_admin", "get_websocket_user"]
@@ -1,8 +1,9 @@
-from fastapi import Request, HTTPException, status, Depends
+from fastapi import Request, HTTPException, status, Depends, WebSocket, WebSocketException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 import os
 from typing import Optional
+from ...infrastructure.security.jwt_claims_cache import JWTClaimsCache
 
 
 security = HTTPBearer()
@@ -12,11 +13,15 @@ class AuthMiddleware:
     """
     JWT Authentication Middleware für FastAPI.
     Verifiziert Access Tokens und extrahiert User-Informationen.
+
+    Verifizierte Claims landen im JWTClaimsCache (bis exp) - alle Dependencies
+    (get_current_user, get_current_user_optional, get_websocket_user) teilen ihn.
     """
 
-    def __init__(self):
+    def __init__(self, claims_cache: Optional[JWTClaimsCache] = None):
         self.jwt_secret = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
         self.jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+        self.claims_cache = claims_cache or JWTClaimsCache()
 
     def verify_token(self, token: str) -> dict:
         """
@@ -26,11 +31,16 @@ class AuthMiddleware:
             token: JWT Access Token
 
         Returns:
-            dict mit user_id, email, role
+            dict mit user_id, email, role, exp
 
         Raises:
             HTTPException: Wenn Token invalid oder expired
         """
+        digest = self.claims_cache.digest(token)
+        claims = self.claims_cache.get(digest)
+        if claims is not None:
+            return claims
+
         try:
             payload = jwt.decode(
                 token,
@@ -45,11 +55,14 @@ class AuthMiddleware:
                     detail="Invalid token type"
                 )
 
-            return {
+            claims = {
                 "user_id": payload.get("sub"),
                 "email": payload.get("email"),
-                "role": payload.get("role")
+                "role": payload.get("role"),
+                "exp": payload.get("exp")
             }
+            self.claims_cache.put(digest, claims, payload.get("exp"))
+            return claims
 
         except jwt.ExpiredSignatureError:
             raise HTTPException(
@@ -79,7 +92,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
             ...
 
     Returns:
-        dict mit user_id, email, role
+        dict mit user_id, email, role, exp
 
     Raises:
         HTTPException: Wenn Token fehlt oder invalid
@@ -112,7 +125,7 @@ def get_current_user_optional(
                 ...
 
     Returns:
-        dict mit user_id, email, role oder None
+        dict mit user_id, email, role, exp oder None
     """
     if not credentials:
         return None
@@ -122,3 +135,47 @@ def get_current_user_optional(
         return auth_middleware.verify_token(token)
     except HTTPException:
         return None
+
+
+def get_websocket_user(websocket: WebSocket) -> dict:
+    """
+    FastAPI Dependency für WebSocket-Routes.
+    Browser können beim Handshake keinen Authorization Header setzen - der
+    Access Token kommt deshalb als Query-Parameter (?token=...).
+
+    Returns:
+        dict mit user_id, email, role, exp
+
+    Raises:
+        WebSocketException 1008: Wenn Token fehlt oder invalid (Handshake wird abgelehnt)
+    """
+    token = websocket.query_params.get("token")
+    if not token:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Missing authentication credentials")
+    try:
+        return auth_middleware.verify_token(token)
+    except HTTPException as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
+
+
+def get_current_admin(current_user: dict = Depends(get_current_user)) -> dict:
+    """
+    FastAPI Dependency für Admin-Routes (Analytics, Support).
+    Admins werden über die Allowlist ADMIN_USER_IDS (kommagetrennte User IDs) festgelegt,
+    da Rollen an den Subscription-Plan gekoppelt sind. Bewusst nicht über die E-Mail:
+    die Registrierung verifiziert keine Adressen.
+
+    Raises:
+        HTTPException 403: Wenn der User kein Admin ist
+    """
+    admin_user_ids = {
+        user_id.strip().lower()
+        for user_id in os.getenv("ADMIN_USER_IDS", "").split(",")
+        if user_id.strip()
+    }
+    if str(current_user.get("user_id") or "").lower() not in admin_user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin-Berechtigung erforderlich"
+        )
+    return current_user
@@ -0,0 +1,222 @@
+"""
+Streaming Helpers für große Responses und Uploads (NDJSON Export/Import, PDF Bundles, Datei-Downloads).
+"""
+import asyncio
+import io
+import os
+import re
+import zipfile
+import zlib
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, BinaryIO, List, Mapping, Optional, Tuple
+from fastapi import Response, status
+from starlette.types import Receive, Scope, Send
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+async def buffer_chunks(chunks: AsyncIterable[bytes], chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Fasst viele kleine Chunks (z.B. NDJSON-Zeilen) zu ~chunk_size großen Writes zusammen"""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def gzip_chunks(chunks: AsyncIterable[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Komprimiert einen Byte-Stream inkrementell als gzip"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 → gzip Header
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def gunzip_chunks(chunks: AsyncIterable[bytes], max_output_chunk: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Dekomprimiert einen gzip Byte-Stream inkrementell.
+    max_output_chunk begrenzt den Speicher pro Schritt (Schutz vor Kompressions-Bomben).
+    """
+    decompressor = zlib.decompressobj(47)  # wbits=47 → gzip oder zlib automatisch erkennen
+    try:
+        async for chunk in chunks:
+            data = chunk
+            while data:
+                output = decompressor.decompress(data, max_output_chunk)
+                if output:
+                    yield output
+                data = decompressor.unconsumed_tail
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+    except zlib.error as e:
+        raise ValueError(f"Ungültige gzip-Daten: {e}") from e
+
+
+class _ZipSink(io.RawIOBase):
+    """Nicht seekbares Ziel für zipfile - sammelt geschriebene Bytes bis zum nächsten drain()"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def zip_chunks(files: AsyncIterable[Tuple[str, datetime, bytes]]) -> AsyncIterator[bytes]:
+    """
+    Baut ein ZIP inkrementell aus (Dateiname, Zeitstempel, Bytes) - jede Datei wird
+    geschrieben und sofort ausgeliefert, im Speicher liegt nie mehr als eine Datei.
+    Ohne Kompression (ZIP_STORED): PDFs sind bereits komprimiert, der Event Loop bleibt frei.
+    """
+    sink = _ZipSink()
+    # Ohne seek() schreibt zipfile Data Descriptors statt die Header nachträglich zu patchen
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        async for name, modified_at, data in files:
+            info = zipfile.ZipInfo(name, date_time=modified_at.timetuple()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            archive.writestr(info, data)
+            yield sink.drain()
+    yield sink.drain()
+
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeFileResponse(Response):
+    """
+    Liefert eine geöffnete Datei aus - mit Content-Length, Accept-Ranges und Range/If-Range
+    (RFC 9110), damit abgebrochene Downloads fortgesetzt werden können. Unterstützt wird ein
+    Bereich; mehrere Bereiche, ungültige Header oder ein veraltetes If-Range liefern die
+    ganze Datei (200), ein Bereich hinter dem Dateiende 416.
+
+    Die Datei wird offen übergeben (z.B. aus PDFDiskCache.open) und nach dem Senden
+    geschlossen. Bietet der Server die ASGI Extension http.response.zerocopy an, sendet er
+    per sendfile direkt aus dem Page Cache; sonst wird in chunk_size Stücken aus einem
+    Thread gelesen - die Datei liegt nie komplett im Speicher.
+    """
+
+    chunk_size = STREAM_CHUNK_SIZE
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        media_type: str,
+        etag: str,
+        range_header: Optional[str] = None,
+        if_range: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None
+    ):
+        self.file = file
+        self.media_type = media_type
+        self.background = None
+        self.size = self._size(file)
+        self.start, self.length = 0, self.size
+        self.status_code = status.HTTP_200_OK
+
+        byte_range = self._parse_range(range_header, self.size) if self._if_range_matches(if_range, etag) else None
+        self.init_headers({**(headers or {}), "ETag": etag, "Accept-Ranges": "bytes"})
+        if byte_range == (None, None):
+            self.status_code = status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+            self.length = 0
+            self.headers["Content-Range"] = f"bytes */{self.size}"
+        elif byte_range is not None:
+            self.status_code = status.HTTP_206_PARTIAL_CONTENT
+            self.start, end = byte_range
+            self.length = end - self.start + 1
+            self.headers["Content-Range"] = f"bytes {self.start}-{end}/{self.size}"
+        self.headers["Content-Length"] = str(self.length)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            if scope["method"].upper() == "HEAD" or self.length == 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+            elif "http.response.zerocopy" in scope.get("extensions", {}) and self._has_fileno():
+                await send({
+                    "type": "http.response.zerocopy",
+                    "file": self.file,
+                    "offset": self.start,
+                    "count": self.length,
+                    "more_body": False
+                })
+            else:
+                await self._send_chunks(send)
+        finally:
+            self.file.close()
+
+    async def _send_chunks(self, send: Send) -> None:
+        # BytesIO (frisch gerendert) direkt lesen, echte Dateien im Thread
+        in_memory = isinstance(self.file, io.BytesIO)
+        self.file.seek(self.start)
+        remaining = self.length
+        while remaining > 0:
+            size = min(self.chunk_size, remaining)
+            chunk = self.file.read(size) if in_memory else await asyncio.to_thread(self.file.read, size)
+            if not chunk:
+                break  # Datei kürzer als beim Öffnen - Verbindung sauber beenden
+            remaining -= len(chunk)
+            await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    def _has_fileno(self) -> bool:
+        try:
+            self.file.fileno()
+            return True
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return False
+
+    @staticmethod
+    def _size(file: BinaryIO) -> int:
+        if isinstance(file, io.BytesIO):
+            return file.getbuffer().nbytes
+        return os.fstat(file.fileno()).st_size
+
+    @staticmethod
+    def _if_range_matches(if_range: Optional[str], etag: str) -> bool:
+        """If-Range verlangt einen starken Vergleich - sonst wird Range ignoriert"""
+        return if_range is None or if_range.strip() == etag
+
+    @staticmethod
+    def _parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """
+        Returns: (start, end) inklusive, (None, None) wenn nicht erfüllbar (416)
+        oder None wenn der Header fehlt bzw. ignoriert wird (200)
+        """
+        if not range_header:
+            return None
+        match = _RANGE.match(range_header.strip())
+        if match is None:
+            return None  # Mehrere Bereiche oder andere Einheit
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            # Suffix: die letzten n Bytes
+            suffix = int(last)
+            if suffix == 0:
+                return None, None
+            return max(size - suffix, 0), size - 1
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+        if start >= size:
+            return None, None
+        return start, end
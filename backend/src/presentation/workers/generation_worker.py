@@ -0,0 +1,285 @@
+"""
+Worker Pool für asynchrone Content-Generierung (POST /api/content/{type}?async=true).
+
+Holt Jobs aus generation_jobs, führt den jeweiligen Generate Use Case aus und
+setzt den Content auf COMPLETED bzw. nach dem letzten Versuch auf FAILED.
+Läuft im API-Prozess (GENERATION_WORKER_CONCURRENCY > 0, Start im lifespan)
+oder als eigener Prozess:
+
+    python -m src.presentation.workers.generation_worker --concurrency 4
+"""
+import argparse
+import asyncio
+import dataclasses
+import logging
+import os
+import signal
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from ...domain.entities.content import ContentType, ContentStatus
+from ...domain.entities.generation_job import GenerationJob
+from ...domain.entities.progress import ProgressEvent, JobKind, ProgressStatus
+from ...domain.interfaces.progress_publisher import IProgressPublisher
+from ...infrastructure.database.postgres.config import async_session_maker
+from ...infrastructure.database.postgres.unit_of_work import SqlAlchemyUnitOfWork
+from ...infrastructure.database.postgres.content_repository import PostgresContentRepository
+from ...infrastructure.database.postgres.generation_job_repository import PostgresGenerationJobRepository
+from ...infrastructure.monitoring import metrics
+from ...application.dto.content_dto import (
+    GenerateHookRequestDTO,
+    GenerateScriptRequestDTO,
+    GenerateShotlistRequestDTO,
+    GenerateVoiceoverRequestDTO,
+    GenerateCaptionRequestDTO,
+    GenerateBRollRequestDTO,
+    GenerateCalendarRequestDTO
+)
+from ..dependencies import (
+    get_database_router,
+    get_progress_broker,
+    get_generate_hook_use_case,
+    get_generate_script_use_case,
+    get_generate_shotlist_use_case,
+    get_generate_voiceover_use_case,
+    get_generate_caption_use_case,
+    get_generate_broll_use_case,
+    get_generate_calendar_use_case
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Content-Typ → (Use Case Provider, Request DTO)
+GENERATORS = {
+    ContentType.HOOK: (get_generate_hook_use_case, GenerateHookRequestDTO),
+    ContentType.SCRIPT: (get_generate_script_use_case, GenerateScriptRequestDTO),
+    ContentType.SHOTLIST: (get_generate_shotlist_use_case, GenerateShotlistRequestDTO),
+    ContentType.VOICEOVER: (get_generate_voiceover_use_case, GenerateVoiceoverRequestDTO),
+    ContentType.CAPTION: (get_generate_caption_use_case, GenerateCaptionRequestDTO),
+    ContentType.BROLL: (get_generate_broll_use_case, GenerateBRollRequestDTO),
+    ContentType.CALENDAR: (get_generate_calendar_use_case, GenerateCalendarRequestDTO),
+}
+
+
+class GenerationWorker:
+    """
+    N Worker-Tasks, jeder mit eigener Unit of Work pro Job.
+
+    Ein Job wird per claim() für lease_seconds geleast - stirbt der Prozess während
+    des LLM Calls, übernimmt nach Ablauf ein anderer Worker. Fehler im LLM Call bzw.
+    in der Validierung werden mit Backoff wiederholt (MAX_ATTEMPTS); ValueError und
+    PermissionError (Content/User weg, Rate-Limit) scheitern sofort.
+
+    Endgültig fehlgeschlagen: neue Contents → FAILED (Grund in metadata.error),
+    Regenerierungen → zurück auf COMPLETED (die bisherige Version bleibt aktuell).
+
+    Jeder Schritt (started, completed, failed, erneut queued) wird als Progress Event
+    an die WebSockets des Users gemeldet.
+    """
+
+    MAX_ATTEMPTS = 3
+    RETRY_BASE_SECONDS = 10  # 10s, 20s, ...
+    SHUTDOWN_TIMEOUT_SECONDS = 25
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        poll_interval_seconds: Optional[float] = None,
+        session_factory: async_sessionmaker = async_session_maker,
+        progress_publisher: Optional[IProgressPublisher] = None
+    ):
+        self.concurrency = concurrency if concurrency is not None else int(
+            os.getenv("GENERATION_WORKER_CONCURRENCY", "2")
+        )
+        self.lease_seconds = lease_seconds or int(os.getenv("GENERATION_JOB_LEASE_SECONDS", "300"))
+        self.poll_interval_seconds = poll_interval_seconds or float(
+            os.getenv("GENERATION_WORKER_POLL_SECONDS", "1")
+        )
+        self.session_factory = session_factory
+        self.progress = progress_publisher or get_progress_broker()
+        self._tasks: List[asyncio.Task] = []
+        self._stopping: Optional[asyncio.Event] = None
+
+        self._jobs = metrics.counter("generation_jobs_total", "Asynchrone Generierungen nach Ergebnis")
+        self._duration = metrics.histogram(
+            "generation_job_duration_seconds", "Laufzeit eines Generierungs-Jobs (inkl. LLM Call)",
+            buckets=(1, 2.5, 5, 10, 20, 30, 60, 120)
+        )
+        self._queue_wait = metrics.histogram(
+            "generation_job_queue_wait_seconds", "Wartezeit vom Einstellen bis zum ersten Claim",
+            buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+        )
+        self._busy = metrics.gauge("generation_workers_busy", "Worker-Tasks mit laufendem Job")
+
+    # ---------- Lifecycle ----------
+
+    async def start(self) -> None:
+        """Startet die Worker-Tasks (im FastAPI lifespan bzw. per CLI aufrufen)"""
+        if self._tasks or self.concurrency <= 0:
+            return
+        self._stopping = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+        logger.info("Generation Worker gestartet (%d Tasks)", self.concurrency)
+
+    async def close(self) -> None:
+        """
+        Lässt laufende Jobs bis SHUTDOWN_TIMEOUT_SECONDS zu Ende laufen und bricht den Rest ab
+        (abgebrochene Jobs werden nach Ablauf ihres Leases erneut vergeben).
+        """
+        if not self._tasks:
+            return
+        self._stopping.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=self.SHUTDOWN_TIMEOUT_SECONDS)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+
+    # ---------- Processing ----------
+
+    async def run_once(self) -> bool:
+        """Verarbeitet höchstens einen Job. Returns: False wenn kein Job fällig war"""
+        async with self._unit_of_work() as uow:
+            job = await PostgresGenerationJobRepository(uow.session).claim(self.lease_seconds)
+            await uow.commit()
+        if job is None:
+            return False
+
+        if job.attempts == 1 and job.created_at is not None:
+            self._queue_wait.observe((datetime.now(timezone.utc) - job.created_at).total_seconds())
+
+        await self._publish(job, ProgressStatus.STARTED, {"type": job.content_type.value, "attempt": job.attempts})
+        self._busy.inc()
+        started = time.perf_counter()
+        try:
+            outcome = await self._process(job)
+        finally:
+            self._busy.dec()
+        self._jobs.inc(outcome=outcome)
+        self._duration.observe(time.perf_counter() - started, outcome=outcome)
+        return True
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                # z.B. DB kurz nicht erreichbar - nach dem Poll-Intervall erneut versuchen
+                logger.warning("Generation Worker: Fehler beim Claim: %s", e)
+                processed = False
+            if processed:
+                continue
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _process(self, job: GenerationJob) -> str:
+        error: Optional[str] = None
+        permanent = False
+        version: Optional[int] = None
+
+        async with self._unit_of_work() as uow:
+            content = await PostgresContentRepository(uow.session).get_by_id(job.content_id, job.user_id)
+            if content is None or content.status != ContentStatus.GENERATING:
+                # Content inzwischen gelöscht oder bereits abgeschlossen (Job nach Commit erneut geclaimt)
+                await PostgresGenerationJobRepository(uow.session).delete(job.content_id)
+                await uow.commit()
+                return "skipped"
+
+            provider, dto_class = GENERATORS[job.content_type]
+            fields = {field.name for field in dataclasses.fields(dto_class)}
+            request = dto_class(
+                user_id=job.user_id,
+                prompt=job.prompt,
+                content_id=job.content_id,
+                complete_pending=not job.regenerate,
+                queued=True,
+                **{key: value for key, value in job.params.items() if key in fields}
+            )
+            use_case = await provider(uow=uow)
+            try:
+                result = await use_case.execute(request)
+                version = result.version
+            except (ValueError, PermissionError) as e:
+                await uow.rollback()
+                error, permanent = str(e), True
+            except Exception as e:
+                await uow.rollback()
+                error = str(e)
+
+        async with self._unit_of_work() as uow:
+            jobs = PostgresGenerationJobRepository(uow.session)
+            if error is None:
+                await jobs.delete(job.content_id)
+                outcome, status, data = "completed", ProgressStatus.COMPLETED, {"version": version}
+            elif permanent or job.attempts >= self.MAX_ATTEMPTS:
+                await self._fail(uow, job, error)
+                await jobs.delete(job.content_id)
+                outcome, status, data = "failed", ProgressStatus.FAILED, {"error": error}
+            else:
+                logger.info("Generation %s: Versuch %d fehlgeschlagen: %s", job.content_id, job.attempts, error)
+                delay = self.RETRY_BASE_SECONDS * 2 ** (job.attempts - 1)
+                await jobs.retry(job.content_id, delay)
+                outcome, status, data = "retried", ProgressStatus.QUEUED, {"attempt": job.attempts, "retry_in": delay}
+            await uow.commit()
+
+        await self._publish(job, status, data)
+        return outcome
+
+    async def _fail(self, uow: SqlAlchemyUnitOfWork, job: GenerationJob, error: str) -> None:
+        logger.warning("Generation %s endgültig fehlgeschlagen: %s", job.content_id, error)
+        contents = PostgresContentRepository(uow.session)
+        try:
+            if job.regenerate:
+                await contents.update(job.content_id, job.user_id, status=ContentStatus.COMPLETED)
+            else:
+                await contents.update(
+                    job.content_id, job.user_id, status=ContentStatus.FAILED, metadata={"error": error}
+                )
+        except ValueError:
+            pass  # Content inzwischen gelöscht
+        uow.mark_written(job.user_id)
+
+    async def _publish(self, job: GenerationJob, status: ProgressStatus, data: dict) -> None:
+        await self.progress.publish(job.user_id, ProgressEvent(
+            job_id=job.content_id,
+            kind=JobKind.GENERATION,
+            status=status,
+            data=data
+        ))
+
+    def _unit_of_work(self) -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(self.session_factory, guard=get_database_router().guard)
+
+
+async def _main(argv: Optional[List[str]] = None) -> None:
+    from ...infrastructure.database.postgres.config import engine
+
+    parser = argparse.ArgumentParser(description="Worker Pool für asynchrone Content-Generierung")
+    parser.add_argument("--concurrency", type=int, default=None, help="Parallele Jobs (Default: GENERATION_WORKER_CONCURRENCY)")
+    args = parser.parse_args(argv)
+
+    worker = GenerationWorker(concurrency=args.concurrency if args.concurrency is not None else max(
+        int(os.getenv("GENERATION_WORKER_CONCURRENCY", "2")), 1
+    ))
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await worker.start()
+        await stop.wait()
+    finally:
+        await worker.close()
+        await get_progress_broker().close()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
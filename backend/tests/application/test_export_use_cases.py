@@ -0,0 +1,111 @@
+"""
+Export Use Cases mit Platzhaltern: Contents, die noch generiert werden (GENERATING)
+oder fehlgeschlagen sind (FAILED), haben keine Daten - der Export muss sie ablehnen
+(ValueError → 404), statt beim Rendern mit KeyError in einen 500 zu laufen.
+"""
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from src.application.dto.content_dto import ExportDataRequestDTO, ExportPDFRequestDTO
+from src.application.use_cases.export_data_use_case import ExportDataUseCase
+from src.application.use_cases.export_pdf_use_case import ExportPDFUseCase
+from src.domain.entities.content import Content, ContentStatus, ContentType
+
+
+USER_ID = "user-1"
+
+
+def _content(status: ContentStatus, content_type: ContentType = ContentType.HOOK) -> Content:
+    now = datetime(2024, 1, 1, 9, 30)
+    return Content(
+        id="content-1", user_id=USER_ID, type=content_type, status=status,
+        data={}, prompt="Morgenroutine", version=1, created_at=now, updated_at=now
+    )
+
+
+class FakeContentRepository:
+    def __init__(self, content: Content):
+        self.content = content
+
+    async def get_by_id(self, content_id: str, user_id: str = None):
+        return self.content if content_id == self.content.id else None
+
+
+class FakeUserRepository:
+    async def get_by_id(self, user_id: str):
+        return SimpleNamespace(id=user_id)
+
+
+class FakeSubscriptionRepository:
+    async def get_by_user_id(self, user_id: str):
+        return SimpleNamespace(user_id=user_id)
+
+
+class FakeUnitOfWork:
+    async def release(self) -> None:
+        pass
+
+
+class FailingRenderPool:
+    """Darf nie erreicht werden - Platzhalter werden vorher abgelehnt"""
+
+    async def render(self, *args, **kwargs):
+        raise AssertionError("Platzhalter darf nicht gerendert werden")
+
+
+class FailingPDFCache:
+    def key(self, *args) -> str:
+        raise AssertionError("Platzhalter darf keinen Cache Key bekommen")
+
+    async def open(self, key: str):
+        raise AssertionError("Platzhalter darf nicht aus dem Cache gelesen werden")
+
+
+class FailingDataExporter:
+    def formats(self, content_type: ContentType):
+        raise AssertionError("Für Platzhalter darf kein Format ausgehandelt werden")
+
+    def negotiate(self, content_type: ContentType, accept):
+        raise AssertionError("Für Platzhalter darf kein Format ausgehandelt werden")
+
+
+def _pdf_use_case(content: Content) -> ExportPDFUseCase:
+    return ExportPDFUseCase(
+        content_repository=FakeContentRepository(content),
+        user_repository=FakeUserRepository(),
+        subscription_repository=FakeSubscriptionRepository(),
+        usage_repository=None,
+        pdf_render_pool=FailingRenderPool(),
+        pdf_cache=FailingPDFCache(),
+        rate_limiter=None,
+        unit_of_work=FakeUnitOfWork()
+    )
+
+
+@pytest.mark.parametrize("status", [ContentStatus.GENERATING, ContentStatus.FAILED], ids=lambda status: status.value)
+def test_pdf_export_rejects_placeholder(status):
+    use_case = _pdf_use_case(_content(status))
+    dto = ExportPDFRequestDTO(user_id=USER_ID, content_id="content-1")
+    with pytest.raises(ValueError, match="noch nicht fertig generiert"):
+        asyncio.run(use_case.execute(dto))
+
+
+def test_pdf_export_checks_ownership_before_status():
+    use_case = _pdf_use_case(_content(ContentStatus.GENERATING))
+    dto = ExportPDFRequestDTO(user_id="someone-else", content_id="content-1")
+    with pytest.raises(PermissionError):
+        asyncio.run(use_case.execute(dto))
+
+
+@pytest.mark.parametrize("status", [ContentStatus.GENERATING, ContentStatus.FAILED], ids=lambda status: status.value)
+@pytest.mark.parametrize("export_format", [None, "csv", "pdf"])
+def test_data_export_rejects_placeholder_before_negotiation(status, export_format):
+    use_case = ExportDataUseCase(
+        content_repository=FakeContentRepository(_content(status)),
+        data_exporter=FailingDataExporter(),
+        unit_of_work=FakeUnitOfWork()
+    )
+    dto = ExportDataRequestDTO(user_id=USER_ID, content_id="content-1", format=export_format, accept="text/csv")
+    with pytest.raises(ValueError, match="noch nicht fertig generiert"):
+        asyncio.run(use_case.execute(dto))
@@ -0,0 +1,7 @@
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-golden",
+        action="store_true",
+        default=False,
+        help="Golden Files der PDF-Tests neu erzeugen (nur nach Erhöhen von PDFGenerator.TEMPLATE_VERSION)"
+    )
@@ -0,0 +1,54 @@
+"""
+PasswordHasher: Ein abgebrochener Request (z.B. Client-Disconnect) gibt seinen Slot
+erst frei, wenn der bcrypt-Thread wirklich fertig ist - sonst laufen mehr Hashes als
+workers + max_queue gleichzeitig.
+"""
+import asyncio
+import threading
+import pytest
+from src.infrastructure.security.password_hasher import PasswordHasher
+
+
+def test_cancelled_request_keeps_slot_until_thread_finishes():
+    async def scenario():
+        hasher = PasswordHasher(workers=1, max_queue=0, rounds=4)
+        release = threading.Event()
+        task = asyncio.create_task(hasher._run("hash", release.wait))
+        await asyncio.sleep(0.05)
+
+        try:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # Thread läuft noch → Slot bleibt belegt, weitere Operationen werden abgelehnt
+            assert hasher.stats()["in_flight"] == 1
+            with pytest.raises(asyncio.QueueFull):
+                await asyncio.wait_for(hasher.hash("secret"), 5)
+        finally:
+            release.set()
+        for _ in range(100):
+            if hasher.stats()["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert hasher.stats()["in_flight"] == 0
+        assert (await hasher.verify_and_update("secret", await hasher.hash("secret")))[0]
+        await hasher.close()
+
+    asyncio.run(scenario())
+
+
+def test_failed_submit_releases_slot():
+    async def scenario():
+        hasher = PasswordHasher(workers=1, max_queue=0, rounds=4)
+        await hasher.close()
+        hasher._executor = _ShutDownExecutor()
+        with pytest.raises(RuntimeError):
+            await hasher.hash("secret")
+        assert hasher.stats()["in_flight"] == 0
+
+    asyncio.run(scenario())
+
+
+class _ShutDownExecutor:
+    def submit(self, *args, **kwargs):
+        raise RuntimeError("cannot schedule new futures after shutdown")
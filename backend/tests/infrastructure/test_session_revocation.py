@@ -0,0 +1,53 @@
+"""
+Quelle der User-Invalidierungen: nur beendete Sessions (Löschung, Deaktivierung,
+Passwortwechsel) sollen WebSockets schließen - nicht Stripe Webhooks oder der Rehash
+beim Login, die ebenfalls den User-Cache invalidieren.
+"""
+import asyncio
+from src.infrastructure.cache.cached_repositories import CachedUserRepository
+from src.infrastructure.cache.entity_cache import (
+    EntityCache, SESSION_REVOKING_SOURCES, SUBSCRIPTION_NAMESPACE, USER_NAMESPACE
+)
+
+
+class FakeUserRepository:
+    async def update(self, user_id: str, revoke_sessions: bool = False, **kwargs):
+        return None
+
+    async def delete(self, user_id: str) -> None:
+        pass
+
+
+def _revoked_users(write) -> list:
+    """Führt einen Write aus und liefert die User, deren Sessions er beendet"""
+    cache = EntityCache(redis_url="")
+    revoked = []
+    cache.add_invalidation_listener(
+        lambda namespace, key, source: revoked.append(key)
+        if namespace == USER_NAMESPACE and source in SESSION_REVOKING_SOURCES else None
+    )
+    asyncio.run(write(cache, CachedUserRepository(FakeUserRepository(), cache)))
+    return revoked
+
+
+def test_rehash_and_profile_updates_keep_sessions():
+    assert _revoked_users(lambda cache, repo: repo.update("u1", password_hash="$2b$12$neu")) == []
+    assert _revoked_users(lambda cache, repo: repo.update("u1", name="Neu", is_active=True)) == []
+
+
+def test_stripe_webhook_keeps_sessions():
+    assert _revoked_users(lambda cache, repo: cache.invalidate_user("u1", source="stripe_webhook")) == []
+
+
+def test_deactivation_password_change_and_delete_revoke_sessions():
+    assert _revoked_users(lambda cache, repo: repo.update("u1", is_active=False)) == ["u1"]
+    assert _revoked_users(lambda cache, repo: repo.update("u1", password_hash="x", revoke_sessions=True)) == ["u1"]
+    assert _revoked_users(lambda cache, repo: repo.delete("u1")) == ["u1"]
+
+
+def test_invalidation_message_carries_source():
+    cache_key = f"{USER_NAMESPACE}:u1"
+    message = '{"key": "%s", "source": "user_repo.delete"}' % cache_key
+    assert EntityCache._parse_invalidation(message) == (cache_key, "user_repo.delete")
+    # Nachrichten älterer Worker (nur der Key) schließen keine Sessions
+    assert EntityCache._parse_invalidation(f"{SUBSCRIPTION_NAMESPACE}:u1") == (f"{SUBSCRIPTION_NAMESPACE}:u1", "write")
@@ -0,0 +1,159 @@
+"""
+Golden-File Tests für die PDF-Ausgabe (PDFGenerator).
+
+PDF-Cache und ETags setzen voraus, dass gleiche Daten + gleiche TEMPLATE_VERSION
+byte-identische PDFs ergeben. Für jeden Content Type liegt das Platypus-PDF
+(render_template), für Hooks, B-Roll und Caption zusätzlich das Fast-Path-PDF
+(ListPDFRenderer) unter golden/, die SHA-256 Hashes mit der TEMPLATE_VERSION in
+golden/manifest.json.
+
+Ändert sich die Ausgabe, schlagen die Tests fehl. Gewollte Layout-Änderung:
+TEMPLATE_VERSION erhöhen, dann (aus backend/)
+
+    pytest tests/pdf --update-golden
+
+Ohne erhöhte TEMPLATE_VERSION verweigert --update-golden geänderte Ausgaben.
+"""
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+import pytest
+from src.domain.entities.content import ContentType
+from src.infrastructure.pdf.fast_renderer import ListPDFRenderer
+from src.infrastructure.pdf.pdf_generator import PDFGenerator
+
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+MANIFEST = GOLDEN_DIR / "manifest.json"
+
+PROMPT = "Morgenroutine für Gründer"
+GENERATED_AT = datetime(2024, 1, 1, 9, 30)
+
+SAMPLE_DATA = {
+    ContentType.HOOK: {"hooks": [f"Hook {i}: Diese Morgenroutine verändert deinen ganzen Tag" for i in range(1, 11)]},
+    ContentType.SCRIPT: {
+        "scenes": [
+            {
+                "scene_number": i, "type": "Facecam" if i % 2 else "B-Roll",
+                "text": f"Szene {i}: Warum die ersten 30 Minuten nach dem Aufstehen über Fokus und Energie entscheiden.",
+                "visual_description": "Nahaufnahme, natürliches Licht", "duration_seconds": 4.5
+            }
+            for i in range(1, 5)
+        ],
+        "cta": "Folge für mehr Routinen!",
+        "total_duration": 18,
+    },
+    ContentType.SHOTLIST: {"shots": [f"Shot {i}: Halbtotale vom Schreibtisch, Kamera auf Augenhöhe" for i in range(1, 9)]},
+    ContentType.VOICEOVER: {"text": "Deine Morgenroutine entscheidet über deinen Tag. " * 8, "estimated_duration": 30},
+    ContentType.CAPTION: {
+        "caption": "Deine Morgenroutine entscheidet über deinen Tag. Starte mit Wasser, Licht und einem klaren Ziel. " * 2,
+        "hashtags": [f"#morgenroutine{i}" for i in range(1, 16)],
+    },
+    ContentType.BROLL: {"ideas": [f"Idee {i}: Kaffee am Fenster" for i in range(1, 11)]},
+    ContentType.CALENDAR: {
+        "niche": "Fitness",
+        "days": {
+            str(day): {"day": day, "hook": f"Tag {day}: Dein schnellstes Workout für volle Tage", "theme": "Motivation"}
+            for day in range(1, 31)
+        },
+    },
+}
+
+CASES = [f"{content_type.value}.platypus" for content_type in SAMPLE_DATA] + [
+    f"{content_type.value}.fast" for content_type in SAMPLE_DATA if content_type in ListPDFRenderer.CONTENT_TYPES
+]
+
+
+def _render(generator: PDFGenerator, case: str) -> bytes:
+    content_type, path = case.split(".")
+    content_type = ContentType(content_type)
+    data = SAMPLE_DATA[content_type]
+    if path == "platypus":
+        return generator.render_template(content_type, data, PROMPT, GENERATED_AT)
+    pdf_bytes = generator.fast_renderer.render(content_type, data, PROMPT, GENERATED_AT)
+    assert pdf_bytes is not None, f"Fast Path hat die Golden-Daten für {content_type.value} abgelehnt"
+    return pdf_bytes
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _load_manifest() -> dict:
+    if not MANIFEST.exists():
+        return {"template_version": None, "files": {}}
+    return json.loads(MANIFEST.read_text())
+
+
+def _update_golden(rendered: Dict[str, bytes]) -> None:
+    """Schreibt Golden Files + Manifest - geänderte Ausgaben nur mit erhöhter TEMPLATE_VERSION"""
+    manifest = _load_manifest()
+    if manifest["template_version"] == PDFGenerator.TEMPLATE_VERSION:
+        changed = [
+            case for case, pdf_bytes in rendered.items()
+            if case in manifest["files"] and manifest["files"][case] != _sha256(pdf_bytes)
+        ]
+        if changed:
+            pytest.fail(
+                f"PDF-Ausgabe geändert ({', '.join(changed)}), aber TEMPLATE_VERSION ist weiterhin "
+                f"{PDFGenerator.TEMPLATE_VERSION} - erst PDFGenerator.TEMPLATE_VERSION erhöhen"
+            )
+
+    GOLDEN_DIR.mkdir(exist_ok=True)
+    for case, pdf_bytes in rendered.items():
+        (GOLDEN_DIR / f"{case}.pdf").write_bytes(pdf_bytes)
+    MANIFEST.write_text(json.dumps({
+        "template_version": PDFGenerator.TEMPLATE_VERSION,
+        "files": {case: _sha256(pdf_bytes) for case, pdf_bytes in sorted(rendered.items())},
+    }, indent=2) + "\n")
+
+
+@pytest.fixture(scope="module")
+def generator() -> PDFGenerator:
+    return PDFGenerator()
+
+
+@pytest.fixture(scope="module")
+def golden(request, generator) -> dict:
+    """Manifest der Golden Files (mit --update-golden vorher neu erzeugt)"""
+    if request.config.getoption("--update-golden"):
+        _update_golden({case: _render(generator, case) for case in CASES})
+    return _load_manifest()
+
+
+def test_manifest_matches_template_version(golden):
+    """Eine erhöhte TEMPLATE_VERSION verlangt neu erzeugte Golden Files (und umgekehrt)"""
+    assert golden["template_version"] == PDFGenerator.TEMPLATE_VERSION, (
+        f"Golden Files gehören zu TEMPLATE_VERSION {golden['template_version']}, PDFGenerator hat "
+        f"{PDFGenerator.TEMPLATE_VERSION} - mit `pytest tests/pdf --update-golden` neu erzeugen"
+    )
+    assert sorted(golden["files"]) == sorted(CASES)
+    for case, digest in golden["files"].items():
+        assert _sha256((GOLDEN_DIR / f"{case}.pdf").read_bytes()) == digest, f"{case}.pdf passt nicht zum Manifest"
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_output_matches_golden(generator, golden, case):
+    """Gleiche Daten + gleiche TEMPLATE_VERSION → byte-identisches PDF"""
+    pdf_bytes = _render(generator, case)
+    assert _sha256(pdf_bytes) == golden["files"].get(case), (
+        f"PDF-Ausgabe für {case} hat sich geändert - bei gewollter Layout-Änderung TEMPLATE_VERSION "
+        f"erhöhen und mit `pytest tests/pdf --update-golden` neu erzeugen"
+    )
+
+
+@pytest.mark.parametrize("content_type", list(SAMPLE_DATA), ids=lambda content_type: content_type.value)
+def test_generate_pdf_uses_fast_path_where_available(generator, golden, content_type):
+    """generate_pdf liefert für Hooks, B-Roll und Caption das Fast-Path-PDF, sonst Platypus"""
+    path = "fast" if content_type in ListPDFRenderer.CONTENT_TYPES else "platypus"
+    pdf_bytes = generator.generate_pdf(content_type, SAMPLE_DATA[content_type], PROMPT, GENERATED_AT)
+    assert _sha256(pdf_bytes) == golden["files"].get(f"{content_type.value}.{path}")
+
+
+def test_render_is_deterministic_across_generators(generator):
+    """Ein frisch gebauter PDFGenerator (z.B. im nächsten Render-Worker) rendert dieselben Bytes"""
+    other = PDFGenerator()
+    for case in CASES:
+        assert _render(other, case) == _render(generator, case), case
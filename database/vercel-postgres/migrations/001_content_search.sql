@@ -0,0 +1,32 @@
+-- Migration 001: Volltextsuche über generierten Content
+-- Fügt eine generierte tsvector-Spalte (german) + GIN-Index zu contents hinzu.
+-- Die Spalte wird beim INSERT/UPDATE von Postgres berechnet, Suchen lesen nur den Index.
+--
+-- Hinweis: ADD COLUMN ... STORED schreibt die Tabelle einmalig neu (ACCESS EXCLUSIVE Lock).
+-- Auf großen Tabellen außerhalb der Peak-Zeiten ausführen.
+
+ALTER TABLE contents
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('german'::regconfig, coalesce(prompt, '')), 'A') ||
+        setweight(jsonb_to_tsvector(
+            'german'::regconfig,
+            jsonb_path_query_array(data, '$.hooks[*]')
+            || jsonb_path_query_array(data, '$.scenes[*].text')
+            || jsonb_path_query_array(data, '$.cta')
+            || jsonb_path_query_array(data, '$.shots[*]')
+            || jsonb_path_query_array(data, '$.text')
+            || jsonb_path_query_array(data, '$.caption')
+            || jsonb_path_query_array(data, '$.hashtags[*]')
+            || jsonb_path_query_array(data, '$.ideas[*]')
+            || jsonb_path_query_array(data, '$.niche')
+            || jsonb_path_query_array(data, '$.days.*.hook')
+            || jsonb_path_query_array(data, '$.days.*.theme'),
+            '["string"]'
+        ), 'B')
+    ) STORED;
+
+-- CONCURRENTLY: blockiert keine Writes (nicht innerhalb einer Transaktion ausführen)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contents_search_vector
+    ON contents USING GIN (search_vector);
+
+COMMENT ON COLUMN contents.search_vector IS 'Generated tsvector (german) over prompt and text fields in data - GIN indexed for full-text search';
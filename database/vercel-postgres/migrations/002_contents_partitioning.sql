@@ -0,0 +1,104 @@
+-- Migration 002: contents monatlich nach created_at partitionieren
+-- Alte Monate können danach per Content Archival Job als komprimiertes NDJSON
+-- in den Cold Storage verschoben werden (siehe backend/src/infrastructure/jobs).
+--
+-- Eine bestehende Tabelle kann nicht in-place partitioniert werden: die alte Tabelle
+-- wird umbenannt, der partitionierte Parent neu angelegt und alle Zeilen kopiert.
+-- Läuft in EINER Transaktion (ACCESS EXCLUSIVE Lock auf contents) - im Wartungsfenster ausführen.
+--
+-- Voraussetzung: Migration 001 (search_vector) ist eingespielt.
+
+BEGIN;
+
+ALTER TABLE contents RENAME TO contents_legacy;
+ALTER INDEX IF EXISTS contents_pkey RENAME TO contents_legacy_pkey;
+DROP INDEX IF EXISTS idx_contents_user_id;
+DROP INDEX IF EXISTS idx_contents_type;
+DROP INDEX IF EXISTS idx_contents_created_at;
+DROP INDEX IF EXISTS idx_contents_search_vector;
+DROP TRIGGER IF EXISTS update_contents_updated_at ON contents_legacy;
+
+-- NULL-Werte in created_at sind als Partition Key nicht erlaubt
+UPDATE contents_legacy SET created_at = COALESCE(updated_at, NOW()) WHERE created_at IS NULL;
+
+-- Primary Key muss den Partition Key enthalten → (id, created_at)
+CREATE TABLE contents (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    user_id UUID REFERENCES users(id) ON DELETE CASCADE,
+    type TEXT NOT NULL CHECK (type IN ('hook', 'script', 'shotlist', 'voiceover', 'caption', 'broll', 'calendar')),
+    status TEXT NOT NULL DEFAULT 'completed' CHECK (status IN ('generating', 'completed', 'failed')),
+    data JSONB NOT NULL,
+    prompt TEXT NOT NULL,
+    version INTEGER DEFAULT 1,
+    metadata JSONB,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('german'::regconfig, coalesce(prompt, '')), 'A') ||
+        setweight(jsonb_to_tsvector(
+            'german'::regconfig,
+            jsonb_path_query_array(data, '$.hooks[*]')
+            || jsonb_path_query_array(data, '$.scenes[*].text')
+            || jsonb_path_query_array(data, '$.cta')
+            || jsonb_path_query_array(data, '$.shots[*]')
+            || jsonb_path_query_array(data, '$.text')
+            || jsonb_path_query_array(data, '$.caption')
+            || jsonb_path_query_array(data, '$.hashtags[*]')
+            || jsonb_path_query_array(data, '$.ideas[*]')
+            || jsonb_path_query_array(data, '$.niche')
+            || jsonb_path_query_array(data, '$.days.*.hook')
+            || jsonb_path_query_array(data, '$.days.*.theme'),
+            '["string"]'
+        ), 'B')
+    ) STORED,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE OR REPLACE FUNCTION create_contents_partition(p_month DATE)
+RETURNS TEXT AS $$
+DECLARE
+    v_start DATE := date_trunc('month', p_month)::DATE;
+    v_name TEXT := format('contents_p%s', to_char(v_start, 'YYYY_MM'));
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF contents FOR VALUES FROM (%L) TO (%L)',
+        v_name, v_start, (v_start + INTERVAL '1 month')::DATE
+    );
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Partitionen vom ältesten vorhandenen Monat bis 3 Monate in die Zukunft
+SELECT create_contents_partition(m::DATE)
+FROM generate_series(
+    date_trunc('month', COALESCE((SELECT MIN(created_at) FROM contents_legacy), NOW())),
+    date_trunc('month', NOW()) + INTERVAL '3 months',
+    INTERVAL '1 month'
+) AS m;
+
+CREATE TABLE contents_default PARTITION OF contents DEFAULT;
+
+-- search_vector ist generiert und wird nicht kopiert
+INSERT INTO contents (id, user_id, type, status, data, prompt, version, metadata, created_at, updated_at)
+SELECT id, user_id, type, status, data, prompt, version, metadata, created_at, updated_at
+FROM contents_legacy;
+
+-- Indizes auf dem Parent werden automatisch auf allen Partitionen angelegt
+CREATE INDEX idx_contents_user_id ON contents(user_id);
+CREATE INDEX idx_contents_type ON contents(type);
+CREATE INDEX idx_contents_created_at ON contents(created_at DESC);
+CREATE INDEX idx_contents_search_vector ON contents USING GIN (search_vector);
+
+CREATE TRIGGER update_contents_updated_at
+    BEFORE UPDATE ON contents
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+COMMENT ON TABLE contents IS 'Generated content (hooks, scripts, etc.) - polymorphic design, monthly range partitions on created_at';
+COMMENT ON COLUMN contents.data IS 'JSONB field containing type-specific content data';
+COMMENT ON COLUMN contents.search_vector IS 'Generated tsvector (german) over prompt and text fields in data - GIN indexed for full-text search';
+COMMENT ON COLUMN contents.type IS 'Type of content: hook, script, shotlist, voiceover, caption, broll, calendar';
+
+DROP TABLE contents_legacy;
+
+COMMIT;
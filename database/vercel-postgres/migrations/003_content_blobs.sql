@@ -0,0 +1,110 @@
+-- Migration 003: Deduplizierte Payloads (content_blobs)
+-- Generierte JSON-Payloads werden genau einmal in content_blobs gespeichert (Key = SHA-256
+-- der kanonischen jsonb-Darstellung); contents referenziert sie über blob_hash.
+-- search_vector wird danach per Trigger statt als Generated Column gepflegt, da er
+-- den Payload aus content_blobs liest.
+--
+-- Voraussetzung: Migrationen 001 + 002, Postgres >= 13 (BEFORE-Trigger auf partitionierten Tabellen).
+-- Läuft in EINER Transaktion (schreibt contents einmal komplett neu) - im Wartungsfenster ausführen.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS content_blobs (
+    hash TEXT PRIMARY KEY,
+    data JSONB NOT NULL,
+    refcount INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    last_referenced_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION content_blob_hash(p_data JSONB)
+RETURNS TEXT AS $$
+    SELECT encode(sha256(convert_to(p_data::text, 'UTF8')), 'hex');
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+
+CREATE OR REPLACE FUNCTION contents_search_vector(p_prompt TEXT, p_data JSONB)
+RETURNS TSVECTOR AS $$
+    SELECT setweight(to_tsvector('german'::regconfig, coalesce(p_prompt, '')), 'A') ||
+        setweight(jsonb_to_tsvector(
+            'german'::regconfig,
+            jsonb_path_query_array(p_data, '$.hooks[*]')
+            || jsonb_path_query_array(p_data, '$.scenes[*].text')
+            || jsonb_path_query_array(p_data, '$.cta')
+            || jsonb_path_query_array(p_data, '$.shots[*]')
+            || jsonb_path_query_array(p_data, '$.text')
+            || jsonb_path_query_array(p_data, '$.caption')
+            || jsonb_path_query_array(p_data, '$.hashtags[*]')
+            || jsonb_path_query_array(p_data, '$.ideas[*]')
+            || jsonb_path_query_array(p_data, '$.niche')
+            || jsonb_path_query_array(p_data, '$.days.*.hook')
+            || jsonb_path_query_array(p_data, '$.days.*.theme'),
+            '["string"]'
+        ), 'B');
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- search_vector behält seine Werte, wird ab jetzt aber vom Trigger gepflegt
+ALTER TABLE contents ALTER COLUMN search_vector DROP EXPRESSION;
+
+-- Backfill: jeden distinkten Payload einmal ablegen
+INSERT INTO content_blobs (hash, data)
+SELECT DISTINCT ON (hash) hash, data
+FROM (SELECT content_blob_hash(data) AS hash, data FROM contents) AS payloads
+ON CONFLICT (hash) DO NOTHING;
+
+ALTER TABLE contents ADD COLUMN blob_hash TEXT;
+
+-- updated_at beim Backfill nicht anfassen
+ALTER TABLE contents DISABLE TRIGGER update_contents_updated_at;
+UPDATE contents SET blob_hash = content_blob_hash(data);
+ALTER TABLE contents ENABLE TRIGGER update_contents_updated_at;
+
+UPDATE content_blobs b SET refcount = r.n
+FROM (SELECT blob_hash, COUNT(*) AS n FROM contents GROUP BY blob_hash) AS r
+WHERE b.hash = r.blob_hash;
+
+ALTER TABLE contents ALTER COLUMN blob_hash SET NOT NULL;
+ALTER TABLE contents ADD CONSTRAINT contents_blob_hash_fkey FOREIGN KEY (blob_hash) REFERENCES content_blobs(hash);
+ALTER TABLE contents DROP COLUMN data;
+
+CREATE INDEX IF NOT EXISTS idx_contents_blob_hash ON contents(blob_hash);
+CREATE INDEX IF NOT EXISTS idx_content_blobs_gc ON content_blobs(last_referenced_at) WHERE refcount <= 0;
+
+CREATE OR REPLACE FUNCTION contents_set_search_vector()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector := contents_search_vector(
+        NEW.prompt,
+        (SELECT data FROM content_blobs WHERE hash = NEW.blob_hash)
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER contents_search_vector
+    BEFORE INSERT OR UPDATE OF prompt, blob_hash ON contents
+    FOR EACH ROW
+    EXECUTE FUNCTION contents_set_search_vector();
+
+CREATE OR REPLACE FUNCTION contents_blob_refcount()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE content_blobs SET refcount = refcount + 1 WHERE hash = NEW.blob_hash;
+    END IF;
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE content_blobs SET refcount = refcount - 1 WHERE hash = OLD.blob_hash;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER contents_blob_refcount
+    AFTER INSERT OR DELETE OR UPDATE OF blob_hash ON contents
+    FOR EACH ROW
+    EXECUTE FUNCTION contents_blob_refcount();
+
+COMMENT ON TABLE content_blobs IS 'Deduplicated generated payloads keyed by sha256 of canonical jsonb text - refcounted, garbage collected';
+COMMENT ON COLUMN contents.blob_hash IS 'Reference to the type-specific JSONB payload in content_blobs';
+COMMENT ON COLUMN contents.search_vector IS 'Trigger-maintained tsvector (german) over prompt and text fields of the payload - GIN indexed for full-text search';
+
+COMMIT;
@@ -0,0 +1,22 @@
+-- Migration 004: Tages-Rollups für Usage Analytics
+-- Der erste Lauf von `python -m src.infrastructure.jobs.usage_rollup_job run` befüllt
+-- die Rollups ab dem ältesten Content; danach inkrementell ab dem Watermark.
+
+CREATE TABLE IF NOT EXISTS usage_daily_rollups (
+    day DATE NOT NULL,
+    content_type TEXT NOT NULL,
+    plan TEXT NOT NULL,
+    user_id UUID NOT NULL,
+    count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, content_type, plan, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS job_watermarks (
+    name TEXT PRIMARY KEY,
+    watermark TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_usage_daily_rollups_user_day ON usage_daily_rollups(user_id, day);
+
+COMMENT ON TABLE usage_daily_rollups IS 'Daily generated-content counts per (type, plan, user) - maintained incrementally by the usage rollup job';
@@ -0,0 +1,33 @@
+-- Migration 005: Versions-Historie für regenerierte Contents
+-- Bestehende Contents bekommen erst bei ihrer ersten Regenerierung Einträge
+-- (Version 1 wird dann als Snapshot nachgetragen).
+
+CREATE TABLE IF NOT EXISTS content_versions (
+    content_id UUID NOT NULL,
+    version INTEGER NOT NULL,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL CHECK (kind IN ('snapshot', 'patch')),
+    payload JSONB NOT NULL,
+    prompt TEXT NOT NULL,
+    metadata JSONB,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (content_id, version)
+);
+
+CREATE INDEX IF NOT EXISTS idx_content_versions_snapshots ON content_versions(content_id, version) WHERE kind = 'snapshot';
+
+CREATE OR REPLACE FUNCTION contents_delete_versions()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM content_versions WHERE content_id = OLD.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS contents_delete_versions ON contents;
+CREATE TRIGGER contents_delete_versions
+    AFTER DELETE ON contents
+    FOR EACH ROW
+    EXECUTE FUNCTION contents_delete_versions();
+
+COMMENT ON TABLE content_versions IS 'Version history of regenerated contents - periodic full snapshots, json patches (RFC 6902) against the previous version in between';
@@ -0,0 +1,38 @@
+-- Migration 006: contents.type, contents.status und usage_tracking.content_type als native Enums
+-- TEXT + CHECK → content_type_enum / content_status_enum (4 Bytes pro Wert, kleinere Indexes).
+--
+-- ALTER COLUMN ... TYPE schreibt alle contents-Partitionen und ihre Indexes neu und hält
+-- dabei einen ACCESS EXCLUSIVE Lock - im Wartungsfenster ausführen. Unbekannte Werte
+-- lassen die Migration abbrechen (vorher prüfen: SELECT DISTINCT content_type FROM usage_tracking).
+-- Vergleich vorher/nachher: python -m benchmarks.enum_encoding (aus backend/)
+
+BEGIN;
+
+DO $$ BEGIN
+    CREATE TYPE content_type_enum AS ENUM ('hook', 'script', 'shotlist', 'voiceover', 'caption', 'broll', 'calendar');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE content_status_enum AS ENUM ('generating', 'completed', 'failed');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- CHECK Constraints werden durch die Enums ersetzt, der Default muss vor dem Typwechsel weg
+ALTER TABLE contents
+    DROP CONSTRAINT IF EXISTS contents_type_check,
+    DROP CONSTRAINT IF EXISTS contents_status_check,
+    ALTER COLUMN status DROP DEFAULT;
+
+ALTER TABLE contents
+    ALTER COLUMN type TYPE content_type_enum USING type::content_type_enum,
+    ALTER COLUMN status TYPE content_status_enum USING status::content_status_enum,
+    ALTER COLUMN status SET DEFAULT 'completed';
+
+ALTER TABLE usage_tracking
+    ALTER COLUMN content_type TYPE content_type_enum USING content_type::content_type_enum;
+
+COMMIT;
+
+ANALYZE contents;
+ANALYZE usage_tracking;
@@ -0,0 +1,20 @@
+-- Migration 007: Queue für asynchrone Generierungen (POST /api/content/{type}?async=true)
+-- Setzt Migration 006 voraus (content_type_enum). Contents im Status 'generating'
+-- entstehen erst mit dieser Migration - bestehende Daten bleiben unverändert.
+
+CREATE TABLE IF NOT EXISTS generation_jobs (
+    content_id UUID PRIMARY KEY,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    content_type content_type_enum NOT NULL,
+    prompt TEXT NOT NULL,
+    params JSONB NOT NULL DEFAULT '{}'::jsonb,
+    regenerate BOOLEAN NOT NULL DEFAULT FALSE,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_generation_jobs_available_at ON generation_jobs(available_at);
+CREATE INDEX IF NOT EXISTS idx_generation_jobs_user_type ON generation_jobs(user_id, content_type);
+
+COMMENT ON TABLE generation_jobs IS 'Queue of asynchronous generations - one job per content in status generating, claimed with FOR UPDATE SKIP LOCKED';
@@ -0,0 +1,20 @@
+-- Migration 008: Content Blobs ohne Refcount
+-- Ein Dedup-Treffer schreibt die Blob-Zeile nicht mehr (kein last_referenced_at Update, kein
+-- refcount Trigger) - parallele Generierungen desselben Payloads serialisieren sich so nicht
+-- mehr an einer Zeilensperre. Ob ein Blob noch referenziert wird, prüft der ContentBlobGCJob
+-- per NOT EXISTS gegen contents (Index idx_contents_blob_hash).
+--
+-- Voraussetzung: Migration 003. Nur Katalog-Änderungen, kein Table Rewrite.
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS contents_blob_refcount ON contents;
+DROP FUNCTION IF EXISTS contents_blob_refcount();
+
+DROP INDEX IF EXISTS idx_content_blobs_gc;
+ALTER TABLE content_blobs DROP COLUMN IF EXISTS refcount;
+ALTER TABLE content_blobs DROP COLUMN IF EXISTS last_referenced_at;
+
+COMMENT ON TABLE content_blobs IS 'Deduplicated generated payloads keyed by sha256 of canonical jsonb text - garbage collected when no content references them';
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- Migration 009: Index (user_id, created_at) auf contents
+-- Der RetentionJob löst zuerst die User eines Plans auf und löscht dann deren Contents vor
+-- dem Cutoff - dafür braucht er einen Index über (user_id, created_at). Der neue Index
+-- ersetzt idx_contents_user_id (gleicher führender Key, bedient auch alle user_id Lookups
+-- und die Listen sortiert nach created_at).
+--
+-- Voraussetzung: Migration 002. Auf partitionierten Tabellen gibt es kein
+-- CREATE INDEX CONCURRENTLY - der Index sperrt Writes auf contents während des Aufbaus
+-- (Wartungsfenster).
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_contents_user_created_at ON contents(user_id, created_at);
+DROP INDEX IF EXISTS idx_contents_user_id;
+
+COMMIT;
@@ -0,0 +1,42 @@
+-- Migration 010: contents.completed_at
+-- Der Usage Rollup zählt Contents am Tag ihres ersten Abschlusses statt am Tag ihrer Anlage.
+-- Asynchrone Generierungen (Platzhalter mit Status generating) werden oft erst abgeschlossen,
+-- wenn das Watermark ihren created_at-Tag schon hinter sich gelassen hat - nach created_at
+-- gefenstert wurden sie nie gezählt.
+--
+-- completed_at setzt der Trigger contents_set_completed_at einmalig: beim INSERT eines
+-- abgeschlossenen Contents auf created_at (auch Import, Rehydrierung, Partition-Umzug),
+-- beim Wechsel eines Platzhalters auf completed auf NOW(). Regenerierungen ändern ihn nicht.
+--
+-- Voraussetzung: Migration 006. Der Backfill schreibt jede abgeschlossene Zeile von contents
+-- neu (Wartungsfenster). Bereits abgeschlossene Rollup-Tage bleiben unverändert - fehlende
+-- asynchrone Generierungen der Vergangenheit danach mit `usage_rollup_job rebuild --since` nachzählen.
+
+BEGIN;
+
+ALTER TABLE contents ADD COLUMN IF NOT EXISTS completed_at TIMESTAMPTZ;
+
+-- Backfill ohne updated_at zu verändern
+ALTER TABLE contents DISABLE TRIGGER update_contents_updated_at;
+UPDATE contents SET completed_at = created_at WHERE status = 'completed' AND completed_at IS NULL;
+ALTER TABLE contents ENABLE TRIGGER update_contents_updated_at;
+
+CREATE OR REPLACE FUNCTION contents_set_completed_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.status = 'completed' AND NEW.completed_at IS NULL THEN
+        NEW.completed_at := CASE WHEN TG_OP = 'INSERT' THEN NEW.created_at ELSE NOW() END;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS contents_completed_at ON contents;
+CREATE TRIGGER contents_completed_at
+    BEFORE INSERT OR UPDATE OF status ON contents
+    FOR EACH ROW
+    EXECUTE FUNCTION contents_set_completed_at();
+
+CREATE INDEX IF NOT EXISTS idx_contents_completed_at ON contents(completed_at);
+
+COMMIT;
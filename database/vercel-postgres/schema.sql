@@ -32,25 +32,101 @@ CREATE TABLE IF NOT EXISTS subscriptions (
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
--- Contents Table (polymorphic)
+-- Content Blobs (content-addressed, deduplizierte Payloads)
+-- Identische generierte JSON-Payloads werden genau einmal gespeichert;
+-- contents referenziert sie über blob_hash. Unreferenzierte Blobs entfernt der GC Job.
+CREATE TABLE IF NOT EXISTS content_blobs (
+    hash TEXT PRIMARY KEY,
+    data JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Hash über die kanonische Darstellung: jsonb::text normalisiert Key-Reihenfolge und Whitespace
+CREATE OR REPLACE FUNCTION content_blob_hash(p_data JSONB)
+RETURNS TEXT AS $$
+    SELECT encode(sha256(convert_to(p_data::text, 'UTF8')), 'hex');
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+
+-- Suchvektor: Prompt (Gewicht A) + alle Text-Felder des Payloads (Gewicht B)
+CREATE OR REPLACE FUNCTION contents_search_vector(p_prompt TEXT, p_data JSONB)
+RETURNS TSVECTOR AS $$
+    SELECT setweight(to_tsvector('german'::regconfig, coalesce(p_prompt, '')), 'A') ||
+        setweight(jsonb_to_tsvector(
+            'german'::regconfig,
+            jsonb_path_query_array(p_data, '$.hooks[*]')
+            || jsonb_path_query_array(p_data, '$.scenes[*].text')
+            || jsonb_path_query_array(p_data, '$.cta')
+            || jsonb_path_query_array(p_data, '$.shots[*]')
+            || jsonb_path_query_array(p_data, '$.text')
+            || jsonb_path_query_array(p_data, '$.caption')
+            || jsonb_path_query_array(p_data, '$.hashtags[*]')
+            || jsonb_path_query_array(p_data, '$.ideas[*]')
+            || jsonb_path_query_array(p_data, '$.niche')
+            || jsonb_path_query_array(p_data, '$.days.*.hook')
+            || jsonb_path_query_array(p_data, '$.days.*.theme'),
+            '["string"]'
+        ), 'B');
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- Content-Typ und -Status als native Enums (4 Bytes pro Wert, kleinere Indexes, günstigere Vergleiche)
+DO $$ BEGIN
+    CREATE TYPE content_type_enum AS ENUM ('hook', 'script', 'shotlist', 'voiceover', 'caption', 'broll', 'calendar');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE content_status_enum AS ENUM ('generating', 'completed', 'failed');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- Contents Table (polymorphic, monatlich nach created_at partitioniert)
+-- Der Primary Key muss den Partition Key enthalten → (id, created_at)
 CREATE TABLE IF NOT EXISTS contents (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
     user_id UUID REFERENCES users(id) ON DELETE CASCADE,
-    type TEXT NOT NULL CHECK (type IN ('hook', 'script', 'shotlist', 'voiceover', 'caption', 'broll', 'calendar')),
-    status TEXT NOT NULL DEFAULT 'completed' CHECK (status IN ('generating', 'completed', 'failed')),
-    data JSONB NOT NULL,
+    type content_type_enum NOT NULL,
+    status content_status_enum NOT NULL DEFAULT 'completed',
+    blob_hash TEXT NOT NULL REFERENCES content_blobs(hash),
     prompt TEXT NOT NULL,
     version INTEGER DEFAULT 1,
     metadata JSONB,
-    created_at TIMESTAMPTZ DEFAULT NOW(),
-    updated_at TIMESTAMPTZ DEFAULT NOW()
-);
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    -- Erster Abschluss (status completed) - per Trigger gesetzt (contents_set_completed_at)
+    completed_at TIMESTAMPTZ,
+    -- Volltextsuche: per Trigger aus prompt + Blob-Payload berechnet (contents_search_vector)
+    search_vector TSVECTOR,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Monatspartition anlegen (idempotent), z.B. SELECT create_contents_partition('2025-03-01');
+CREATE OR REPLACE FUNCTION create_contents_partition(p_month DATE)
+RETURNS TEXT AS $$
+DECLARE
+    v_start DATE := date_trunc('month', p_month)::DATE;
+    v_name TEXT := format('contents_p%s', to_char(v_start, 'YYYY_MM'));
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF contents FOR VALUES FROM (%L) TO (%L)',
+        v_name, v_start, (v_start + INTERVAL '1 month')::DATE
+    );
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Default-Partition fängt Zeilen außerhalb aller Monatsbereiche ab (sollte leer bleiben)
+CREATE TABLE IF NOT EXISTS contents_default PARTITION OF contents DEFAULT;
+
+-- Partitionen für letzten, aktuellen und die nächsten 3 Monate
+-- (danach legt das Backend beim Start bzw. der Archival Job neue Partitionen an)
+SELECT create_contents_partition((date_trunc('month', NOW()) + make_interval(months => m))::DATE)
+FROM generate_series(-1, 3) AS m;
 
 -- Usage Tracking Table
 CREATE TABLE IF NOT EXISTS usage_tracking (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     user_id UUID REFERENCES users(id) ON DELETE CASCADE,
-    content_type TEXT NOT NULL,
+    content_type content_type_enum NOT NULL,
     count INTEGER DEFAULT 0,
     period_start TIMESTAMPTZ NOT NULL,
     period_end TIMESTAMPTZ NOT NULL,
@@ -59,15 +135,71 @@ CREATE TABLE IF NOT EXISTS usage_tracking (
     UNIQUE(user_id, content_type, period_start, period_end)
 );
 
+-- Usage Daily Rollups (vorberechnete Aggregate für Analytics/Billing Dashboards)
+-- Gepflegt vom UsageRollupJob ab dem Watermark in job_watermarks
+CREATE TABLE IF NOT EXISTS usage_daily_rollups (
+    day DATE NOT NULL,
+    content_type TEXT NOT NULL,
+    plan TEXT NOT NULL,
+    user_id UUID NOT NULL,
+    count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, content_type, plan, user_id)
+);
+
+-- Watermarks inkrementeller Jobs
+CREATE TABLE IF NOT EXISTS job_watermarks (
+    name TEXT PRIMARY KEY,
+    watermark TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Versions-Historie der Contents (Regenerierung erzeugt neue Versionen derselben Content-ID)
+-- kind = 'snapshot': payload ist der komplette Content; kind = 'patch': JSON Patch (RFC 6902)
+-- gegen die vorherige Version. Die aktuelle Version liegt zusätzlich voll in contents/content_blobs.
+-- Kein Foreign Key auf contents (Primary Key enthält created_at) - aufgeräumt per Trigger.
+CREATE TABLE IF NOT EXISTS content_versions (
+    content_id UUID NOT NULL,
+    version INTEGER NOT NULL,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL CHECK (kind IN ('snapshot', 'patch')),
+    payload JSONB NOT NULL,
+    prompt TEXT NOT NULL,
+    metadata JSONB,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (content_id, version)
+);
+
+-- Queue der asynchronen Generierungen (POST /api/content/{type}?async=true)
+-- Ein Job pro Content (Status 'generating'); Worker claimen per FOR UPDATE SKIP LOCKED,
+-- available_at dient als Lease. Kein Foreign Key auf contents (Primary Key enthält created_at).
+CREATE TABLE IF NOT EXISTS generation_jobs (
+    content_id UUID PRIMARY KEY,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    content_type content_type_enum NOT NULL,
+    prompt TEXT NOT NULL,
+    params JSONB NOT NULL DEFAULT '{}'::jsonb,
+    regenerate BOOLEAN NOT NULL DEFAULT FALSE,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
 -- Indexes für Performance
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
-CREATE INDEX IF NOT EXISTS idx_contents_user_id ON contents(user_id);
+CREATE INDEX IF NOT EXISTS idx_contents_user_created_at ON contents(user_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_contents_type ON contents(type);
 CREATE INDEX IF NOT EXISTS idx_contents_created_at ON contents(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_contents_completed_at ON contents(completed_at);
+CREATE INDEX IF NOT EXISTS idx_contents_search_vector ON contents USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_contents_blob_hash ON contents(blob_hash);
 CREATE INDEX IF NOT EXISTS idx_subscriptions_user_id ON subscriptions(user_id);
 CREATE INDEX IF NOT EXISTS idx_subscriptions_stripe_id ON subscriptions(stripe_subscription_id);
 CREATE INDEX IF NOT EXISTS idx_usage_user_content ON usage_tracking(user_id, content_type);
 CREATE INDEX IF NOT EXISTS idx_usage_period ON usage_tracking(period_start, period_end);
+CREATE INDEX IF NOT EXISTS idx_usage_daily_rollups_user_day ON usage_daily_rollups(user_id, day);
+CREATE INDEX IF NOT EXISTS idx_content_versions_snapshots ON content_versions(content_id, version) WHERE kind = 'snapshot';
+CREATE INDEX IF NOT EXISTS idx_generation_jobs_available_at ON generation_jobs(available_at);
+CREATE INDEX IF NOT EXISTS idx_generation_jobs_user_type ON generation_jobs(user_id, content_type);
 
 -- Functions
 
@@ -99,6 +231,57 @@ CREATE TRIGGER update_contents_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- search_vector aus prompt + Blob-Payload berechnen
+CREATE OR REPLACE FUNCTION contents_set_search_vector()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector := contents_search_vector(
+        NEW.prompt,
+        (SELECT data FROM content_blobs WHERE hash = NEW.blob_hash)
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS contents_search_vector ON contents;
+CREATE TRIGGER contents_search_vector
+    BEFORE INSERT OR UPDATE OF prompt, blob_hash ON contents
+    FOR EACH ROW
+    EXECUTE FUNCTION contents_set_search_vector();
+
+-- completed_at einmalig setzen: neue abgeschlossene Zeilen (auch Import, Rehydrierung) auf
+-- created_at, Platzhalter asynchroner Generierungen beim Wechsel auf completed auf NOW()
+CREATE OR REPLACE FUNCTION contents_set_completed_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.status = 'completed' AND NEW.completed_at IS NULL THEN
+        NEW.completed_at := CASE WHEN TG_OP = 'INSERT' THEN NEW.created_at ELSE NOW() END;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS contents_completed_at ON contents;
+CREATE TRIGGER contents_completed_at
+    BEFORE INSERT OR UPDATE OF status ON contents
+    FOR EACH ROW
+    EXECUTE FUNCTION contents_set_completed_at();
+
+-- Versions-Historie gelöschter Contents entfernen (Retention, API, ON DELETE CASCADE von users)
+CREATE OR REPLACE FUNCTION contents_delete_versions()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM content_versions WHERE content_id = OLD.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS contents_delete_versions ON contents;
+CREATE TRIGGER contents_delete_versions
+    AFTER DELETE ON contents
+    FOR EACH ROW
+    EXECUTE FUNCTION contents_delete_versions();
+
 DROP TRIGGER IF EXISTS update_usage_updated_at ON usage_tracking;
 CREATE TRIGGER update_usage_updated_at
     BEFORE UPDATE ON usage_tracking
@@ -136,9 +319,14 @@ CREATE TRIGGER create_user_subscription
 -- Comments
 COMMENT ON TABLE users IS 'Registered users of the AI Reels Generator';
 COMMENT ON TABLE subscriptions IS 'User subscription plans and status';
-COMMENT ON TABLE contents IS 'Generated content (hooks, scripts, etc.) - polymorphic design';
+COMMENT ON TABLE contents IS 'Generated content (hooks, scripts, etc.) - polymorphic design, monthly range partitions on created_at';
 COMMENT ON TABLE usage_tracking IS 'Tracks usage for rate limiting per subscription plan';
 
-COMMENT ON COLUMN contents.data IS 'JSONB field containing type-specific content data';
+COMMENT ON TABLE content_blobs IS 'Deduplicated generated payloads keyed by sha256 of canonical jsonb text - garbage collected when no content references them';
+COMMENT ON COLUMN contents.blob_hash IS 'Reference to the type-specific JSONB payload in content_blobs';
+COMMENT ON COLUMN contents.search_vector IS 'Trigger-maintained tsvector (german) over prompt and text fields of the payload - GIN indexed for full-text search';
 COMMENT ON COLUMN contents.type IS 'Type of content: hook, script, shotlist, voiceover, caption, broll, calendar';
 COMMENT ON COLUMN usage_tracking.count IS 'Number of generations in the current period';
+COMMENT ON TABLE usage_daily_rollups IS 'Daily generated-content counts per (type, plan, user) - maintained incrementally by the usage rollup job';
+COMMENT ON TABLE content_versions IS 'Version history of regenerated contents - periodic full snapshots, json patches (RFC 6902) against the previous version in between';
+COMMENT ON TABLE generation_jobs IS 'Queue of asynchronous generations - one job per content in status generating, claimed with FOR UPDATE SKIP LOCKED';
@@ -162,6 +162,29 @@ class ApiClient {
     return data;
   }
 
+  async searchContent(q: string, cursor?: string, limit = 20) {
+    const { data } = await this.client.get('/api/content/search', {
+      params: { q, cursor, limit },
+    });
+    return data;
+  }
+
+  async exportContent(gzip = false) {
+    const response = await this.client.get('/api/content/export.ndjson', {
+      params: { gzip },
+      responseType: 'blob',
+    });
+    return response.data;
+  }
+
+  async importContent(file: File) {
+    const gzip = file.name.endsWith('.gz');
+    const { data } = await this.client.post('/api/content/import.ndjson', file, {
+      headers: { 'Content-Type': gzip ? 'application/gzip' : 'application/x-ndjson' },
+    });
+    return data;
+  }
+
   async getContentById(id: string) {
     const { data } = await this.client.get(`/api/content/${id}`);
     return data;